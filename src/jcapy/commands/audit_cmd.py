@@ -0,0 +1,130 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+`jcapy audit` — query the audit trail through its sidecar index.
+
+    jcapy audit query --type TOOL_CALL --session 3f2a* --since 1h
+    jcapy audit query --since 2026-10-01 --until 2026-10-02 --json --limit 500
+    jcapy audit stats | reindex
+
+Parser spec: jcapy.core.bootstrap.setup_audit.
+"""
+import json
+import re
+import sys
+import time
+from datetime import datetime
+from typing import Optional
+
+from jcapy.core.audit_index import AuditIndex, AuditQuery
+
+# ANSI Colors
+CYAN = '\033[1;36m'
+GREEN = '\033[1;32m'
+YELLOW = '\033[1;33m'
+RED = '\033[1;31m'
+RESET = '\033[0m'
+GREY = '\033[0;90m'
+
+_RELATIVE = re.compile(r"^(\d+(?:\.\d+)?)([smhdw])$")
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def parse_time(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Accepts epoch seconds, ISO dates/datetimes, or relative ages like 30m / 1h / 7d."""
+    if not value:
+        return None
+    value = value.strip()
+    match = _RELATIVE.match(value)
+    if match:
+        return (now if now is not None else time.time()) - float(match.group(1)) * _UNITS[match.group(2)]
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    return datetime.fromisoformat(value).timestamp()
+
+
+def _format(record: dict) -> str:
+    ts = datetime.fromtimestamp(record.get("timestamp", 0)).strftime("%Y-%m-%d %H:%M:%S")
+    outcome = record.get("outcome") or ""
+    color = GREEN if outcome.upper() == "SUCCESS" else (RED if outcome.upper() in ("FAILURE", "ERROR", "DENIED") else GREY)
+    payload = json.dumps(record.get("payload", {}), default=str)
+    if len(payload) > 100:
+        payload = payload[:97] + "..."
+    return (f"{GREY}{ts}{RESET}  {CYAN}{record.get('event_type', '?'):<18}{RESET} "
+            f"{(record.get('session_id') or '')[:8]}  {record.get('agent_id', ''):<12} "
+            f"{color}{outcome:<8}{RESET} {payload}")
+
+
+def _index() -> AuditIndex:
+    from jcapy.core.audit import get_audit_logger
+    audit_logger = get_audit_logger()
+    audit_logger.flush()  # Records buffered by this process become visible
+    return AuditIndex(audit_logger.audit_file)
+
+
+def run_audit(args):
+    action = getattr(args, 'action', None) or "query"
+    index = _index()
+
+    if action == "stats":
+        index.refresh()
+        stats = index.stats()
+        span = ""
+        if stats["events"]:
+            first = datetime.fromtimestamp(stats["first_ts"]).isoformat(timespec="seconds")
+            last = datetime.fromtimestamp(stats["last_ts"]).isoformat(timespec="seconds")
+            span = f" ({first} → {last})"
+        print(f"{CYAN}Audit index:{RESET} {stats['events']} records in {stats['segments']} segments{span}")
+        print(f"{GREY}{stats['index_path']}{RESET}")
+        return
+
+    if action == "reindex":
+        start = time.perf_counter()
+        added = index.rebuild()
+        print(f"{GREEN}Indexed {added} records in {time.perf_counter() - start:.2f}s{RESET}")
+        return
+
+    try:
+        q = AuditQuery(
+            start=parse_time(getattr(args, 'since', None)),
+            end=parse_time(getattr(args, 'until', None)),
+            event_type=getattr(args, 'event_type', None),
+            session_id=getattr(args, 'session', None),
+            agent_id=getattr(args, 'agent', None),
+        )
+    except ValueError as e:
+        print(f"{RED}Invalid time: {e}{RESET}")
+        return
+
+    as_json = getattr(args, 'json', False)
+    page_size = None if getattr(args, 'all', False) else max(1, getattr(args, 'limit', None) or 50)
+    interactive = page_size is not None and not as_json and sys.stdin.isatty() and sys.stdout.isatty()
+    after = getattr(args, 'after', None)
+    refresh = True
+
+    while True:
+        shown = 0
+        cursor = None
+        has_more = False
+        # Fetch one extra row to know whether another page exists
+        fetch = None if page_size is None else page_size + 1
+        for row_cursor, record in index.query(q, limit=fetch, after=after, refresh=refresh):
+            if page_size is not None and shown == page_size:
+                has_more = True
+                break
+            print(json.dumps(record, default=str) if as_json else _format(record), flush=True)
+            cursor = row_cursor
+            shown += 1
+        refresh = False  # One consistent snapshot per invocation
+
+        if not has_more:
+            if not shown and not after and not as_json:
+                print(f"{GREY}No matching audit records.{RESET}")
+            return
+        after = cursor
+        if not interactive:
+            print(f"{GREY}-- more: --after {cursor}{RESET}", file=sys.stderr if as_json else sys.stdout)
+            return
+        if input(f"{YELLOW}-- more (Enter to continue, q to quit) --{RESET} ").strip().lower() == "q":
+            return
@@ -1,13 +1,16 @@
 # SPDX-License-Identifier: Apache-2.0
 import os
 import sys
-import glob
+import hashlib
 from rich.console import Console
 from jcapy.config import load_config, save_config, get_active_library_path, get_current_persona_name, load_config_local
 from jcapy.utils.ai import call_ai_agent
 
 console = Console()
 
+MAX_CHUNKS = 24
+MAX_CONTEXT_CHARS = 50000
+
 def link_brain(path):
     """Links a local directory as the JCapy Brain (Library Path)"""
     target_path = os.path.abspath(os.path.expanduser(path))
@@ -34,6 +37,18 @@ def link_brain(path):
     console.print(f"    Persona: [yellow]{current_persona}[/yellow]")
     console.print("\n[dim]New harvests will be saved here. 'jcapy ask' will search here.[/dim]")
 
+def _brain_memory(lib_path):
+    """The chunk index behind 'jcapy ask', one per library under ~/.jcapy/brain."""
+    from jcapy.config import JCAPY_HOME
+    from jcapy.memory.hybrid import HybridMemoryBank
+    key = hashlib.sha1(os.path.realpath(lib_path).encode("utf-8")).hexdigest()[:16]
+    return HybridMemoryBank(persistence_path=os.path.join(JCAPY_HOME, "brain", key))
+
+def _recall_from_brain(lib_path, question):
+    bank = _brain_memory(lib_path)
+    bank.memorize([lib_path])  # incremental: only new or changed files are chunked and embedded
+    return bank.recall(question, n_results=MAX_CHUNKS)
+
 def ask_brain(question):
     """RAG-lite: Ask a question to the Knowledge Graph"""
     # 0. Handle Piping & MockArgs
@@ -63,42 +78,25 @@ def ask_brain(question):
         orchestrator.run(q_str, context=piped_data)
         return
 
-    console.print(f"[bold magenta]🧠 Thinking...[/bold magenta] [dim](Scanning {lib_path})[/dim]")
+    console.print(f"[bold magenta]🧠 Thinking...[/bold magenta] [dim](Searching {lib_path})[/dim]")
 
-    # 1. Scan for Knowledge
-    md_files = glob.glob(os.path.join(lib_path, "**/*.md"), recursive=True)
     context_blob = ""
-    file_count = 0
-    max_files = 20 # Safety limit
+    chunk_count = 0
 
     if piped_data:
         context_blob = f"--- PIPED CONTEXT ---\n{piped_data}\n\n"
-        file_count += 1
-
-    # Priority: Files with matching keywords in filename
-    keywords = q_str.lower().split()
-    scored_files = []
-
-    for f in md_files:
-        score = 0
-        fname = os.path.basename(f).lower()
-        for k in keywords:
-            if k in fname: score += 10
-        scored_files.append((score, f))
-
-    scored_files.sort(key=lambda x: (x[0], os.path.getmtime(x[1])), reverse=True)
+        chunk_count += 1
 
+    # 1. Retrieve the best chunks (BM25 keywords + vector similarity)
     used_files = []
-    for score, fpath in scored_files[:max_files]:
-        try:
-            with open(fpath, 'r') as f:
-                content = f.read()
-                if len(context_blob) + len(content) > 50000: break
-                context_blob += f"\n\n--- FILE: {os.path.basename(fpath)} ---\n{content}"
-                used_files.append(os.path.basename(fpath))
-                file_count += 1
-        except:
-            pass
+    for hit in _recall_from_brain(lib_path, q_str):
+        content = hit["content"] or ""
+        if len(context_blob) + len(content) > MAX_CONTEXT_CHARS: break
+        source = os.path.relpath(hit["metadata"].get("source", ""), lib_path)
+        context_blob += f"\n\n--- FILE: {source} ---\n{content}"
+        if source not in used_files:
+            used_files.append(source)
+        chunk_count += 1
 
     if not context_blob:
          console.print("[yellow]Brain is empty or unreadable.[/yellow]")
@@ -112,7 +110,7 @@ If the answer is not in the context, say "I don't have that information in my br
 
 QUESTION: {q_str}
 
---- KNOWLEDGE GRAPH CONTEXT ({file_count} files) ---
+--- KNOWLEDGE GRAPH CONTEXT ({chunk_count} excerpts from {len(used_files)} files) ---
 {context_blob}
 """
 
@@ -131,7 +129,7 @@ QUESTION: {q_str}
         console.print("Run 'jcapy config set-key <provider>' to enable RAG.")
         return
 
-    console.print(f"[dim]Consulting {file_count} documents...[/dim]")
+    console.print(f"[dim]Consulting {chunk_count} excerpts from {len(used_files)} documents...[/dim]")
 
     try:
         response, err = call_ai_agent(prompt, provider=provider)
@@ -48,8 +48,14 @@ class MemorizeCommand(CommandBase):
 
             stats = bank.memorize(paths, clear_first=args.force)
             console.print(f"\n[bold green]✨ Update Complete:[/bold green]")
-            print(f"  • Added: {stats['added']}")
-            print(f"  • Skipped: {stats['skipped']}")
+            if "scanned" in stats:
+                print(f"  • Scanned: {stats['scanned']}")
+                print(f"  • Embedded: {stats['embedded']}")
+                print(f"  • Skipped (unchanged): {stats['unchanged']}")
+                print(f"  • Removed: {stats['removed']}")
+            else:
+                print(f"  • Added: {stats['added']}")
+                print(f"  • Skipped: {stats['skipped']}")
             print(f"  • Errors: {stats['errors']}")
         except ImportError:
              console.print(f"[bold red]Error: 'chromadb' not installed.[/bold red]")
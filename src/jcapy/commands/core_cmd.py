@@ -8,9 +8,6 @@ from jcapy.config import get_active_library_path
 
 console = Console()
 
-def setup_undo(parser):
-    parser.add_argument("--list", action="store_true", dest="list_undo", help="List undo history")
-
 def run_undo(args):
     undo_stack = get_undo_stack()
     if getattr(args, 'list_undo', False):
@@ -28,9 +25,6 @@ def run_undo(args):
         else:
             show_error("Nothing to undo", hint="Run 'jcapy undo --list' to see history")
 
-def setup_tutorial(parser):
-    parser.add_argument("--reset", action="store_true", help="Reset tutorial progress")
-
 def run_tutorial(args):
     tutorial = get_tutorial()
     if getattr(args, 'reset', False):
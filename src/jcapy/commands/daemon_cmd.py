@@ -18,6 +18,8 @@ import time
 from pathlib import Path
 from datetime import datetime
 
+from jcapy.daemon.discovery import get_pid_file, get_socket_path, daemon_alive
+
 # ANSI Colors
 CYAN = '\033[1;36m'
 GREEN = '\033[1;32m'
@@ -28,16 +30,10 @@ RESET = '\033[0m'
 GREY = '\033[0;90m'
 
 # Default paths
-DEFAULT_PID_FILE = Path.home() / '.jcapy' / 'daemon.pid'
 DEFAULT_LOG_FILE = Path.home() / '.jcapy' / 'logs' / 'daemon.log'
 DEFAULT_PORT = 8080
 
 
-def get_pid_file() -> Path:
-    """Get the PID file path"""
-    return Path(os.environ.get('JCAPY_PID_FILE', DEFAULT_PID_FILE))
-
-
 def get_log_file() -> Path:
     """Get the log file path"""
     return Path(os.environ.get('JCAPY_LOG_DIR', Path.home() / '.jcapy' / 'logs')) / 'daemon.log'
@@ -217,6 +213,8 @@ def cmd_status(args):
             print(f"  {GREY}(Could not fetch detailed status){RESET}")
         
         print(f"  Control Plane: http://localhost:8080")
+        local = f"{GREEN}accepting{RESET}" if daemon_alive() else f"{YELLOW}not listening{RESET}"
+        print(f"  Local Socket: {get_socket_path()} ({local})")
     else:
         print(f"  Status: {RED}○ Stopped{RESET}")
     
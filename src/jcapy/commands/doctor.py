@@ -28,6 +28,7 @@ class DoctorCommand(CommandBase):
         self.check_version()
         self.check_tools()
         self.check_local_storage()
+        self.check_ai_cache()
 
         # 2. Telemetry Health
         self.check_telemetry()
@@ -81,6 +82,31 @@ class DoctorCommand(CommandBase):
         else:
             console.print(f"  Log Dir:   [red]Permission Denied[/red] ({log_dir})")
 
+    def check_ai_cache(self):
+        console.print("\n[bold]⚡ AI Response Cache[/bold]")
+        from jcapy.config import JCAPY_HOME
+        from jcapy.utils.ai_cache import cache_enabled, get_response_cache
+
+        enabled = cache_enabled()
+        if not enabled and not os.path.exists(os.path.join(JCAPY_HOME, "ai_cache.db")):
+            console.print("  Status:    [dim]Disabled[/dim] (enable with `jcapy config set ai.cache.enabled true`)")
+            return
+        try:
+            cache = get_response_cache()
+            stats = cache.stats()
+        except Exception as e:
+            console.print(f"  Status:    [red]Unreadable ({e})[/red]")
+            return
+
+        status = "[green]Enabled[/green]" if enabled else "[yellow]Disabled (entries kept)[/yellow]"
+        console.print(f"  Status:    {status}")
+        console.print(f"  Entries:   [cyan]{stats['entries']}[/cyan]")
+        console.print(f"  Size:      [cyan]{stats['size_bytes'] / 1024 / 1024:.1f} MB[/cyan] of {cache.max_bytes / 1024 / 1024:.0f} MB")
+        console.print(f"  TTL:       [dim]{cache.ttl / 3600:g}h[/dim]")
+        if stats["hits"] or stats["misses"]:
+            console.print(f"  Hit rate:  [cyan]{stats['hit_rate']:.0%}[/cyan] "
+                          f"({stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evicted)")
+
     def check_telemetry(self):
         console.print("\n[bold]📡 Telemetry[/bold]")
         try:
@@ -152,6 +178,12 @@ class DoctorCommand(CommandBase):
                    console.print(f"  Connect:   [red]Failed ({e})[/red]")
             else:
                 console.print("  API Key:   [red]Missing JCAPY_PINECONE_API_KEY[/red]")
+        elif provider in ("flat", "hybrid"):
+            try:
+                import numpy
+                console.print(f"  NumPy:     [green]Installed[/green] ({numpy.__version__})")
+            except ImportError:
+                console.print("  NumPy:     [red]Missing[/red]")
         else:
             # Check Chroma
             try:
@@ -11,6 +11,7 @@ from jcapy.config import (
     get_current_persona_name, DEFAULT_LIBRARY_PATH, JCAPY_HOME
 )
 from jcapy.ui.menu import interactive_menu
+from jcapy.core.skill_catalog import get_catalog
 from jcapy.models.frameworks import ResultStatus as FrameworkStatus
 from jcapy.services.frameworks.engine import FrameworkEngine
 
@@ -54,42 +55,34 @@ def list_frameworks():
         table.add_column("Status", style="yellow")
 
         frameworks_count = 0
-        for root, dirs, files in os.walk(lib_path):
-            # Prune .git and __pycache__ from traversal
-            dirs[:] = [d for d in dirs if d not in [".git", "__pycache__"]]
-
-            folder_name = os.path.basename(root)
-            if folder_name == "skills": continue
-
-            # Simple Category detection based on folder depth/name
-            rel_path = os.path.relpath(root, lib_path)
-            category = rel_path if rel_path != "." else "General"
-
-            for f in files:
-                # Skip system files and templates
-                if f in [".DS_Store", "TEMPLATE_FRAMEWORK.md", "README.md"] or f.startswith("."):
-                    continue
-
-                path = os.path.join(root, f)
-                mtime = os.path.getmtime(path)
-                is_recent = (time.time() - mtime) < 86400 # 24 hours
-                status = "Recent" if is_recent else ""
-
-                # Icons based on extension
-                icon = "📄"
-                ftype = "File"
-                if f.endswith(".md"):
-                    icon = "📜"
-                    ftype = "Skill"
-                elif f.endswith(".py"):
-                    icon = "🐍"
-                    ftype = "Script"
-                elif f.endswith(".sh"):
-                    icon = "🐚"
-                    ftype = "Script"
-
-                table.add_row(category, f"{icon} {f}", ftype, status)
-                frameworks_count += 1
+        now = time.time()
+        for entry in get_catalog(lib_path).entries():
+            # Files directly inside a 'skills' folder aren't listed
+            if os.path.basename(os.path.dirname(entry.path)) == "skills": continue
+
+            # Skip system files and templates
+            if entry.name in [".DS_Store", "TEMPLATE_FRAMEWORK.md", "README.md"]:
+                continue
+
+            is_recent = (now - entry.mtime) < 86400 # 24 hours
+            status = "Recent" if is_recent else ""
+
+            # Icons based on extension
+            f = entry.name
+            icon = "📄"
+            ftype = "File"
+            if f.endswith(".md"):
+                icon = "📜"
+                ftype = "Skill"
+            elif f.endswith(".py"):
+                icon = "🐍"
+                ftype = "Script"
+            elif f.endswith(".sh"):
+                icon = "🐚"
+                ftype = "Script"
+
+            table.add_row(entry.category, f"{icon} {f}", ftype, status)
+            frameworks_count += 1
 
         if frameworks_count == 0:
             console.print(f"[dim](No frameworks harvested yet. Use 'jcapy harvest')[/dim]")
@@ -397,25 +390,13 @@ def search_frameworks(query):
     print(f"{BLUE}🔍 Searching Knowledge Base for '{search_term}'...{RESET}")
     print("-----------------------------------------------------")
 
-    matches = []
+    hits = get_catalog(lib_path).search(search_term, highlight=(YELLOW, WHITE))
 
-    for root, dirs, files in os.walk(lib_path):
-        for f in files:
-            if f.endswith(".md"):
-                path = os.path.join(root, f)
-                try:
-                    with open(path, 'r') as file_content:
-                        content = file_content.read()
-                        if query.lower() in content.lower():
-                            matches.append(path)
-                except Exception:
-                    continue
-
-    if matches:
-        for match in matches:
-            rel_path = match.replace(lib_path + "/", "")
-            # Try to show snippet
-            print(f"{GREEN}✅ Found in: {WHITE}{rel_path}{RESET}")
+    if hits:
+        for hit in hits:
+            print(f"{GREEN}✅ Found in: {WHITE}{hit.entry.rel_path}{RESET} {GREY}({hit.entry.title}){RESET}")
+            if hit.snippet:
+                print(f"   {WHITE}{hit.snippet}{RESET}")
     else:
          print(f"{YELLOW}No matches found.{RESET}")
     print("-----------------------------------------------------")
@@ -423,25 +404,9 @@ def search_frameworks(query):
 def open_framework(name_query):
     lib_path = get_active_library_path()
 
-    # Find the framework file by fuzzy name match
-    target_file = None
-
-    # Direct match first
-    for root, dirs, files in os.walk(lib_path):
-        for f in files:
-             if f == name_query or f == f"{name_query}.md":
-                 target_file = os.path.join(root, f)
-                 break
-        if target_file: break
-
-    # Fuzzy match if no direct match
-    if not target_file:
-         for root, dirs, files in os.walk(lib_path):
-            for f in files:
-                if name_query.lower() in f.lower() and f.endswith(".md"):
-                     target_file = os.path.join(root, f)
-                     break
-            if target_file: break
+    # Find the framework file: direct match first, then fuzzy name match
+    entry = get_catalog(lib_path).find(name_query)
+    target_file = entry.path if entry else None
 
     if target_file:
         print(f"{GREEN}Opening {target_file}...{RESET}")
@@ -459,6 +424,8 @@ def open_framework(name_query):
              print(f"{RED}Failed to open: {e}{RESET}")
              # Fallback
              subprocess.call(['open', target_file])
+        # In-place edits don't change the directory mtime the catalog watches
+        get_catalog(lib_path).touch(target_file)
     else:
         print(f"{RED}Framework '{name_query}' not found.{RESET}")
         print(f"{GREY}Tip: Use 'jcapy search' to find the correct name.{RESET}")
@@ -466,25 +433,9 @@ def open_framework(name_query):
 def delete_framework(name_query):
     lib_path = get_active_library_path()
 
-    # Find the framework file by fuzzy name match
-    target_file = None
-
-    # Direct match first
-    for root, dirs, files in os.walk(lib_path):
-        for f in files:
-             if f == name_query or f == f"{name_query}.md":
-                 target_file = os.path.join(root, f)
-                 break
-        if target_file: break
-
-    # Fuzzy match if no direct match
-    if not target_file:
-         for root, dirs, files in os.walk(lib_path):
-            for f in files:
-                if name_query.lower() in f.lower() and f.endswith(".md"):
-                     target_file = os.path.join(root, f)
-                     break
-            if target_file: break
+    # Find the framework file: direct match first, then fuzzy name match
+    entry = get_catalog(lib_path).find(name_query)
+    target_file = entry.path if entry else None
 
     if target_file:
         from jcapy.ui.ux.safety import confirm, get_undo_stack
@@ -500,6 +451,7 @@ def delete_framework(name_query):
                 undo_stack.push("delete", target_file, f"Delete: {os.path.basename(target_file)}")
 
                 os.remove(target_file)
+                get_catalog(lib_path).touch(target_file)
                 show_success("Framework deleted", hint="Run 'jcapy undo' to restore")
             except Exception as e:
                 show_error(f"Error deleting file: {e}")
@@ -575,23 +527,9 @@ def apply_framework(framework_name, dry_run=False, context=None, interactive=Tru
         console = Console()
         lib_path = get_active_library_path()
 
-        # 1. Find the Skill File (Prioritize Exact Matches)
-        target_file = None
-        fuzzy_match = None
-
-        for root, dirs, files in os.walk(lib_path):
-            for f in files:
-                # Exact Match (with or without .md)
-                if f == framework_name or f == f"{framework_name}.md":
-                    target_file = os.path.join(root, f)
-                    break
-                # Fuzzy Match (keep as fallback)
-                if not fuzzy_match and framework_name.lower() in f.lower() and f.endswith(".md"):
-                    fuzzy_match = os.path.join(root, f)
-            if target_file: break
-
-        # Fallback to fuzzy only if no exact match found
-        target_file = target_file or fuzzy_match
+        # 1. Find the Skill File (exact match with or without .md, else fuzzy)
+        entry = get_catalog(lib_path).find(framework_name)
+        target_file = entry.path if entry else None
 
         if not target_file:
             console.print(f"[bold red]❌ Error:[/bold red] Framework '{framework_name}' not found.")
@@ -718,20 +656,18 @@ def merge_frameworks(init_project_func=None):
         with console.status("[bold cyan]Scanning library for frameworks...") as status:
             for lib_path in lib_paths:
                 if not os.path.exists(lib_path): continue
-                for root, dirs, files in os.walk(lib_path):
-                    for f in files:
-                        if f.endswith(".md") and f != "TEMPLATE_FRAMEWORK.md":
-                            path = os.path.join(root, f)
-                            try:
-                                    res = engine.harvest(path)
-                                    if res.status == FrameworkStatus.SUCCESS:
-                                        meta = res.payload
-                                        framework_id = f.replace(".md", "")
-                                        if framework_id not in all_frameworks:
-                                            all_frameworks[framework_id] = meta
-                                            all_frameworks[framework_id]['path'] = path
-                            except:
-                                continue
+                for entry in get_catalog(lib_path).entries(markdown_only=True):
+                    f = entry.name
+                    if f == "TEMPLATE_FRAMEWORK.md": continue
+                    framework_id = f.replace(".md", "")
+                    if framework_id in all_frameworks: continue
+                    try:
+                            res = engine.harvest(entry.path)
+                            if res.status == FrameworkStatus.SUCCESS:
+                                all_frameworks[framework_id] = res.payload
+                                all_frameworks[framework_id]['path'] = entry.path
+                    except:
+                        continue
 
         if not all_frameworks:
             console.print("[red]No frameworks with valid metadata found in library.[/red]")
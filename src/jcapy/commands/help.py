@@ -93,14 +93,14 @@ HELP_REGISTRY = {
     "sync": {
         "title": "🔄 Sync",
         "aliases": [],
-        "usage": "jcapy sync",
+        "usage": "jcapy sync [--workers N]",
         "description": "Pulls the latest updates for all your personas from their respective Git remotes.",
         "tips": "Essential for keeping your knowledge base synchronized across different machines."
     },
     "push": {
         "title": "⬆️ Push",
         "aliases": [],
-        "usage": "jcapy push",
+        "usage": "jcapy push [--workers N]",
         "description": "Uploads all your local skill updates to their configured Git remotes.",
         "tips": "Run this after harvesting new value to ensure your backup and team are updated."
     },
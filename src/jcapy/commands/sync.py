@@ -1,8 +1,12 @@
 import os
 import shutil
+import threading
 import time
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Callable, Dict, List, Optional
 from jcapy.config import load_config, save_config, DEFAULT_LIBRARY_PATH
 from jcapy.utils.git_lib import get_git_status
 from jcapy.ui.menu import interactive_menu
@@ -16,134 +20,230 @@ RED = '\033[1;31m'
 RESET = '\033[0m'
 GREY = '\033[0;90m'
 
-def sync_all_personas():
-    """Smart Sync: Pulls updates or Clones missing brains. Interactive & Robust."""
-    config = load_config()
-    personas = config.get("personas", {})
-    if "programmer" not in personas: personas["programmer"] = {"path": DEFAULT_LIBRARY_PATH}
+# Personas are synced/pushed concurrently; each repository's own git steps stay sequential.
+DEFAULT_SYNC_WORKERS = int(os.environ.get('JCAPY_SYNC_WORKERS', 4))
+
+ProgressCallback = Callable[[str, str], None]
+
+
+@dataclass
+class PersonaResult:
+    """Outcome of syncing or pushing a single persona brain."""
+    name: str
+    status: str                      # updated | cloned | pushed | failed | skipped | needs_setup
+    message: str = ""
+    duration: float = 0.0
+    remote_url: Optional[str] = None  # Discovered origin URL to record in config
+
+    @property
+    def ok(self) -> bool:
+        return self.status in ("updated", "cloned", "pushed")
+
+
+def console_progress() -> ProgressCallback:
+    """Line-per-event progress printer; safe to call from worker threads."""
+    lock = threading.Lock()
+
+    def report(name: str, message: str):
+        with lock:
+            print(f"  {CYAN}• {name.capitalize()}:{RESET} {message}", flush=True)
+
+    return report
+
+
+def _quiet(name: str, message: str):
+    pass
+
+
+def _run_parallel(targets: List[str], work: Callable[[str], PersonaResult],
+                  max_workers: Optional[int] = None) -> List[PersonaResult]:
+    """Runs `work` for each persona on a bounded pool; results keep target order."""
+    workers = DEFAULT_SYNC_WORKERS if max_workers is None else max_workers
+    if workers < 1:
+        raise ValueError(f"sync workers must be at least 1, got {workers}")
+    if not targets:
+        return []
+    workers = min(workers, len(targets))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jcapy-sync") as pool:
+        futures = [pool.submit(work, name) for name in targets]
+        results = []
+        for name, future in zip(targets, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(PersonaResult(name, "failed", f"Error: {e}"))
+        return results
+
+
+def _summarize(results: List[PersonaResult], elapsed: float):
+    counts: Dict[str, int] = {}
+    for r in results:
+        counts[r.status] = counts.get(r.status, 0) + 1
+    serial = sum(r.duration for r in results)
+    summary = ", ".join(f"{n} {status}" for status, n in counts.items())
+    print(f"\n{GREY}{summary} in {elapsed:.1f}s (sequential estimate {serial:.1f}s){RESET}")
+    for r in results:
+        if not r.ok and r.status != "needs_setup":
+            print(f"    {RED}✗ {r.name}: {r.message}{RESET}")
+
 
-    # 1. Build Menu Options
+def _persona_targets(personas: Dict[str, Dict], choice_label: str, title: str, width: int,
+                     status_fmt: Callable[[int], str]) -> List[str]:
+    """Builds the selection menu and returns the chosen persona keys."""
     persona_keys = ["programmer"] + sorted([k for k in personas.keys() if k != "programmer"])
-    menu_options = ["Sync All (Default)"]
+    menu_options = [choice_label]
 
     for p in persona_keys:
         p_data = personas.get(p, {})
         path = p_data.get("path")
         remote = p_data.get("remote_url", "No Remote")
-        short_remote = remote.replace("https://", "").replace("git@", "")[:25] + "..." if len(remote) > 25 else remote
+        short_remote = remote.replace("https://", "").replace("git@", "")[:width] + "..." if len(remote) > width else remote
 
         last_sync, pending = get_git_status(path)
-        status_icon = "✅" if pending == 0 else "⚠️ Dirty"
+        menu_options.append(f"{p.capitalize()} [{short_remote}] {status_fmt(pending)}")
 
-        menu_options.append(f"{p.capitalize()} [{short_remote}] {status_icon}")
+    choice_idx = interactive_menu(title, menu_options)
+    if choice_idx == 0:
+        return persona_keys # All
+    return [persona_keys[choice_idx - 1]] # Specific
 
-    # 2. Select Target
-    print(f"\n{MAGENTA}🔄 jcapy Sync Protocol{RESET}")
-    choice_idx = interactive_menu("Select Target to Sync:", menu_options)
 
-    targets = []
-    if choice_idx == 0:
-        targets = persona_keys # All
-    else:
-        targets = [persona_keys[choice_idx - 1]] # Specific
+# ──────────────────────────────────────────────
+# Sync (pull)
+# ──────────────────────────────────────────────
 
-    print(f"\n{MAGENTA}⬇️  Syncing Selected Brains...{RESET}")
-    config_changed = False
+def sync_persona(name: str, p_data: Dict, progress: ProgressCallback = _quiet) -> PersonaResult:
+    """Pulls (stash -> pull --rebase -> pop) or clones one persona. Never prompts."""
+    start = time.monotonic()
+    path = p_data.get("path")
+    remote_url = p_data.get("remote_url")
 
-    for name in targets:
-        p_data = personas.get(name, {})
-        path = p_data.get("path")
-        remote_url = p_data.get("remote_url")
+    def finish(status: str, message: str) -> PersonaResult:
+        duration = time.monotonic() - start
+        color = GREEN if status in ("updated", "cloned") else (YELLOW if status == "needs_setup" else RED)
+        progress(name, f"{color}{message}{RESET} {GREY}({duration:.1f}s){RESET}")
+        return PersonaResult(name, status, message, duration)
 
-        print(f"  {CYAN}• {name.capitalize()}:{RESET} ", end="", flush=True)
+    if path and os.path.exists(path):
+        if not os.path.exists(os.path.join(path, ".git")):
+            return finish("needs_setup", "Exists but not Git-linked.")
 
-        if os.path.exists(path):
-            if os.path.exists(os.path.join(path, ".git")):
-                # Check for dirty state
-                _, pending = get_git_status(path)
+        # Check for dirty state
+        _, pending = get_git_status(path)
 
-                # Logic: Stash -> Pull (Rebase) -> Pop
-                commands = []
-                if pending > 0:
-                    print(f"{YELLOW} Local changes ({pending}). Stashing...{RESET}", end="")
-                    commands.append(["git", "stash"])
+        # Logic: Stash -> Pull (Rebase) -> Pop
+        commands = []
+        if pending > 0:
+            progress(name, f"{YELLOW}Local changes ({pending}). Stashing...{RESET}")
+            commands.append(["git", "stash"])
 
-                commands.append(["git", "pull", "--rebase"])
+        commands.append(["git", "pull", "--rebase"])
 
-                if pending > 0:
-                    commands.append(["git", "stash", "pop"])
+        if pending > 0:
+            commands.append(["git", "stash", "pop"])
 
-                # Execute
-                success = True
-                for cmd in commands:
+        # Execute
+        for cmd in commands:
+            res = subprocess.run(cmd, cwd=path, capture_output=True, text=True)
+            if res.returncode != 0:
+                # Fallback: If pull failed, maybe upstream isn't set?
+                if "pull" in cmd and "no tracking information" in res.stderr:
+                    try:
+                        current_branch = subprocess.check_output(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=path).decode().strip()
+                    except Exception:
+                        current_branch = "main"
+
+                    progress(name, f"{YELLOW}Setting upstream to origin/{current_branch}...{RESET}")
+                    subprocess.run(["git", "branch", "--set-upstream-to", f"origin/{current_branch}", current_branch], cwd=path, capture_output=True)
+                    # Retry pull
                     res = subprocess.run(cmd, cwd=path, capture_output=True, text=True)
-                    if res.returncode != 0:
-                        # Fallback: If pull failed, maybe upstream isn't set?
-                        if "pull" in cmd and "no tracking information" in res.stderr:
-                             try:
-                                 current_branch = subprocess.check_output(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=path).decode().strip()
-                             except:
-                                 current_branch = "main"
-
-                             print(f"{YELLOW} Setting upstream to origin/{current_branch}...{RESET}")
-                             subprocess.run(["git", "branch", "--set-upstream-to", f"origin/{current_branch}", current_branch], cwd=path, capture_output=True)
-                             # Retry pull
-                             res = subprocess.run(cmd, cwd=path, capture_output=True, text=True)
-
-                        if res.returncode != 0:
-                            print(f"\n    {RED}❌ Error during '{cmd[1]}':{RESET} {res.stderr.strip()}")
-                            success = False
-                            break
-
-                if success:
-                    print(f"{GREEN}Updated ✔{RESET}")
-
-            else:
-                 # Exists but not Git-linked
-                 print(f"{YELLOW}Exists but not Git-linked.{RESET}")
-                 if input(f"    {CYAN}? Initialize and link to remote? (y/N): {RESET}").strip().lower() == 'y':
-                     new_remote = input(f"    {CYAN}? Remote Git URL: {RESET}").strip()
-                     if new_remote:
-                         try:
-                             subprocess.run(["git", "init"], cwd=path, check=True, capture_output=True)
-                             subprocess.run(["git", "branch", "-M", "main"], cwd=path, check=True, capture_output=True)
-                             subprocess.run(["git", "remote", "add", "origin", new_remote], cwd=path, check=True, capture_output=True)
-                             p_data["remote_url"] = new_remote
-                             config_changed = True
-                             print(f"    {GREY}Linking...{RESET}")
-                             subprocess.run(["git", "pull", "origin", "main"], cwd=path, capture_output=True)
-                             print(f"    {GREEN}Linked & Synced ✔{RESET}")
-                         except Exception as e:
-                             print(f"    {RED}Failed: {e}{RESET}")
-
-        elif remote_url:
-            # Clone Recovery
+
+                if res.returncode != 0:
+                    return finish("failed", f"Error during '{cmd[1]}': {res.stderr.strip()}")
+
+        return finish("updated", "Updated ✔")
+
+    if path and remote_url:
+        # Clone Recovery
+        progress(name, f"{GREY}Cloning...{RESET}")
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            res = subprocess.run(["git", "clone", remote_url, path], capture_output=True, text=True)
+            if res.returncode == 0:
+                return finish("cloned", "Recovered (Clone) ☁️ -> 💾")
+            return finish("failed", f"Clone Failed: {res.stderr.strip()}")
+        except Exception as e:
+            return finish("failed", f"Error: {e}")
+
+    return finish("needs_setup", "Missing & No Remote.")
+
+
+def sync_personas(personas: Dict[str, Dict], targets: List[str], max_workers: Optional[int] = None,
+                  progress: ProgressCallback = _quiet) -> List[PersonaResult]:
+    """Syncs the given personas concurrently (bounded by `max_workers`)."""
+    return _run_parallel(targets, lambda name: sync_persona(name, personas.get(name, {}), progress), max_workers)
+
+
+def _setup_sync_interactively(name: str, p_data: Dict) -> bool:
+    """Prompts to link or clone a persona that sync could not handle. Returns True if config changed."""
+    path = p_data.get("path")
+    print(f"  {CYAN}• {name.capitalize()}:{RESET}")
+
+    if path and os.path.exists(path):
+        # Exists but not Git-linked
+        if input(f"    {CYAN}? Initialize and link to remote? (y/N): {RESET}").strip().lower() == 'y':
+            new_remote = input(f"    {CYAN}? Remote Git URL: {RESET}").strip()
+            if new_remote:
+                try:
+                    subprocess.run(["git", "init"], cwd=path, check=True, capture_output=True)
+                    subprocess.run(["git", "branch", "-M", "main"], cwd=path, check=True, capture_output=True)
+                    subprocess.run(["git", "remote", "add", "origin", new_remote], cwd=path, check=True, capture_output=True)
+                    p_data["remote_url"] = new_remote
+                    print(f"    {GREY}Linking...{RESET}")
+                    subprocess.run(["git", "pull", "origin", "main"], cwd=path, capture_output=True)
+                    print(f"    {GREEN}Linked & Synced ✔{RESET}")
+                    return True
+                except Exception as e:
+                    print(f"    {RED}Failed: {e}{RESET}")
+        return False
+
+    # Missing & No Remote
+    if path and input(f"    {CYAN}? Clone from a URL? (y/N): {RESET}").strip().lower() == 'y':
+        new_remote = input(f"    {CYAN}? Remote Git URL: {RESET}").strip()
+        if new_remote:
             try:
                 os.makedirs(os.path.dirname(path), exist_ok=True)
-                res = subprocess.run(["git", "clone", remote_url, path], capture_output=True, text=True)
+                res = subprocess.run(["git", "clone", new_remote, path], capture_output=True, text=True)
                 if res.returncode == 0:
-                    print(f"{GREEN}Recovered (Clone) ☁️ -> 💾{RESET}")
-                else:
-                    print(f"{RED}Clone Failed: {res.stderr}{RESET}")
+                    print(f"    {GREEN}Recovered (Clone) ☁️ -> 💾{RESET}")
+                    p_data["remote_url"] = new_remote
+                    return True
+                print(f"    {RED}Clone Failed.{RESET}")
             except Exception as e:
-                print(f"{RED}Error: {e}{RESET}")
-        else:
-             # Missing & No Remote
-             print(f"{RED}Missing & No Remote.{RESET}")
-             if input(f"    {CYAN}? Clone from a URL? (y/N): {RESET}").strip().lower() == 'y':
-                 new_remote = input(f"    {CYAN}? Remote Git URL: {RESET}").strip()
-                 if new_remote:
-                     try:
-                        os.makedirs(os.path.dirname(path), exist_ok=True)
-                        res = subprocess.run(["git", "clone", new_remote, path], capture_output=True, text=True)
-                        if res.returncode == 0:
-                            print(f"    {GREEN}Recovered (Clone) ☁️ -> 💾{RESET}")
-                            p_data["remote_url"] = new_remote
-                            config_changed = True
-                        else:
-                            print(f"    {RED}Clone Failed.{RESET}")
-                     except Exception as e:
-                        print(f"    {RED}Error: {e}{RESET}")
+                print(f"    {RED}Error: {e}{RESET}")
+    return False
+
+
+def sync_all_personas(workers: Optional[int] = None):
+    """Smart Sync: Pulls updates or Clones missing brains. Interactive & Robust."""
+    config = load_config()
+    personas = config.get("personas", {})
+    if "programmer" not in personas: personas["programmer"] = {"path": DEFAULT_LIBRARY_PATH}
+
+    print(f"\n{MAGENTA}🔄 jcapy Sync Protocol{RESET}")
+    targets = _persona_targets(personas, "Sync All (Default)", "Select Target to Sync:", 25,
+                               lambda pending: "✅" if pending == 0 else "⚠️ Dirty")
+
+    print(f"\n{MAGENTA}⬇️  Syncing Selected Brains...{RESET}")
+    start = time.monotonic()
+    results = sync_personas(personas, targets, workers, progress=console_progress())
+    _summarize(results, time.monotonic() - start)
+
+    # Prompts can't interleave, so anything needing input is handled afterwards, one at a time
+    config_changed = False
+    for result in results:
+        if result.status == "needs_setup":
+            config_changed |= _setup_sync_interactively(result.name, personas.setdefault(result.name, {}))
 
     if config_changed:
         save_config(config)
@@ -152,130 +252,142 @@ def sync_all_personas():
     time.sleep(2)
 
 
-def push_all_personas():
-    """Iterates through all personas and pushes changes. Interactive."""
-    config = load_config()
-    personas = config.get("personas", {})
-    if "programmer" not in personas: personas["programmer"] = {"path": DEFAULT_LIBRARY_PATH}
+# ──────────────────────────────────────────────
+# Push
+# ──────────────────────────────────────────────
 
-    # 1. Build Menu Options
-    persona_keys = ["programmer"] + sorted([k for k in personas.keys() if k != "programmer"])
-    menu_options = ["Push All (Default)"]
+def push_persona(name: str, p_data: Dict, progress: ProgressCallback = _quiet) -> PersonaResult:
+    """Commits, rebases onto origin/main and pushes one persona. Never prompts."""
+    start = time.monotonic()
+    path = p_data.get("path")
 
-    for p in persona_keys:
-        p_data = personas.get(p, {})
-        path = p_data.get("path")
-        remote = p_data.get("remote_url", "No Remote")
-        short_remote = remote.replace("https://", "").replace("git@", "")[:20] + "..." if len(remote) > 20 else remote
+    def finish(status: str, message: str, remote_url: Optional[str] = None) -> PersonaResult:
+        duration = time.monotonic() - start
+        color = GREEN if status == "pushed" else (RED if status == "failed" else YELLOW)
+        progress(name, f"{color}{message}{RESET} {GREY}({duration:.1f}s){RESET}")
+        return PersonaResult(name, status, message, duration, remote_url)
 
-        last_sync, pending = get_git_status(path)
-        status = f"[{pending} pending]" if pending > 0 else "Clean"
+    if not path or not os.path.exists(path):
+        return PersonaResult(name, "skipped", "Path missing.")
 
-        menu_options.append(f"{p.capitalize()} [{short_remote}] {status}")
+    # Check for Git
+    if not os.path.exists(os.path.join(path, ".git")):
+        return finish("needs_setup", "Not a git repo.")
 
-    # 2. Select Target
-    print(f"\n{MAGENTA}🚀 jcapy Push Protocol{RESET}")
-    choice_idx = interactive_menu("Select Target to Push:", menu_options)
+    # Check Remote
+    res = subprocess.run(["git", "remote"], cwd=path, capture_output=True, text=True)
+    if "origin" not in res.stdout.split():
+        return finish("needs_setup", "No remote configured.")
 
-    if choice_idx == 0:
-        targets = persona_keys # All
-    else:
-        targets = [persona_keys[choice_idx - 1]] # Specific
+    try:
+        # Add
+        subprocess.run(["git", "add", "."], cwd=path, check=True, capture_output=True)
+        # Commit (ignore empty)
+        subprocess.run(["git", "commit", "-m", f"Brain Sync: {datetime.now()}"], cwd=path, capture_output=True)
 
-    print(f"\n{MAGENTA}⬆️  Pushing Selected Brains...{RESET}")
-    config_changed = False
+        # Pull (Rebase) - Sync with remote before pushing
+        progress(name, f"{GREY}Syncing (Rebase)...{RESET}")
+        pull_res = subprocess.run(["git", "pull", "origin", "main", "--rebase"], cwd=path, capture_output=True, text=True)
 
-    for name in targets:
-        p_data = personas.get(name, {})
-        path = p_data.get("path")
+        if pull_res.returncode != 0 and "no tracking information" not in pull_res.stderr:
+            progress(name, f"{YELLOW}Pull/Rebase encountered issues. Trying to push anyway (might fail)...{RESET}")
 
-        if not path or not os.path.exists(path): continue
+        # Push
+        res = subprocess.run(["git", "push", "origin", "main"], cwd=path, capture_output=True, text=True)
+        if res.returncode != 0:
+            # Try master fallback
+            res = subprocess.run(["git", "push", "origin", "master"], cwd=path, capture_output=True, text=True)
 
-        print(f"  {CYAN}• {name.capitalize()}:{RESET} ", end="", flush=True)
+        if res.returncode != 0:
+            return finish("failed", "Push Failed.")
 
-        # Check for Git
-        if not os.path.exists(os.path.join(path, ".git")):
-             print(f"{YELLOW} Not a git repo.{RESET}")
-             if input(f"    {CYAN}? Initialize Git? (y/N): {RESET}").strip().lower() == 'y':
-                 try:
-                     subprocess.run(["git", "init"], cwd=path, check=True, capture_output=True)
-                     subprocess.run(["git", "branch", "-M", "main"], cwd=path, check=True, capture_output=True)
-                     print(f"    {GREEN}Initialized.{RESET}")
-                 except:
-                     print(f"    {RED}Failed.{RESET}")
-                     continue
-             else:
-                 continue
-
-        # Check Remote
-        has_remote = False
+        remote_url = None
+        if "remote_url" not in p_data:
+            remote_url = subprocess.check_output(["git", "remote", "get-url", "origin"], cwd=path).decode().strip()
+        return finish("pushed", "Synced ✔", remote_url)
+    except Exception as e:
+        return finish("failed", f"Error: {e}")
+
+
+def push_personas(personas: Dict[str, Dict], targets: List[str], max_workers: Optional[int] = None,
+                  progress: ProgressCallback = _quiet) -> List[PersonaResult]:
+    """Pushes the given personas concurrently (bounded by `max_workers`)."""
+    return _run_parallel(targets, lambda name: push_persona(name, personas.get(name, {}), progress), max_workers)
+
+
+def _setup_push_interactively(name: str, p_data: Dict) -> bool:
+    """Prompts to initialise git / add a remote. Returns True if the persona is ready to push."""
+    path = p_data.get("path")
+    print(f"  {CYAN}• {name.capitalize()}:{RESET}")
+
+    if not os.path.exists(os.path.join(path, ".git")):
+        if input(f"    {CYAN}? Initialize Git? (y/N): {RESET}").strip().lower() != 'y':
+            return False
         try:
-            res = subprocess.run(["git", "remote"], cwd=path, capture_output=True, text=True)
-            if "origin" in res.stdout:
-                has_remote = True
-        except: pass
-
-        if not has_remote:
-            print(f"{YELLOW} No remote configured.{RESET}")
-            if input(f"    {CYAN}? Add Remote URL? (y/N): {RESET}").strip().lower() == 'y':
-                url = input(f"    {CYAN}? URL: {RESET}").strip()
-                if url:
-                    try:
-                        subprocess.run(["git", "remote", "add", "origin", url], cwd=path, check=True, capture_output=True)
-                        print(f"    {GREEN}Remote added.{RESET}")
-                        personas[name]["remote_url"] = url
-                        config_changed = True
-                        has_remote = True
-                    except:
-                        print(f"    {RED}Failed to add remote.{RESET}")
-
-        if has_remote:
+            subprocess.run(["git", "init"], cwd=path, check=True, capture_output=True)
+            subprocess.run(["git", "branch", "-M", "main"], cwd=path, check=True, capture_output=True)
+            print(f"    {GREEN}Initialized.{RESET}")
+        except Exception:
+            print(f"    {RED}Failed.{RESET}")
+            return False
+
+    res = subprocess.run(["git", "remote"], cwd=path, capture_output=True, text=True)
+    if "origin" in res.stdout.split():
+        return True
+
+    if input(f"    {CYAN}? Add Remote URL? (y/N): {RESET}").strip().lower() == 'y':
+        url = input(f"    {CYAN}? URL: {RESET}").strip()
+        if url:
             try:
-                # Add
-                subprocess.run(["git", "add", "."], cwd=path, check=True, capture_output=True)
-                # Commit (ignore empty)
-                subprocess.run(["git", "commit", "-m", f"Brain Sync: {datetime.now()}"], cwd=path, capture_output=True)
-
-                # Pull (Rebase) - Sync with remote before pushing
-                print(f"    {GREY}Syncing (Rebase)...{RESET}", end="", flush=True)
-                pull_res = subprocess.run(["git", "pull", "origin", "main", "--rebase"], cwd=path, capture_output=True, text=True)
-
-                if pull_res.returncode != 0:
-                     # Check if it was just "no upstream"
-                     if "no tracking information" in pull_res.stderr:
-                         pass # New repo, just push
-                     else:
-                         print(f"\n    {YELLOW}Pull/Rebase encountered issues. Trying to push anyway (might fail)...{RESET}")
-
-                # Push
-                res = subprocess.run(["git", "push", "origin", "main"], cwd=path, capture_output=True, text=True)
-                if res.returncode != 0:
-                     # Try master fallback
-                     res = subprocess.run(["git", "push", "origin", "master"], cwd=path, capture_output=True, text=True)
+                subprocess.run(["git", "remote", "add", "origin", url], cwd=path, check=True, capture_output=True)
+                print(f"    {GREEN}Remote added.{RESET}")
+                p_data["remote_url"] = url
+                return True
+            except Exception:
+                print(f"    {RED}Failed to add remote.{RESET}")
 
-                if res.returncode == 0:
-                    print(f"{GREEN}Synced ✔{RESET}")
-                    # Update config if remote wasn't there
-                    if "remote_url" not in personas[name]:
-                        # Get URL
-                        url = subprocess.check_output(["git", "remote", "get-url", "origin"], cwd=path).decode().strip()
-                        personas[name]["remote_url"] = url
-                        config_changed = True
-                else:
-                    print(f"{RED}Push Failed.{RESET}")
-                    # Prompt to Change Remote?
-                    if input(f"    {CYAN}? Push Failed. Change Remote URL? (y/N): {RESET}").strip().lower() == 'y':
-                        new_url = input(f"    {CYAN}? New URL: {RESET}").strip()
-                        if new_url:
-                            subprocess.run(["git", "remote", "set-url", "origin", new_url], cwd=path, check=True)
-                            personas[name]["remote_url"] = new_url
-                            config_changed = True
-                            print(f"    {GREEN}Remote Updated. Try pushing again.{RESET}")
+    print(f"    {GREY}Skipped (No Remote){RESET}")
+    return False
 
-            except Exception as e:
-                 print(f"{RED}Error: {e}{RESET}")
-        else:
-             print(f"{GREY} Skipped (No Remote){RESET}")
+
+def push_all_personas(workers: Optional[int] = None):
+    """Pushes changes for all selected personas concurrently. Interactive."""
+    config = load_config()
+    personas = config.get("personas", {})
+    if "programmer" not in personas: personas["programmer"] = {"path": DEFAULT_LIBRARY_PATH}
+
+    print(f"\n{MAGENTA}🚀 jcapy Push Protocol{RESET}")
+    targets = _persona_targets(personas, "Push All (Default)", "Select Target to Push:", 20,
+                               lambda pending: f"[{pending} pending]" if pending > 0 else "Clean")
+
+    print(f"\n{MAGENTA}⬆️  Pushing Selected Brains...{RESET}")
+    progress = console_progress()
+    start = time.monotonic()
+    results = push_personas(personas, targets, workers, progress=progress)
+    config_changed = False
+
+    # Interactive follow-ups run one at a time after the parallel pass
+    for i, result in enumerate(results):
+        p_data = personas.setdefault(result.name, {})
+        if result.status == "needs_setup" and _setup_push_interactively(result.name, p_data):
+            config_changed = True
+            results[i] = result = push_persona(result.name, p_data, progress)
+
+        if result.remote_url:
+            p_data["remote_url"] = result.remote_url
+            config_changed = True
+
+        if result.status == "failed" and result.message == "Push Failed.":
+            # Prompt to Change Remote?
+            if input(f"    {CYAN}? {result.name.capitalize()}: Push Failed. Change Remote URL? (y/N): {RESET}").strip().lower() == 'y':
+                new_url = input(f"    {CYAN}? New URL: {RESET}").strip()
+                if new_url:
+                    subprocess.run(["git", "remote", "set-url", "origin", new_url], cwd=p_data.get("path"), check=True)
+                    p_data["remote_url"] = new_url
+                    config_changed = True
+                    print(f"    {GREEN}Remote Updated. Try pushing again.{RESET}")
+
+    _summarize([r for r in results if r.status != "skipped"], time.monotonic() - start)
 
     if config_changed:
         save_config(config)
@@ -3,7 +3,9 @@ import os
 import json
 import shutil
 import sys
-from jcapy.core.config_manager import ConfigManager
+import threading
+from jcapy.core.config_manager import ConfigManager, thaw
+from jcapy.utils.startup_profile import timed
 
 # ==========================================
 # CONFIGURATION & CONSTANTS
@@ -42,8 +44,28 @@ def get_default_library_path():
     # 3. Always return the external path as the source of truth
     return EXTERNAL_LIB_PATH
 
-DEFAULT_LIBRARY_PATH = get_default_library_path()
-TEMPLATE_PATH = os.path.join(DEFAULT_LIBRARY_PATH, "templates/skill.md")
+_default_library_path = None
+_default_library_lock = threading.Lock()
+
+def _resolve_default_library_path():
+    """get_default_library_path(), resolved once on first use rather than at import."""
+    global _default_library_path
+    if _default_library_path is None:
+        with _default_library_lock:
+            if _default_library_path is None:
+                with timed("config: default library"):
+                    _default_library_path = get_default_library_path()
+    return _default_library_path
+
+def __getattr__(name):
+    # DEFAULT_LIBRARY_PATH / TEMPLATE_PATH are computed on first access: resolving
+    # them may copy the bundled library, which `jcapy --version` shouldn't pay for
+    if name == "DEFAULT_LIBRARY_PATH":
+        return _resolve_default_library_path()
+    if name == "TEMPLATE_PATH":
+        return os.path.join(_resolve_default_library_path(), "templates/skill.md")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # We'll need to ensure logo.md is moved or embedded. For now, referencing it relative to BASE_DIR if it exists there.
 LOGO_PATH = os.path.join(BASE_DIR, "logo.md")
 
@@ -51,7 +73,9 @@ LOGO_PATH = os.path.join(BASE_DIR, "logo.md")
 # CONFIGURATION MANAGEMENT
 # ==========================================
 def load_config():
-    return CONFIG_MANAGER.get_all()
+    """Mutable copy of the saved config, for read-modify-save_config() callers.
+    Read-only callers should use CONFIG_MANAGER.get()/snapshot(), which don't copy."""
+    return thaw(CONFIG_MANAGER.get_all())
 
 def save_config(data):
     CONFIG_MANAGER.set_all(data)
@@ -101,18 +125,19 @@ def set_api_key(provider, key):
     return True, f"Successfully saved {provider.capitalize()} API key."
 
 def get_active_library_path():
-    config = load_config()
+    config = CONFIG_MANAGER.snapshot().data
     current_persona = config.get("current_persona", "programmer")
     personas = config.get("personas", {})
 
     if current_persona in personas:
-        return personas[current_persona].get("path", DEFAULT_LIBRARY_PATH)
+        persona = personas[current_persona]
+        return persona["path"] if "path" in persona else _resolve_default_library_path()
 
     # Default to Programmer/Default path
-    return DEFAULT_LIBRARY_PATH
+    return _resolve_default_library_path()
 
 def get_current_persona_name():
-    config = load_config()
+    config = CONFIG_MANAGER.snapshot().data
     return config.get("current_persona", "programmer").capitalize()
 
 def load_config_local():
@@ -206,8 +231,8 @@ DEFAULT_LAYOUT = {
 }
 
 def get_dashboard_layout():
-    """Get dashboard widget layout."""
-    return CONFIG_MANAGER.get("dashboard_layout", DEFAULT_LAYOUT)
+    """Get dashboard widget layout (a mutable copy; save edits with set_dashboard_layout)."""
+    return thaw(CONFIG_MANAGER.get("dashboard_layout", DEFAULT_LAYOUT))
 
 def set_dashboard_layout(layout):
     """Set dashboard widget layout."""
@@ -215,8 +240,8 @@ def set_dashboard_layout(layout):
     return True
 
 def get_dashboard_dimensions():
-    """Get dashboard widget dimensions (widths/heights)."""
-    return CONFIG_MANAGER.get("dashboard_dimensions", {})
+    """Get dashboard widget dimensions (widths/heights) as a mutable copy."""
+    return thaw(CONFIG_MANAGER.get("dashboard_dimensions", {}))
 
 def set_dashboard_dimensions(dimensions):
     """Set dashboard widget dimensions (widths/heights)."""
@@ -1,2 +1,12 @@
 # SPDX-License-Identifier: Apache-2.0
-from .plugins import get_registry, CommandRegistry
+# get_registry/CommandRegistry are resolved on first access so that importing
+# a light submodule (config_manager, bus, ...) doesn't load the plugin system.
+
+__all__ = ["get_registry", "CommandRegistry"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        from . import plugins
+        return getattr(plugins, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,260 @@
+import atexit
+import gzip
 import os
 import json
+import re
+import shutil
+import threading
 import time
 import uuid
-from typing import Any, Dict, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from jcapy.core.bus import get_event_bus
+from jcapy.utils.startup_profile import timed
+from jcapy.utils.write_behind import WriteBehindQueue, flush_defaults
+
+try:
+    import fcntl
+except ImportError:  # Windows: os.link below still never overwrites a segment
+    fcntl = None
+
+DEFAULT_FLUSH_INTERVAL, DEFAULT_FLUSH_RECORDS = flush_defaults('JCAPY_AUDIT', 0.5, 256)
+DEFAULT_MAX_BYTES = int(os.environ.get('JCAPY_AUDIT_MAX_BYTES', 64 * 1024 * 1024))
+DEFAULT_MAX_PENDING = int(os.environ.get('JCAPY_AUDIT_MAX_PENDING', 100000))
+DEFAULT_FSYNC = os.environ.get('JCAPY_AUDIT_FSYNC', '1').lower() not in ('0', 'false', 'no', 'off')
+DEFAULT_COMPRESS = os.environ.get('JCAPY_AUDIT_COMPRESS', '0').lower() in ('1', 'true', 'yes', 'on')
+
+
+def list_segments(audit_file: str) -> List[str]:
+    """Closed segments of an audit log (oldest first), then the active file."""
+    directory, base = os.path.split(audit_file)
+    pattern = re.compile(re.escape(base) + r"\.(\d+)(\.gz)?$")
+    segments = []
+    try:
+        for name in os.listdir(directory or "."):
+            match = pattern.match(name)
+            if match:
+                segments.append((int(match.group(1)), os.path.join(directory, name)))
+    except FileNotFoundError:
+        return []
+    paths = [path for _, path in sorted(segments)]
+    if os.path.exists(audit_file):
+        paths.append(audit_file)
+    return paths
+
+
+class AuditWriter:
+    """
+    Background group-commit writer for an append-only JSONL file.
+
+    Records are buffered in memory and written by a single thread in one
+    write() per batch, when `flush_records` are pending or `flush_interval`
+    elapses. Each batch is fsync'd unless `fsync=False`. When the active
+    file reaches `max_bytes` it is renamed to `<file>.<N>` (gzip'd if
+    `compress`) and a fresh file is started. Rotation holds an flock on
+    `<file>.lock`, so writers in several processes rotate one at a time.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        flush_records: int = DEFAULT_FLUSH_RECORDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        fsync: bool = DEFAULT_FSYNC,
+        compress: bool = DEFAULT_COMPRESS,
+        max_pending: int = DEFAULT_MAX_PENDING
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.fsync = fsync
+        self.compress = compress
+
+        self._queue = WriteBehindQueue(
+            self._commit, "jcapy-audit-writer", flush_interval, flush_records,
+            max_pending=max_pending, on_stop=self._close_file
+        )
+        self._file = None
+        self._inode = None
+        self.lock_file = path + ".lock"
+        self._compressors: List[threading.Thread] = []
+
+        self.started_at = time.time()
+        self.records_written = 0
+        self.bytes_written = 0
+        self.batches = 0
+        self.fsyncs = 0
+        self.rotations = 0
+        self.errors = 0
+        self.last_batch_seconds = 0.0
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def write(self, line: str):
+        """Queue one serialized record. Blocks only if `max_pending` records are waiting."""
+        self._queue.put(line)
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Write everything queued so far. Returns False if it timed out."""
+        return self._queue.flush(timeout)
+
+    def close(self, timeout: float = 5.0):
+        self._queue.close(timeout)
+        # Don't leave a segment half-compressed at exit
+        for compressor in self._compressors:
+            compressor.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        depth = self._queue.depth()
+        elapsed = max(time.time() - self.started_at, 1e-9)
+        return {
+            "queue_depth": depth,
+            "records_written": self.records_written,
+            "bytes_written": self.bytes_written,
+            "batches": self.batches,
+            "avg_batch": round(self.records_written / self.batches, 1) if self.batches else 0.0,
+            "records_per_second": round(self.records_written / elapsed, 1),
+            "bytes_per_second": round(self.bytes_written / elapsed, 1),
+            "last_batch_seconds": round(self.last_batch_seconds, 6),
+            "fsyncs": self.fsyncs,
+            "rotations": self.rotations,
+            "errors": self.errors,
+        }
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _commit(self, batch: List[str]) -> bool:
+        data = "".join(batch).encode("utf-8")
+        start = time.perf_counter()
+        try:
+            f = self._open()
+            f.write(data)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+                self.fsyncs += 1
+        except OSError:
+            # Audit logging must never take the agent down; the batch is dropped
+            self.errors += 1
+            self._close_file()
+            return True
+        self.last_batch_seconds = time.perf_counter() - start
+        self.records_written += len(batch)
+        self.bytes_written += len(data)
+        self.batches += 1
+
+        if self.max_bytes and f.tell() >= self.max_bytes:
+            self._rotate()
+        return True
+
+    def _open(self):
+        # Another process may have rotated the file underneath us
+        try:
+            inode = os.stat(self.path).st_ino
+        except FileNotFoundError:
+            inode = None
+        if self._file is not None and inode != self._inode:
+            self._close_file()
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._file = open(self.path, "ab")
+            self._inode = os.fstat(self._file.fileno()).st_ino
+        return self._file
+
+    def _close_file(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+            self._inode = None
+
+    @contextmanager
+    def _rotation_lock(self):
+        if fcntl is None:
+            yield
+            return
+        fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)  # releases the lock
+
+    def _rotate(self):
+        self._close_file()
+        try:
+            with self._rotation_lock():
+                segment = self._claim_segment()
+        except OSError:
+            self.errors += 1
+            return
+        if segment is None:
+            return
+        self.rotations += 1
+        if self.compress:
+            compressor = threading.Thread(target=self._compress, args=(segment,),
+                                          name="jcapy-audit-gzip", daemon=True)
+            self._compressors = [t for t in self._compressors if t.is_alive()] + [compressor]
+            compressor.start()
+
+    def _claim_segment(self) -> Optional[str]:
+        """Move the active file to the next free segment number (caller holds the lock)."""
+        try:
+            if os.stat(self.path).st_size < self.max_bytes:
+                return None  # another process rotated it first
+        except FileNotFoundError:
+            return None
+        last = 0
+        for segment in list_segments(self.path):
+            match = re.search(r"\.(\d+)(\.gz)?$", segment)
+            if match and segment != self.path:
+                last = max(last, int(match.group(1)))
+        while True:
+            last += 1
+            segment = f"{self.path}.{last:06d}"
+            if os.path.exists(segment + ".gz"):
+                continue
+            try:
+                # Unlike rename, link refuses to replace an existing segment
+                os.link(self.path, segment)
+            except FileExistsError:
+                continue
+            except OSError:  # no hard links on this filesystem
+                if os.path.exists(segment):
+                    continue
+                os.rename(self.path, segment)
+                return segment
+            os.unlink(self.path)
+            return segment
+
+    @staticmethod
+    def _compress(segment: str):
+        tmp = segment + ".gz.tmp"
+        try:
+            with open(segment, "rb") as src, gzip.open(tmp, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(tmp, segment + ".gz")
+            os.remove(segment)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
 
 class AuditLogger:
     """
     Persistent, append-only logger for JCapy Agent events (2.4).
-    Logs to ~/.jcapy/audit.jsonl
+    Logs to ~/.jcapy/audit.jsonl through a background AuditWriter;
+    call flush() when records must be on disk before continuing.
     """
-    def __init__(self, audit_file: Optional[str] = None):
+    def __init__(self, audit_file: Optional[str] = None, writer: Optional[AuditWriter] = None,
+                 subscribe: bool = True):
         if audit_file is None:
             home = os.path.expanduser("~")
             self.audit_file = os.path.join(home, ".jcapy", "audit.jsonl")
@@ -18,10 +263,11 @@ class AuditLogger:
 
         os.makedirs(os.path.dirname(self.audit_file), exist_ok=True)
         self.session_id = str(uuid.uuid4())
+        self.writer = writer or AuditWriter(self.audit_file)
 
         # Subscribe to AUDIT_LOG events (2.4 Decoupling)
-        from jcapy.core.bus import get_event_bus
-        get_event_bus().subscribe("AUDIT_LOG", self.handle_event)
+        if subscribe:
+            get_event_bus().subscribe("AUDIT_LOG", self.handle_event)
 
     def handle_event(self, event_data: Dict[str, Any]) -> None:
         """
@@ -43,6 +289,7 @@ class AuditLogger:
     ) -> None:
         """
         Append an event to the audit log.
+        The record is serialized here, so later changes to `payload` don't leak in.
         """
         event = {
             "timestamp": time.time(),
@@ -54,24 +301,47 @@ class AuditLogger:
         }
 
         try:
-            with open(self.audit_file, 'a') as f:
-                f.write(json.dumps(event) + "\n")
-        except IOError as e:
-            # We don't want to crash the agent if logging fails,
-            # but we should at least print to stderr in dev
+            self.writer.write(json.dumps(event, default=str) + "\n")
+        except (TypeError, ValueError):
+            # We don't want to crash the agent if logging fails
             pass
 
-# Global instance for easy access
-_global_audit_logger = AuditLogger()
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        return self.writer.flush(timeout)
+
+    def close(self):
+        self.writer.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return self.writer.stats()
+
+# Global instance for easy access, created on first use so that importing
+# this module doesn't create ~/.jcapy or start the writer
+_global_audit_logger: Optional[AuditLogger] = None
+_global_lock = threading.Lock()
 
 def get_audit_logger() -> AuditLogger:
+    global _global_audit_logger
+    if _global_audit_logger is None:
+        with _global_lock:
+            if _global_audit_logger is None:
+                with timed("audit logger"):
+                    _global_audit_logger = AuditLogger(subscribe=False)
+                atexit.register(_global_audit_logger.close)
     return _global_audit_logger
 
+def _forward_event(event_data: Dict[str, Any]) -> None:
+    get_audit_logger().handle_event(event_data)
+
+# AUDIT_LOG events published before anything called get_audit_logger() still
+# reach the global logger, which is created by the first one
+get_event_bus().subscribe("AUDIT_LOG", _forward_event)
+
 def audit_log(event_type: str, payload: Dict[str, Any], outcome: Optional[str] = None) -> None:
     """
     Convenience function to log an audit event using the global logger.
     """
-    _global_audit_logger.log_event(
+    get_audit_logger().log_event(
         event_type=event_type,
         agent_id="system",
         payload=payload,
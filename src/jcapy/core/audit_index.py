@@ -0,0 +1,311 @@
+"""
+Sidecar query index for the audit log.
+
+A SQLite database next to audit.jsonl (audit.index.db) holds one row per
+record: its timestamp, event type, session and agent plus the segment and
+byte offset where the full JSON line lives. Lookups by time range, event
+type or session use B-tree indexes instead of scanning the log.
+
+Indexing is incremental and pull-based: refresh() reads only bytes appended
+since the last run. Segments are identified by a fingerprint of their first
+line, so rotation (audit.jsonl -> audit.jsonl.NNNNNN) and gzip compression
+don't invalidate rows already indexed.
+"""
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from jcapy.core.audit import list_segments
+
+COMMIT_EVERY = 5000
+
+
+@dataclass(frozen=True)
+class AuditQuery:
+    """Filters for AuditIndex.query. All set fields must match."""
+    start: Optional[float] = None       # inclusive, epoch seconds
+    end: Optional[float] = None         # exclusive, epoch seconds
+    event_type: Optional[str] = None
+    session_id: Optional[str] = None    # exact id, or a prefix ending in '*'
+    agent_id: Optional[str] = None
+
+
+def _open_segment(path: str):
+    return gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")
+
+
+def _fingerprint(path: str) -> Optional[str]:
+    """Hash of the segment's first complete line, or None if it has none yet."""
+    try:
+        with _open_segment(path) as f:
+            first = f.readline()
+    except (OSError, EOFError):
+        return None
+    if not first.endswith(b"\n"):
+        return None
+    return hashlib.sha1(first).hexdigest()
+
+
+def encode_cursor(ts: float, rowid: int) -> str:
+    return f"{ts!r}:{rowid}"
+
+
+def decode_cursor(cursor: str) -> Tuple[float, int]:
+    ts, _, rowid = cursor.rpartition(":")
+    return float(ts), int(rowid)
+
+
+class AuditIndex:
+    """Incrementally maintained SQLite index over an audit log and its rotated segments."""
+
+    def __init__(self, audit_file: str, index_path: Optional[str] = None):
+        self.audit_file = audit_file
+        self.index_path = index_path or os.path.splitext(audit_file)[0] + ".index.db"
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode: writers open their own BEGIN IMMEDIATE transactions
+        conn = sqlite3.connect(self.index_path, timeout=10.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @staticmethod
+    @contextmanager
+    def _write(conn: sqlite3.Connection):
+        """Write transaction holding the database lock from the first read."""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    def _init_db(self):
+        os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS segments (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    fingerprint TEXT UNIQUE NOT NULL,
+                    path TEXT NOT NULL,
+                    indexed_bytes INTEGER NOT NULL DEFAULT 0,
+                    complete INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE TABLE IF NOT EXISTS events (
+                    segment_id INTEGER NOT NULL,
+                    offset INTEGER NOT NULL,
+                    length INTEGER NOT NULL,
+                    ts REAL NOT NULL,
+                    event_type TEXT,
+                    session_id TEXT,
+                    agent_id TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_events_ts ON events(ts);
+                CREATE INDEX IF NOT EXISTS idx_events_type_ts ON events(event_type, ts);
+                CREATE INDEX IF NOT EXISTS idx_events_session_ts ON events(session_id, ts);
+            """)
+            conn.commit()
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> int:
+        """
+        Index records appended since the last refresh. Returns how many were added.
+
+        Each batch is read and inserted inside one BEGIN IMMEDIATE transaction
+        that re-reads the segment's `indexed_bytes`, so several processes
+        refreshing the same index never insert a record twice.
+        """
+        added = 0
+        with self._lock:
+            conn = self._connect()
+            try:
+                on_disk = set()
+                for path in list_segments(self.audit_file):
+                    fingerprint = _fingerprint(path)
+                    if fingerprint is None:
+                        continue
+                    on_disk.add(fingerprint)
+                    added += self._index_segment(conn, path, fingerprint, closed=path != self.audit_file)
+
+                # Segments deleted from disk (e.g. retention) drop out of the index
+                with self._write(conn):
+                    for seg_id, fingerprint in conn.execute("SELECT id, fingerprint FROM segments").fetchall():
+                        if fingerprint not in on_disk:
+                            conn.execute("DELETE FROM events WHERE segment_id = ?", (seg_id,))
+                            conn.execute("DELETE FROM segments WHERE id = ?", (seg_id,))
+            finally:
+                conn.close()
+        return added
+
+    @staticmethod
+    def _segment_row(conn: sqlite3.Connection, path: str, fingerprint: str) -> Tuple[int, int, int]:
+        row = conn.execute(
+            "SELECT id, path, indexed_bytes, complete FROM segments WHERE fingerprint = ?", (fingerprint,)
+        ).fetchone()
+        if row is None:
+            cur = conn.execute("INSERT INTO segments (fingerprint, path) VALUES (?, ?)", (fingerprint, path))
+            return cur.lastrowid, 0, 0
+        seg_id, old_path, indexed_bytes, complete = row
+        if old_path != path:
+            conn.execute("UPDATE segments SET path = ? WHERE id = ?", (path, seg_id))
+        return seg_id, indexed_bytes, complete
+
+    def _index_segment(self, conn: sqlite3.Connection, path: str, fingerprint: str, closed: bool) -> int:
+        added = 0
+        offset = None
+        with _open_segment(path) as f:
+            while True:
+                with self._write(conn):
+                    seg_id, indexed_bytes, complete = self._segment_row(conn, path, fingerprint)
+                    if offset is None:
+                        offset = indexed_bytes
+                        f.seek(offset)
+                    elif indexed_bytes != offset:
+                        return added  # Another process indexed past us; it owns the rest
+                    if complete:
+                        return added
+
+                    batch, offset, full = self._read_batch(f, seg_id, offset)
+                    if offset != indexed_bytes:
+                        self._insert(conn, seg_id, batch, offset)
+                    if not full:
+                        if closed:
+                            conn.execute("UPDATE segments SET complete = 1 WHERE id = ?", (seg_id,))
+                        return added + len(batch)
+                added += len(batch)
+
+    @staticmethod
+    def _read_batch(f, seg_id: int, offset: int) -> Tuple[List[Tuple], int, bool]:
+        """Parse up to COMMIT_EVERY complete records from `offset`; True if more may follow."""
+        batch: List[Tuple] = []
+        for line in f:
+            if not line.endswith(b"\n"):
+                break  # Partially written record; picked up next refresh
+            try:
+                record = json.loads(line)
+                batch.append((seg_id, offset, len(line), float(record.get("timestamp", 0.0)),
+                              record.get("event_type"), record.get("session_id"), record.get("agent_id")))
+            except (ValueError, TypeError, AttributeError):
+                pass  # Not a record; skip but keep the offset moving
+            offset += len(line)
+            if len(batch) >= COMMIT_EVERY:
+                return batch, offset, True
+        return batch, offset, False
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, seg_id: int, batch: List[Tuple], offset: int):
+        conn.executemany(
+            "INSERT INTO events (segment_id, offset, length, ts, event_type, session_id, agent_id) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)", batch
+        )
+        conn.execute("UPDATE segments SET indexed_bytes = ? WHERE id = ?", (offset, seg_id))
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def _where(self, q: AuditQuery, after: Optional[str]) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        if q.start is not None:
+            clauses.append("e.ts >= ?")
+            params.append(q.start)
+        if q.end is not None:
+            clauses.append("e.ts < ?")
+            params.append(q.end)
+        if q.event_type:
+            clauses.append("e.event_type = ?")
+            params.append(q.event_type)
+        if q.session_id:
+            if q.session_id.endswith("*"):
+                clauses.append("e.session_id >= ? AND e.session_id < ?")
+                prefix = q.session_id[:-1]
+                params.extend([prefix, prefix + "￿"])
+            else:
+                clauses.append("e.session_id = ?")
+                params.append(q.session_id)
+        if q.agent_id:
+            clauses.append("e.agent_id = ?")
+            params.append(q.agent_id)
+        if after:
+            ts, rowid = decode_cursor(after)
+            clauses.append("(e.ts > ? OR (e.ts = ? AND e.rowid > ?))")
+            params.extend([ts, ts, rowid])
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(self, q: AuditQuery = AuditQuery(), limit: Optional[int] = None,
+              after: Optional[str] = None, refresh: bool = True) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Stream matching records in time order as (cursor, record) pairs.
+        Pass the last cursor back as `after` to fetch the next page.
+        """
+        if refresh:
+            self.refresh()
+        where, params = self._where(q, after)
+        sql = ("SELECT e.rowid, e.ts, e.offset, e.length, s.path FROM events e "
+               "JOIN segments s ON s.id = e.segment_id" + where + " ORDER BY e.ts, e.rowid")
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        conn = self._connect()
+        handles: Dict[str, Any] = {}
+        try:
+            for rowid, ts, offset, length, path in conn.execute(sql, params):
+                f = handles.get(path)
+                if f is None:
+                    try:
+                        f = handles[path] = _open_segment(path)
+                    except OSError:
+                        continue  # Segment vanished since the last refresh
+                f.seek(offset)
+                yield encode_cursor(ts, rowid), json.loads(f.read(length))
+        finally:
+            for f in handles.values():
+                f.close()
+            conn.close()
+
+    def count(self, q: AuditQuery = AuditQuery(), refresh: bool = True) -> int:
+        if refresh:
+            self.refresh()
+        where, params = self._where(q, None)
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT COUNT(*) FROM events e" + where, params).fetchone()[0]
+        finally:
+            conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        conn = self._connect()
+        try:
+            events, first, last = conn.execute("SELECT COUNT(*), MIN(ts), MAX(ts) FROM events").fetchone()
+            segments = conn.execute("SELECT COUNT(*) FROM segments").fetchone()[0]
+        finally:
+            conn.close()
+        return {"events": events, "segments": segments, "first_ts": first, "last_ts": last,
+                "index_path": self.index_path}
+
+    def rebuild(self) -> int:
+        """Drop and rebuild the whole index."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                with self._write(conn):
+                    conn.execute("DELETE FROM events")
+                    conn.execute("DELETE FROM segments")
+            finally:
+                conn.close()
+        return self.refresh()
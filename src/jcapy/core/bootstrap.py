@@ -1,225 +1,310 @@
 # SPDX-License-Identifier: Apache-2.0
-from jcapy.core.plugins import CommandRegistry
-import sys
-import os
-
-# Import commands
-from jcapy.commands.frameworks import list_frameworks, harvest_framework, search_frameworks, delete_framework, merge_frameworks, apply_framework
-from jcapy.commands.brain import select_persona, open_brain_vscode, run_brainstorm_wizard
-from jcapy.commands.sync import sync_all_personas, push_all_personas
-from jcapy.commands.project import init_project, deploy_project, map_project_patterns
-from jcapy.commands.install import InstallCommand
-from jcapy.commands.manage import ManageCommand
-from jcapy.commands.core import MemorizeCommand, RecallCommand, ConfigCommand
-from jcapy.commands.doctor import DoctorCommand
-from jcapy.commands.core_cmd import run_undo, setup_undo, run_suggest, run_tutorial, setup_tutorial, run_tui
-from jcapy.commands.theme import ThemeCommand
-from jcapy.commands.grep import GrepCommand
-from jcapy.commands.edit import EditCommand
-from jcapy.commands.version import run_version
-from jcapy.commands.daemon_cmd import register_parser as register_daemon_parser
-from jcapy.ui.ux.safety import get_undo_stack
-from jcapy.ui.ux.feedback import show_success, show_error
-from jcapy.config import get_active_library_path, load_config
+"""
+Built-in command manifest.
 
+Commands are declared as CommandSpec entries pointing at "module:attr"
+targets. Registration only records names, help text and parser specs; the
+implementing module is imported the first time the command is dispatched,
+so CLI/TUI cold start does not pay for every command's dependencies.
 
-def register_core_commands(registry):
-    """
-    Register all built-in commands.
-    This acts as the 'Standard Library' of JCapy.
+Parser specs live here (not in the command modules) for the same reason:
+argparse needs them up front. tests/core/test_bootstrap.py checks they stay
+in sync with the CommandBase classes' own `setup_parser`.
+"""
+import argparse
 
-    Commands are organized into categories:
-    ─────────────────────────────────────────────
-    🏗️  PROJECT LIFECYCLE    init, deploy, map
-    📦  SKILL LIBRARY        list, harvest, search, delete, merge, apply, install
-    🧠  KNOWLEDGE & MEMORY   memorize, recall, persona, brain, ask
-    🩺  DIAGNOSTICS & CONFIG  doctor, config, theme, manage, undo
-    🤖  AI-POWERED           brainstorm, suggest, fix, explore
-    🔌  INFRASTRUCTURE       tui, mcp, sync, push, code, tutorial
-    ─────────────────────────────────────────────
+from jcapy.core.plugins import CommandRegistry, CommandSpec, SilentParser
 
-    Interactive commands (suspend TUI for raw terminal I/O):
-      init, deploy, harvest, persona, tutorial, brainstorm, tui, install, apply
-    """
 
-    # ══════════════════════════════════════════
-    # 🏗️  PROJECT LIFECYCLE
-    # ══════════════════════════════════════════
+# ══════════════════════════════════════════
+# Parser specs
+# ══════════════════════════════════════════
 
-    def setup_init(parser):
-        parser.add_argument("--grade", choices=["A", "B", "C"], help="Project Grade (Headless)")
+def setup_init(parser):
+    parser.add_argument("--grade", choices=["A", "B", "C"], help="Project Grade (Headless)")
 
-    registry.register("init", lambda args: init_project(
-        grade=getattr(args, 'grade', None),
-        tui_data=getattr(args, 'tui_data', None)
-    ), "Scaffold One-Army Project", setup_parser=setup_init, interactive=True)
 
-    registry.register("deploy", lambda args: deploy_project(
-        tui_data=getattr(args, 'tui_data', None)
-    ), "Deploy Project", interactive=True)
+def setup_map(parser):
+    parser.add_argument("path", nargs="?", default=".", help="Project path to map")
 
-    def setup_map(parser):
-        parser.add_argument("path", nargs="?", default=".", help="Project path to map")
 
-    registry.register("map", lambda args: map_project_patterns(args.path),
-                      "Analyze project for harvesting candidates", setup_parser=setup_map)
+def setup_harvest(parser):
+    parser.add_argument("--doc", help="Document path to harvest")
+    parser.add_argument("--auto", help="Auto-harvest from code file")
+    parser.add_argument("--name", help="Framework Name")
+    parser.add_argument("--desc", help="Framework Description")
+    parser.add_argument("--grade", choices=["A", "B", "C"], help="Framework Grade")
+    parser.add_argument("--yes", action="store_true", help="Skip confirmation prompts (Headless Mode)")
+    parser.add_argument("--force", action="store_true", help="Force overwrite existing framework")
 
-    # ══════════════════════════════════════════
-    # 📦  SKILL LIBRARY
-    # ══════════════════════════════════════════
 
-    registry.register(
-        name="list",
-        handler=lambda args: list_frameworks(),
-        description="List all harvested frameworks",
-        aliases=["ls"]
-    )
-
-    def setup_harvest(parser):
-        parser.add_argument("--doc", help="Document path to harvest")
-        parser.add_argument("--auto", help="Auto-harvest from code file")
-        parser.add_argument("--name", help="Framework Name")
-        parser.add_argument("--desc", help="Framework Description")
-        parser.add_argument("--grade", choices=["A", "B", "C"], help="Framework Grade")
-        parser.add_argument("--yes", action="store_true", help="Skip confirmation prompts (Headless Mode)")
-        parser.add_argument("--force", action="store_true", help="Force overwrite existing framework")
-
-    registry.register("harvest", lambda args: harvest_framework(
-        doc_path=getattr(args, 'doc', None),
-        auto_path=getattr(args, 'auto', None),
-        name=getattr(args, 'name', None),
-        description=getattr(args, 'desc', None),
-        grade=getattr(args, 'grade', None),
-        confirm=getattr(args, 'yes', False),
-        force=getattr(args, 'force', False),
-        tui_data=getattr(args, 'tui_data', None)
-    ), "Create a new Skill (Interactive/Headless)", aliases=["new"], setup_parser=setup_harvest, interactive=True)
-
-    def setup_search(parser):
-        parser.add_argument("query", help="Keyword to search for")
-
-    registry.register("search", lambda args: search_frameworks(args.query),
-                      "Search frameworks by content", setup_parser=setup_search)
-
-    def setup_delete(parser):
-        parser.add_argument("name", help="Name of the framework to delete")
-
-    registry.register("delete", lambda args: delete_framework(args.name),
-                      "Delete a framework", aliases=["rm"], setup_parser=setup_delete)
-
-    registry.register("merge", lambda args: merge_frameworks(),
-                      "Merge Skills into Blueprint")
-
-    def setup_apply(parser):
-        parser.add_argument("name", help="Name of the framework to apply")
-        parser.add_argument("--dry-run", action="store_true", help="Preview commands without running")
-
-    registry.register("apply", lambda args: apply_framework(args.name, args.dry_run),
-                      "Apply Skill (Executable Knowledge)", setup_parser=setup_apply, interactive=True)
-
-    registry.register(InstallCommand(), interactive=True)
+def setup_search(parser):
+    parser.add_argument("query", help="Keyword to search for")
 
-    # ══════════════════════════════════════════
-    # 🧠  KNOWLEDGE & MEMORY
-    # ══════════════════════════════════════════
 
-    registry.register(MemorizeCommand())
-    registry.register(RecallCommand())
+def setup_delete(parser):
+    parser.add_argument("name", help="Name of the framework to delete")
 
-    def setup_persona(parser):
-        parser.add_argument("name", nargs="?", help="Name of the persona to switch to")
 
-    registry.register("persona", lambda args: select_persona(getattr(args, 'name', None)),
-                      "Switch Persona", aliases=["p"], setup_parser=setup_persona, interactive=True)
+def setup_apply(parser):
+    parser.add_argument("name", help="Name of the framework to apply")
+    parser.add_argument("--dry-run", action="store_true", help="Preview commands without running")
 
-    from jcapy.commands import brain_cmd
 
-    def setup_brain(parser):
-        subs = parser.add_subparsers(dest="subcommand", help="Brain actions")
-        link = subs.add_parser("link", help="Link a local directory as Brain")
-        link.add_argument("path", help="Path to Rowboat/Obsidian vault")
-        ask = subs.add_parser("ask", help="Ask the Brain a question")
-        ask.add_argument("question", nargs="+", help="Question to ask")
+def setup_install(parser):
+    parser.add_argument("url", help="Git URL of the skill repository")
+    parser.add_argument("--no-sandbox", action="store_true",
+                        help="Install dependencies to system Python (not recommended)")
+    parser.add_argument("--sandbox", action="store_true",
+                        help="Force sandboxed installation (default for skills with requirements)")
 
-    registry.register("brain", brain_cmd.run_brain,
-                      "Manage Knowledge Graph (Rowboat)", setup_parser=setup_brain)
 
-    def setup_ask(parser):
-        parser.add_argument("question", nargs="+", help="Question")
-        parser.add_argument("--cognitive", action="store_true", help="Enable Sentinel Cognitive Orchestration (Planning split)")
+def setup_memorize(parser):
+    parser.add_argument("--force", action="store_true", help="Clear memory before ingesting")
+    parser.add_argument("--path", help="Specific path to ingest (file or dir)", default=None)
 
-    registry.register("ask", lambda args: brain_cmd.ask_brain(args),
-                      "Ask the Brain (Shortcut)", setup_parser=setup_ask)
 
-    # ══════════════════════════════════════════
-    # 🩺  DIAGNOSTICS & CONFIG
-    # ══════════════════════════════════════════
+def setup_recall(parser):
+    parser.add_argument("query", nargs="+", help="Natural language query")
 
-    registry.register(DoctorCommand())
-    registry.register(ConfigCommand())
-    registry.register(ThemeCommand())
-    registry.register(ManageCommand())
-    registry.register("undo", run_undo, "Undo last destructive action", setup_parser=setup_undo)
 
-    # ══════════════════════════════════════════
-    # 🤖  AI-POWERED
-    # ══════════════════════════════════════════
+def setup_persona(parser):
+    parser.add_argument("name", nargs="?", help="Name of the persona to switch to")
 
-    from jcapy.commands.brain import brainstorming_handler
-    def setup_brainstorm(parser):
-        parser.add_argument("file", nargs="?", help="Target file to refactor")
-        parser.add_argument("--provider", default="local", help="AI Provider")
 
-    registry.register("brainstorm", brainstorming_handler,
-                      "AI Refactor & Optimization", aliases=["bs"], setup_parser=setup_brainstorm, interactive=True)
+def setup_brain(parser):
+    subs = parser.add_subparsers(dest="subcommand", help="Brain actions")
+    link = subs.add_parser("link", help="Link a local directory as Brain")
+    link.add_argument("path", help="Path to Rowboat/Obsidian vault")
+    ask = subs.add_parser("ask", help="Ask the Brain a question")
+    ask.add_argument("question", nargs="+", help="Question to ask")
 
-    registry.register("suggest", run_suggest, "Recommend next best actions")
 
-    def setup_fix(parser):
-        parser.add_argument("file", help="Path to file to fix")
-        parser.add_argument("instruction", help="Instruction for the fix")
-        parser.add_argument("--diag", help="LSP diagnostic context (error messages)")
+def setup_ask(parser):
+    parser.add_argument("question", nargs="+", help="Question")
+    parser.add_argument("--cognitive", action="store_true", help="Enable Sentinel Cognitive Orchestration (Planning split)")
 
-    registry.register("fix", lambda args: rapid_fix(args.file, args.instruction, diagnostics=args.diag),
-                      "Rapid tactical code fix", setup_parser=setup_fix)
 
-    def setup_explore(parser):
-        parser.add_argument("topic", help="Topic to research")
+def setup_config(parser):
+    subparsers = parser.add_subparsers(dest="action")
+    subparsers.add_parser("list", help="List all preferences")
 
-    registry.register("explore", lambda args: autonomous_explore(args.topic),
-                      "Autonomous research & draft skill", setup_parser=setup_explore)
+    set_key_parser = subparsers.add_parser("set-key", help="Set AI Provider API Key")
+    set_key_parser.add_argument("provider", choices=["gemini", "openai", "deepseek"], help="AI Provider name")
 
-    # ══════════════════════════════════════════
-    # 🔌  INFRASTRUCTURE
-    # ══════════════════════════════════════════
+    config_get_parser = subparsers.add_parser("get", help="Get a preference")
+    config_get_parser.add_argument("key_value", help="Key name")
 
-    registry.register("tui", run_tui, "Launch Interactive TUI Dashboard", interactive=True)
+    config_set_parser = subparsers.add_parser("set", help="Set a preference")
+    config_set_parser.add_argument("key_value", help="key=value")
 
-    def run_mcp(args):
-        from jcapy.mcp.server import run_mcp_server
-        run_mcp_server()
 
-    registry.register("mcp", run_mcp, "Start JCapy MCP Server (Stdio)")
+def setup_theme(parser):
+    parser.add_argument("name", nargs="?", help="Name of the theme (default, dracula, matrix)", default=None)
+    parser.add_argument("--list", action="store_true", help="List available themes")
 
-    registry.register(sync_all_personas)
-    registry.register(push_all_personas)
 
-    registry.register("code", lambda args: open_brain_vscode(),
-                      "Open jcapy Brain in VS Code")
+def setup_undo(parser):
+    parser.add_argument("--list", action="store_true", dest="list_undo", help="List undo history")
 
-    registry.register("tutorial", run_tutorial,
-                      "Interactive onboarding", setup_parser=setup_tutorial, interactive=True)
 
-    registry.register(GrepCommand())
-    registry.register(EditCommand())
-    registry.register("version", run_version, "Display version info")
+def setup_brainstorm(parser):
+    parser.add_argument("file", nargs="?", help="Target file to refactor")
+    parser.add_argument("--provider", default="local", help="AI Provider")
 
-    # ══════════════════════════════════════════
-    # 🖥️  DAEMON (Background Service)
-    # ══════════════════════════════════════════
 
-    # Daemon commands are registered via configure_parsers hook
-    # The register_daemon_parser function adds subparsers directly
+def setup_fix(parser):
+    parser.add_argument("file", help="Path to file to fix")
+    parser.add_argument("instruction", help="Instruction for the fix")
+    parser.add_argument("--diag", help="LSP diagnostic context (error messages)")
+
+
+def setup_explore(parser):
+    parser.add_argument("topic", help="Topic to research")
+
+
+def setup_tutorial(parser):
+    parser.add_argument("--reset", action="store_true", help="Reset tutorial progress")
+
+
+def setup_audit(parser):
+    subs = parser.add_subparsers(dest="action")
+    query = subs.add_parser("query", help="Search audit records (streamed, paginated)")
+    query.add_argument("--type", dest="event_type", help="Event type, e.g. TOOL_CALL")
+    query.add_argument("--session", help="Session ID (a trailing * matches a prefix)")
+    query.add_argument("--agent", help="Agent ID")
+    query.add_argument("--since", help="Start: ISO time, epoch seconds, or age like 1h / 30m / 7d")
+    query.add_argument("--until", help="End (exclusive), same formats as --since")
+    query.add_argument("--limit", type=int, default=50, help="Records per page (default 50)")
+    query.add_argument("--after", help="Resume after this cursor (printed at the end of a page)")
+    query.add_argument("--all", action="store_true", help="Stream every match without paging")
+    query.add_argument("--json", action="store_true", help="Emit raw JSON lines")
+    subs.add_parser("stats", help="Show index statistics")
+    subs.add_parser("reindex", help="Rebuild the audit index from the log files")
+
+
+def setup_grep(parser):
+    parser.add_argument("pattern", help="Regex pattern to match")
+    parser.add_argument("-i", "--ignore-case", action="store_true", help="Case-insensitive matching")
+
+
+def _worker_count(value):
+    try:
+        workers = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid worker count: {value!r}")
+    if workers < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {workers}")
+    return workers
+
+
+def setup_sync(parser):
+    parser.add_argument("--workers", type=_worker_count,
+                        help="Personas to process at once (default: JCAPY_SYNC_WORKERS or 4)")
+
+
+def _run_with_workers(fn, args):
+    if "workers" not in vars(args):
+        # The registry falls back to raw tokens when parsing fails; re-parse
+        # so a bad --workers is reported instead of quietly using the default.
+        parser = SilentParser(add_help=False)
+        setup_sync(parser)
+        args = parser.parse_args(args._tokens or [])
+    return fn(workers=args.workers)
+
+
+def setup_edit(parser):
+    parser.add_argument("filename", nargs="?", help="File to edit")
+
+
+# ══════════════════════════════════════════
+# Command manifest
+# ══════════════════════════════════════════
+#
+# 🏗️  PROJECT LIFECYCLE    init, deploy, map
+# 📦  SKILL LIBRARY        list, harvest, search, delete, merge, apply, install
+# 🧠  KNOWLEDGE & MEMORY   memorize, recall, persona, brain, ask
+# 🩺  DIAGNOSTICS & CONFIG  doctor, config, theme, manage, undo, audit
+# 🤖  AI-POWERED           brainstorm, suggest, fix, explore
+# 🔌  INFRASTRUCTURE       tui, mcp, sync, push, code, tutorial, grep, edit, version
+
+CORE_COMMANDS = (
+    # 🏗️  PROJECT LIFECYCLE
+    CommandSpec("init", "jcapy.commands.project:init_project", "Scaffold One-Army Project",
+                setup_parser=setup_init, interactive=True,
+                adapter=lambda fn, args: fn(grade=getattr(args, 'grade', None),
+                                            tui_data=getattr(args, 'tui_data', None))),
+    CommandSpec("deploy", "jcapy.commands.project:deploy_project", "Deploy Project",
+                interactive=True,
+                adapter=lambda fn, args: fn(tui_data=getattr(args, 'tui_data', None))),
+    CommandSpec("map", "jcapy.commands.project:map_project_patterns",
+                "Analyze project for harvesting candidates", setup_parser=setup_map,
+                adapter=lambda fn, args: fn(args.path)),
+
+    # 📦  SKILL LIBRARY
+    CommandSpec("list", "jcapy.commands.frameworks:list_frameworks",
+                "List all harvested frameworks", aliases=("ls",)),
+    CommandSpec("harvest", "jcapy.commands.frameworks:harvest_framework",
+                "Create a new Skill (Interactive/Headless)", aliases=("new",),
+                setup_parser=setup_harvest, interactive=True,
+                adapter=lambda fn, args: fn(
+                    doc_path=getattr(args, 'doc', None),
+                    auto_path=getattr(args, 'auto', None),
+                    name=getattr(args, 'name', None),
+                    description=getattr(args, 'desc', None),
+                    grade=getattr(args, 'grade', None),
+                    confirm=getattr(args, 'yes', False),
+                    force=getattr(args, 'force', False),
+                    tui_data=getattr(args, 'tui_data', None))),
+    CommandSpec("search", "jcapy.commands.frameworks:search_frameworks",
+                "Search frameworks by content", setup_parser=setup_search,
+                adapter=lambda fn, args: fn(args.query)),
+    CommandSpec("delete", "jcapy.commands.frameworks:delete_framework",
+                "Delete a framework", aliases=("rm",), setup_parser=setup_delete,
+                adapter=lambda fn, args: fn(args.name)),
+    CommandSpec("merge", "jcapy.commands.frameworks:merge_frameworks",
+                "Merge Skills into Blueprint",
+                adapter=lambda fn, args: fn()),
+    CommandSpec("apply", "jcapy.commands.frameworks:apply_framework",
+                "Apply Skill (Executable Knowledge)", setup_parser=setup_apply, interactive=True,
+                adapter=lambda fn, args: fn(args.name, args.dry_run)),
+    CommandSpec("install", "jcapy.commands.install:InstallCommand",
+                "Install a skill from a GitHub URL with isolated dependencies",
+                setup_parser=setup_install, interactive=True),
+
+    # 🧠  KNOWLEDGE & MEMORY
+    CommandSpec("memorize", "jcapy.commands.core:MemorizeCommand",
+                "Ingest knowledge into Memory Bank", setup_parser=setup_memorize),
+    CommandSpec("recall", "jcapy.commands.core:RecallCommand",
+                "Semantic Search (Vector Memory)", setup_parser=setup_recall),
+    CommandSpec("persona", "jcapy.commands.brain:select_persona", "Switch Persona",
+                aliases=("p",), setup_parser=setup_persona, interactive=True,
+                adapter=lambda fn, args: fn(getattr(args, 'name', None))),
+    CommandSpec("brain", "jcapy.commands.brain_cmd:run_brain",
+                "Manage Knowledge Graph (Rowboat)", setup_parser=setup_brain),
+    CommandSpec("ask", "jcapy.commands.brain_cmd:ask_brain",
+                "Ask the Brain (Shortcut)", setup_parser=setup_ask),
+
+    # 🩺  DIAGNOSTICS & CONFIG
+    CommandSpec("doctor", "jcapy.commands.doctor:DoctorCommand", "Check system health",
+                aliases=("chk", "check")),
+    CommandSpec("config", "jcapy.commands.core:ConfigCommand",
+                "Manage UX preferences and keys", setup_parser=setup_config),
+    CommandSpec("theme", "jcapy.commands.theme:ThemeCommand", "Switch TUI Theme",
+                setup_parser=setup_theme),
+    CommandSpec("manage", "jcapy.commands.manage:ManageCommand",
+                "Manage MCP servers, widgets, plugins, and layouts"),
+    CommandSpec("undo", "jcapy.commands.core_cmd:run_undo",
+                "Undo last destructive action", setup_parser=setup_undo),
+    CommandSpec("audit", "jcapy.commands.audit_cmd:run_audit",
+                "Query the audit trail (indexed)", setup_parser=setup_audit),
+
+    # 🤖  AI-POWERED
+    CommandSpec("brainstorm", "jcapy.commands.brain:brainstorming_handler",
+                "AI Refactor & Optimization", aliases=("bs",),
+                setup_parser=setup_brainstorm, interactive=True),
+    CommandSpec("suggest", "jcapy.commands.core_cmd:run_suggest", "Recommend next best actions"),
+    # No rapid_fix implementation ships yet; dispatch reports the ImportError.
+    CommandSpec("fix", "jcapy.commands.fix:rapid_fix", "Rapid tactical code fix",
+                setup_parser=setup_fix,
+                adapter=lambda fn, args: fn(args.file, args.instruction, diagnostics=args.diag)),
+    CommandSpec("explore", "jcapy.commands.research:autonomous_explore",
+                "Autonomous research & draft skill", setup_parser=setup_explore,
+                adapter=lambda fn, args: fn(args.topic)),
+
+    # 🔌  INFRASTRUCTURE
+    CommandSpec("tui", "jcapy.commands.core_cmd:run_tui",
+                "Launch Interactive TUI Dashboard", interactive=True),
+    CommandSpec("mcp", "jcapy.mcp.server:run_mcp_server", "Start JCapy MCP Server (Stdio)"),
+    CommandSpec("sync", "jcapy.commands.sync:sync_all_personas", "Smart Sync: pull or clone all persona brains",
+                setup_parser=setup_sync, adapter=_run_with_workers),
+    CommandSpec("push", "jcapy.commands.sync:push_all_personas", "Push changes for all persona brains",
+                setup_parser=setup_sync, adapter=_run_with_workers),
+    CommandSpec("code", "jcapy.commands.brain:open_brain_vscode", "Open jcapy Brain in VS Code"),
+    CommandSpec("tutorial", "jcapy.commands.core_cmd:run_tutorial", "Interactive onboarding",
+                setup_parser=setup_tutorial, interactive=True),
+    CommandSpec("grep", "jcapy.commands.grep:GrepCommand",
+                "Filter piped text or lines from a file", setup_parser=setup_grep),
+    CommandSpec("edit", "jcapy.commands.edit:EditCommand",
+                "Edit a file in the terminal editor (suspend TUI)", aliases=("e", "vi", "nano"),
+                setup_parser=setup_edit, interactive=True),
+    CommandSpec("version", "jcapy.commands.version:run_version", "Display version info"),
+)
+
+
+def register_core_commands(registry):
+    """
+    Register all built-in commands.
+    This acts as the 'Standard Library' of JCapy.
+
+    Only the manifest is registered here; see CORE_COMMANDS for the
+    categorized list. Daemon commands are registered via the
+    configure_parsers hook (jcapy.commands.daemon_cmd).
+
+    Interactive commands (suspend TUI for raw terminal I/O):
+      init, deploy, harvest, persona, tutorial, brainstorm, tui, install, apply, edit
+    """
+    registry.register_manifest(CORE_COMMANDS)
 
     # ══════════════════════════════════════════
     # 🔧  CONFIG OVERRIDES
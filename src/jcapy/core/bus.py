@@ -1,39 +1,70 @@
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional
+from collections import deque
+from enum import Enum
 import queue
 import threading
+import time
 import logging
 
 logger = logging.getLogger('jcapy.bus')
 
 
+class OverflowPolicy(Enum):
+    """What `publish` does when a background dispatch queue is full."""
+    BLOCK = "block"              # Publisher waits for space (back-pressure; never a bus worker)
+    DROP_NEWEST = "drop_newest"  # Discard the event being published
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest queued event on that shard
+
+
 class EventBus:
     """
     A simple Pub/Sub Event Bus for JCapy (2.4).
     Decouples system components and enables async processing.
     
     Enhanced with ZMQ bridge integration for TUI ↔ Web communication.
+
+    By default subscribers run inline on the publisher's thread. Calling
+    `start()` switches to background dispatch: events are sharded by topic
+    onto bounded queues, each drained by one worker thread, so events of the
+    same topic are delivered in publish order while slow subscribers no
+    longer add latency to publishers.
+
+    Subscribers may publish. An event published onto the handler's own shard
+    is held in that worker's pending deque and queued behind everything
+    already waiting once the handler returns. Bus workers never block on a
+    full queue, since two shards waiting on each other's queues would
+    deadlock: under BLOCK their events are queued past the capacity instead.
     """
     def __init__(self):
+        # Lists are replaced, never mutated, so publishers can iterate a snapshot lock-free
         self._subscribers: Dict[str, List[Callable]] = {}
-        self._queue = queue.Queue()
+        self._sub_lock = threading.Lock()
+        self._queues: List[queue.Queue] = []
+        self._workers: List[threading.Thread] = []
         self._running = False
-        self._worker_thread: threading.Thread = None
+        self._overflow = OverflowPolicy.BLOCK
+        self._block_timeout: Optional[float] = None
+        self._dropped = 0
+        self._local = threading.local()  # Set on worker threads: their queue and pending deque
+        self._stopped = threading.Event()  # Replaced on each start()
         self._zmq_publisher: Optional[Any] = None  # ZmqPublisher reference
         self._zmq_enabled = False
 
     def subscribe(self, event_type: str, callback: Callable[[Any], None]):
         """Register a callback for a specific event type."""
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-        self._subscribers[event_type].append(callback)
+        with self._sub_lock:
+            self._subscribers[event_type] = self._subscribers.get(event_type, []) + [callback]
 
     def unsubscribe(self, event_type: str, callback: Callable[[Any], None]):
         """Remove a callback for a specific event type."""
-        if event_type in self._subscribers:
-            try:
-                self._subscribers[event_type].remove(callback)
-            except ValueError:
-                pass
+        with self._sub_lock:
+            if event_type in self._subscribers:
+                callbacks = list(self._subscribers[event_type])
+                try:
+                    callbacks.remove(callback)
+                except ValueError:
+                    return
+                self._subscribers[event_type] = callbacks
 
     def set_zmq_publisher(self, publisher: Any):
         """
@@ -52,13 +83,8 @@ class EventBus:
         Also publishes to ZMQ bridge if enabled, allowing Web UI
         to receive real-time events from TUI/daemon.
         """
-        # 1. Local subscribers
-        if event_type in self._subscribers:
-            for callback in self._subscribers[event_type]:
-                try:
-                    callback(payload)
-                except Exception as e:
-                    logger.error(f"EventBus Error [Type: {event_type}]: {e}")
+        # 1. Local subscribers (inline, or queued when background dispatch is on)
+        self._dispatch(event_type, payload)
 
         # 2. ZMQ bridge (TUI → Web)
         if self._zmq_enabled and self._zmq_publisher:
@@ -72,16 +98,186 @@ class EventBus:
         Publish only to local subscribers (skip ZMQ).
         Use for internal events that shouldn't go to Web UI.
         """
-        if event_type in self._subscribers:
-            for callback in self._subscribers[event_type]:
+        self._dispatch(event_type, payload)
+
+    def _deliver(self, event_type: str, payload: Any):
+        """Invoke every subscriber of `event_type`, isolating failures."""
+        for callback in self._subscribers.get(event_type, ()):
+            try:
+                callback(payload)
+            except Exception as e:
+                logger.error(f"EventBus Error [Type: {event_type}]: {e}")
+
+    def _dispatch(self, event_type: str, payload: Any):
+        queues = self._queues
+        if not self._running or not queues or event_type not in self._subscribers:
+            self._deliver(event_type, payload)
+            return
+
+        q = queues[hash(event_type) % len(queues)]
+        item = (event_type, payload)
+        pending: Optional[Deque] = getattr(self._local, "pending", None)
+        if pending is None:
+            self._enqueue(q, item, block=True)
+        elif self._local.queue is q:
+            # Re-entrant publish: queue it after the current handler returns
+            pending.append(item)
+        else:
+            self._enqueue(q, item, block=False)
+
+    def _enqueue(self, q: queue.Queue, item: tuple, block: bool):
+        """Queue `item` under the overflow policy; BLOCK overfills instead of waiting unless `block`."""
+        event_type = item[0]
+        if self._overflow == OverflowPolicy.BLOCK:
+            try:
+                if block:
+                    q.put(item, timeout=self._block_timeout)
+                else:
+                    q.put_nowait(item)
+            except queue.Full:
+                if block:
+                    self._count_drop(event_type)
+                else:
+                    with q.mutex:
+                        q.queue.append(item)
+                        q.unfinished_tasks += 1
+                        q.not_empty.notify()
+        elif self._overflow == OverflowPolicy.DROP_NEWEST:
+            try:
+                q.put_nowait(item)
+            except queue.Full:
+                self._count_drop(event_type)
+        else:
+            while True:
                 try:
-                    callback(payload)
-                except Exception as e:
-                    logger.error(f"EventBus Error [Type: {event_type}]: {e}")
+                    q.put_nowait(item)
+                    break
+                except queue.Full:
+                    try:
+                        q.get_nowait()
+                        q.task_done()
+                        self._count_drop(event_type)
+                    except queue.Empty:
+                        pass
+
+    def _count_drop(self, event_type: str):
+        self._dropped += 1
+        logger.warning(f"EventBus queue full, dropped event [Type: {event_type}]")
+
+    # ------------------------------------------------------------------
+    # Background dispatch
+    # ------------------------------------------------------------------
+
+    def start(
+        self,
+        workers: int = 2,
+        max_queue: int = 10000,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        block_timeout: Optional[float] = None
+    ):
+        """
+        Switch to background dispatch.
+
+        Args:
+            workers: Worker threads; each topic is pinned to one worker.
+            max_queue: Capacity of each worker's queue.
+            overflow: Policy applied when a worker's queue is full.
+            block_timeout: With BLOCK, drop after waiting this long (None = wait forever).
+        """
+        if self._running:
+            return
+        self._overflow = OverflowPolicy(overflow)
+        self._block_timeout = block_timeout
+        self._queues = [queue.Queue(maxsize=max_queue) for _ in range(max(1, workers))]
+        # Per start(): a worker outliving a timed-out stop() never sees a later start's flag
+        stopped = threading.Event()
+        self._stopped = stopped
+        self._workers = [
+            threading.Thread(target=self._worker_loop, args=(q, stopped), name=f"jcapy-bus-{i}", daemon=True)
+            for i, q in enumerate(self._queues)
+        ]
+        for t in self._workers:
+            t.start()
+        self._running = True
+        logger.info(f"EventBus: background dispatch started ({len(self._workers)} workers, overflow={self._overflow.value})")
+
+    def _worker_loop(self, q: queue.Queue, stopped: threading.Event):
+        pending: Deque = deque()
+        self._local.queue, self._local.pending = q, pending
+        discarded = 0
+        while not stopped.is_set():
+            try:
+                item = q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            try:
+                if stopped.is_set():
+                    # Left over from a stop() that timed out; publishers already dispatch
+                    # inline, so delivering it now would race them and break topic order
+                    discarded += 1
+                    continue
+                self._deliver(*item)
+                # Queued before this task is marked done, so flush() waits for them too
+                while pending:
+                    self._enqueue(q, pending.popleft(), block=False)
+            finally:
+                q.task_done()
+        discarded += len(pending) + q.qsize()
+        if discarded:
+            self._dropped += discarded
+            logger.warning(f"EventBus: {discarded} queued events discarded on stop")
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued event has been delivered. Returns False on timeout."""
+        if not self._running or threading.current_thread() in self._workers:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for q in self._queues:
+            with q.all_tasks_done:
+                while q.unfinished_tasks:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    q.all_tasks_done.wait(remaining)
+        return True
+
+    def stop(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Drain queued events, stop the workers and return to inline dispatch.
+
+        Returns False if the queues did not drain or a worker did not exit
+        within `timeout`; events still queued then are discarded, and the
+        workers are kept so a later stop() can wait for them again.
+        """
+        if not self._running and not self._workers:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        drained = self.flush(timeout) if self._running else True
+        self._running = False
+        self._stopped.set()
+        current = threading.current_thread()
+        for t in self._workers:
+            if t is not current:
+                t.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        if any(t.is_alive() and t is not current for t in self._workers):
+            logger.warning("EventBus: a worker did not stop in time (subscriber still running)")
+            return False
+        self._queues, self._workers = [], []
+        logger.info("EventBus: background dispatch stopped")
+        return drained
+
+    @property
+    def is_async(self) -> bool:
+        return self._running
 
-    # Future: Background processing for high-throughput events
-    # def start(self): ...
-    # def stop(self): ...
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "async": self._running,
+            "workers": len(self._workers),
+            "queue_depth": sum(q.qsize() for q in self._queues),
+            "overflow": self._overflow.value,
+            "dropped": self._dropped,
+        }
 
 
 # Global instance
@@ -15,12 +15,15 @@ logger = logging.getLogger('jcapy.client')
 class JCapyClient:
     """
     Unified client for JCapy 2.0 Orbital Architecture.
-    Handles communication with the background daemon (jcapyd) via gRPC.
+    Handles communication with the background daemon (jcapyd) via gRPC,
+    over TCP (mTLS when certificates exist) or, given `socket_path`, over
+    the daemon's local Unix socket.
     """
 
-    def __init__(self, host: str = 'localhost', port: int = 50051):
+    def __init__(self, host: str = 'localhost', port: int = 50051, socket_path: Optional[str] = None):
         self.host = host
         self.port = port
+        self.socket_path = socket_path
         self.channel = None
         self.stub = None
         self._connected = False
@@ -28,15 +31,13 @@ class JCapyClient:
     def connect(self, timeout: int = 2) -> bool:
         """Connect to the JCapy Daemon."""
         try:
-            target = f"{self.host}:{self.port}"
-            # Secure gRPC with mTLS
-            try:
-                credentials = get_grpc_credentials(is_server=False)
-                self.channel = grpc.secure_channel(target, credentials)
-                logger.info("Using SECURE mTLS channel")
-            except Exception as e:
-                logger.warning(f"Failed to initialize secure channel: {e}. Falling back to INSECURE.")
+            if self.socket_path:
+                # Only reachable by this user (0700 directory); no TLS needed
+                target = f"unix:{self.socket_path}"
                 self.channel = grpc.insecure_channel(target)
+            else:
+                target = f"{self.host}:{self.port}"
+                self.channel = self._tcp_channel(target)
 
             self.stub = jcapy_pb2_grpc.JCapyOrchestratorStub(self.channel)
 
@@ -51,6 +52,17 @@ class JCapyClient:
             logger.warning(f"Could not connect to JCapy Daemon: {e}")
             return False
 
+    def _tcp_channel(self, target: str):
+        # Secure gRPC with mTLS
+        try:
+            credentials = get_grpc_credentials(is_server=False)
+            channel = grpc.secure_channel(target, credentials)
+            logger.info("Using SECURE mTLS channel")
+            return channel
+        except Exception as e:
+            logger.warning(f"Failed to initialize secure channel: {e}. Falling back to INSECURE.")
+            return grpc.insecure_channel(target)
+
     def execute(self, command_str: str, context: Optional[Dict[str, str]] = None) -> jcapy_pb2.CommandResponse:
         """Execute a command on the daemon."""
         if not self._connected and not self.connect():
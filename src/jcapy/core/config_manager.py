@@ -1,29 +1,228 @@
 # SPDX-License-Identifier: Apache-2.0
+import atexit
 import json
+import logging
 import os
 import threading
-from typing import Any, Dict, Optional
-from jcapy.ui.messages import ConfigUpdated
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: writes stay atomic, but concurrent flushes can lose keys
+    fcntl = None
+
+logger = logging.getLogger('jcapy.config')
+
+DEFAULT_SAVE_DELAY = float(os.environ.get('JCAPY_CONFIG_SAVE_DELAY', 0.0))
+DEFAULT_SAVE_MAX_DELAY = float(os.environ.get('JCAPY_CONFIG_SAVE_MAX_DELAY', 5.0))
+DEFAULT_WATCH_INTERVAL = float(os.environ.get('JCAPY_CONFIG_WATCH_INTERVAL', 1.0))
+
+_MISSING = object()
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict used inside config snapshots. It is still a real dict
+    (json.dumps, isinstance and == work), but every mutator raises TypeError.
+    """
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("config snapshots are read-only; use ConfigManager.set() or thaw() a copy")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts to FrozenDict and lists to tuples."""
+    if isinstance(value, FrozenDict):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Mutable deep copy of a frozen value (FrozenDict -> dict, tuple -> list)."""
+    if isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(v) for v in value]
+    return value
+
+
+def _get_nested(data: Dict[str, Any], key: str) -> Any:
+    """Traverse nested dicts with dot notation."""
+    if "." in key:
+        current = data
+        for part in key.split("."):
+            if isinstance(current, dict) and part in current:
+                current = current[part]
+            else:
+                return None
+        return current
+    return data.get(key)
+
+
+def _assoc(data: FrozenDict, key: str, value: Any) -> FrozenDict:
+    """Copy of `data` with dotted `key` set; only the dicts along the path are copied."""
+    parts = key.split(".")
+    nodes = [data]
+    for part in parts[:-1]:
+        child = nodes[-1].get(part)
+        nodes.append(child if isinstance(child, dict) else _EMPTY)
+    new = value
+    for node, part in zip(reversed(nodes), reversed(parts)):
+        updated = dict(node)
+        updated[part] = new
+        new = FrozenDict(updated)
+    return new
+
+
+def diff_config(old: Any, new: Any, prefix: str = "") -> Dict[str, Tuple[Any, Any]]:
+    """
+    Leaf-level differences between two configs as {dotted.key: (old, new)}.
+    A missing side is None. Shared (identical) subtrees are skipped without walking them.
+    """
+    if old is new:
+        return {}
+    # An added or removed section is reported leaf by leaf
+    if isinstance(old, dict) and new is _MISSING:
+        new = _EMPTY
+    elif isinstance(new, dict) and old is _MISSING:
+        old = _EMPTY
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = {}
+        for k in old.keys() | new.keys():
+            path = f"{prefix}.{k}" if prefix else k
+            changes.update(diff_config(old.get(k, _MISSING), new.get(k, _MISSING), path))
+        return changes
+    if old == new:
+        return {}
+    return {prefix or "*": (None if old is _MISSING else old, None if new is _MISSING else new)}
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+class ConfigSnapshot:
+    """
+    One immutable, versioned view of the configuration layers.
+    Safe to hold and share across threads; nothing in it is ever mutated.
+    """
+    __slots__ = ("version", "data", "secrets", "env")
+
+    def __init__(self, version: int, data: FrozenDict, secrets: FrozenDict, env: FrozenDict):
+        self.version = version
+        self.data = data          # file config (what get_all() returns)
+        self.secrets = secrets
+        self.env = env
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Env vars, then secrets, then the config file; dot notation supported."""
+        for layer in (self.env, self.secrets, self.data):
+            value = _get_nested(layer, key)
+            if value is not None:
+                return value
+        return default
+
+    def __repr__(self):
+        return f"<ConfigSnapshot v{self.version} keys={len(self.data)}>"
+
+
+_EMPTY = FrozenDict()
+
 
 class ConfigManager:
     """
     Unified Configuration Manager for JCapy.
     Handles loading, saving, and merging configuration from JSON files.
-    Thread-safe singleton pattern usage recommended.
+
+    Readers get the current ConfigSnapshot (or values out of it) without
+    copying: its mappings are FrozenDicts and its lists tuples. Writers
+    build a new snapshot under a lock and publish it with a single
+    reference assignment, bumping its version.
+
+    Persistence is coalesced: sets inside transaction(), or within
+    `save_delay` seconds of each other, produce one atomic file write and
+    one ConfigUpdated listing every changed key. Each set restarts the
+    delay, but a burst is written at most `max_delay` seconds after its
+    first change. Readers see each set immediately; flush() forces the
+    pending write.
+
+    Changes written by other processes are picked up by
+    check_for_changes() (a stat of the config and secrets files, run by
+    watch() in the background or before each write), never by get().
+    flush() holds an flock on `<config>.lock` across that re-read, the
+    merge and the atomic replace, so concurrent writers never drop keys.
     """
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, save_delay: float = DEFAULT_SAVE_DELAY,
+                 max_delay: float = DEFAULT_SAVE_MAX_DELAY):
         self._path = path
         # Secrets path: sibling to config file
         self._secrets_path = os.path.join(os.path.dirname(path), ".jcapy_secrets.json")
-        self._config: Dict[str, Any] = {}
+        self._lock_path = path + ".lock"
+        self._config: Dict[str, Any] = _EMPTY
         self._env_config: Dict[str, Any] = {} # Env var overrides
         self._secrets_config: Dict[str, Any] = {} # Secrets file overrides
         self._lock = threading.RLock()
         self._app = None  # Reference to Textual App
+        self._snapshot = ConfigSnapshot(0, _EMPTY, _EMPTY, _EMPTY)
+        self.save_delay = save_delay
+        self.max_delay = max_delay
+        self._dirty: Dict[str, Any] = {}  # changed key -> new value, awaiting save/emit
+        self._txn_depth = 0
+        self._timer: Optional[threading.Timer] = None
+        self._dirty_since: Optional[float] = None  # monotonic time of the first unsaved change
+        self._atexit_registered = False
+        self._subscribers: List[Callable[[Dict[str, Tuple[Any, Any]]], None]] = []
+        self._watcher: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
+        # Stat before reading: a write racing the load shows up as a change later
+        self._file_sig = _file_signature(path)
+        self._secrets_sig = _file_signature(self._secrets_path)
         self._load()
         self._load_secrets()
         self._parse_env_vars()
+        self._publish()
+
+    def _publish(self) -> ConfigSnapshot:
+        """Swap in a new snapshot built from the current layers."""
+        self._snapshot = ConfigSnapshot(
+            self._snapshot.version + 1,
+            self._config,
+            freeze(self._secrets_config),
+            freeze(self._env_config),
+        )
+        return self._snapshot
+
+    def snapshot(self) -> ConfigSnapshot:
+        """The current immutable configuration snapshot. Lock-free."""
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
 
     def bind_app(self, app):
         """Bind the Textual App instance to enable reactive updates."""
@@ -64,10 +263,12 @@ class ConfigManager:
                     # For now keep as string to avoid magic
                     current[keys[-1]] = value
 
-    def _emit_update(self, key: str, value: Any):
+    def _emit_update(self, key: str, value: Any, keys=None):
         """Emit ConfigUpdated message if app is bound."""
         if self._app:
-            self._app.post_message(ConfigUpdated(key, value))
+            # Imported here: the message pulls in textual, which CLI-only runs never need
+            from jcapy.ui.messages import ConfigUpdated
+            self._app.post_message(ConfigUpdated(key, value, keys))
 
     def _load(self):
         """Load configuration from disk."""
@@ -75,18 +276,18 @@ class ConfigManager:
             if os.path.exists(self._path):
                 try:
                     with open(self._path, 'r') as f:
-                        self._config = json.load(f)
+                        self._config = freeze(json.load(f))
                 except (json.JSONDecodeError, IOError):
                     # Fallback to empty config if corrupt/unreadable
-                    self._config = {}
+                    self._config = _EMPTY
             else:
-                self._config = {}
+                self._config = _EMPTY
 
     def _save(self):
         """Save configuration to disk atomically."""
         with self._lock:
             # Atomic save: write to temp file then rename
-            tmp_path = self._path + ".tmp"
+            tmp_path = f"{self._path}.{os.getpid()}.tmp"
             try:
                 # Ensure directory exists
                 os.makedirs(os.path.dirname(os.path.abspath(self._path)), exist_ok=True)
@@ -95,96 +296,256 @@ class ConfigManager:
                 fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
                 with os.fdopen(fd, 'w') as f:
                     json.dump(self._config, f, indent=2)
+                    # Durable before it becomes visible; a crash leaves the old or new file
+                    f.flush()
+                    os.fsync(f.fileno())
+                    st = os.fstat(f.fileno())
 
                 os.replace(tmp_path, self._path)
                 os.chmod(self._path, 0o600)
+                # Our own write must not look like another process's change
+                self._file_sig = (st.st_ino, st.st_mtime_ns, st.st_size)
             except Exception as e:
                 # If save fails, we log it but don't crash
-                # In a real app we might rely on a logger
-                print(f"Error saving config: {e}")
+                logger.error(f"Error saving config: {e}")
                 if os.path.exists(tmp_path):
                     os.remove(tmp_path)
 
     def _get_nested(self, data: Dict[str, Any], key: str) -> Any:
         """Helper to traverse nested dicts with dot notation."""
-        if "." in key:
-            parts = key.split(".")
-            current = data
-            for part in parts:
-                if isinstance(current, dict) and part in current:
-                    current = current[part]
-                else:
-                    return None
-            return current
-        return data.get(key)
+        return _get_nested(data, key)
 
     def get(self, key: str, default: Any = None) -> Any:
-        """Get a value from configuration, checking Env Vars then Secrets then File."""
-        import copy
-        with self._lock:
-            # 1. Check Env Config
-            env_val = self._get_nested(self._env_config, key)
-            if env_val is not None:
-                return copy.deepcopy(env_val)
-
-            # 2. Check Secrets Config
-            secret_val = self._get_nested(self._secrets_config, key)
-            if secret_val is not None:
-                return copy.deepcopy(secret_val)
-
-            # 3. Check File Config
-            file_val = self._get_nested(self._config, key)
-            if file_val is not None:
-                return copy.deepcopy(file_val)
-
-            return copy.deepcopy(default)
+        """
+        Get a value from configuration, checking Env Vars then Secrets then File.
+        Mappings and lists come back frozen and uncopied; thaw() them to edit.
+        """
+        return self._snapshot.get(key, default)
 
     def get_all(self) -> Dict[str, Any]:
-        """Get entire merged configuration dictionary."""
-        with self._lock:
-            # Deep merge _config into _env_config copy?
-            # Or just return _config (disk state)?
-            # get_all usually implies "effective config"
-            # Implementing robust deep merge is complex.
-            # For now, return _config, as UI often needs to know what is SAVED.
-            # To indicate overrides, we might need a separate API (get_effective_config)
-            # But the requirement is unified.
-            # Let's do a shallow merge for top level keys for now?
-            result = self._config.copy()
-            # Simple recursive merge could go here if needed.
-            # For simplicity:
-            return result
+        """The saved file configuration as a read-only mapping (env/secret overrides not merged)."""
+        return self._snapshot.data
 
     def set(self, key: str, value: Any):
         """Set a value in configuration and save, supporting dot notation."""
-        import copy
+        value = freeze(value)
         with self._lock:
             # Check current DISK value to avoid unnecessary saves
             current_disk_val = self._get_nested(self._config, key)
             if current_disk_val == value:
                 return # No change, skip save/emit
 
-            if "." in key:
-                parts = key.split(".")
-                current = self._config
-                # Traverse to the second to last part, creating dicts if needed
-                for part in parts[:-1]:
-                    if part not in current or not isinstance(current[part], dict):
-                        current[part] = {}
-                    current = current[part]
-                current[parts[-1]] = copy.deepcopy(value)
-            else:
-                self._config[key] = copy.deepcopy(value)
-            self._save()
-            self._emit_update(key, value)
+            # Copy only the dicts along the key path; everything else is shared
+            new = _assoc(self._config, key, value)
+            self._config = new
+            self._publish()
+            self._changed(key, value)
 
     def set_all(self, config: Dict[str, Any]):
         """Replace entire configuration and save."""
-        import copy
+        frozen = freeze(config)
         with self._lock:
-            if self._config == config:
+            if self._config == frozen:
                 return # No change
 
-            self._config = copy.deepcopy(config)
-            self._save()
-            self._emit_update("*", config)
+            self._config = frozen
+            self._publish()
+            self._changed("*", config)
+
+    # ------------------------------------------------------------------
+    # Batching & coalesced persistence
+    # ------------------------------------------------------------------
+
+    def _changed(self, key: str, value: Any):
+        """Record a change; persist now, at transaction end, or after save_delay."""
+        self._dirty.pop(key, None)  # keep keys in last-changed order
+        self._dirty[key] = value
+        if not self._txn_depth:
+            self._persist_later()
+
+    def _persist_later(self):
+        if self.save_delay <= 0:
+            self.flush()
+            return
+        # Debounce: restart the delay, but never past max_delay from the first change
+        now = time.monotonic()
+        if self._dirty_since is None:
+            self._dirty_since = now
+        deadline = self._dirty_since + max(self.max_delay, self.save_delay)
+        delay = max(0.0, min(self.save_delay, deadline - now))
+        if self._timer is not None:
+            self._timer.cancel()
+        if not self._atexit_registered:
+            atexit.register(self.flush)
+            self._atexit_registered = True
+        self._timer = threading.Timer(delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group several set() calls into one write and one ConfigUpdated.
+        Other writers wait until it ends; readers see changes as they happen.
+        If the block raises, the configuration is rolled back.
+        """
+        with self._lock:
+            base, base_dirty = self._config, dict(self._dirty)
+            self._txn_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._txn_depth -= 1
+                if self._txn_depth == 0 and self._config is not base:
+                    self._config, self._dirty = base, base_dirty
+                    self._publish()
+                raise
+            self._txn_depth -= 1
+            if self._txn_depth == 0 and self._dirty:
+                self._persist_later()
+
+    def flush(self) -> bool:
+        """Write pending changes and emit one ConfigUpdated for them. Returns True if anything was written."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._txn_depth:
+                return False
+            self._dirty_since = None
+            if not self._dirty:
+                return False
+            with self._file_lock():
+                # Fold in other processes' edits first so this write doesn't undo them
+                changes = self._reload_if_changed()
+                dirty, self._dirty = self._dirty, {}
+                self._save()
+            if len(dirty) == 1:
+                (key, value), = dirty.items()
+                self._emit_update(key, value)
+            else:
+                self._emit_update("*", None, keys=list(dirty))
+            subscribers = self._subscribers if changes else []
+        self._notify(subscribers, changes)
+        return True
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive flock shared by every process writing this config file."""
+        if fcntl is None:
+            yield
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self._path)), exist_ok=True)
+        fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)  # releases the lock
+
+    @property
+    def pending_keys(self) -> tuple:
+        """Keys changed in memory but not yet written to disk."""
+        with self._lock:
+            return tuple(self._dirty)
+
+    # ------------------------------------------------------------------
+    # Cross-process change detection
+    # ------------------------------------------------------------------
+
+    def subscribe(self, callback: Callable[[Dict[str, Tuple[Any, Any]]], None]):
+        """
+        Call `callback({key: (old, new)})` whenever a reload from disk changes keys.
+        Callbacks run on the thread that noticed the change (usually the watcher).
+        """
+        with self._lock:
+            self._subscribers = self._subscribers + [callback]
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            self._subscribers = [cb for cb in self._subscribers if cb is not callback]
+
+    def check_for_changes(self) -> Dict[str, Tuple[Any, Any]]:
+        """
+        Reload if the config or secrets file was replaced or modified since we
+        last read or wrote it. Costs two stat() calls when nothing changed.
+        Returns the key-level diff (empty if nothing changed).
+        """
+        if self._files_unchanged():
+            return {}
+        with self._lock:
+            changes = self._reload()
+            subscribers = self._subscribers if changes else []
+        self._notify(subscribers, changes)
+        return changes
+
+    def _files_unchanged(self) -> bool:
+        return (_file_signature(self._path) == self._file_sig
+                and _file_signature(self._secrets_path) == self._secrets_sig)
+
+    def _reload_if_changed(self) -> Dict[str, Tuple[Any, Any]]:
+        """check_for_changes() for callers holding the lock; they notify subscribers."""
+        return {} if self._files_unchanged() else self._reload()
+
+    @staticmethod
+    def _notify(subscribers, changes: Dict[str, Tuple[Any, Any]]):
+        for callback in subscribers:
+            try:
+                callback(changes)
+            except Exception:
+                logger.exception("Config subscriber error")
+
+    def _reload(self) -> Dict[str, Tuple[Any, Any]]:
+        changes: Dict[str, Tuple[Any, Any]] = {}
+        file_sig = _file_signature(self._path)
+        if file_sig != self._file_sig:
+            self._file_sig = file_sig
+            old = self._config
+            if "*" not in self._dirty:  # a pending set_all() replaces whatever is on disk
+                self._load()
+                # Unsaved local changes win over the file; they are still written later
+                for key, value in self._dirty.items():
+                    self._config = _assoc(self._config, key, value)
+            changes.update(diff_config(old, self._config))
+
+        secrets_sig = _file_signature(self._secrets_path)
+        if secrets_sig != self._secrets_sig:
+            self._secrets_sig = secrets_sig
+            old_secrets = freeze(self._secrets_config)
+            self._secrets_config = {}
+            self._load_secrets()
+            changes.update(diff_config(old_secrets, freeze(self._secrets_config)))
+
+        if changes:
+            self._publish()
+            if len(changes) == 1:
+                (key, (_, value)), = changes.items()
+                self._emit_update(key, value)
+            else:
+                self._emit_update("*", None, keys=list(changes))
+        return changes
+
+    def watch(self, interval: float = DEFAULT_WATCH_INTERVAL):
+        """Poll for changes from other processes on a background thread."""
+        with self._lock:
+            if self._watcher is not None:
+                return
+            self._watch_stop.clear()
+            self._watcher = threading.Thread(
+                target=self._watch_loop, args=(interval,), name="jcapy-config-watch", daemon=True
+            )
+            self._watcher.start()
+
+    def stop_watching(self):
+        with self._lock:
+            watcher, self._watcher = self._watcher, None
+        if watcher is not None:
+            self._watch_stop.set()
+            watcher.join(timeout=5)
+
+    def _watch_loop(self, interval: float):
+        while not self._watch_stop.wait(interval):
+            try:
+                self.check_for_changes()
+            except Exception:
+                logger.exception("Config watch error")
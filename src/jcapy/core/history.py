@@ -1,65 +1,278 @@
 # SPDX-License-Identifier: Apache-2.0
+import bisect
 import json
 import os
-from typing import List
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Set
+
+from jcapy.utils.startup_profile import timed
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends stay atomic, compaction is unguarded
+    fcntl = None
+
+DEFAULT_MAX_ENTRIES = 1000
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
 
 class CommandHistoryManager:
-    """Manages persistent command history."""
+    """
+    Manages persistent command history.
+
+    History lives in an append-only JSONL file (one JSON string per line)
+    shared by the CLI, TUI and daemon. Each add appends a single line under
+    a shared lock; once the file holds `compact_factor` times more lines
+    than the kept entries, it is rewritten under an exclusive lock. Before
+    reading or appending, lines written by other processes are folded in.
+
+    In memory, an insertion-ordered dict gives O(1) dedupe (re-running a
+    command moves it to the end), a sorted list answers prefix lookups and
+    a trigram index answers substring lookups.
+    """
 
-    def __init__(self, history_file: str = None):
+    def __init__(self, history_file: str = None, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 compact_factor: int = 2):
         if history_file is None:
             home = os.path.expanduser("~")
-            self.history_file = os.path.join(home, ".jcapy", "command_history.json")
+            self.history_file = os.path.join(home, ".jcapy", "command_history.jsonl")
         else:
             self.history_file = history_file
+        self.lock_file = self.history_file + ".lock"
+        self.max_entries = max_entries
+        self.compact_factor = max(2, compact_factor)
+
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # command -> recency sequence
+        self._seq = 0
+        self._sorted: List[str] = []
+        self._trigram_index: Dict[str, Set[str]] = {}
+        self._offset = 0        # bytes of the log already folded in
+        self._inode = None
+        self._lines = 0         # lines in the log, for the compaction threshold
 
         os.makedirs(os.path.dirname(self.history_file), exist_ok=True)
-        self.history: List[str] = self._load_history()
+        self._migrate_legacy()
+        self._catch_up()
+
+    # ------------------------------------------------------------------
+    # In-memory index
+    # ------------------------------------------------------------------
+
+    def _apply(self, command: str) -> None:
+        if command in self._entries:
+            self._entries.move_to_end(command)
+        else:
+            self._entries[command] = 0
+            bisect.insort(self._sorted, command)
+            for gram in _trigrams(command):
+                self._trigram_index.setdefault(gram, set()).add(command)
+        self._seq += 1
+        self._entries[command] = self._seq
+
+        while len(self._entries) > self.max_entries:
+            oldest, _ = self._entries.popitem(last=False)
+            del self._sorted[bisect.bisect_left(self._sorted, oldest)]
+            for gram in _trigrams(oldest):
+                bucket = self._trigram_index.get(gram)
+                if bucket is not None:
+                    bucket.discard(oldest)
+                    if not bucket:
+                        del self._trigram_index[gram]
+
+    def _reset_index(self) -> None:
+        self._entries = OrderedDict()
+        self._sorted = []
+        self._trigram_index = {}
+        self._offset = 0
+        self._lines = 0
+
+    def _by_recency(self, matches, limit: Optional[int]) -> List[str]:
+        ranked = sorted(matches, key=self._entries.__getitem__, reverse=True)
+        return ranked if limit is None else ranked[:limit]
 
-    def _load_history(self) -> List[str]:
-        if not os.path.exists(self.history_file):
-            return []
+    # ------------------------------------------------------------------
+    # Log file
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool):
+        if fcntl is None:
+            yield
+            return
+        fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+        finally:
+            os.close(fd)  # releases the lock
+
+    def _catch_up(self) -> None:
+        """Fold in lines appended since the last read; reload if the log was replaced."""
         try:
-            with open(self.history_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return []
+            f = open(self.history_file, "rb")
+        except FileNotFoundError:
+            if self._inode is not None:
+                self._reset_index()
+                self._inode = None
+            return
+        with f:
+            st = os.fstat(f.fileno())
+            if st.st_ino != self._inode or st.st_size < self._offset:
+                self._reset_index()
+                self._inode = st.st_ino
+            if st.st_size == self._offset:
+                return
+            f.seek(self._offset)
+            data = f.read()
+        end = data.rfind(b"\n") + 1  # leave a half-written line for next time
+        for line in data[:end].splitlines():
+            self._lines += 1
+            try:
+                command = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(command, str) and command:
+                self._apply(command)
+        self._offset += end
+
+    def _append(self, command: str) -> None:
+        line = (json.dumps(command) + "\n").encode("utf-8")
+        with self._file_lock(exclusive=False):
+            # Opened per append so a concurrent compaction's new file is used
+            fd = os.open(self.history_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
 
-    def _save_history(self) -> None:
+    def _compact(self) -> None:
+        """Rewrite the log with just the live entries, oldest first."""
+        with self._file_lock(exclusive=True):
+            self._catch_up()
+            if self._lines <= self.max_entries * self.compact_factor:
+                return  # another process already compacted
+            tmp = f"{self.history_file}.{os.getpid()}.tmp"
+            data = "".join(json.dumps(c) + "\n" for c in self._entries).encode("utf-8")
+            try:
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, self.history_file)
+            except OSError:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+                return
+            self._inode = os.stat(self.history_file).st_ino
+            self._offset = len(data)
+            self._lines = len(self._entries)
+
+    def _migrate_legacy(self) -> None:
+        """Import the old whole-file JSON history once."""
+        legacy = os.path.splitext(self.history_file)[0] + ".json"
+        if legacy == self.history_file or not os.path.exists(legacy) or os.path.exists(self.history_file):
+            return
         try:
-            with open(self.history_file, 'w') as f:
-                json.dump(self.history, f)
-        except IOError:
+            with open(legacy, "r") as f:
+                commands = [c for c in json.load(f) if isinstance(c, str) and c]
+            with open(self.history_file, "w") as f:
+                f.write("".join(json.dumps(c) + "\n" for c in commands))
+            os.rename(legacy, legacy + ".bak")
+        except (json.JSONDecodeError, TypeError, IOError):
             pass
 
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @property
+    def history(self) -> List[str]:
+        return self.get_history()
+
     def add_command(self, command: str) -> None:
-        """Add command to history, preventing consecutive duplicates."""
+        """Add command to history; an earlier occurrence moves to the end (like most shells)."""
         command = command.strip()
         if not command:
             return
 
-        # Prevent duplicates if same as last entry
-        if self.history and self.history[-1] == command:
-            return
+        with self._lock:
+            self._catch_up()
+            # Prevent duplicates if same as last entry
+            if self._entries and next(reversed(self._entries)) == command:
+                return
+            try:
+                self._append(command)
+            except OSError:
+                pass
+            self._catch_up()  # picks up our own line (and anyone else's) in order
+            if command not in self._entries:
+                self._apply(command)  # write failed; keep it for this session
+            if self._lines > self.max_entries * self.compact_factor:
+                self._compact()
 
-        # Remove previous occurrence to move it to the end (like most shells)
-        if command in self.history:
-            self.history.remove(command)
+    def get_history(self) -> List[str]:
+        """Distinct commands, oldest first."""
+        with self._lock:
+            self._catch_up()
+            return list(self._entries)
 
-        self.history.append(command)
+    def search_prefix(self, prefix: str, limit: Optional[int] = 10) -> List[str]:
+        """Commands starting with `prefix`, most recent first."""
+        with self._lock:
+            self._catch_up()
+            start = bisect.bisect_left(self._sorted, prefix)
+            matches = []
+            for command in self._sorted[start:]:
+                if not command.startswith(prefix):
+                    break
+                matches.append(command)
+            return self._by_recency(matches, limit)
 
-        # Limit history size (e.g., last 1000 commands)
-        if len(self.history) > 1000:
-            self.history = self.history[-1000:]
+    def search(self, text: str, limit: Optional[int] = 10) -> List[str]:
+        """Commands containing `text`, most recent first."""
+        with self._lock:
+            self._catch_up()
+            if len(text) < 3:
+                candidates = self._entries.keys()
+            else:
+                buckets = sorted((self._trigram_index.get(g, set()) for g in _trigrams(text)), key=len)
+                candidates = set.intersection(*buckets) if buckets[0] else set()
+            return self._by_recency([c for c in candidates if text in c], limit)
 
-        self._save_history()
+    def clear(self) -> None:
+        with self._lock, self._file_lock(exclusive=True):
+            # Replace rather than truncate so other processes see a new inode and reload
+            tmp = f"{self.history_file}.{os.getpid()}.tmp"
+            try:
+                open(tmp, "wb").close()
+                os.replace(tmp, self.history_file)
+            except IOError:
+                pass
+            self._reset_index()
+            self._inode = None
+            self._catch_up()
 
-    def get_history(self) -> List[str]:
-        return list(self.history)
+# Global instance, created (and the log read) on first use
+_manager: Optional[CommandHistoryManager] = None
+_manager_lock = threading.Lock()
 
-    def clear(self) -> None:
-        self.history = []
-        self._save_history()
+def get_history_manager() -> CommandHistoryManager:
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                with timed("command history"):
+                    _manager = CommandHistoryManager()
+    return _manager
 
-# Global instance
-HISTORY_MANAGER = CommandHistoryManager()
+def __getattr__(name):
+    # Keeps `from jcapy.core.history import HISTORY_MANAGER` working
+    if name == "HISTORY_MANAGER":
+        return get_history_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,17 +1,21 @@
 # SPDX-License-Identifier: Apache-2.0
+import argparse
 import contextlib
+import importlib
 import importlib.metadata
 import importlib.util
+import inspect
 import io
 import os
 import shlex
 import sys
+import threading
 import time
-import yaml
-from typing import Dict, Any, Callable, Optional, List
+from dataclasses import dataclass
+from typing import Dict, Any, Callable, Optional, List, Sequence, Tuple
 
 from jcapy.core.base import CommandResult, ResultStatus
-from jcapy.core.history import HISTORY_MANAGER
+from jcapy.core.history import get_history_manager
 
 
 class MockArgs:
@@ -36,6 +40,132 @@ class StreamingIO(io.StringIO):
         return super().write(s)
 
 
+class _RoutedStream:
+    """
+    Stands in for sys.stdout/sys.stderr and sends each write to the
+    capture buffer of the thread that made it, or to the stream it
+    replaced when that thread is not capturing. Swapping the global
+    stream per command would mix the output of commands running on
+    different threads (daemon jobs, RPC workers).
+    """
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    @property
+    def _target(self):
+        return getattr(self._local, "target", None) or self._fallback
+
+    def write(self, s: str) -> int:
+        return self._target.write(s)
+
+    def flush(self):
+        return self._target.flush()
+
+    def __getattr__(self, item):
+        return getattr(self._target, item)
+
+
+_route_lock = threading.Lock()
+
+
+def _routed(name: str) -> _RoutedStream:
+    """The _RoutedStream installed as sys.<name>, installing it once."""
+    with _route_lock:
+        stream = getattr(sys, name)
+        if not isinstance(stream, _RoutedStream):
+            stream = _RoutedStream(stream)
+            setattr(sys, name, stream)
+        return stream
+
+
+@contextlib.contextmanager
+def capture_output(buffer):
+    """Route this thread's stdout and stderr writes into `buffer`."""
+    streams = [_routed("stdout"), _routed("stderr")]
+    previous = [getattr(s._local, "target", None) for s in streams]
+    for stream in streams:
+        stream._local.target = buffer
+    try:
+        yield buffer
+    finally:
+        for stream, target in zip(streams, previous):
+            stream._local.target = target
+
+
+class SilentParser(argparse.ArgumentParser):
+    """ArgumentParser that raises instead of printing usage and exiting."""
+    def error(self, message): raise ValueError(message)
+    def exit(self, status=0, message=None): raise ValueError(message or f"Exit {status}")
+
+
+@dataclass(frozen=True)
+class CommandMeta:
+    """Per-command dispatch metadata, built once and reused across calls."""
+    parser: Optional[argparse.ArgumentParser]  # None: no setup_parser (or it failed) -> MockArgs
+    takes_args: bool                           # Whether the handler accepts the args namespace
+
+
+@dataclass(frozen=True)
+class CommandSpec:
+    """
+    Manifest entry for a command whose implementation is imported lazily.
+
+    `target` is a "module:attr" path to a function or CommandBase subclass.
+    `adapter(resolved, args)` maps the parsed namespace onto a function's own
+    signature; without one the target receives `args` if it takes a parameter.
+    """
+    name: str
+    target: str
+    description: str = ""
+    aliases: Tuple[str, ...] = ()
+    setup_parser: Optional[Callable] = None
+    interactive: bool = False
+    adapter: Optional[Callable[[Callable, Any], Any]] = None
+
+
+class LazyHandler:
+    """Command handler that imports its target module on first dispatch."""
+
+    def __init__(self, target: str, adapter: Optional[Callable[[Callable, Any], Any]] = None):
+        self.target = target
+        self.adapter = adapter
+        self._resolved: Optional[Callable] = None
+        self._takes_args = True
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._resolved is not None
+
+    def resolve(self) -> Callable:
+        """Import the target (once) and return the callable that runs the command."""
+        if self._resolved is not None:
+            return self._resolved
+        with self._lock:
+            if self._resolved is None:
+                module_name, _, attr = self.target.partition(":")
+                obj = getattr(importlib.import_module(module_name), attr)
+                if isinstance(obj, type):
+                    obj = obj().execute  # CommandBase subclass
+                try:
+                    self._takes_args = len(inspect.signature(obj).parameters) > 0
+                except (TypeError, ValueError):
+                    self._takes_args = True
+                self._resolved = obj
+        return self._resolved
+
+    def __call__(self, args=None):
+        handler = self.resolve()
+        if self.adapter is not None:
+            return self.adapter(handler, args)
+        return handler(args) if self._takes_args else handler()
+
+    def __repr__(self):
+        state = "loaded" if self.is_loaded else "deferred"
+        return f"<LazyHandler {self.target} ({state})>"
+
+
 class CommandRegistry:
     """
     Central registry for JCapy commands.
@@ -47,7 +177,10 @@ class CommandRegistry:
         self._aliases: Dict[str, str] = {}
         self._arguments: Dict[str, Callable] = {} # Hook for argparse setup
         self._interactive: set = set()  # Commands that need raw TTY (can't run in TUI)
+        self._default_interactive: set = set()  # As registered, before config overrides
         self._disabled: set = set()     # Commands hidden from execution by config
+        self._meta: Dict[str, CommandMeta] = {}  # Compiled parsers/signatures (see _get_meta)
+        self._meta_lock = threading.Lock()
 
     def register(self, name, handler: Callable = None, description: str = None, aliases: List[str] = None, setup_parser: Callable = None, interactive: bool = False):
         """
@@ -74,22 +207,40 @@ class CommandRegistry:
         self._commands[name] = handler
         self._descriptions[name] = description
         self._arguments[name] = setup_parser
+        self._meta.pop(name, None)
 
         if interactive:
             self._interactive.add(name)
+            self._default_interactive.add(name)
 
         if aliases:
             for alias in aliases:
                 self._aliases[alias] = name
 
+    def register_manifest(self, specs: Sequence[CommandSpec]):
+        """
+        Register commands from a manifest without importing their modules.
+        Each handler is a LazyHandler that imports its target on first call.
+        """
+        for spec in specs:
+            self.register(
+                spec.name,
+                LazyHandler(spec.target, spec.adapter),
+                spec.description,
+                aliases=list(spec.aliases),
+                setup_parser=spec.setup_parser,
+                interactive=spec.interactive,
+            )
+
     def get_interactive_defaults(self) -> set:
         """Return the hardcoded interactive command set (for config reset)."""
-        return self._interactive.copy()
+        return self._default_interactive.copy()
 
     def apply_config_overrides(self):
         """
         Read `commands.interactive` from ConfigManager and override the
-        _interactive set. Format: comma-separated command names.
+        _interactive set. Format: comma-separated command names. Without
+        the key, the registered defaults apply again.
 
         Usage:
             jcapy config set commands.interactive "init,deploy,harvest,persona,tutorial"
@@ -107,6 +258,8 @@ class CommandRegistry:
                     import sys
                     print(f"[jcapy] Warning: unknown interactive commands ignored: {invalid}", file=sys.stderr)
                 self._interactive = valid
+            else:
+                self._interactive = set(self._default_interactive)
         except Exception:
             pass  # Config not available yet — use hardcoded defaults
 
@@ -146,6 +299,39 @@ class CommandRegistry:
 
         return None
 
+    def _get_meta(self, canonical: str, handler: Callable) -> CommandMeta:
+        """
+        Return the cached parser and signature info for a command, building it
+        on first use. argparse parsers are not mutated by parse_args, so one
+        instance is safely shared by concurrent dispatches.
+        """
+        meta = self._meta.get(canonical)
+        if meta is not None:
+            return meta
+
+        with self._meta_lock:
+            meta = self._meta.get(canonical)
+            if meta is not None:
+                return meta
+
+            parser = None
+            setup_parser_func = self._arguments.get(canonical)
+            if setup_parser_func:
+                parser = SilentParser(prog=canonical, add_help=False)
+                try:
+                    setup_parser_func(parser)
+                except Exception:
+                    parser = None  # Fallback to MockArgs
+
+            try:
+                takes_args = len(inspect.signature(handler).parameters) > 0
+            except (TypeError, ValueError):
+                takes_args = True
+
+            meta = CommandMeta(parser=parser, takes_args=takes_args)
+            self._meta[canonical] = meta
+            return meta
+
     def get_commands(self) -> Dict[str, str]:
         """Return all registered commands and descriptions (excluding disabled)."""
         return {k: v for k, v in self._descriptions.items() if k not in self._disabled}
@@ -160,7 +346,7 @@ class CommandRegistry:
         Supports integrated piping via '|'.
         """
         # Save to history
-        HISTORY_MANAGER.add_command(command_str)
+        get_history_manager().add_command(command_str)
 
         # Handle Piping
         if "|" in command_str:
@@ -214,17 +400,10 @@ class CommandRegistry:
 
         # Prepare arguments (Try parsing if setup_parser exists)
         mock_args = MockArgs(cmd_args, piped_data=piped_data, tui_data=tui_data)
-        setup_parser_func = self._arguments.get(canonical)
-        if setup_parser_func:
-            import argparse
-            class SilentParser(argparse.ArgumentParser):
-                def error(self, message): raise ValueError(message)
-                def exit(self, status=0, message=None): raise ValueError(message or f"Exit {status}")
-
-            parser = SilentParser(prog=base_cmd, add_help=False)
+        meta = self._get_meta(canonical, handler)
+        if meta.parser is not None:
             try:
-                setup_parser_func(parser)
-                parsed_args = parser.parse_args(cmd_args)
+                parsed_args = meta.parser.parse_args(cmd_args)
                 setattr(parsed_args, 'piped_data', piped_data)
                 setattr(parsed_args, 'tui_data', tui_data)
                 setattr(parsed_args, '_tokens', cmd_args)
@@ -236,13 +415,9 @@ class CommandRegistry:
         capture = StreamingIO(callback=log_callback)
 
         try:
-            import inspect
-            sig = inspect.signature(handler)
-
-            with contextlib.redirect_stdout(capture), \
-                 contextlib.redirect_stderr(capture):
+            with capture_output(capture):
                 # Check if it's a bound method or has 1+ parameters
-                if len(sig.parameters) > 0:
+                if meta.takes_args:
                     result = handler(mock_args)
                 else:
                     result = handler()
@@ -355,6 +530,7 @@ class CommandRegistry:
 
     def _load_single_plugin(self, plugin_dir: str, manifest_path: str):
         """Helper to load a single plugin from a directory."""
+        import yaml  # only needed once a plugin manifest is found
         with open(manifest_path, 'r') as f:
             manifest = yaml.safe_load(f)
 
@@ -4,19 +4,10 @@ from typing import Optional, Any, Callable, Dict
 
 from jcapy.core.plugins import CommandRegistry
 from jcapy.config import CONFIG_MANAGER
-from jcapy.core.history import HISTORY_MANAGER
+from jcapy.core.history import get_history_manager
 from jcapy.core.audit import audit_log
 from jcapy.core.bus import EVENT_BUS
-from jcapy.core.zmq_publisher import get_zmq_bridge
-
-try:
-    from jcapy.core.a2a.client import A2AClient
-    from jcapy.core.a2a.protocol import Message, Role, Part
-except ImportError:
-    A2AClient = None
-    Message = None
-    Role = None
-    Part = None
+from jcapy.utils.startup_profile import timed
 
 logger = logging.getLogger('jcapy.service')
 
@@ -29,24 +20,41 @@ class JCapyService:
     def __init__(self, registry: Optional[CommandRegistry] = None):
         self.registry = registry or CommandRegistry()
         self.config = CONFIG_MANAGER
-        self.history = HISTORY_MANAGER
         self.bus = EVENT_BUS
         self._publisher = None # Lazy loaded or injected
 
-        # A2A Integration (Commander Phase 5)
-        self.a2a_client = A2AClient() if A2AClient else None
-        if self.a2a_client:
-            self.bus.subscribe("task_updated", self._on_task_updated)
+        # A2A Integration (Commander Phase 5). The client (grpc, pydantic) is
+        # created the first time a task targets a remote agent.
+        self._a2a_client = None
+        self._a2a_loaded = False
+        self.bus.subscribe("task_updated", self._on_task_updated)
+
+    @property
+    def history(self):
+        return get_history_manager()
+
+    @property
+    def a2a_client(self):
+        """Lazy A2A client; None if its dependencies aren't installed."""
+        if not self._a2a_loaded:
+            self._a2a_loaded = True
+            try:
+                from jcapy.core.a2a.client import A2AClient
+                with timed("a2a client"):
+                    self._a2a_client = A2AClient()
+            except ImportError:
+                self._a2a_client = None
+        return self._a2a_client
 
     def _on_task_updated(self, event_data: Dict) -> None:
         """Forward task updates to the A2A Network if they target a remote agent."""
-        if not self.a2a_client or not Message:
-            return
-
         target = event_data.get("target")
         # If it targets another agent (like 'cline' or 'opencode'), dispatch it
         if target and target.lower() not in ["jcapy", "local", "self"]:
+            if not self.a2a_client:
+                return
             import uuid
+            from jcapy.core.a2a.protocol import Message, Role, Part
             msg = Message(
                 message_id=str(uuid.uuid4()),
                 task_id=str(event_data.get("task_id", "unknown")),
@@ -64,6 +72,7 @@ class JCapyService:
     def publisher(self):
         """Lazy access to the global ZMQ bridge publisher."""
         if self._publisher is None:
+            from jcapy.core.zmq_publisher import get_zmq_bridge
             bridge = get_zmq_bridge()
             if bridge and bridge.is_running:
                 self._publisher = bridge.publisher
@@ -123,8 +132,9 @@ def get_service() -> JCapyService:
     global _service_instance
     if _service_instance is None:
         from jcapy.core.bootstrap import register_core_commands
-        registry = CommandRegistry()
-        register_core_commands(registry)
-        registry.load_plugins()
-        _service_instance = JCapyService(registry)
+        with timed("service: registry + plugins"):
+            registry = CommandRegistry()
+            register_core_commands(registry)
+            registry.load_plugins()
+            _service_instance = JCapyService(registry)
     return _service_instance
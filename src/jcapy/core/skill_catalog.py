@@ -0,0 +1,571 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Persistent catalog of a skill library.
+
+A SQLite database per library (~/.jcapy/catalog/<hash>.db) records every
+file's relative path, name, title, frontmatter, size and mtime, plus the
+mtime of every directory, and keeps an FTS5 index over the title,
+frontmatter and body of every markdown file. refresh() stats the known
+directories and rescans only those whose mtime changed, so listings,
+name lookups and searches no longer walk the library or read each file.
+
+Editing a file in place doesn't change its directory's mtime. Code that
+writes into the library calls touch(). search() also compares the size
+and mtime of every indexed markdown file, at most once every
+`file_check_interval` seconds (JCAPY_CATALOG_FILE_CHECK_INTERVAL), so a
+fresh process always searches current text. Other lookups pick up such
+edits at the next verifying refresh, which re-stats files at most once
+every `verify_interval` seconds (JCAPY_CATALOG_VERIFY_INTERVAL).
+
+Query results are kept in memory until this process changes the catalog
+or SQLite's data_version shows another process did.
+"""
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import stat
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_VERIFY_INTERVAL = float(os.environ.get('JCAPY_CATALOG_VERIFY_INTERVAL', 3600))
+DEFAULT_FILE_CHECK_INTERVAL = float(os.environ.get('JCAPY_CATALOG_FILE_CHECK_INTERVAL', 2))
+FRONTMATTER_BYTES = 64 * 1024
+MAX_BODY_BYTES = 1024 * 1024
+SCHEMA_VERSION = 2
+SKIP_DIRS = {".git", "__pycache__"}
+MAX_CACHED_QUERIES = 256
+SNIPPET_BATCH = 500
+
+_H1 = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+_WORD = re.compile(r'\w+')
+
+
+@dataclass(frozen=True)
+class SkillEntry:
+    """One file in the library."""
+    path: str                   # absolute
+    rel_path: str               # relative to the library root, '/'-separated
+    name: str                   # file name
+    title: str
+    metadata: Dict[str, Any]    # YAML frontmatter (markdown files only)
+    size: int
+    mtime: float
+
+    @property
+    def category(self) -> str:
+        return os.path.dirname(self.rel_path) or "General"
+
+    @property
+    def is_markdown(self) -> bool:
+        return self.name.endswith(".md")
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """A full-text match, best first. `snippet` is from the body, matched words marked."""
+    entry: SkillEntry
+    snippet: str
+    score: float
+
+
+@dataclass
+class CatalogChanges:
+    """Relative paths (re)indexed or dropped by a refresh."""
+    updated: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    def __bool__(self):
+        return bool(self.updated or self.removed)
+
+
+def _join(rel_dir: str, name: str) -> str:
+    return f"{rel_dir}/{name}" if rel_dir else name
+
+
+def _under(prefix: str) -> Tuple[str, str]:
+    """Range of '/'-separated paths below `prefix`, for `path >= ? AND path < ?`."""
+    prefix = prefix.strip("/") + "/"
+    return prefix, prefix[:-1] + chr(ord("/") + 1)
+
+
+def _read_skill(path: str, name: str) -> Tuple[str, Dict[str, Any], str]:
+    """Title, frontmatter and body of a library file (body only for markdown)."""
+    stem = os.path.splitext(name)[0]
+    if not name.endswith(".md"):
+        return stem, {}, ""
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            content = f.read(MAX_BODY_BYTES)
+    except OSError:
+        return stem, {}, ""
+    from jcapy.services.frameworks.parsers.markdown import parse_frontmatter
+    head = content[:FRONTMATTER_BYTES]
+    metadata = parse_frontmatter(head)
+    body = content
+    if not isinstance(metadata, dict):
+        metadata = {}
+    else:
+        body = content.lstrip().split("---", 2)[-1]
+    title = metadata.get("title") or metadata.get("name")
+    if not title:
+        match = _H1.search(head)
+        title = match.group(1).strip() if match else stem
+    return str(title), metadata, body
+
+
+def _metadata_text(value: Any) -> str:
+    """Frontmatter values flattened to searchable text."""
+    if isinstance(value, dict):
+        return " ".join(_metadata_text(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return " ".join(_metadata_text(v) for v in value)
+    return "" if value is None else str(value)
+
+
+def _match_expression(query: str) -> Optional[str]:
+    """
+    A user query as an FTS5 expression: every word must appear, the last
+    one as a prefix so results narrow while typing. Words are quoted, so
+    FTS syntax in the query is matched literally.
+    """
+    words = _WORD.findall(query)
+    if not words:
+        return None
+    terms = ['"' + w.replace('"', '""') + '"' for w in words]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+class SkillCatalog:
+    """Incrementally maintained SQLite catalog of the files in a skill library."""
+
+    def __init__(self, library_path: str, db_path: Optional[str] = None,
+                 verify_interval: float = DEFAULT_VERIFY_INTERVAL,
+                 file_check_interval: float = DEFAULT_FILE_CHECK_INTERVAL):
+        self.library_path = os.path.abspath(library_path)
+        if db_path is None:
+            from jcapy.config import JCAPY_HOME
+            key = hashlib.sha1(os.path.realpath(self.library_path).encode("utf-8")).hexdigest()[:16]
+            db_path = os.path.join(JCAPY_HOME, "catalog", f"{key}.db")
+        self.db_path = db_path
+        self.verify_interval = verify_interval
+        self.file_check_interval = file_check_interval
+        self._files_checked_at = float("-inf")
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._data_version = None
+        self._dirs: Optional[Dict[str, int]] = None
+        self._files: Optional[Dict[str, Tuple[int, int]]] = None    # absolute path -> (size, mtime_ns)
+        self._results: Dict[Tuple, List[SkillEntry]] = {}
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10.0, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _db(self) -> sqlite3.Connection:
+        """The catalog's connection (caller holds the lock), dropping cached
+        results when another process has committed since we last looked."""
+        if self._conn is None:
+            self._conn = self._connect()
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._data_version:
+            self._data_version = version
+            self._invalidate()
+        return self._conn
+
+    def _invalidate(self) -> None:
+        self._dirs = None
+        self._files = None
+        self._results.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._invalidate()
+
+    def _init_db(self):
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS dirs (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS skills (
+                    path TEXT PRIMARY KEY,
+                    dir TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    lname TEXT NOT NULL,
+                    depth INTEGER NOT NULL,
+                    title TEXT,
+                    metadata TEXT,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_skills_name ON skills(name);
+                CREATE INDEX IF NOT EXISTS idx_skills_dir ON skills(dir);
+                CREATE TABLE IF NOT EXISTS catalog_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            """)
+            row = conn.execute("SELECT value FROM catalog_meta WHERE key = 'schema'").fetchone()
+            if row is None or row[0] != str(SCHEMA_VERSION):
+                # Older layout: start over, the next refresh rebuilds everything
+                conn.executescript("DELETE FROM skills; DELETE FROM dirs; DELETE FROM catalog_meta;"
+                                   "DROP TABLE IF EXISTS skills_fts;")
+                conn.execute("INSERT INTO catalog_meta (key, value) VALUES ('schema', ?)", (str(SCHEMA_VERSION),))
+            try:
+                # rowid matches skills.rowid; bm25 weights below follow this column order
+                conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS skills_fts USING fts5("
+                             "title, metadata, body, tokenize = 'porter unicode61')")
+                self.has_fts = True
+            except sqlite3.OperationalError:  # SQLite built without FTS5
+                self.has_fts = False
+        finally:
+            conn.close()
+
+    def _abs(self, rel_path: str) -> str:
+        return os.path.join(self.library_path, *rel_path.split("/")) if rel_path else self.library_path
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def refresh(self, full: bool = False, files: bool = False) -> CatalogChanges:
+        """
+        Bring the catalog up to date. Directories whose mtime is unchanged
+        are skipped; `full` (or an elapsed verify interval) also re-stats
+        the files in them. `files` re-stats the indexed markdown files
+        when `file_check_interval` has passed, catching in-place edits.
+        """
+        with self._lock:
+            conn = self._db()
+            now = time.monotonic()
+            check_files = files and now - self._files_checked_at >= self.file_check_interval
+            if check_files:
+                self._files_checked_at = now
+            if not full and not self._verify_due(conn) and not self._changed_dirs(conn) \
+                    and not (check_files and self._changed_files(conn)):
+                return CatalogChanges()  # the common case: a few stats, no write lock
+            return self._refresh(conn, full or check_files)
+
+    def _verify_due(self, conn: sqlite3.Connection) -> bool:
+        row = conn.execute("SELECT value FROM catalog_meta WHERE key = 'verified_at'").fetchone()
+        return row is None or time.time() - float(row[0]) >= self.verify_interval
+
+    def _changed_dirs(self, conn: sqlite3.Connection) -> bool:
+        if self._dirs is None:
+            self._dirs = dict(conn.execute("SELECT path, mtime_ns FROM dirs"))
+        if not self._dirs:
+            return True
+        for rel_dir, mtime_ns in self._dirs.items():
+            try:
+                if os.stat(self._abs(rel_dir)).st_mtime_ns != mtime_ns:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def _changed_files(self, conn: sqlite3.Connection) -> bool:
+        if self._files is None:
+            root = os.path.join(self.library_path, "")
+            self._files = {root + path.replace("/", os.sep): (size, mtime_ns) for path, size, mtime_ns in
+                           conn.execute("SELECT path, size, mtime_ns FROM skills WHERE name GLOB '*.md'")}
+        stat_ = os.stat
+        for path, (size, mtime_ns) in self._files.items():
+            try:
+                st = stat_(path)
+            except OSError:
+                return True
+            if st.st_mtime_ns != mtime_ns or st.st_size != size:
+                return True
+        return False
+
+    def _refresh(self, conn: sqlite3.Connection, full: bool) -> CatalogChanges:
+        changes = CatalogChanges()
+        conn.execute("BEGIN IMMEDIATE")  # one process scans at a time
+        try:
+            verify = full or self._verify_due(conn)
+            known = dict(conn.execute("SELECT path, mtime_ns FROM dirs"))
+            rebuild = not known
+            pending = [""] if rebuild else []
+            for rel_dir, mtime_ns in list(known.items()):
+                try:
+                    st = os.stat(self._abs(rel_dir))
+                except OSError:
+                    st = None
+                if st is None or not stat.S_ISDIR(st.st_mode):
+                    self._drop_dir(conn, rel_dir, changes)
+                elif st.st_mtime_ns != mtime_ns:
+                    pending.append(rel_dir)
+                elif verify:
+                    self._verify_dir(conn, rel_dir, changes)
+
+            while pending:
+                self._scan_dir(conn, pending.pop(), known, pending, changes)
+
+            if verify:
+                conn.execute("INSERT OR REPLACE INTO catalog_meta (key, value) VALUES ('verified_at', ?)",
+                             (repr(time.time()),))
+            conn.execute("COMMIT")
+            if verify or rebuild:
+                self._files_checked_at = time.monotonic()  # every file was just stat'ed
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            self._invalidate()
+        return changes
+
+    def _scan_dir(self, conn: sqlite3.Connection, rel_dir: str, known: Dict[str, int],
+                  pending: List[str], changes: CatalogChanges) -> None:
+        abs_dir = self._abs(rel_dir)
+        try:
+            mtime_ns = os.stat(abs_dir).st_mtime_ns  # taken before listing: a later change rescans
+            entries = list(os.scandir(abs_dir))
+        except OSError:
+            self._drop_dir(conn, rel_dir, changes)
+            return
+        conn.execute("INSERT OR REPLACE INTO dirs (path, mtime_ns) VALUES (?, ?)", (rel_dir, mtime_ns))
+
+        indexed = {name: (size, mtime) for name, size, mtime in conn.execute(
+            "SELECT name, size, mtime_ns FROM skills WHERE dir = ?", (rel_dir,))}
+        seen = set()
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    child = _join(rel_dir, entry.name)
+                    if entry.name not in SKIP_DIRS and child not in known:
+                        known[child] = -1
+                        pending.append(child)
+                    continue
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            seen.add(entry.name)
+            if indexed.get(entry.name) != (st.st_size, st.st_mtime_ns):
+                self._index_file(conn, _join(rel_dir, entry.name), st)
+                changes.updated.append(_join(rel_dir, entry.name))
+
+        for name in indexed.keys() - seen:
+            self._delete_file(conn, _join(rel_dir, name))
+            changes.removed.append(_join(rel_dir, name))
+
+    def _verify_dir(self, conn: sqlite3.Connection, rel_dir: str, changes: CatalogChanges) -> None:
+        rows = conn.execute("SELECT path, size, mtime_ns FROM skills WHERE dir = ?", (rel_dir,)).fetchall()
+        for rel_path, size, mtime_ns in rows:
+            try:
+                st = os.stat(self._abs(rel_path))
+            except OSError:
+                self._delete_file(conn, rel_path)
+                changes.removed.append(rel_path)
+                continue
+            if (st.st_size, st.st_mtime_ns) != (size, mtime_ns):
+                self._index_file(conn, rel_path, st)
+                changes.updated.append(rel_path)
+
+    def _drop_dir(self, conn: sqlite3.Connection, rel_dir: str, changes: CatalogChanges) -> None:
+        for (rel_path,) in conn.execute("SELECT path FROM skills WHERE dir = ?", (rel_dir,)).fetchall():
+            self._delete_file(conn, rel_path)
+            changes.removed.append(rel_path)
+        conn.execute("DELETE FROM dirs WHERE path = ?", (rel_dir,))
+
+    def _index_file(self, conn: sqlite3.Connection, rel_path: str, st: os.stat_result) -> None:
+        rel_dir, _, name = rel_path.rpartition("/")
+        title, metadata, body = _read_skill(self._abs(rel_path), name)
+        self._delete_file(conn, rel_path)
+        cur = conn.execute(
+            "INSERT INTO skills (path, dir, name, lname, depth, title, metadata, size, mtime_ns) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (rel_path, rel_dir, name, name.lower(), rel_path.count("/"), title,
+             json.dumps(metadata, default=str), st.st_size, st.st_mtime_ns)
+        )
+        if self.has_fts and name.endswith(".md"):
+            conn.execute("INSERT INTO skills_fts (rowid, title, metadata, body) VALUES (?, ?, ?, ?)",
+                         (cur.lastrowid, title, _metadata_text(metadata), body))
+
+    def _delete_file(self, conn: sqlite3.Connection, rel_path: str) -> None:
+        if self.has_fts:
+            conn.execute("DELETE FROM skills_fts WHERE rowid = (SELECT rowid FROM skills WHERE path = ?)",
+                         (rel_path,))
+        conn.execute("DELETE FROM skills WHERE path = ?", (rel_path,))
+
+    def touch(self, path: str) -> None:
+        """Re-index (or drop) one file after writing or deleting it."""
+        rel_path = os.path.relpath(os.path.abspath(path), self.library_path).replace(os.sep, "/")
+        if rel_path.startswith("../"):
+            return
+        with self._lock:
+            conn = self._db()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                try:
+                    self._index_file(conn, rel_path, os.stat(path))
+                except OSError:
+                    self._delete_file(conn, rel_path)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            finally:
+                self._invalidate()
+
+    def rebuild(self) -> CatalogChanges:
+        """Drop and rebuild the whole catalog."""
+        with self._lock:
+            conn = self._db()
+            conn.execute("DELETE FROM skills")
+            conn.execute("DELETE FROM dirs")
+            conn.execute("DELETE FROM catalog_meta WHERE key != 'schema'")
+            if self.has_fts:
+                conn.execute("DELETE FROM skills_fts")
+            self._invalidate()
+        return self.refresh()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    _COLUMNS = "path, name, title, metadata, size, mtime_ns"
+
+    def _entry(self, row) -> SkillEntry:
+        rel_path, name, title, metadata, size, mtime_ns = row
+        return SkillEntry(path=self._abs(rel_path), rel_path=rel_path, name=name, title=title or name,
+                          metadata=json.loads(metadata) if metadata and metadata != "{}" else {},
+                          size=size, mtime=mtime_ns / 1e9)
+
+    def _query(self, where: str = "", params: Tuple = (), order: str = "dir, name",
+               limit: Optional[int] = None, refresh: bool = True) -> List[SkillEntry]:
+        if refresh:
+            self.refresh()
+        sql = f"SELECT {self._COLUMNS} FROM skills{where} ORDER BY {order}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            conn = self._db()
+            key = (sql, params)
+            found = self._results.get(key)
+            if found is None:
+                if len(self._results) >= MAX_CACHED_QUERIES:
+                    self._results.clear()
+                found = self._results[key] = [self._entry(row) for row in conn.execute(sql, params)]
+        return list(found)
+
+    def entries(self, under: Optional[str] = None, markdown_only: bool = False,
+                refresh: bool = True) -> List[SkillEntry]:
+        """Every cataloged file (optionally below `under`), grouped by directory."""
+        clauses, params = [], []
+        if under:
+            clauses.append("path >= ? AND path < ?")
+            params.extend(_under(under))
+        if markdown_only:
+            clauses.append("name GLOB '*.md'")
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        return self._query(where, tuple(params), refresh=refresh)
+
+    def get(self, rel_path: str, refresh: bool = True) -> Optional[SkillEntry]:
+        found = self._query(" WHERE path = ?", (rel_path.strip("/"),), refresh=refresh)
+        return found[0] if found else None
+
+    def find(self, name: str, fuzzy: bool = True, under: Optional[str] = None,
+             refresh: bool = True) -> Optional[SkillEntry]:
+        """
+        Resolve a skill by file name: an exact match (`name` or `name.md`)
+        first, then, if `fuzzy`, the first markdown file whose name
+        contains `name` (case-insensitive). Shallower paths win ties.
+        """
+        scope, params = "", ()
+        if under:
+            scope, params = " AND path >= ? AND path < ?", _under(under)
+        found = self._query(" WHERE name IN (?, ?)" + scope, (name, f"{name}.md") + params,
+                            order="depth, path", limit=1, refresh=refresh)
+        if not found and fuzzy:
+            found = self._query(" WHERE instr(lname, ?) > 0 AND name GLOB '*.md'" + scope,
+                                (name.lower(),) + params, order="depth, path", limit=1, refresh=False)
+        return found[0] if found else None
+
+    def search(self, query: str, limit: Optional[int] = None, under: Optional[str] = None,
+               highlight: Tuple[str, str] = ("[", "]"), refresh: bool = True) -> List[SearchHit]:
+        """
+        Markdown files matching every word of `query` in their title,
+        frontmatter or body, ranked by BM25 (title hits weigh most).
+        All matches unless `limit` is given.
+        """
+        if refresh:
+            self.refresh(files=True)
+        if not self.has_fts:
+            return self._scan_search(query, limit, under)
+        expression = _match_expression(query)
+        if expression is None:
+            return []
+        scope, params = "", ()
+        if under:
+            scope, params = " AND s.path >= ? AND s.path < ?", _under(under)
+        # Rank first, then build snippets for the page only: inside the
+        # ranking query SQLite would compute one for every match
+        rank_sql = ("SELECT skills_fts.rowid, bm25(skills_fts, 10.0, 4.0, 1.0) AS score FROM skills_fts "
+                    + ("JOIN skills s ON s.rowid = skills_fts.rowid " if scope else "")
+                    + f"WHERE skills_fts MATCH ?{scope} ORDER BY score LIMIT ?")
+        with self._lock:
+            conn = self._db()
+            ranked = conn.execute(rank_sql, (expression, *params, -1 if limit is None else int(limit))).fetchall()
+            if not ranked:
+                return []
+            columns = ", ".join("s." + c for c in self._COLUMNS.split(", "))
+            by_rowid = {}
+            for start in range(0, len(ranked), SNIPPET_BATCH):  # stay under SQLite's variable limit
+                page = [rowid for rowid, _ in ranked[start:start + SNIPPET_BATCH]]
+                by_rowid.update((row[0], row) for row in conn.execute(
+                    f"SELECT skills_fts.rowid, {columns}, snippet(skills_fts, 2, ?, ?, '…', 12) "
+                    "FROM skills_fts JOIN skills s ON s.rowid = skills_fts.rowid "
+                    f"WHERE skills_fts MATCH ? AND skills_fts.rowid IN ({', '.join('?' * len(page))})",
+                    (*highlight, expression, *page)))
+        return [SearchHit(entry=self._entry(by_rowid[rowid][1:7]), snippet=" ".join(by_rowid[rowid][7].split()),
+                          score=-score)
+                for rowid, score in ranked if rowid in by_rowid]
+
+    def _scan_search(self, query: str, limit: Optional[int], under: Optional[str]) -> List[SearchHit]:
+        # Without FTS5: the old substring scan, over cataloged files only
+        needle, hits = query.lower(), []
+        for entry in self.entries(under=under, markdown_only=True, refresh=False):
+            try:
+                with open(entry.path, "r", encoding="utf-8", errors="replace") as f:
+                    content = f.read(MAX_BODY_BYTES)
+            except OSError:
+                continue
+            at = content.lower().find(needle)
+            if at >= 0:
+                hits.append(SearchHit(entry=entry, snippet=" ".join(content[max(0, at - 40):at + 80].split()),
+                                      score=0.0))
+                if limit is not None and len(hits) >= limit:
+                    break
+        return hits
+
+
+_catalogs: Dict[str, SkillCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(library_path: str) -> SkillCatalog:
+    """The process-wide catalog for a library, created on first use."""
+    key = os.path.abspath(library_path)
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = _catalogs[key] = SkillCatalog(key)
+    return catalog
@@ -4,14 +4,18 @@ JCapy ZMQ Publisher Module
 
 Provides ZeroMQ-based communication between TUI and Web Control Plane.
 - ZmqPublisher: PUB socket for broadcasting events (port 5555)
-- ZmqRpcServer: REP socket for handling commands (port 5556)
+- ZmqRpcServer: ROUTER broker with a DEALER worker pool for commands (port 5556)
 """
 
 import os
 import json
+import heapq
+import itertools
 import threading
+import time
 import logging
-from typing import Any, Dict, Optional, Callable
+from collections import deque
+from typing import Any, Dict, List, Optional, Callable
 from datetime import datetime
 
 logger = logging.getLogger('jcapy.zmq')
@@ -157,115 +161,274 @@ class ZmqPublisher:
 
 class ZmqRpcServer:
     """
-    ZeroMQ REP socket for handling commands from Web Control Plane.
-    
+    ZeroMQ RPC broker for handling commands from Web Control Plane.
+
+    A ROUTER socket faces clients; worker threads each hold a DEALER socket
+    connected to an inproc ROUTER backend. Workers announce themselves when
+    idle and the broker hands each request to an idle worker, so one slow
+    command no longer blocks other RPC clients. Existing REQ clients keep
+    working unchanged: they send one JSON string and receive one JSON string.
+
+    Each request carries a deadline (default `request_timeout`, or the
+    request's own `"timeout"` field in seconds). When it passes, the client
+    gets an error reply; queued work is dropped and late replies discarded.
+
     Usage:
-        server = ZmqRpcServer(command_handler=my_handler)
-        server.start()  # Runs in background thread
+        server = ZmqRpcServer(command_handler=my_handler, workers=4)
+        server.start()  # Runs in background threads
     """
-    
+
+    READY = b"READY"
+
     def __init__(
-        self, 
-        port: int = 5556, 
+        self,
+        port: int = 5556,
         bind_addr: str = "tcp://*",
-        command_handler: Optional[Callable[[str, Dict], Dict]] = None
+        command_handler: Optional[Callable[[str, Dict], Dict]] = None,
+        workers: int = 4,
+        request_timeout: float = 30.0
     ):
         self._enabled = ZMQ_AVAILABLE
         self.port = port
         self.bind_addr = bind_addr
         self.command_handler = command_handler
+        self.workers = max(1, workers)
+        self.request_timeout = request_timeout
         self._context: Optional[zmq.Context] = None
-        self._socket: Optional[zmq.Socket] = None
+        self._frontend: Optional[zmq.Socket] = None
+        self._backend: Optional[zmq.Socket] = None
+        self._backend_addr = f"inproc://jcapy-rpc-{id(self)}"
         self._thread: Optional[threading.Thread] = None
+        self._worker_threads: List[threading.Thread] = []
         self._running = False
-        
+
+        self._stats_lock = threading.Lock()
+        self._stats = {"queue_depth": 0, "busy_workers": 0, "handled": 0, "timeouts": 0, "late_replies": 0}
+
     def set_command_handler(self, handler: Callable[[str, Dict], Dict]):
         """Set the command handler function."""
         self.command_handler = handler
-    
+
     def start(self) -> bool:
-        """Start the RPC server in a background thread."""
+        """Start the broker and worker threads."""
         if not self._enabled:
             logger.warning("ZMQ not available, RPC server not started")
             return False
-            
+
         if self._running:
             return True
-            
+
         try:
             self._context = zmq.Context()
-            self._socket = self._context.socket(zmq.REP)
-            self._socket.bind(f"{self.bind_addr}:{self.port}")
+            self._frontend = self._context.socket(zmq.ROUTER)
+            self._frontend.bind(f"{self.bind_addr}:{self.port}")
+            self._backend = self._context.socket(zmq.ROUTER)
+            self._backend.bind(self._backend_addr)
             self._running = True
-            
-            # Start listener thread
-            self._thread = threading.Thread(target=self._listen_loop, daemon=True)
+
+            self._thread = threading.Thread(target=self._broker_loop, name="jcapy-rpc-broker", daemon=True)
             self._thread.start()
-            
-            logger.info(f"ZMQ RPC Server bound to {self.bind_addr}:{self.port}")
+
+            self._worker_threads = [
+                threading.Thread(target=self._worker_loop, args=(i,), name=f"jcapy-rpc-{i}", daemon=True)
+                for i in range(self.workers)
+            ]
+            for t in self._worker_threads:
+                t.start()
+
+            logger.info(f"ZMQ RPC Server bound to {self.bind_addr}:{self.port} ({self.workers} workers)")
             return True
         except Exception as e:
             logger.error(f"Failed to start ZMQ RPC Server: {e}")
             self._running = False
+            self._close_sockets()
             return False
-    
+
     def stop(self):
-        """Stop the RPC server."""
+        """Stop the broker and workers; each thread closes its own socket."""
         self._running = False
-        if self._socket:
-            self._socket.close()
-            self._socket = None
-        if self._context:
-            self._context.term()
-            self._context = None
         if self._thread:
             self._thread.join(timeout=2)
             self._thread = None
+        for t in self._worker_threads:
+            t.join(timeout=2)
+        stuck = [t for t in self._worker_threads if t.is_alive()]
+        self._worker_threads = []
+        if stuck:
+            # A handler is still running; terminating the context would block on its socket
+            logger.warning(f"ZMQ RPC Server stopping with {len(stuck)} busy worker(s)")
+            self._context = None
+        self._close_sockets()
         logger.info("ZMQ RPC Server stopped")
-    
-    def _listen_loop(self):
-        """Main listen loop for handling RPC requests."""
-        if not self._socket:
-            return
-            
+
+    def _close_sockets(self):
+        for sock in (self._frontend, self._backend):
+            if sock is not None and not sock.closed:
+                sock.close(linger=0)
+        self._frontend = None
+        self._backend = None
+        if self._context:
+            self._context.term()
+            self._context = None
+
+    def _broker_loop(self):
+        """Dispatch queued requests to idle workers and route replies, enforcing deadlines."""
+        frontend, backend = self._frontend, self._backend
+        poller = zmq.Poller()
+        poller.register(frontend, zmq.POLLIN)
+        poller.register(backend, zmq.POLLIN)
+
+        idle: deque = deque()                 # worker identities ready for work
+        pending: deque = deque()              # (seq, deadline, payload) awaiting a worker
+        routes: Dict[int, list] = {}          # seq -> client envelope frames
+        deadlines: List[tuple] = []           # heap of (deadline, seq)
+        seq_counter = itertools.count(1)
+
         while self._running:
+            wait_ms = 200
+            if deadlines:
+                wait_ms = max(0, min(wait_ms, int((deadlines[0][0] - time.monotonic()) * 1000) + 1))
+            try:
+                events = dict(poller.poll(wait_ms))
+            except zmq.ZMQError as e:
+                if self._running:
+                    logger.error(f"ZMQ RPC error: {e}")
+                break
+
             try:
-                # Wait for next request with timeout
-                if self._socket.poll(1000):  # 1 second timeout
-                    message = self._socket.recv_string()
-                    
-                    # Parse request
-                    try:
-                        request = json.loads(message)
-                        command = request.get("command", "")
-                        params = request.get("params", {})
-                    except json.JSONDecodeError:
-                        response = {"status": "error", "message": "Invalid JSON"}
-                        self._socket.send_string(json.dumps(response))
-                        continue
-                    
-                    # Handle request
-                    if self.command_handler:
-                        try:
-                            result = self.command_handler(command, params)
-                            response = {"status": "ok", "result": result}
-                        except Exception as e:
-                            response = {"status": "error", "message": str(e)}
-                    else:
-                        response = {"status": "error", "message": "No command handler"}
-                    
-                    self._socket.send_string(json.dumps(response))
-                    
+                if backend in events:
+                    frames = backend.recv_multipart()
+                    worker_id = frames[0]
+                    if frames[1] != self.READY:
+                        seq_bytes, reply = frames[1], frames[2]
+                        envelope = routes.pop(int(seq_bytes), None)
+                        if envelope is None:
+                            self._bump(late_replies=1)
+                        else:
+                            self._bump(handled=1)
+                            frontend.send_multipart(envelope + [reply])
+                    idle.append(worker_id)
+
+                if frontend in events:
+                    frames = frontend.recv_multipart()
+                    seq = next(seq_counter)
+                    deadline = time.monotonic() + self._request_timeout_for(frames[-1])
+                    routes[seq] = frames[:-1]
+                    pending.append((seq, deadline, frames[-1]))
+                    heapq.heappush(deadlines, (deadline, seq))
+
+                now = time.monotonic()
+                while deadlines and deadlines[0][0] <= now:
+                    _, seq = heapq.heappop(deadlines)
+                    envelope = routes.pop(seq, None)
+                    if envelope is not None:
+                        self._bump(timeouts=1)
+                        response = {"status": "error", "message": "Request timed out"}
+                        frontend.send_multipart(envelope + [json.dumps(response).encode()])
+
+                while idle and pending:
+                    seq, deadline, payload = pending.popleft()
+                    if seq not in routes:
+                        continue  # Timed out while queued
+                    backend.send_multipart([idle.popleft(), str(seq).encode(), repr(deadline).encode(), payload])
+
+                with self._stats_lock:
+                    self._stats["queue_depth"] = sum(1 for item in pending if item[0] in routes)
             except zmq.ZMQError as e:
                 if self._running:
                     logger.error(f"ZMQ RPC error: {e}")
             except Exception as e:
                 if self._running:
                     logger.error(f"RPC server error: {e}")
-    
+
+        frontend.close(linger=0)
+        backend.close(linger=0)
+
+    def _request_timeout_for(self, payload: bytes) -> float:
+        try:
+            timeout = json.loads(payload).get("timeout")
+            if timeout is not None:
+                return max(0.0, float(timeout))
+        except Exception:
+            pass
+        return self.request_timeout
+
+    def _worker_loop(self, index: int):
+        """Worker: announce readiness, then handle one request at a time."""
+        sock = self._context.socket(zmq.DEALER)
+        sock.setsockopt(zmq.IDENTITY, f"worker-{index}".encode())
+        sock.connect(self._backend_addr)
+        sock.send(self.READY)
+
+        while self._running:
+            try:
+                if not sock.poll(200):
+                    continue
+                seq, deadline, payload = sock.recv_multipart()
+                if time.monotonic() >= float(deadline):
+                    # Client already received a timeout; skip stale work
+                    sock.send_multipart([seq, b""])
+                    continue
+
+                sock.send_multipart([seq, self._reply(payload)])
+            except zmq.ZMQError as e:
+                if self._running:
+                    logger.error(f"ZMQ RPC worker error: {e}")
+                break
+            except Exception as e:
+                # Malformed frames from the broker: no seq to answer, but the
+                # worker must still be handed back to the idle pool
+                if self._running:
+                    logger.error(f"RPC worker error: {e}")
+                    sock.send(self.READY)
+
+        sock.close(linger=0)
+
+    def _reply(self, payload: bytes) -> bytes:
+        """
+        Encoded reply for one request. Never raises: a request that is not
+        UTF-8 or a result that is not JSON-serializable still gets an error
+        reply, which is also what returns the worker to the idle pool.
+        """
+        self._bump(busy_workers=1)
+        try:
+            return json.dumps(self._handle_message(payload.decode("utf-8"))).encode("utf-8")
+        except Exception as e:
+            logger.error(f"RPC worker error: {e}")
+            return json.dumps({"status": "error", "message": f"Could not process request: {e}"}).encode("utf-8")
+        finally:
+            self._bump(busy_workers=-1)
+
+    def _handle_message(self, message: str) -> Dict[str, Any]:
+        """Parse a JSON request and run the command handler."""
+        try:
+            request = json.loads(message)
+            command = request.get("command", "")
+            params = request.get("params", {})
+        except (json.JSONDecodeError, AttributeError):
+            return {"status": "error", "message": "Invalid JSON"}
+
+        if not self.command_handler:
+            return {"status": "error", "message": "No command handler"}
+        try:
+            result = self.command_handler(command, params)
+            return {"status": "ok", "result": result}
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
+    def _bump(self, **deltas: int):
+        with self._stats_lock:
+            for key, delta in deltas.items():
+                self._stats[key] += delta
+
+    def stats(self) -> Dict[str, int]:
+        """Broker metrics: queue depth counts requests waiting for an idle worker."""
+        with self._stats_lock:
+            return {"workers": self.workers, **self._stats}
+
     def __repr__(self):
         status = "running" if self._running else "stopped"
-        return f"<ZmqRpcServer port={self.port} status={status}>"
+        return f"<ZmqRpcServer port={self.port} workers={self.workers} status={status}>"
 
 
 class ZmqBridge:
@@ -279,10 +442,17 @@ class ZmqBridge:
         self,
         pub_port: int = 5555,
         rpc_port: int = 5556,
-        command_handler: Optional[Callable[[str, Dict], Dict]] = None
+        command_handler: Optional[Callable[[str, Dict], Dict]] = None,
+        rpc_workers: int = 4,
+        rpc_timeout: float = 30.0
     ):
         self.publisher = ZmqPublisher(port=pub_port)
-        self.rpc_server = ZmqRpcServer(port=rpc_port, command_handler=command_handler)
+        self.rpc_server = ZmqRpcServer(
+            port=rpc_port,
+            command_handler=command_handler,
+            workers=rpc_workers,
+            request_timeout=rpc_timeout
+        )
         self._started = False
         
     def start(self) -> bool:
@@ -305,6 +475,10 @@ class ZmqBridge:
     def set_command_handler(self, handler: Callable[[str, Dict], Dict]):
         """Set the RPC command handler."""
         self.rpc_server.set_command_handler(handler)
+
+    def rpc_stats(self) -> Dict[str, int]:
+        """Queue depth and throughput metrics of the RPC broker."""
+        return self.rpc_server.stats()
     
     @property
     def is_running(self) -> bool:
@@ -326,7 +500,9 @@ def get_zmq_bridge() -> Optional[ZmqBridge]:
 def init_zmq_bridge(
     pub_port: int = 5555,
     rpc_port: int = 5556,
-    command_handler: Optional[Callable[[str, Dict], Dict]] = None
+    command_handler: Optional[Callable[[str, Dict], Dict]] = None,
+    rpc_workers: int = 4,
+    rpc_timeout: float = 30.0
 ) -> ZmqBridge:
     """Initialize and return the global ZMQ bridge."""
     global _global_bridge
@@ -335,7 +511,9 @@ def init_zmq_bridge(
         _global_bridge = ZmqBridge(
             pub_port=pub_port,
             rpc_port=rpc_port,
-            command_handler=command_handler
+            command_handler=command_handler,
+            rpc_workers=rpc_workers,
+            rpc_timeout=rpc_timeout
         )
     
     return _global_bridge
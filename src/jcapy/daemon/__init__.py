@@ -6,10 +6,25 @@ Provides background service capabilities for JCapy:
 - Web Control Plane (HTTP server)
 - Health monitoring
 - Session persistence
-- Background task execution
+- Background task execution (job queue)
+- Local discovery (pidfile + Unix socket) for CLI delegation
 """
 
-from jcapy.daemon.server import DaemonServer
-from jcapy.daemon.health import HealthChecker
+import importlib
 
-__all__ = ['DaemonServer', 'HealthChecker']
\ No newline at end of file
+_EXPORTS = {
+    'DaemonServer': 'server',
+    'HealthChecker': 'health',
+    'JobManager': 'jobs',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    # Resolved on first access so the CLI can import jcapy.daemon.discovery
+    # without starting to load the server
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{__name__}.{module}"), name)
@@ -0,0 +1,153 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Local daemon discovery.
+
+A running daemon publishes a pidfile and serves gRPC on a Unix-domain
+socket next to it. The CLI uses `daemon_alive()` to decide whether to
+delegate a command: a stat() of the socket path answers "no daemon" in
+microseconds, and a non-blocking connect() confirms that a daemon is
+actually listening. The channel readiness wait is only paid when the
+answer is yes.
+
+Standard library only: this is imported on every CLI invocation.
+"""
+import os
+import socket
+import stat
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_PID_FILE = Path.home() / '.jcapy' / 'daemon.pid'
+DEFAULT_SOCKET = Path.home() / '.jcapy' / 'run' / 'daemon.sock'
+
+HAS_UNIX_SOCKETS = hasattr(socket, "AF_UNIX")
+
+
+def get_pid_file() -> Path:
+    """Get the PID file path"""
+    return Path(os.environ.get('JCAPY_PID_FILE', DEFAULT_PID_FILE))
+
+
+def get_socket_path() -> Path:
+    """Get the daemon's Unix-domain socket path"""
+    return Path(os.environ.get('JCAPY_DAEMON_SOCKET', DEFAULT_SOCKET))
+
+
+def grpc_target(path: Optional[Path] = None) -> str:
+    """gRPC target string for the local socket."""
+    return f"unix:{path or get_socket_path()}"
+
+
+def read_pid() -> Optional[int]:
+    """PID recorded in the pidfile, if it names a live process."""
+    try:
+        with open(get_pid_file()) as f:
+            pid = int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+    try:
+        os.kill(pid, 0)
+    except PermissionError:
+        return pid  # alive, owned by someone else
+    except OSError:
+        return None
+    return pid
+
+
+def _listening(path: Path) -> bool:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.setblocking(False)
+        sock.connect(str(path))
+        return True
+    except BlockingIOError:
+        return True  # listener's backlog is full: busy, but there
+    except OSError:
+        return False  # ECONNREFUSED (stale socket), ENOENT, EACCES...
+    finally:
+        sock.close()
+
+
+def daemon_alive() -> bool:
+    """True if a daemon is accepting connections on the local socket."""
+    if not HAS_UNIX_SOCKETS:
+        return False
+    path = get_socket_path()
+    try:
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            return False
+    except OSError:
+        return False
+    return _listening(path)
+
+
+# ------------------------------------------------------------------
+# Daemon side
+# ------------------------------------------------------------------
+
+def _private_dir(path: Path) -> None:
+    """
+    Create `path` with mode 0700, or check that the existing directory is
+    a real directory owned by us with no group/other access. Never chmods:
+    the socket must live in a directory dedicated to it.
+    """
+    try:
+        path.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode):
+        raise PermissionError(f"{path} is not a directory")
+    if hasattr(os, "geteuid") and info.st_uid != os.geteuid():
+        raise PermissionError(f"{path} is not owned by the current user")
+    if info.st_mode & 0o077:
+        raise PermissionError(f"{path} is accessible to other users (mode {oct(info.st_mode & 0o777)}); "
+                              "point JCAPY_DAEMON_SOCKET into a private directory")
+
+
+def prepare_socket() -> Optional[Path]:
+    """
+    Make the socket path bindable: create its dedicated directory (0700, so
+    the socket is only reachable by this user) and remove a stale socket
+    left by a daemon that died. Returns None if another daemon is listening
+    there or Unix sockets aren't available; raises PermissionError if an
+    existing directory is not private to this user.
+    """
+    if not HAS_UNIX_SOCKETS:
+        return None
+    path = get_socket_path()
+    path.parent.parent.mkdir(parents=True, exist_ok=True)
+    _private_dir(path.parent)
+    if os.path.lexists(path):
+        if _listening(path):
+            return None
+        os.unlink(path)
+    return path
+
+
+def publish(socket_path: Optional[Path]) -> None:
+    """Record this process as the local daemon (after its socket is listening)."""
+    if socket_path is not None:
+        try:
+            os.chmod(socket_path, 0o600)
+        except OSError:
+            pass
+    pid_file = get_pid_file()
+    pid_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp = pid_file.with_name(f"{pid_file.name}.{os.getpid()}.tmp")
+    tmp.write_text(str(os.getpid()))
+    os.replace(tmp, pid_file)
+
+
+def unpublish(socket_path: Optional[Path]) -> None:
+    """Remove the socket and, if it is still ours, the pidfile."""
+    if socket_path is not None:
+        try:
+            os.unlink(socket_path)
+        except OSError:
+            pass
+    if read_pid() == os.getpid():
+        try:
+            os.unlink(get_pid_file())
+        except OSError:
+            pass
@@ -0,0 +1,243 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+JCapy Daemon Job Manager
+
+Asynchronous command execution for the HTTP Control Plane:
+- Bounded submission queue (back-pressure instead of unbounded growth)
+- Worker pool running commands through JCapyService.execute
+- Poll / long-poll access to results by job ID
+- Size-capped LRU store for finished results
+"""
+
+import json
+import queue
+import threading
+import time
+import uuid
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger('jcapyd.jobs')
+
+
+class JobStatus(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobQueueFull(Exception):
+    """Raised when the submission queue is at capacity."""
+
+
+@dataclass
+class Job:
+    """A single command submitted to the daemon."""
+    command: str
+    context: Optional[Dict] = None
+    job_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: JobStatus = JobStatus.QUEUED
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        def iso(ts: Optional[float]) -> Optional[str]:
+            return datetime.fromtimestamp(ts).isoformat() if ts else None
+
+        return {
+            "job_id": self.job_id,
+            "command": self.command,
+            "status": self.status.value,
+            "submitted_at": iso(self.submitted_at),
+            "started_at": iso(self.started_at),
+            "finished_at": iso(self.finished_at),
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+def result_to_dict(result: Any) -> Optional[Dict[str, Any]]:
+    """Convert a CommandResult (or anything a handler returned) to JSON-safe data."""
+    if result is None:
+        return None
+    if not hasattr(result, '__dataclass_fields__'):
+        return {"status": "success", "message": str(result)}
+
+    out = {}
+    for f in fields(result):
+        value = getattr(result, f.name)
+        if isinstance(value, Enum):
+            value = value.value
+        out[f.name] = value
+    # Round-trip so arbitrary `data` payloads degrade to strings instead of failing later
+    return json.loads(json.dumps(out, default=str))
+
+
+def _default_executor(command: str, context: Optional[Dict]) -> Any:
+    from jcapy.core.service import get_service
+    return get_service().execute(command, tui_data=context)
+
+
+class JobManager:
+    """
+    Bounded queue + worker pool for daemon command execution.
+
+    Workers are started lazily on the first submission so importing the
+    daemon module does not spawn threads.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Callable[[str, Optional[Dict]], Any]] = None,
+        max_workers: int = 4,
+        max_queue: int = 256,
+        max_results: int = 1000,
+        on_complete: Optional[Callable[[Job], None]] = None
+    ):
+        self._executor = executor or _default_executor
+        self.max_workers = max_workers
+        self.max_results = max_results
+        self._on_complete = on_complete
+
+        self._queue: "queue.Queue[Optional[Job]]" = queue.Queue(maxsize=max_queue)
+        self._active: Dict[str, Job] = {}                 # queued + running
+        self._finished: "OrderedDict[str, Job]" = OrderedDict()  # LRU of results
+        self._lock = threading.Lock()
+        self._workers: List[threading.Thread] = []
+        self._running = False
+
+        self.submitted = 0
+        self.rejected = 0
+        self.evicted = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self):
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            for i in range(self.max_workers):
+                t = threading.Thread(target=self._worker_loop, name=f"jcapyd-job-{i}", daemon=True)
+                t.start()
+                self._workers.append(t)
+        logger.info(f"Job manager started ({self.max_workers} workers)")
+
+    def stop(self, timeout: float = 5.0):
+        """Stop workers after the jobs already dequeued finish."""
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            workers, self._workers = self._workers, []
+        for _ in workers:
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                break
+        for t in workers:
+            t.join(timeout=timeout)
+
+    # ------------------------------------------------------------------
+    # Submission / lookup
+    # ------------------------------------------------------------------
+
+    def submit(self, command: str, context: Optional[Dict] = None) -> Job:
+        """Queue a command and return its Job immediately. Raises JobQueueFull."""
+        if not self._running:
+            self.start()
+
+        job = Job(command=command, context=context)
+        with self._lock:
+            try:
+                self._queue.put_nowait(job)
+            except queue.Full:
+                self.rejected += 1
+                raise JobQueueFull(f"Job queue is full ({self._queue.maxsize} pending)")
+            self._active[job.job_id] = job
+            self.submitted += 1
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            job = self._active.get(job_id)
+            if job is None:
+                job = self._finished.get(job_id)
+                if job is not None:
+                    self._finished.move_to_end(job_id)
+            return job
+
+    def wait(self, job_id: str, timeout: float) -> Optional[Job]:
+        """Long-poll: block up to `timeout` seconds for the job to finish."""
+        job = self.get(job_id)
+        if job is not None and timeout > 0:
+            job.done.wait(timeout)
+        return job
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            running = sum(1 for j in self._active.values() if j.status == JobStatus.RUNNING)
+            return {
+                "workers": self.max_workers,
+                "queue_depth": self._queue.qsize(),
+                "queue_capacity": self._queue.maxsize,
+                "running": running,
+                "stored_results": len(self._finished),
+                "submitted": self.submitted,
+                "rejected": self.rejected,
+                "evicted": self.evicted,
+            }
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def _worker_loop(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            self._run(job)
+
+    def _run(self, job: Job):
+        job.status = JobStatus.RUNNING
+        job.started_at = time.time()
+        try:
+            result = self._executor(job.command, job.context)
+            job.result = result_to_dict(result)
+            failed = job.result is not None and job.result.get("status") == "failure"
+            job.status = JobStatus.FAILED if failed else JobStatus.SUCCEEDED
+        except Exception as e:
+            logger.exception(f"Job {job.job_id} failed: {job.command}")
+            job.error = str(e)
+            job.status = JobStatus.FAILED
+        job.finished_at = time.time()
+
+        with self._lock:
+            self._active.pop(job.job_id, None)
+            self._finished[job.job_id] = job
+            while len(self._finished) > self.max_results:
+                self._finished.popitem(last=False)
+                self.evicted += 1
+        job.done.set()
+
+        if self._on_complete:
+            try:
+                self._on_complete(job)
+            except Exception as e:
+                logger.error(f"Job completion hook error: {e}")
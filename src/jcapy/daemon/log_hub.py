@@ -0,0 +1,201 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+JCapy Log Fan-out Hub
+
+Single EventBus subscription shared by every log stream (gRPC StreamLogs):
+- One bounded ring buffer per subscriber (oldest entries dropped on overflow)
+- Server-side filtering, evaluated once per entry per subscriber
+- Subscriptions removed when the stream closes
+- Per-stream delivered / dropped / lag counters
+
+Filter syntax (space separated, all terms must match):
+    level:error source:service   field match (source, level, topic)
+    timeout                      case-insensitive substring of the message
+"""
+
+import itertools
+import threading
+import time
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger('jcapyd.logs')
+
+LOG_TOPICS = ("TERMINAL_OUTPUT", "AUDIT_LOG")
+FILTER_FIELDS = ("source", "level", "topic")
+
+
+def normalize_log_event(topic: str, payload: Any) -> Dict[str, str]:
+    """Flatten a bus payload into the fields of a LogEntry."""
+    if not isinstance(payload, dict):
+        payload = {"message": str(payload)}
+    return {
+        "topic": topic,
+        "source": str(payload.get("source", "daemon")),
+        "level": str(payload.get("level", "info")),
+        "message": str(payload.get("line") or payload.get("message") or payload),
+        "timestamp": str(payload.get("timestamp") or datetime.now().isoformat()),
+    }
+
+
+def compile_filter(filter_str: str) -> Optional[Callable[[Dict[str, str]], bool]]:
+    """Compile a filter string into a predicate. Returns None when everything matches."""
+    terms = (filter_str or "").split()
+    if not terms:
+        return None
+
+    fields: List[Tuple[str, str]] = []
+    needles: List[str] = []
+    for term in terms:
+        key, sep, value = term.partition(":")
+        if sep and key.lower() in FILTER_FIELDS:
+            fields.append((key.lower(), value.lower()))
+        else:
+            needles.append(term.lower())
+
+    def matches(entry: Dict[str, str]) -> bool:
+        for key, value in fields:
+            if entry[key].lower() != value:
+                return False
+        if needles:
+            message = entry["message"].lower()
+            return all(n in message for n in needles)
+        return True
+
+    return matches
+
+
+class LogSubscription:
+    """A single stream's view of the hub: bounded buffer plus counters."""
+
+    def __init__(self, stream_id: int, filter_str: str = "", capacity: int = 1000):
+        self.stream_id = stream_id
+        self.filter_str = filter_str
+        self.capacity = capacity
+        self._matches = compile_filter(filter_str)
+        self._buffer: deque = deque(maxlen=capacity)
+        self._cond = threading.Condition()
+        self.closed = False
+        self.opened_at = time.time()
+        self.delivered = 0
+        self.dropped = 0
+        self.filtered = 0
+
+    def offer(self, entry: Dict[str, str]):
+        accepted = self._matches is None or self._matches(entry)
+        with self._cond:
+            if self.closed:
+                return
+            if not accepted:
+                self.filtered += 1
+                return
+            if len(self._buffer) == self.capacity:
+                self.dropped += 1
+            self._buffer.append((time.monotonic(), entry))
+            self._cond.notify()
+
+    def get(self, timeout: Optional[float] = None) -> List[Dict[str, str]]:
+        """Drain buffered entries, blocking up to `timeout` if none are ready."""
+        with self._cond:
+            if not self._buffer and not self.closed:
+                self._cond.wait(timeout)
+            items = [entry for _, entry in self._buffer]
+            self._buffer.clear()
+            self.delivered += len(items)
+            return items
+
+    def close(self):
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            pending = len(self._buffer)
+            lag = time.monotonic() - self._buffer[0][0] if pending else 0.0
+        return {
+            "stream_id": self.stream_id,
+            "filter": self.filter_str,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "filtered": self.filtered,
+            "pending": pending,
+            "lag_seconds": round(lag, 3),
+        }
+
+
+class LogFanoutHub:
+    """
+    Fans bus log events out to many streams through one bus subscription.
+
+    The hub attaches to the bus when the first stream subscribes and detaches
+    when the last one leaves, so idle daemons pay nothing per publish.
+    """
+
+    def __init__(self, bus: Any = None, capacity: int = 1000, topics: Tuple[str, ...] = LOG_TOPICS):
+        self._bus = bus
+        self.capacity = capacity
+        self.topics = topics
+        self._lock = threading.Lock()
+        # Copy-on-write tuple so publishers iterate without taking the lock
+        self._subscriptions: Tuple[LogSubscription, ...] = ()
+        self._handlers: Dict[str, Callable[[Any], None]] = {}
+        self._ids = itertools.count(1)
+
+    def _get_bus(self):
+        if self._bus is None:
+            from jcapy.core.bus import get_event_bus
+            self._bus = get_event_bus()
+        return self._bus
+
+    def subscribe(self, filter_str: str = "", capacity: Optional[int] = None) -> LogSubscription:
+        sub = LogSubscription(next(self._ids), filter_str, capacity or self.capacity)
+        with self._lock:
+            self._subscriptions = self._subscriptions + (sub,)
+            if not self._handlers:
+                self._attach()
+        return sub
+
+    def unsubscribe(self, sub: LogSubscription):
+        sub.close()
+        with self._lock:
+            self._subscriptions = tuple(s for s in self._subscriptions if s is not sub)
+            if not self._subscriptions and self._handlers:
+                self._detach()
+        stats = sub.stats()
+        logger.info(
+            f"Log stream {sub.stream_id} closed: delivered={stats['delivered']} "
+            f"dropped={stats['dropped']} filtered={stats['filtered']}"
+        )
+
+    def _attach(self):
+        bus = self._get_bus()
+        for topic in self.topics:
+            handler = self._make_handler(topic)
+            self._handlers[topic] = handler
+            bus.subscribe(topic, handler)
+
+    def _detach(self):
+        bus = self._get_bus()
+        for topic, handler in self._handlers.items():
+            bus.unsubscribe(topic, handler)
+        self._handlers = {}
+
+    def _make_handler(self, topic: str) -> Callable[[Any], None]:
+        def on_event(payload: Any):
+            subs = self._subscriptions
+            if not subs:
+                return
+            entry = normalize_log_event(topic, payload)
+            for sub in subs:
+                sub.offer(entry)
+        return on_event
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [sub.stats() for sub in self._subscriptions]
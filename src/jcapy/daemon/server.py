@@ -13,16 +13,24 @@ A lightweight HTTP server providing:
 import os
 import sys
 import json
+import time
+import select
 import signal
 import threading
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from typing import Optional, Dict, Any
 from pathlib import Path
+from urllib.parse import urlsplit, parse_qs
 
 from jcapy.core.service import get_service
-from jcapy.core.base import CommandResult
+from jcapy.core.base import CommandResult, ResultStatus
+from jcapy.daemon import discovery
+from jcapy.daemon.jobs import JobManager, JobQueueFull
+from jcapy.daemon.log_hub import LogFanoutHub
 from jcapy.utils.updates import VERSION
 
 # Configure logging
@@ -48,6 +56,31 @@ except ImportError:
 _zmq_bridge = None
 _command_queue = []  # Queue for commands from Web UI
 
+# HTTP Control Plane tuning (overridable via env or CLI flags)
+DEFAULT_HTTP_WORKERS = int(os.environ.get('JCAPY_HTTP_WORKERS', 32))
+DEFAULT_HTTP_BACKLOG = int(os.environ.get('JCAPY_HTTP_BACKLOG', 128))
+DEFAULT_KEEPALIVE_TIMEOUT = float(os.environ.get('JCAPY_HTTP_KEEPALIVE', 5.0))
+
+# Job subsystem tuning
+DEFAULT_JOB_WORKERS = int(os.environ.get('JCAPY_JOB_WORKERS', 4))
+DEFAULT_JOB_QUEUE = int(os.environ.get('JCAPY_JOB_QUEUE', 256))
+DEFAULT_JOB_RESULTS = int(os.environ.get('JCAPY_JOB_RESULTS', 1000))
+MAX_LONG_POLL_SECONDS = float(os.environ.get('JCAPY_HTTP_LONG_POLL', 30.0))
+# Connections allowed to park in `?wait=` at once; the rest get an immediate answer
+DEFAULT_LONG_POLLS = int(os.environ.get('JCAPY_HTTP_LONG_POLLS', 8))
+
+# Per-stream ring buffer size for gRPC StreamLogs
+DEFAULT_LOG_STREAM_BUFFER = int(os.environ.get('JCAPY_LOG_STREAM_BUFFER', 1000))
+
+# EventBus background dispatch (0 = deliver inline on the publisher's thread)
+DEFAULT_BUS_WORKERS = int(os.environ.get('JCAPY_BUS_WORKERS', 0))
+DEFAULT_BUS_QUEUE = int(os.environ.get('JCAPY_BUS_QUEUE', 10000))
+DEFAULT_BUS_OVERFLOW = os.environ.get('JCAPY_BUS_OVERFLOW', 'block')
+
+# ZMQ RPC broker worker pool
+DEFAULT_RPC_WORKERS = int(os.environ.get('JCAPY_RPC_WORKERS', 4))
+DEFAULT_RPC_TIMEOUT = float(os.environ.get('JCAPY_RPC_TIMEOUT', 30.0))
+
 
 class DaemonState:
     """Shared daemon state"""
@@ -97,40 +130,229 @@ class DaemonState:
 # Global state
 state = DaemonState()
 
+# Async command execution behind POST /api/command (workers start on first submit)
+jobs = JobManager(
+    max_workers=DEFAULT_JOB_WORKERS,
+    max_queue=DEFAULT_JOB_QUEUE,
+    max_results=DEFAULT_JOB_RESULTS,
+    on_complete=lambda job: state.increment_task()
+)
+
+# Shared log fan-out for StreamLogs (one bus subscription for all streams)
+log_hub = LogFanoutHub(capacity=DEFAULT_LOG_STREAM_BUFFER)
+
+
+class ControlPlaneServer(HTTPServer):
+    """
+    Concurrent HTTP server for the Control Plane.
+
+    Connections are served by a bounded worker pool instead of the accept
+    thread, so one slow client cannot stall health probes or dashboard polls.
+    Keep-alive is honoured while workers are free; once connections start
+    queueing, responses carry `Connection: close` and idle kept-alive
+    connections are closed within a moment, so waiting clients get a turn.
+    Long-polls may hold at most `max_long_polls` workers (never more than half
+    the pool); further waits are answered at once and the client re-polls.
+    """
+
+    allow_reuse_address = True
+
+    def __init__(
+        self,
+        server_address,
+        handler_class,
+        max_workers: int = DEFAULT_HTTP_WORKERS,
+        backlog: int = DEFAULT_HTTP_BACKLOG,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        max_long_polls: int = DEFAULT_LONG_POLLS
+    ):
+        # Must be set before bind/listen in the base constructor
+        self.request_queue_size = backlog
+        self.max_workers = max_workers
+        self.keepalive_timeout = keepalive_timeout
+        self.max_long_polls = max(0, min(max_long_polls, max_workers // 2))
+        self._long_polls = threading.Semaphore(self.max_long_polls)
+        self._waiting = 0
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='jcapyd-http')
+        self._counter_lock = threading.Lock()
+        self._active = 0
+        self._pending = 0
+        super().__init__(server_address, handler_class)
+
+    def process_request(self, request, client_address):
+        """Hand the accepted connection to the worker pool."""
+        with self._counter_lock:
+            self._pending += 1
+        try:
+            self._pool.submit(self._process_request_worker, request, client_address)
+        except RuntimeError:
+            # Pool already shut down
+            with self._counter_lock:
+                self._pending -= 1
+            self.shutdown_request(request)
+
+    def _process_request_worker(self, request, client_address):
+        with self._counter_lock:
+            self._pending -= 1
+            self._active += 1
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            with self._counter_lock:
+                self._active -= 1
+            self.shutdown_request(request)
+
+    def handle_error(self, request, client_address):
+        # Clients hanging up mid-response are routine for pollers; don't dump tracebacks
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            logger.debug(f"Client {client_address[0]} disconnected")
+            return
+        super().handle_error(request, client_address)
+
+    def is_saturated(self) -> bool:
+        """True when accepted connections are waiting for a worker."""
+        with self._counter_lock:
+            return self._pending > 0
+
+    @contextmanager
+    def long_poll(self):
+        """Yield True if this worker may block in a long-poll, False to answer now."""
+        if self.is_saturated() or not self._long_polls.acquire(blocking=False):
+            yield False
+            return
+        with self._counter_lock:
+            self._waiting += 1
+        try:
+            yield True
+        finally:
+            with self._counter_lock:
+                self._waiting -= 1
+            self._long_polls.release()
+
+    def connection_stats(self) -> Dict[str, int]:
+        with self._counter_lock:
+            return {
+                "active": self._active,
+                "pending": self._pending,
+                "long_polls": self._waiting,
+                "max_workers": self.max_workers
+            }
+
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
 
 class ControlPlaneHandler(BaseHTTPRequestHandler):
     """HTTP request handler for the Control Plane"""
 
+    # HTTP/1.1 enables persistent connections; every response sets Content-Length
+    protocol_version = 'HTTP/1.1'
+
+    # While connections queue for a worker, an idle keep-alive connection is
+    # closed after this much idle time instead of `keepalive_timeout`; the
+    # short grace lets a client that is already sending its next request in
+    IDLE_WHEN_BUSY_SECONDS = 0.1
+    # How often an idle keep-alive connection re-checks the pool
+    IDLE_POLL_SECONDS = 0.02
+
+    def setup(self):
+        # Idle keep-alive connections give their worker back after this timeout
+        self.timeout = getattr(self.server, 'keepalive_timeout', None)
+        super().setup()
+
+    def handle(self):
+        """Serve requests on this connection until it closes or goes idle while others queue."""
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection and self._await_next_request():
+            self.handle_one_request()
+
+    def _await_next_request(self) -> bool:
+        """
+        Wait for the next request on a kept-alive connection. Returns False,
+        closing it, once it has idled past the timeout, or past
+        IDLE_WHEN_BUSY_SECONDS while accepted connections wait for a worker:
+        an idle client must not hold one while others queue.
+        """
+        server = self.server
+        start = time.monotonic()
+        deadline = None if self.timeout is None else start + self.timeout
+        while True:
+            # Non-blocking peek: a pipelined request may already be buffered
+            self.connection.settimeout(0)
+            try:
+                if self.rfile.peek(1):
+                    return True
+            finally:
+                self.connection.settimeout(self.timeout)
+            if (hasattr(server, 'is_saturated') and server.is_saturated()
+                    and time.monotonic() - start >= self.IDLE_WHEN_BUSY_SECONDS):
+                return False
+            wait = self.IDLE_POLL_SECONDS
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            readable, _, _ = select.select([self.connection], [], [], wait)
+            if readable:
+                return True  # data, or EOF which handle_one_request turns into a close
+
     # Suppress default logging
     def log_message(self, format, *args):
         logger.info(f"{self.client_address[0]} - {format % args}")
 
-    def _send_json(self, data: Dict, status: int = 200):
-        """Send JSON response"""
+    def _send_body(self, body: bytes, content_type: str, status: int = 200, headers: Optional[Dict[str, str]] = None):
+        """Send a complete response, deciding whether the connection stays open."""
         self.send_response(status)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Content-Type', content_type)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+
+        server = self.server
+        if hasattr(server, 'is_saturated') and server.is_saturated():
+            self.close_connection = True
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        else:
+            self.send_header('Connection', 'keep-alive')
         self.end_headers()
-        self.wfile.write(json.dumps(data, indent=2).encode())
+        self.wfile.write(body)
+
+    def _send_json(self, data: Dict, status: int = 200):
+        """Send JSON response"""
+        self._send_body(
+            json.dumps(data, indent=2).encode(),
+            'application/json',
+            status,
+            {'Access-Control-Allow-Origin': '*'}
+        )
 
     def _send_html(self, html: str, status: int = 200):
         """Send HTML response"""
-        self.send_response(status)
-        self.send_header('Content-Type', 'text/html; charset=utf-8')
-        self.end_headers()
-        self.wfile.write(html.encode())
+        self._send_body(html.encode(), 'text/html; charset=utf-8', status)
 
     def do_GET(self):
         """Handle GET requests"""
         state.record_activity()
+        url = urlsplit(self.path)
+        path = url.path
 
-        if self.path == '/health':
+        if path == '/health':
             self._handle_health()
-        elif self.path == '/api/status':
+        elif path == '/api/status':
             self._handle_status()
-        elif self.path == '/api/metrics':
+        elif path == '/api/metrics':
             self._handle_metrics()
-        elif self.path == '/' or self.path == '':
+        elif path == '/api/jobs':
+            self._send_json(jobs.stats())
+        elif path.startswith('/api/jobs/'):
+            self._handle_job(path[len('/api/jobs/'):], parse_qs(url.query))
+        elif path == '/' or path == '':
             self._handle_index()
         else:
             self._send_json({"error": "Not found"}, 404)
@@ -142,6 +364,8 @@ class ControlPlaneHandler(BaseHTTPRequestHandler):
         if self.path == '/api/command':
             self._handle_command()
         else:
+            # Body is left unread, so the connection cannot be reused
+            self.close_connection = True
             self._send_json({"error": "Not found"}, 404)
 
     def _handle_health(self):
@@ -174,10 +398,104 @@ class ControlPlaneHandler(BaseHTTPRequestHandler):
             f"jcapy_active_sessions {metrics['active_sessions']}",
         ]
 
-        self.send_response(200)
-        self.send_header('Content-Type', 'text/plain; version=0.0.4')
-        self.end_headers()
-        self.wfile.write('\n'.join(output).encode())
+        if hasattr(self.server, 'connection_stats'):
+            conns = self.server.connection_stats()
+            output.extend([
+                f"",
+                f"# HELP jcapy_http_active_connections Connections being served",
+                f"# TYPE jcapy_http_active_connections gauge",
+                f"jcapy_http_active_connections {conns['active']}",
+                f"",
+                f"# HELP jcapy_http_pending_connections Connections waiting for a worker",
+                f"# TYPE jcapy_http_pending_connections gauge",
+                f"jcapy_http_pending_connections {conns['pending']}",
+            ])
+
+        job_stats = jobs.stats()
+        output.extend([
+            f"",
+            f"# HELP jcapy_jobs_queue_depth Commands waiting for a job worker",
+            f"# TYPE jcapy_jobs_queue_depth gauge",
+            f"jcapy_jobs_queue_depth {job_stats['queue_depth']}",
+            f"",
+            f"# HELP jcapy_jobs_running Commands currently executing",
+            f"# TYPE jcapy_jobs_running gauge",
+            f"jcapy_jobs_running {job_stats['running']}",
+            f"",
+            f"# HELP jcapy_jobs_rejected_total Submissions rejected because the queue was full",
+            f"# TYPE jcapy_jobs_rejected_total counter",
+            f"jcapy_jobs_rejected_total {job_stats['rejected']}",
+        ])
+
+        from jcapy.core.bus import get_event_bus
+        bus_stats = get_event_bus().stats()
+        output.extend([
+            f"",
+            f"# HELP jcapy_bus_queue_depth Events waiting for background dispatch",
+            f"# TYPE jcapy_bus_queue_depth gauge",
+            f"jcapy_bus_queue_depth {bus_stats['queue_depth']}",
+            f"",
+            f"# HELP jcapy_bus_dropped_total Events dropped by the bus overflow policy",
+            f"# TYPE jcapy_bus_dropped_total counter",
+            f"jcapy_bus_dropped_total {bus_stats['dropped']}",
+        ])
+
+        from jcapy.core.audit import get_audit_logger
+        audit_stats = get_audit_logger().stats()
+        output.extend([
+            f"",
+            f"# HELP jcapy_audit_queue_depth Audit records waiting for the background writer",
+            f"# TYPE jcapy_audit_queue_depth gauge",
+            f"jcapy_audit_queue_depth {audit_stats['queue_depth']}",
+            f"",
+            f"# HELP jcapy_audit_records_written_total Audit records committed to disk",
+            f"# TYPE jcapy_audit_records_written_total counter",
+            f"jcapy_audit_records_written_total {audit_stats['records_written']}",
+            f"",
+            f"# HELP jcapy_audit_records_per_second Average audit write throughput",
+            f"# TYPE jcapy_audit_records_per_second gauge",
+            f"jcapy_audit_records_per_second {audit_stats['records_per_second']}",
+        ])
+
+        if _zmq_bridge and _zmq_bridge.is_running:
+            rpc = _zmq_bridge.rpc_stats()
+            output.extend([
+                f"",
+                f"# HELP jcapy_rpc_queue_depth ZMQ RPC requests waiting for a worker",
+                f"# TYPE jcapy_rpc_queue_depth gauge",
+                f"jcapy_rpc_queue_depth {rpc['queue_depth']}",
+                f"",
+                f"# HELP jcapy_rpc_busy_workers ZMQ RPC workers handling a request",
+                f"# TYPE jcapy_rpc_busy_workers gauge",
+                f"jcapy_rpc_busy_workers {rpc['busy_workers']}",
+                f"",
+                f"# HELP jcapy_rpc_timeouts_total ZMQ RPC requests that hit their deadline",
+                f"# TYPE jcapy_rpc_timeouts_total counter",
+                f"jcapy_rpc_timeouts_total {rpc['timeouts']}",
+            ])
+
+        streams = log_hub.stats()
+        output.extend([
+            f"",
+            f"# HELP jcapy_log_streams Open StreamLogs subscriptions",
+            f"# TYPE jcapy_log_streams gauge",
+            f"jcapy_log_streams {len(streams)}",
+        ])
+        if streams:
+            output.extend([
+                f"",
+                f"# HELP jcapy_log_stream_dropped_total Entries dropped by a slow log stream",
+                f"# TYPE jcapy_log_stream_dropped_total counter",
+            ])
+            output.extend(f'jcapy_log_stream_dropped_total{{stream="{s["stream_id"]}"}} {s["dropped"]}' for s in streams)
+            output.extend([
+                f"",
+                f"# HELP jcapy_log_stream_lag_seconds Age of the oldest undelivered entry",
+                f"# TYPE jcapy_log_stream_lag_seconds gauge",
+            ])
+            output.extend(f'jcapy_log_stream_lag_seconds{{stream="{s["stream_id"]}"}} {s["lag_seconds"]}' for s in streams)
+
+        self._send_body('\n'.join(output).encode(), 'text/plain; version=0.0.4')
 
     def _handle_index(self):
         """Serve the Control Plane UI"""
@@ -185,7 +503,7 @@ class ControlPlaneHandler(BaseHTTPRequestHandler):
         self._send_html(html)
 
     def _handle_command(self):
-        """Handle command execution"""
+        """Queue a command for asynchronous execution and return its job ID"""
         try:
             content_length = int(self.headers.get('Content-Length', 0))
             body = self.rfile.read(content_length)
@@ -195,20 +513,52 @@ class ControlPlaneHandler(BaseHTTPRequestHandler):
             if not command:
                 return self._send_json({"error": "No command provided"}, 400)
 
-            # Execute command (simplified - in production, use proper sandboxing)
-            state.increment_task()
+            try:
+                job = jobs.submit(command, context=data.get('context'))
+            except JobQueueFull as e:
+                self._send_body(
+                    json.dumps({"error": str(e)}).encode(),
+                    'application/json',
+                    503,
+                    {'Retry-After': '1', 'Access-Control-Allow-Origin': '*'}
+                )
+                return
 
             self._send_json({
                 "status": "accepted",
+                "job_id": job.job_id,
                 "command": command,
+                "poll": f"/api/jobs/{job.job_id}",
                 "message": f"Command '{command}' queued for execution"
-            })
+            }, 202)
 
         except json.JSONDecodeError:
             self._send_json({"error": "Invalid JSON"}, 400)
         except Exception as e:
             self._send_json({"error": str(e)}, 500)
 
+    def _handle_job(self, job_id: str, query: Dict[str, list]):
+        """
+        Poll a job; `?wait=N` long-polls up to N seconds for completion.
+
+        When every long-poll slot is taken the current state is returned
+        immediately, so pollers cannot starve the pool; clients just re-poll.
+        """
+        try:
+            wait = float(query.get('wait', ['0'])[0])
+        except ValueError:
+            return self._send_json({"error": "Invalid wait parameter"}, 400)
+        wait = max(0.0, min(wait, MAX_LONG_POLL_SECONDS))
+
+        if wait and hasattr(self.server, 'long_poll'):
+            with self.server.long_poll() as allowed:
+                job = jobs.wait(job_id, wait if allowed else 0)
+        else:
+            job = jobs.wait(job_id, wait)
+        if job is None:
+            return self._send_json({"error": f"Unknown or expired job: {job_id}"}, 404)
+        self._send_json(job.to_dict())
+
     def _get_control_plane_html(self) -> str:
         """Generate the Control Plane HTML UI"""
         return '''<!DOCTYPE html>
@@ -513,19 +863,51 @@ class ControlPlaneHandler(BaseHTTPRequestHandler):
 class DaemonServer:
     """JCapy Daemon Server"""
 
-    def __init__(self, port: int = 8080, grpc_port: int = 50051, host: str = '0.0.0.0'):
+    def __init__(
+        self,
+        port: int = 8080,
+        grpc_port: int = 50051,
+        host: str = '0.0.0.0',
+        http_workers: int = DEFAULT_HTTP_WORKERS,
+        http_backlog: int = DEFAULT_HTTP_BACKLOG,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT
+    ):
         self.port = port
         self.grpc_port = grpc_port
         self.host = host
-        self.server: Optional[HTTPServer] = None
+        self.http_workers = http_workers
+        self.http_backlog = http_backlog
+        self.keepalive_timeout = keepalive_timeout
+        self.server: Optional[ControlPlaneServer] = None
         self.grpc_server = None
+        self.socket_path = None
         self._shutdown = False
 
     def start(self):
         """Start the daemon server"""
         logger.info(f"Starting JCapy Daemon on {self.host}:{self.port} (HTTP) and {self.grpc_port} (gRPC)")
 
-        self.server = HTTPServer((self.host, self.port), ControlPlaneHandler)
+        self.server = ControlPlaneServer(
+            (self.host, self.port),
+            ControlPlaneHandler,
+            max_workers=self.http_workers,
+            backlog=self.http_backlog,
+            keepalive_timeout=self.keepalive_timeout
+        )
+        logger.info(f"HTTP workers: {self.http_workers}, backlog: {self.http_backlog}, keep-alive: {self.keepalive_timeout}s")
+
+        if DEFAULT_BUS_WORKERS > 0:
+            from jcapy.core.bus import get_event_bus
+            get_event_bus().start(
+                workers=DEFAULT_BUS_WORKERS,
+                max_queue=DEFAULT_BUS_QUEUE,
+                overflow=DEFAULT_BUS_OVERFLOW
+            )
+
+        # Pick up config edits made by the CLI/TUI without a restart
+        from jcapy.config import CONFIG_MANAGER
+        CONFIG_MANAGER.subscribe(_on_config_reloaded)
+        CONFIG_MANAGER.watch()
 
         # Start gRPC server if available
         if GRPC_AVAILABLE:
@@ -544,10 +926,19 @@ class DaemonServer:
                     self.grpc_server.add_insecure_port(f'[::]:{self.grpc_port}')
                     logger.info(f"🧠 JCapy Brain (gRPC INSECURE) active at [::]:{self.grpc_port}")
 
+                # Local CLI delegation: a Unix socket in a 0700 directory, so
+                # filesystem permissions stand in for mTLS
+                self._add_local_socket()
+
                 self.grpc_server.start()
             except Exception:
                 logger.exception("Failed to start gRPC server")
 
+        try:
+            discovery.publish(self.socket_path)
+        except OSError as e:
+            logger.warning(f"Could not write pidfile {discovery.get_pid_file()}: {e}")
+
         # Setup signal handlers
         signal.signal(signal.SIGTERM, self._signal_handler)
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -572,17 +963,59 @@ class DaemonServer:
             if self.grpc_server:
                 self.grpc_server.stop(0)
                 logger.info("gRPC server stopped")
+            discovery.unpublish(self.socket_path)
+
+            jobs.stop()
+
+            from jcapy.config import CONFIG_MANAGER
+            CONFIG_MANAGER.stop_watching()
+            CONFIG_MANAGER.unsubscribe(_on_config_reloaded)
+            CONFIG_MANAGER.flush()
+
+            from jcapy.core.bus import get_event_bus
+            get_event_bus().stop()
+
+            # Bus handlers may have queued final audit records
+            from jcapy.core.audit import get_audit_logger
+            get_audit_logger().flush()
 
             self.server.shutdown()
+            self.server.server_close()
             self.server = None
             logger.info("JCapy Daemon stopped")
 
+    def _add_local_socket(self):
+        try:
+            path = discovery.prepare_socket()
+            if path is None:
+                logger.warning(f"Local socket {discovery.get_socket_path()} unavailable (in use or unsupported)")
+                return
+            if not self.grpc_server.add_insecure_port(discovery.grpc_target(path)):
+                raise RuntimeError("bind failed")
+            self.socket_path = path
+            logger.info(f"🧠 JCapy Brain (gRPC local) active at {path}")
+        except Exception as e:
+            logger.warning(f"Failed to bind local gRPC socket: {e}")
+
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
         logger.info(f"Received signal {signum}")
         self.stop()
 
 
+def _on_config_reloaded(changes: Dict[str, Any]):
+    """Apply config changes written by another process (CLI, TUI) to the running daemon."""
+    keys = sorted(changes)
+    logger.info(f"Config reloaded from disk: {', '.join(keys)}")
+    if any(k == "*" or k.split(".")[0] == "commands" for k in keys):
+        registry = get_service().registry
+        registry.apply_config_overrides()
+        registry.apply_disabled_from_config()
+
+    from jcapy.core.bus import get_event_bus
+    get_event_bus().publish_local("CONFIG_CHANGED", {"keys": keys})
+
+
 def _init_zmq_bridge():
     """Initialize ZMQ bridge for TUI ↔ Web communication."""
     global _zmq_bridge
@@ -594,7 +1027,9 @@ def _init_zmq_bridge():
         _zmq_bridge = init_zmq_bridge(
             pub_port=5555,
             rpc_port=5556,
-            command_handler=_handle_rpc_command
+            command_handler=_handle_rpc_command,
+            rpc_workers=DEFAULT_RPC_WORKERS,
+            rpc_timeout=DEFAULT_RPC_TIMEOUT
         )
 
         if start_zmq_bridge():
@@ -623,13 +1058,15 @@ def _handle_rpc_command(command: str, params: dict) -> dict:
     if command == "EXECUTE_COMMAND":
         cmd_str = params.get("command", "")
         if cmd_str:
-            # Execute via Service Layer
+            # Execute via Service Layer. Output is captured per thread, so
+            # commands running on parallel RPC workers keep their own logs.
             result = service.execute(cmd_str, tui_data=params.get("tui_data"))
             state.increment_task()
             return {
-                "status": "success" if result.status == "success" else "failure",
+                "status": "success" if result.status == ResultStatus.SUCCESS else "failure",
                 "message": result.message,
-                "result": str(result.data) if result.data else None
+                "result": str(result.data) if result.data else None,
+                "logs": result.logs
             }
         return {"status": "error", "message": "No command provided"}
 
@@ -673,43 +1110,23 @@ class JCapyServicer(jcapy_pb2_grpc.JCapyOrchestratorServicer):
         )
 
     def StreamLogs(self, request, context):
-        """Stream logs from the service bus via gRPC."""
-        from jcapy.core.bus import get_event_bus
-        bus = get_event_bus()
-
-        queue = []
-        lock = threading.Lock()
-        event = threading.Event()
-
-        def on_log(payload):
-            with lock:
-                queue.append(payload)
-                event.set()
-
-        # Subscribe to terminal output and audit logs
-        bus.subscribe("TERMINAL_OUTPUT", on_log)
-        bus.subscribe("AUDIT_LOG", on_log)
+        """Stream logs from the service bus via gRPC, filtered server-side."""
+        sub = log_hub.subscribe(request.filter)
+        # Wake the stream immediately when the client goes away
+        context.add_callback(sub.close)
+        logger.info(f"Log stream {sub.stream_id} opened (filter={request.filter!r})")
 
         try:
-            while context.is_active():
-                if event.wait(timeout=1.0):
-                    with lock:
-                        items = list(queue)
-                        queue.clear()
-                        event.clear()
-
-                    for item in items:
-                        # Convert to LogEntry
-                        yield jcapy_pb2.LogEntry(
-                            source=item.get("source", "daemon"),
-                            level=item.get("level", "info"),
-                            message=item.get("line") or item.get("message") or str(item),
-                            timestamp=item.get("timestamp", datetime.now().isoformat())
-                        )
+            while context.is_active() and not sub.closed:
+                for item in sub.get(timeout=5.0):
+                    yield jcapy_pb2.LogEntry(
+                        source=item["source"],
+                        level=item["level"],
+                        message=item["message"],
+                        timestamp=item["timestamp"]
+                    )
         finally:
-            # Unsubscribe would be nice, but bus doesn't support it yet in a simple way
-            # We'll just ignore for now as it's a POC/Alpha
-            pass
+            log_hub.unsubscribe(sub)
 
 
 def _start_heartbeat():
@@ -757,8 +1174,17 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='JCapy Daemon Server')
     parser.add_argument('--port', type=int, default=8080, help='Port to listen on')
     parser.add_argument('--host', default='0.0.0.0', help='Host to bind to')
+    parser.add_argument('--http-workers', type=int, default=DEFAULT_HTTP_WORKERS, help='Max concurrent HTTP connections being served')
+    parser.add_argument('--backlog', type=int, default=DEFAULT_HTTP_BACKLOG, help='HTTP listen backlog')
+    parser.add_argument('--keepalive-timeout', type=float, default=DEFAULT_KEEPALIVE_TIMEOUT, help='Idle keep-alive timeout in seconds')
 
     args = parser.parse_args()
 
-    server = DaemonServer(port=args.port, host=args.host)
+    server = DaemonServer(
+        port=args.port,
+        host=args.host,
+        http_workers=args.http_workers,
+        http_backlog=args.backlog,
+        keepalive_timeout=args.keepalive_timeout
+    )
     server.start()
@@ -4,15 +4,15 @@ import os
 import json
 import time
 import argparse
-import logging
 import threading
-from jcapy.config import get_active_library_path, get_current_persona_name, load_config
+from jcapy.config import get_current_persona_name
 from jcapy.utils.updates import check_for_framework_updates, get_update_status, VERSION
-from jcapy.ui.ux.hints import prompt_typo_correction, get_tutorial, JCAPY_COMMANDS
+from jcapy.ui.ux.hints import prompt_typo_correction, get_tutorial
 from jcapy.core.plugins import get_registry
 from jcapy.core.service import get_service
-from jcapy.core.client import JCapyClient
 from jcapy.ui.menu import terminal_hygiene
+from jcapy.utils import startup_profile
+# jcapy.core.client (grpc, cryptography) is imported only when a local daemon is found
 
 # ANSI Colors
 CYAN = '\033[1;36m'
@@ -54,6 +54,14 @@ def print_help():
         print("Rich not installed. Run 'pip install rich'")
 
 def main():
+    # 0. Fast paths that don't need the command registry
+    if startup_profile.FLAG in sys.argv[1:]:
+        argv = [a for a in sys.argv[1:] if a != startup_profile.FLAG]
+        sys.exit(startup_profile.run(argv))
+    if "--version" in sys.argv or "-v" in sys.argv:
+        print(f"jcapy v{VERSION}")
+        return
+
     # 1. Initialize Service (Registry + Plugins)
     service = get_service()
     registry = service.registry
@@ -66,6 +74,8 @@ def main():
 
     # 4. Configure Parsers from Registry
     parser.add_argument("-o", "--orbital", action="store_true", help="Launch in Orbital (Stateless) mode")
+    parser.add_argument(startup_profile.FLAG, action="store_true",
+                        help="Run the command and report where startup time went (imports, service init)")
     registry.configure_parsers(subparsers)
 
     # 5. Register daemon subparser (special case with nested commands)
@@ -73,11 +83,7 @@ def main():
     register_daemon_parser(subparsers)
 
     try:
-        # 1. Handle version and help manually before parsing to preserve cinematic side-effects
-        if "--version" in sys.argv or "-v" in sys.argv:
-            print(f"jcapy v{VERSION}")
-            return
-
+        # 1. Handle help manually before parsing to preserve cinematic side-effects
         if len(sys.argv) == 2 and sys.argv[1] in ["-h", "--help"]:
             check_for_framework_updates()
             print_help()
@@ -162,9 +168,15 @@ def main():
             is_interactive = cmd_name in registry._interactive
 
             if not is_interactive and sys.stdout.isatty():
-                # Orbital Architecture delegation (Phase 7.2)
-                client = JCapyClient()
-                if client.connect(timeout=1):
+                # Orbital Architecture delegation (Phase 7.2). The discovery probe is a
+                # stat() + connect() on the daemon's Unix socket, so without a daemon
+                # neither grpc nor a channel readiness wait is paid.
+                from jcapy.daemon import discovery
+                client = None
+                if discovery.daemon_alive():
+                    from jcapy.core.client import JCapyClient
+                    client = JCapyClient(socket_path=str(discovery.get_socket_path()))
+                if client is not None and client.connect(timeout=1):
                     from rich.status import Status
                     with Status(f"[bold cyan]Orchestrating {cmd_name} (Remote)...[/]", spinner="dots"):
                         # Launch log streaming in a background thread
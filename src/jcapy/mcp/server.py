@@ -2,6 +2,7 @@ import os
 import sys
 from mcp.server.fastmcp import FastMCP
 from jcapy.config import get_active_library_path
+from jcapy.core.skill_catalog import get_catalog
 from jcapy.commands.frameworks import apply_framework
 
 # Initialize FastMCP Server
@@ -14,17 +15,14 @@ def list_skills() -> str:
     if not os.path.exists(lib_path):
         return "No library found."
 
-    skills = []
     # Search in 'skills/' subdirectory as per JCapy standard
-    skills_root = os.path.join(lib_path, "skills")
-    search_path = skills_root if os.path.exists(skills_root) else lib_path
+    under = "skills" if os.path.exists(os.path.join(lib_path, "skills")) else None
 
-    for root, dirs, files in os.walk(search_path):
-        for f in files:
-            if f.endswith(".md") and not f.startswith("."):
-                # Return relative path from search_path for better discovery
-                rel_path = os.path.relpath(os.path.join(root, f), search_path)
-                skills.append(rel_path.replace(".md", ""))
+    skills = []
+    for entry in get_catalog(lib_path).entries(under=under, markdown_only=True):
+        # Return relative path from the search root for better discovery
+        rel_path = entry.rel_path[len(under) + 1:] if under else entry.rel_path
+        skills.append(rel_path.replace(".md", ""))
 
     return "\n".join(skills) if skills else "No skills found."
 
@@ -41,12 +39,12 @@ def read_skill(name: str) -> str:
         with open(exact_path, 'r') as file:
             return file.read()
 
-    # Search recursively
-    for root, dirs, files in os.walk(search_path):
-        for f in files:
-            if f == name or f == f"{name}.md":
-                with open(os.path.join(root, f), 'r') as file:
-                    return file.read()
+    # Search the catalog by file name
+    entry = get_catalog(lib_path).find(name, fuzzy=False,
+                                       under="skills" if search_path == skills_root else None)
+    if entry:
+        with open(entry.path, 'r') as file:
+            return file.read()
     return f"Skill '{name}' not found."
 
 @mcp.tool()
@@ -1,28 +1,90 @@
 # SPDX-License-Identifier: Apache-2.0
 import os
+import json
 import time
 import hashlib
-from typing import List, Dict, Any, Optional
-try:
-    import chromadb
-    from chromadb.config import Settings
-except ImportError:
-    chromadb = None
-    Settings = None
-    print("Warning: 'chromadb' not found. Memory features will be disabled.")
-
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
 from jcapy.config import get_active_library_path, load_config
 from jcapy.memory_interfaces import MemoryInterface
 
+MANIFEST_FILE = "ingest_manifest.json"
+DEFAULT_INGEST_BATCH = int(os.environ.get('JCAPY_MEMORY_BATCH', 100))
+
+# Imported on first use: loading chromadb costs seconds, and the flat
+# backend never needs it
+chromadb = None
+
+
+def _load_chromadb():
+    global chromadb
+    if chromadb is None:
+        try:
+            import chromadb as module
+        except ImportError:
+            print("Warning: 'chromadb' not found. Memory features will be disabled.")
+            return None
+        chromadb = module
+    return chromadb
+
+
+class IngestManifest:
+    """
+    Persisted record of every file held in the memory bank.
+
+    Maps absolute path -> {hash, size, mtime, chunk_ids}, plus `stale_ids`
+    for outdated documents whose delete failed. size/mtime are a cheap
+    pre-check; the sha256 content hash decides whether a file that was
+    touched actually changed.
+    """
+    VERSION = 1
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            if data.get("version") == self.VERSION:
+                self.files = data.get("files", {})
+        except (OSError, ValueError):
+            self.files = {}  # Unreadable manifest: next run re-ingests everything
+
+    def save(self):
+        if not self.path:
+            return
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({"version": self.VERSION, "files": self.files}, f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        self.files = {}
+
+    def under(self, root: str) -> List[str]:
+        """Manifest paths equal to or inside `root`."""
+        prefix = root.rstrip(os.sep) + os.sep
+        return [p for p in self.files if p == root or p.startswith(prefix)]
+
+
 class LocalMemoryBank:
     """
     The Long-Term Memory of JCapy (Community Edition).
     Uses local ChromaDB to store and retrieve skills/docs.
     """
-    def __init__(self, persistence_path=None):
-        if not chromadb:
+    IGNORE_DIRS = {'.git', '__pycache__', 'node_modules', 'venv', '.venv', '.idea', '.vscode'}
+    VALID_EXTS = {'.md', '.txt', '.py', '.sh', '.json', '.yaml', '.yml'}
+
+    def __init__(self, persistence_path=None, batch_size: int = DEFAULT_INGEST_BATCH):
+        self.batch_size = max(1, batch_size)
+        if not _load_chromadb():
             self.client = None
             self.collection = None
+            self.manifest = IngestManifest(None)
             return
 
         if not persistence_path:
@@ -40,12 +102,17 @@ class LocalMemoryBank:
             name="jcapy_knowledge",
             metadata={"hnsw:space": "cosine"}
         )
+        self.manifest = IngestManifest(os.path.join(persistence_path, MANIFEST_FILE))
+
+    @staticmethod
+    def _doc_id(source_path: str) -> str:
+        return hashlib.md5(source_path.encode()).hexdigest()
 
     def add_document(self, content: str, source_path: str, metadata: Dict[str, Any] = None):
         if not self.collection: return
         """Adds or updates a document in the memory bank."""
         # Create a unique ID based on the file path
-        doc_id = hashlib.md5(source_path.encode()).hexdigest()
+        doc_id = self._doc_id(source_path)
 
         if metadata is None:
             metadata = {}
@@ -100,6 +167,8 @@ class LocalMemoryBank:
                 name="jcapy_knowledge",
                 metadata={"hnsw:space": "cosine"}
             )
+            self.manifest.clear()
+            self.manifest.save()
             return True
         except Exception as e:
             print(f"Error clearing memory: {e}")
@@ -108,61 +177,226 @@ class LocalMemoryBank:
     def memorize(self, paths: List[str], clear_first: bool = False) -> Dict[str, int]:
         """
         Ingests content from list of paths (files or directories).
+
+        Incremental: files whose content hash matches the manifest are skipped,
+        changed files are re-embedded in batches, and manifest entries under a
+        given path that no longer exist on disk are purged from the collection.
         """
-        stats = {"added": 0, "errors": 0, "skipped": 0}
+        stats = {"scanned": 0, "embedded": 0, "unchanged": 0, "removed": 0,
+                 "added": 0, "errors": 0, "skipped": 0}
         if not self.client: return stats
 
         if clear_first:
             print("🧹 Clearing existing memory...")
             self.clear()
+        else:
+            self._migrate_legacy_ids()
 
-        for path in paths:
-            if os.path.isfile(path):
-                self._ingest_file(path, stats)
-            elif os.path.isdir(path):
-                self._scan_directory(path, stats)
-            else:
-                print(f"⚠️ Path not found: {path}")
-                stats["skipped"] += 1
-
+        pending: List[Tuple[str, str, str, Dict[str, Any], Dict[str, Any]]] = []
+        try:
+            for path in paths:
+                path = os.path.abspath(path)
+                seen: Set[str] = set()
+                if os.path.isfile(path):
+                    seen.add(path)
+                    self._ingest_file(path, stats, pending)
+                elif os.path.isdir(path):
+                    for file_path in self._scan_directory(path):
+                        seen.add(file_path)
+                        self._ingest_file(file_path, stats, pending)
+                else:
+                    print(f"⚠️ Path not found: {path}")
+                    stats["skipped"] += 1
+                self._purge_missing(path, seen, stats)
+            self._flush(pending, stats)
+        finally:
+            self.manifest.save()
+
+        # "added" predates incremental ingestion; keep it for existing callers
+        stats["added"] = stats["embedded"]
         return stats
 
-    def _scan_directory(self, directory: str, stats: Dict[str, int]):
-        """Recursively scans a directory for valid files."""
-        # Ignore list
-        IGNORE_DIRS = {'.git', '__pycache__', 'node_modules', 'venv', '.venv', '.idea', '.vscode'}
-        VALID_EXTS = {'.md', '.txt', '.py', '.sh', '.json', '.yaml', '.yml'}
+    def _migrate_legacy_ids(self):
+        """
+        One-time re-key of a collection built before the manifest existed.
+        Documents were keyed on the path as given (often relative); re-ingesting
+        under absolute-path ids would leave those copies behind as orphans, so
+        they are moved to the new ids, keeping their embeddings.
+        """
+        if not self.manifest.path or os.path.exists(self.manifest.path):
+            return
+        try:
+            if not self.collection.count():
+                return
+            legacy = self.collection.get(include=["documents", "metadatas", "embeddings"])
+        except Exception as e:
+            print(f"  ❌ Error reading memory for migration: {e}")
+            return
+
+        embeddings = legacy.get("embeddings")
+        if embeddings is None:
+            embeddings = [None] * len(legacy["ids"])
+        moved: Dict[str, Tuple[str, Dict[str, Any], Any]] = {}
+        old_ids: List[str] = []
+        for doc_id, doc, meta, embedding in zip(legacy["ids"], legacy["documents"], legacy["metadatas"], embeddings):
+            source = (meta or {}).get("source")
+            if not source:
+                continue
+            path = os.path.abspath(source)
+            new_id = self._doc_id(path)
+            if new_id == doc_id or not os.path.isfile(path):
+                continue  # Already keyed by absolute path, or no longer resolvable from here
+            moved.setdefault(new_id, (doc, dict(meta, source=path), embedding))
+            old_ids.append(doc_id)
+
+        if moved:
+            ids = list(moved)
+            upsert = {"ids": ids, "documents": [moved[i][0] for i in ids], "metadatas": [moved[i][1] for i in ids]}
+            if all(moved[i][2] is not None for i in ids):
+                upsert["embeddings"] = [moved[i][2] for i in ids]
+            try:
+                self.collection.upsert(**upsert)
+                self.collection.delete(ids=old_ids)
+            except Exception as e:
+                print(f"  ❌ Error migrating {len(old_ids)} documents: {e}")
+                return
+            print(f"🔁 Migrated {len(old_ids)} documents to absolute-path ids")
+        self.manifest.save()
 
+    def _scan_directory(self, directory: str) -> Iterator[str]:
+        """Recursively yields ingestible files under a directory."""
         for root, dirs, files in os.walk(directory):
             # Prune ignored dirs
-            dirs[:] = [d for d in dirs if d not in IGNORE_DIRS]
+            dirs[:] = [d for d in dirs if d not in self.IGNORE_DIRS]
 
             for file in files:
                 ext = os.path.splitext(file)[1].lower()
-                if ext in VALID_EXTS:
-                    full_path = os.path.join(root, file)
-                    self._ingest_file(full_path, stats)
+                if ext in self.VALID_EXTS:
+                    yield os.path.join(root, file)
 
-    def _ingest_file(self, file_path: str, stats: Dict[str, int]):
-        """Reads, extracts metadata, and stores a single file."""
+    def _ingest_file(self, file_path: str, stats: Dict[str, int], pending: list):
+        """Queues a single file for embedding unless the manifest shows it unchanged."""
+        stats["scanned"] += 1
         try:
+            st = os.stat(file_path)
+            entry = self.manifest.files.get(file_path)
+            if entry and entry.get("stale_ids"):
+                self._purge_stale(file_path, entry, stats)
+            if entry and entry["size"] == st.st_size and entry["mtime"] == st.st_mtime:
+                stats["unchanged"] += 1
+                stats["skipped"] += 1
+                return
+
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                 content = f.read()
+            digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+            if entry and entry["hash"] == digest:
+                # Touched but identical: refresh the pre-check, skip the embed
+                entry["size"], entry["mtime"] = st.st_size, st.st_mtime
+                stats["unchanged"] += 1
+                stats["skipped"] += 1
+                return
 
             if not content.strip():
+                if entry:
+                    self._remove(file_path, stats)
                 stats["skipped"] += 1
                 return
 
             # Extract basic metadata
             meta = self._extract_metadata(file_path, content)
+            meta["source"] = file_path
+            meta["content_hash"] = digest
 
-            self.add_document(content, file_path, meta)
-            stats["added"] += 1
+            chunks = self._chunk(content)
+            doc_id = self._doc_id(file_path)
+            if len(chunks) == 1:
+                chunk_ids, metas = [doc_id], [meta]
+            else:
+                chunk_ids = [f"{doc_id}:{i}" for i in range(len(chunks))]
+                metas = [dict(meta, chunk_index=i) for i in range(len(chunks))]
+            new_entry = {"hash": digest, "size": st.st_size, "mtime": st.st_mtime, "chunk_ids": chunk_ids}
+            pending.append((file_path, chunk_ids, chunks, metas, new_entry))
+            if sum(len(ids) for _, ids, _, _, _ in pending) >= self.batch_size:
+                self._flush(pending, stats)
 
         except Exception as e:
             print(f"  ❌ Error reading {file_path}: {e}")
             stats["errors"] += 1
 
+    def _chunk(self, content: str) -> List[str]:
+        """Splits a file into the documents stored for it (here: the whole file)."""
+        return [content]
+
+    def _flush(self, pending: list, stats: Dict[str, int]):
+        """Upserts queued documents in one call and records them in the manifest."""
+        if not pending:
+            return
+        batch = list(pending)
+        pending.clear()
+        try:
+            self.collection.upsert(
+                documents=[chunk for _, _, chunks, _, _ in batch for chunk in chunks],
+                metadatas=[meta for _, _, _, metas, _ in batch for meta in metas],
+                ids=[chunk_id for _, chunk_ids, _, _, _ in batch for chunk_id in chunk_ids]
+            )
+        except Exception as e:
+            # Not recorded in the manifest, so these files are retried next run
+            print(f"  ❌ Error storing batch of {len(batch)} documents: {e}")
+            stats["errors"] += len(batch)
+            return
+
+        stale: Dict[str, List[str]] = {}
+        for file_path, _, _, _, entry in batch:
+            previous = self.manifest.files.get(file_path)
+            if previous:
+                ids = set(previous["chunk_ids"]) | set(previous.get("stale_ids", ()))
+                ids -= set(entry["chunk_ids"])
+                if ids:
+                    stale[file_path] = sorted(ids)
+            self.manifest.files[file_path] = entry
+            stats["embedded"] += 1
+        if not stale:
+            return
+        try:
+            self.collection.delete(ids=[doc_id for ids in stale.values() for doc_id in ids])
+        except Exception as e:
+            # Kept in the manifest so the next run purges them
+            print(f"  ❌ Error removing outdated documents of {len(stale)} files: {e}")
+            stats["errors"] += 1
+            for file_path, ids in stale.items():
+                self.manifest.files[file_path]["stale_ids"] = ids
+
+    def _purge_stale(self, file_path: str, entry: Dict[str, Any], stats: Dict[str, int]):
+        """Retries deleting the outdated documents an earlier run failed to remove."""
+        try:
+            self.collection.delete(ids=entry["stale_ids"])
+        except Exception as e:
+            print(f"  ❌ Error removing outdated documents of {file_path}: {e}")
+            stats["errors"] += 1
+            return
+        del entry["stale_ids"]
+
+    def _purge_missing(self, root: str, seen: Set[str], stats: Dict[str, int]):
+        """Drops manifest entries under `root` that were not found in this scan."""
+        for file_path in self.manifest.under(root):
+            if file_path not in seen:
+                self._remove(file_path, stats)
+
+    def _remove(self, file_path: str, stats: Dict[str, int]):
+        entry = self.manifest.files.get(file_path)
+        if not entry:
+            return
+        try:
+            self.collection.delete(ids=entry["chunk_ids"] + entry.get("stale_ids", []))
+        except Exception as e:
+            print(f"  ❌ Error removing {file_path}: {e}")
+            stats["errors"] += 1
+            return
+        del self.manifest.files[file_path]
+        stats["removed"] += 1
+
     def _extract_metadata(self, file_path: str, content: str) -> Dict[str, Any]:
         """Extracts useful metadata from file content/stats."""
         filename = os.path.basename(file_path)
@@ -192,7 +426,8 @@ class LocalMemoryBank:
     def sync_library(self, library_path: str):
         print(f"🧠 Syncing Memory Bank from {library_path}...")
         results = self.memorize([library_path], clear_first=False)
-        print(f"✨ Memory Sync Complete. {results['added']} items indexed.")
+        print(f"✨ Memory Sync Complete. {results['embedded']} items indexed, "
+              f"{results['unchanged']} unchanged, {results['removed']} removed.")
 
 # Default factory
 def get_memory_bank() -> MemoryInterface:
@@ -220,6 +455,28 @@ def get_memory_bank() -> MemoryInterface:
                  print(f"⚠️  Error initializing Remote Memory: {e}. Falling back to Local.")
                  return LocalMemoryBank()
 
+        if provider == "flat":
+            try:
+                from jcapy.memory.flat import FlatMemoryBank
+                return FlatMemoryBank()
+            except ImportError as e:
+                 print(f"⚠️  Detailed error loading FlatMemoryBank (check numpy): {e}. Falling back to Local.")
+                 return LocalMemoryBank()
+            except Exception as e:
+                 print(f"⚠️  Error initializing Flat Memory: {e}. Falling back to Local.")
+                 return LocalMemoryBank()
+
+        if provider == "hybrid":
+            try:
+                from jcapy.memory.hybrid import HybridMemoryBank
+                return HybridMemoryBank()
+            except ImportError as e:
+                 print(f"⚠️  Detailed error loading HybridMemoryBank (check numpy): {e}. Falling back to Local.")
+                 return LocalMemoryBank()
+            except Exception as e:
+                 print(f"⚠️  Error initializing Hybrid Memory: {e}. Falling back to Local.")
+                 return LocalMemoryBank()
+
         if provider == "chroma_cloud":
             try:
                 from jcapy.memory.chroma_cloud import ChromaCloudMemoryBank
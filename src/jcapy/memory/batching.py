@@ -0,0 +1,144 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Batched, concurrent upserts for the cloud memory backends.
+
+Pinecone and Chroma Cloud ingest the same way: records from consecutive
+files are packed into full batches, and the batches are written by a
+bounded pool while the next files are read. Only the batch preparation
+(embedding, for Pinecone) and the write call differ.
+"""
+import os
+import time
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from rich.console import Console
+
+console = Console()
+
+
+class BatchedUpsert:
+    """
+    One memorize() call. Every `batch_size` queued records go through
+    `prepare` on the calling thread and are then split into `write_size`
+    writes for a pool of `concurrency` workers, with at most twice that
+    many queued so preparing cannot run far ahead of the writes.
+    `write(records)` returns True once they are stored. A file counts as
+    added once every one of its records is stored; a batch that fails
+    fails only the files it carries.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[List[Any]], bool],
+        label: str,
+        batch_size: int,
+        concurrency: int,
+        write_size: Optional[int] = None,
+        prepare: Optional[Callable[[List[Any]], List[Any]]] = None,
+        thread_name_prefix: str = "jcapy-upsert"
+    ):
+        self.label = label
+        self.stats = {"added": 0, "errors": 0, "skipped": 0, "chunks": 0, "batches": 0, "chunks_per_sec": 0}
+        self.elapsed = 0.0
+        self._write = write
+        self._prepare = prepare
+        self._batch_size = max(1, batch_size)
+        self._write_size = max(1, write_size or batch_size)
+        self._pending: List[Tuple[str, Any]] = []   # (file_path, record)
+        self._remaining: Dict[str, int] = {}        # file_path -> records not yet settled
+        self._sizes: Dict[str, int] = {}
+        self._seen = set()
+        self._failed = set()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(concurrency * 2)
+        self._pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=thread_name_prefix)
+        self._start = time.perf_counter()
+
+    def add(self, file_path: str, records: List[Any]) -> bool:
+        """Queues one file's records. Returns False if the path was already added in this run."""
+        with self._lock:
+            if file_path in self._seen:
+                return False
+            self._seen.add(file_path)
+            if not records:
+                self.stats["skipped"] += 1
+                return True
+            self._remaining[file_path] = self._sizes[file_path] = len(records)
+        for record in records:
+            self._pending.append((file_path, record))
+            if len(self._pending) >= self._batch_size:
+                self._submit()
+        return True
+
+    def tally(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _submit(self):
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        owners = [file_path for file_path, _ in batch]
+        records = [record for _, record in batch]
+        if self._prepare is not None:
+            try:
+                records = list(self._prepare(records))
+                if len(records) != len(batch):
+                    raise ValueError(f"expected {len(batch)} records, got {len(records)}")
+            except Exception as e:
+                console.print(f"[red]Error preparing {len(batch)} records from {len(set(owners))} files: {e}[/red]")
+                self._settle(Counter(owners), ok=False)
+                return
+
+        for start in range(0, len(batch), self._write_size):
+            end = start + self._write_size
+            self._slots.acquire()  # backpressure: wait for a queue slot
+            self._pool.submit(self._run, owners[start:end], records[start:end])
+
+    def _run(self, owners: List[str], records: List[Any]):
+        ok = False
+        try:
+            ok = self._write(records)
+        except Exception as e:
+            console.print(f"[red]Upsert error for {len(records)} records: {e}[/red]")
+        finally:
+            self._slots.release()
+        self._settle(Counter(owners), ok, written=len(records))
+
+    def _settle(self, owners: Counter, ok: bool, written: int = 0):
+        done = []
+        with self._lock:
+            if ok:
+                self.stats["chunks"] += written
+                self.stats["batches"] += 1
+            for file_path, n in owners.items():
+                if not ok:
+                    self._failed.add(file_path)
+                self._remaining[file_path] -= n
+                if self._remaining[file_path]:
+                    continue
+                del self._remaining[file_path]
+                size = self._sizes.pop(file_path)
+                if file_path in self._failed:
+                    self._failed.discard(file_path)
+                    self.stats["errors"] += 1
+                else:
+                    self.stats["added"] += 1
+                    done.append((file_path, size))
+        for file_path, size in done:
+            console.print(f"[green]☁️  [{self.label}] Indexed:[/green] {os.path.basename(file_path)} "
+                          f"({size} chunks)")
+
+    def flush(self):
+        """Submits the last, partial batch."""
+        self._submit()
+
+    def close(self):
+        """Waits for in-flight writes and records throughput."""
+        self._pool.shutdown(wait=True)
+        self.elapsed = time.perf_counter() - self._start
+        if self.elapsed > 0:
+            self.stats["chunks_per_sec"] = int(self.stats["chunks"] / self.elapsed)
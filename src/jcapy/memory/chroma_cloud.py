@@ -1,12 +1,15 @@
 # SPDX-License-Identifier: Apache-2.0
 import os
+import time
 import logging
 import hashlib
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from rich.console import Console
 from jcapy.memory_interfaces import MemoryInterface
 from jcapy.core.vault import resolve_secret
+from jcapy.memory.batching import BatchedUpsert
+from jcapy.memory.chunking import chunk_text, utf8_len
 
 try:
     import chromadb
@@ -18,11 +21,22 @@ except ImportError:
 console = Console()
 logger = logging.getLogger('jcapy.memory.chroma_cloud')
 
+# Chroma Cloud accepts up to 300 records per write; the server's own
+# get_max_batch_size() lowers this further when it reports less
+UPSERT_BATCH = int(os.environ.get('JCAPY_CHROMA_BATCH', 100))
+UPSERT_CONCURRENCY = int(os.environ.get('JCAPY_CHROMA_CONCURRENCY', 4))
+UPSERT_RETRIES = int(os.environ.get('JCAPY_CHROMA_RETRIES', 3))
+# Chroma Cloud rejects documents over 16KB (of UTF-8); longer files are stored as chunks
+MAX_DOCUMENT_BYTES = 16 * 1024
+
 class ChromaCloudMemoryBank(MemoryInterface):
     """
     Managed Memory Tier: Remote implementation using ChromaDB Cloud.
     """
-    def __init__(self):
+    def __init__(self, batch_size: int = UPSERT_BATCH, concurrency: int = UPSERT_CONCURRENCY,
+                 embedding_function=None):
+        self.batch_size = max(1, batch_size)
+        self.concurrency = max(1, concurrency)
         if not chromadb:
             console.print("[red]Error: 'chromadb' package not installed.[/red]")
             self.active = False
@@ -30,29 +44,39 @@ class ChromaCloudMemoryBank(MemoryInterface):
 
         self.api_key = resolve_secret("CHROMA_CLOUD_API_KEY")
         self.tenant = resolve_secret("CHROMA_CLOUD_TENANT")
-        self.database = resolve_secret("CHROMA_CLOUD_DATABASE", "jcapy")
+        self.database = resolve_secret("CHROMA_CLOUD_DATABASE") or "jcapy"
+        # A self-hosted Chroma server instead of the cloud, e.g. `chroma run` for offline testing
+        self.host = resolve_secret("CHROMA_HOST")
 
-        if not self.api_key or not self.tenant:
+        if not self.host and (not self.api_key or not self.tenant):
             console.print("[yellow]Warning: ChromaDB Cloud credentials not set. Cloud memory disabled.[/yellow]")
             self.active = False
             return
 
         try:
-            # Note: chromadb.CloudClient is the specialized client for Chroma Cloud
-            self.client = chromadb.CloudClient(
-                api_key=self.api_key,
-                tenant=self.tenant,
-                database=self.database
-            )
+            if self.host:
+                self.client = chromadb.HttpClient(host=self.host, port=int(resolve_secret("CHROMA_PORT") or 8000))
+            else:
+                # Note: chromadb.CloudClient is the specialized client for Chroma Cloud
+                self.client = chromadb.CloudClient(
+                    api_key=self.api_key,
+                    tenant=self.tenant,
+                    database=self.database
+                )
 
             # Get or create collection
-            self.collection = self.client.get_or_create_collection(
-                name="jcapy_knowledge",
-                metadata={"hnsw:space": "cosine"}
-            )
+            self.embedding_function = embedding_function
+            self.collection = self._get_collection()
+            try:
+                self.batch_size = min(self.batch_size, self.client.get_max_batch_size())
+            except Exception:
+                pass  # older servers don't report a limit
 
             self.active = True
-            console.print(f"[dim]☁️  Chroma Cloud Active: Tenant [bold]{self.tenant}[/bold], DB [bold]{self.database}[/bold][/dim]")
+            if self.host:
+                console.print(f"[dim]☁️  Chroma Server Active: [bold]{self.host}[/bold][/dim]")
+            else:
+                console.print(f"[dim]☁️  Chroma Cloud Active: Tenant [bold]{self.tenant}[/bold], DB [bold]{self.database}[/bold][/dim]")
         except Exception as e:
             console.print(f"[red]Error initializing Chroma Cloud: {e}[/red]")
             self.active = False
@@ -68,26 +92,44 @@ class ChromaCloudMemoryBank(MemoryInterface):
             console.print("🧹 [Cloud] Clearing collection...")
             self.clear()
 
-        stats = {"added": 0, "errors": 0, "skipped": 0}
-
-        for path in paths:
-            if os.path.isfile(path):
-                self._ingest_file(path, stats)
-            elif os.path.isdir(path):
-                for root, _, files in os.walk(path):
-                    for file in files:
-                        if file.lower().endswith(('.md', '.txt', '.py', '.sh', '.json', '.yaml', '.yml')):
-                            self._ingest_file(os.path.join(root, file), stats)
-
+        # A cleared collection holds no earlier versions to prune
+        prune = not clear_first
+        run = BatchedUpsert(lambda records: self._upsert_with_retry(records, prune), "Chroma Cloud",
+                            self.batch_size, self.concurrency, thread_name_prefix="jcapy-chroma")
+        try:
+            for path in paths:
+                if os.path.isfile(path):
+                    self._ingest_file(path, run)
+                elif os.path.isdir(path):
+                    for root, _, files in os.walk(path):
+                        for file in files:
+                            if file.lower().endswith(('.md', '.txt', '.py', '.sh', '.json', '.yaml', '.yml')):
+                                self._ingest_file(os.path.join(root, file), run)
+            run.flush()
+        finally:
+            run.close()
+
+        stats = run.stats
+        if stats["chunks"]:
+            console.print(f"[dim]☁️  [Chroma Cloud] {stats['chunks']} chunks in {stats['batches']} batches, "
+                          f"{run.elapsed:.1f}s ({stats['chunks_per_sec']} chunks/s)[/dim]")
         return stats
 
-    def _ingest_file(self, file_path: str, stats: Dict[str, int]):
+    def _get_collection(self):
+        kwargs = {"embedding_function": self.embedding_function} if self.embedding_function else {}
+        return self.client.get_or_create_collection(
+            name="jcapy_knowledge",
+            metadata={"hnsw:space": "cosine"},
+            **kwargs
+        )
+
+    def _ingest_file(self, file_path: str, run: BatchedUpsert):
         try:
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                 content = f.read()
 
             if not content.strip():
-                stats["skipped"] += 1
+                run.tally("skipped")
                 return
 
             # Extract basic metadata
@@ -100,18 +142,61 @@ class ChromaCloudMemoryBank(MemoryInterface):
                 "type": os.path.splitext(filename)[1].replace(".", "") or "text"
             }
 
-            self.collection.upsert(
-                documents=[content],
-                metadatas=[metadata],
-                ids=[doc_id]
-            )
-
-            console.print(f"[green]☁️  [Chroma Cloud] Indexed:[/green] {filename}")
-            stats["added"] += 1
+            if utf8_len(content) <= MAX_DOCUMENT_BYTES:
+                run.add(file_path, [(doc_id, content, metadata)])
+            else:
+                chunks = chunk_text(content, MAX_DOCUMENT_BYTES, in_bytes=True)
+                run.add(file_path, [(f"{doc_id}:{i}", chunk, dict(metadata, chunk_index=i, chunk_count=len(chunks)))
+                                    for i, chunk in enumerate(chunks)])
 
         except Exception as e:
             console.print(f"[red]Error indexing {file_path}: {e}[/red]")
-            stats["errors"] += 1
+            run.tally("errors")
+
+    @staticmethod
+    def _stale(records: List[Tuple[str, str, Dict[str, Any]]]) -> Tuple[List[str], Optional[Dict[str, Any]]]:
+        """
+        Ids and a where filter matching what earlier versions of the files
+        starting in this batch left behind: the whole-file document of a
+        file now chunked, and chunks past the new chunk count. Neither can
+        match a record of this run, so batches may run in any order.
+        """
+        ids, clauses = [], []
+        for doc_id, _, meta in records:
+            if meta.get("chunk_index", 0) != 0:
+                continue  # pruned with the file's first chunk
+            count = meta.get("chunk_count", 0)
+            if count:
+                ids.append(doc_id.rsplit(":", 1)[0])
+            clauses.append({"$and": [{"source": meta["source"]}, {"chunk_index": {"$gte": count}}]})
+        where = None
+        if clauses:
+            where = clauses[0] if len(clauses) == 1 else {"$or": clauses}
+        return ids, where
+
+    def _upsert_with_retry(self, records: List[Tuple[str, str, Dict[str, Any]]], prune: bool = True) -> bool:
+        """Upserts one batch, retrying just this batch with exponential backoff."""
+        stale_ids, stale_where = self._stale(records) if prune else ([], None)
+        for attempt in range(UPSERT_RETRIES):
+            try:
+                if stale_ids:
+                    self.collection.delete(ids=stale_ids)
+                if stale_where:
+                    self.collection.delete(where=stale_where)
+                self.collection.upsert(
+                    ids=[doc_id for doc_id, _, _ in records],
+                    documents=[doc for _, doc, _ in records],
+                    metadatas=[meta for _, _, meta in records]
+                )
+                return True
+            except Exception as e:
+                if attempt + 1 == UPSERT_RETRIES:
+                    console.print(f"[red]❌ Batch of {len(records)} failed after {UPSERT_RETRIES} attempts: {e}[/red]")
+                    return False
+                wait = 2 ** attempt
+                console.print(f"[yellow]⚠️  Batch of {len(records)} failed ({e}). Retrying in {wait}s...[/yellow]")
+                time.sleep(wait)
+        return False
 
     def recall(self, query: str, n_results: int = 5) -> List[Dict[str, Any]]:
         """Queries the cloud collection."""
@@ -147,10 +232,7 @@ class ChromaCloudMemoryBank(MemoryInterface):
             # For cloud, we might want to just delete items and keep collection configuration
             # but simple delete/create works too
             self.client.delete_collection("jcapy_knowledge")
-            self.collection = self.client.get_or_create_collection(
-                name="jcapy_knowledge",
-                metadata={"hnsw:space": "cosine"}
-            )
+            self.collection = self._get_collection()
             return True
         except Exception as e:
             console.print(f"[red]Error clearing Chroma Cloud: {e}[/red]")
@@ -0,0 +1,52 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Splitting documents into chunks for the memory backends.
+
+Kept free of heavy imports (numpy, chromadb, pinecone) so every backend
+can use it.
+"""
+import os
+import re
+from typing import List
+
+CHUNK_CHARS = int(os.environ.get('JCAPY_CHUNK_CHARS', 1500))
+
+_PARAGRAPH = re.compile(r'\n\s*\n')
+
+
+def utf8_len(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+def _head(text: str, size: int, in_bytes: bool) -> str:
+    if not in_bytes:
+        return text[:size]
+    # Never split a multibyte character; size >= 4 always keeps at least one
+    return text.encode("utf-8")[:size].decode("utf-8", "ignore")
+
+
+def chunk_text(text: str, size: int = CHUNK_CHARS, in_bytes: bool = False) -> List[str]:
+    """
+    Paragraphs packed greedily into chunks of at most `size` characters
+    (UTF-8 bytes if `in_bytes`); a markdown heading always starts a new
+    chunk, and a paragraph longer than `size` is cut into windows.
+    """
+    length = utf8_len if in_bytes else len
+    chunks: List[str] = []
+    current = ""
+    for paragraph in _PARAGRAPH.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        starts_section = paragraph.startswith("#")
+        if current and (starts_section or length(current) + length(paragraph) + 2 > size):
+            chunks.append(current)
+            current = ""
+        while length(paragraph) > size:
+            head = _head(paragraph, size, in_bytes)
+            chunks.append(head)
+            paragraph = paragraph[len(head):]
+        current = f"{current}\n\n{paragraph}" if current else paragraph
+    if current:
+        chunks.append(current)
+    return chunks or [text]
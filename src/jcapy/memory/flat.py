@@ -0,0 +1,368 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Flat (brute-force) vector store: a numpy backend for the memory bank.
+
+Embeddings live in a memory-mapped matrix on disk (float32, or int8 with
+a per-row scale) next to a mapped liveness mask, and documents/metadata in
+a SQLite sidecar keyed by row. Opening a store only maps files; the
+id -> row table is read from SQLite on the first write.
+Cosine top-k is one blocked matrix-vector product over the mapped rows
+(about 20ms per 100k 384-d rows, bound by memory bandwidth), with neither
+ChromaDB's import/startup cost nor an HNSW index held in memory.
+
+FlatVectorStore speaks the subset of the Chroma collection API that
+LocalMemoryBank uses (upsert/get/delete/query/count), so FlatMemoryBank
+reuses the bank's incremental ingest unchanged.
+
+The store assumes one writer process at a time.
+"""
+import json
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from jcapy.memory import LocalMemoryBank, IngestManifest, MANIFEST_FILE, DEFAULT_INGEST_BATCH
+
+DEFAULT_DTYPE = os.environ.get('JCAPY_VECTOR_DTYPE', 'float32')
+DEFAULT_DIM = 512
+QUERY_BLOCK_ROWS = 4096     # keeps each block (and int8's float32 copy) cache-sized
+_MIN_CAPACITY = 1024
+
+_TOKEN = re.compile(r'\w+')
+
+EmbeddingFunction = Callable[[List[str]], Any]
+
+
+class HashingEmbedder:
+    """
+    Dependency-free text embedder: words and character trigrams hashed
+    (signed, crc32) into `dim` buckets, then L2-normalised. Lexical rather
+    than semantic; pass a model-backed function to the store for that.
+    """
+
+    def __init__(self, dim: int = DEFAULT_DIM):
+        self.dim = dim
+
+    @property
+    def name(self) -> str:
+        return f"hashing-{self.dim}"
+
+    def _features(self, text: str) -> List[int]:
+        features = []
+        for word in _TOKEN.findall(text.lower()):
+            features.append(zlib.crc32(word.encode("utf-8")))
+            padded = f"#{word}#"
+            for i in range(len(padded) - 2):
+                features.append(zlib.crc32(padded[i:i + 3].encode("utf-8")) ^ 0x5bd1e995)
+        return features
+
+    def __call__(self, texts: List[str]) -> np.ndarray:
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            hashes = np.asarray(self._features(text), dtype=np.uint32)
+            if hashes.size:
+                signs = np.where(hashes & 0x80000000, -1.0, 1.0).astype(np.float32)
+                np.add.at(out[row], hashes % self.dim, signs)
+        return _normalize(out)
+
+
+def embedder_name(embedding_function: EmbeddingFunction) -> str:
+    """What a store records to notice that its vectors came from another model."""
+    name = getattr(embedding_function, "name", None)
+    if callable(name):
+        name = name()
+    return str(name or type(embedding_function).__name__)
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def quantize_int8(matrix: np.ndarray):
+    """Symmetric per-row int8 quantization: returns (codes, scales)."""
+    scales = np.abs(matrix).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    codes = np.clip(np.rint(matrix / scales[:, None]), -127, 127).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+class FlatVectorStore:
+    """Memory-mapped embedding matrix + SQLite sidecar, searched exhaustively."""
+
+    def __init__(self, path: str, embedding_function: Optional[EmbeddingFunction] = None,
+                 dtype: str = DEFAULT_DTYPE):
+        if dtype not in ("float32", "int8"):
+            raise ValueError(f"Unsupported vector dtype: {dtype}")
+        self.path = path
+        self.embedding_function = embedding_function or HashingEmbedder()
+        self._lock = threading.RLock()
+        os.makedirs(path, exist_ok=True)
+
+        self._db = sqlite3.connect(os.path.join(path, "store.db"), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS rows (
+                row INTEGER PRIMARY KEY,
+                id TEXT UNIQUE NOT NULL,
+                document TEXT,
+                metadata TEXT
+            );
+            CREATE TABLE IF NOT EXISTS store_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+        meta = dict(self._db.execute("SELECT key, value FROM store_meta"))
+        # An existing store keeps the layout it was built with
+        self.dtype = meta.get("dtype", dtype)
+        self.dim = int(meta["dim"]) if "dim" in meta else None
+        # Stores written before the name was recorded used the default embedder
+        self.embedder = meta.get("embedder", HashingEmbedder().name) if self.dim is not None else None
+
+        self._vectors = self._scales = self._alive = None
+        self._capacity = self._rows = 0
+        self._row_of: Optional[Dict[str, int]] = None  # loaded by _load_rows() on first write
+        self._free: List[int] = []
+        if self.dim is not None:
+            self._map(max(self._capacity_on_disk(), _MIN_CAPACITY))
+            live = np.flatnonzero(self._alive)
+            self._rows = int(live[-1]) + 1 if live.size else 0  # high-water mark
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _vector_file(self) -> str:
+        return os.path.join(self.path, "vectors.i8" if self.dtype == "int8" else "vectors.f32")
+
+    def _scale_file(self) -> str:
+        return os.path.join(self.path, "scales.f32")
+
+    def _alive_file(self) -> str:
+        return os.path.join(self.path, "alive.u8")
+
+    def _row_bytes(self) -> int:
+        return self.dim * (1 if self.dtype == "int8" else 4)
+
+    def _capacity_on_disk(self) -> int:
+        try:
+            return os.path.getsize(self._vector_file()) // self._row_bytes()
+        except OSError:
+            return 0
+
+    def _map(self, capacity: int) -> None:
+        """(Re)map the matrix files, growing them to `capacity` rows."""
+        self._vectors = self._scales = self._alive = None  # drop the old maps before resizing
+        files = [(self._vector_file(), self._row_bytes()), (self._alive_file(), 1)]
+        if self.dtype == "int8":
+            files.append((self._scale_file(), 4))
+        for file_path, row_bytes in files:
+            with open(file_path, "ab") as f:
+                if f.tell() < capacity * row_bytes:
+                    f.truncate(capacity * row_bytes)
+        np_dtype = np.int8 if self.dtype == "int8" else np.float32
+        self._vectors = np.memmap(self._vector_file(), dtype=np_dtype, mode="r+", shape=(capacity, self.dim))
+        if self.dtype == "int8":
+            self._scales = np.memmap(self._scale_file(), dtype=np.float32, mode="r+", shape=(capacity,))
+        self._alive = np.memmap(self._alive_file(), dtype=np.bool_, mode="r+", shape=(capacity,))
+        self._capacity = capacity
+
+    def _load_rows(self) -> None:
+        """
+        Read id -> row from SQLite, the source of truth, and rewrite the
+        mask from it (a crash between the two writes leaves them apart).
+        """
+        if self._row_of is not None:
+            return
+        self._row_of = dict(self._db.execute("SELECT id, row FROM rows"))
+        used = np.fromiter(self._row_of.values(), dtype=np.int64, count=len(self._row_of))
+        self._rows = int(used.max()) + 1 if used.size else 0
+        if self._alive is not None:
+            self._alive[:] = False
+            self._alive[used] = True
+            self._alive.flush()
+            self._free = np.flatnonzero(~self._alive[:self._rows])[::-1].tolist()
+
+    def _allocate(self) -> int:
+        if self._free:
+            return self._free.pop()
+        row = self._rows
+        self._rows += 1
+        if self._rows > self._capacity:
+            self._map(max(self._capacity * 2, _MIN_CAPACITY))
+        return row
+
+    def _embed(self, texts: Sequence[str]) -> np.ndarray:
+        matrix = np.asarray(self.embedding_function(list(texts)), dtype=np.float32)
+        if matrix.ndim != 2:
+            raise ValueError("Embedding function must return one vector per text")
+        return _normalize(matrix)
+
+    # ------------------------------------------------------------------
+    # Collection API
+    # ------------------------------------------------------------------
+
+    def count(self) -> int:
+        if self._row_of is not None:
+            return len(self._row_of)
+        return int(np.count_nonzero(self._alive[:self._rows])) if self._alive is not None else 0
+
+    def upsert(self, ids: List[str], documents: Optional[List[str]] = None,
+               metadatas: Optional[List[Dict[str, Any]]] = None, embeddings=None) -> None:
+        if not ids:
+            return
+        documents = documents if documents is not None else [None] * len(ids)
+        metadatas = metadatas if metadatas is not None else [None] * len(ids)
+        vectors = _normalize(np.asarray(embeddings, dtype=np.float32)) if embeddings is not None \
+            else self._embed(documents)
+        with self._lock:
+            if self.dim is None:
+                self.dim = vectors.shape[1]
+                self.embedder = embedder_name(self.embedding_function)
+                self._db.executemany("INSERT OR REPLACE INTO store_meta (key, value) VALUES (?, ?)",
+                                     [("dim", str(self.dim)), ("dtype", self.dtype), ("embedder", self.embedder)])
+                self._map(_MIN_CAPACITY)
+            if vectors.shape[1] != self.dim:
+                raise ValueError(f"Embedding dimension {vectors.shape[1]} does not match store ({self.dim})")
+            self._load_rows()
+
+            rows = []
+            for doc_id in ids:
+                row = self._row_of.get(doc_id)
+                rows.append(self._allocate() if row is None else row)
+            index = np.asarray(rows)
+            if self.dtype == "int8":
+                codes, scales = quantize_int8(vectors)
+                self._vectors[index] = codes
+                self._scales[index] = scales
+                self._scales.flush()
+            else:
+                self._vectors[index] = vectors
+            self._vectors.flush()  # vectors land before the rows that point at them
+
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO rows (row, id, document, metadata) VALUES (?, ?, ?, ?)",
+                    [(row, doc_id, doc, json.dumps(meta) if meta is not None else None)
+                     for row, doc_id, doc, meta in zip(rows, ids, documents, metadatas)])
+            for row, doc_id in zip(rows, ids):
+                self._row_of[doc_id] = row
+            self._alive[index] = True
+            self._alive.flush()
+
+    def get(self, ids: List[str]) -> Dict[str, List[Any]]:
+        """Stored documents and metadata for `ids` (missing ids are left out)."""
+        if not ids:
+            return {"ids": [], "documents": [], "metadatas": []}
+        with self._lock:
+            found = {doc_id: (doc, meta) for doc_id, doc, meta in self._db.execute(
+                f"SELECT id, document, metadata FROM rows WHERE id IN ({','.join('?' * len(ids))})", list(ids))}
+        present = [doc_id for doc_id in ids if doc_id in found]
+        return {"ids": present,
+                "documents": [found[doc_id][0] for doc_id in present],
+                "metadatas": [json.loads(found[doc_id][1]) if found[doc_id][1] else {} for doc_id in present]}
+
+    def delete(self, ids: List[str]) -> None:
+        with self._lock:
+            self._load_rows()
+            rows = [self._row_of.pop(doc_id) for doc_id in ids if doc_id in self._row_of]
+            if not rows:
+                return
+            with self._db:
+                self._db.executemany("DELETE FROM rows WHERE row = ?", [(row,) for row in rows])
+            self._alive[rows] = False
+            self._alive.flush()
+            self._free.extend(rows)
+            self._free.sort(reverse=True)
+
+    def _scores(self, queries: np.ndarray) -> np.ndarray:
+        """Cosine similarity of every row against each query: (queries, rows)."""
+        n = self._rows
+        out = np.empty((len(queries), n), dtype=np.float32)
+        for start in range(0, n, QUERY_BLOCK_ROWS):
+            stop = min(start + QUERY_BLOCK_ROWS, n)
+            block = self._vectors[start:stop]
+            if self.dtype == "int8":
+                out[:, start:stop] = (queries @ block.astype(np.float32).T) * self._scales[start:stop]
+            else:
+                out[:, start:stop] = queries @ block.T
+        out[:, ~self._alive[:n]] = -np.inf
+        return out
+
+    def query(self, query_texts: Optional[List[str]] = None, n_results: int = 10,
+              query_embeddings=None) -> Dict[str, List[List[Any]]]:
+        """Chroma-shaped results: ids/distances/metadatas/documents per query."""
+        queries = _normalize(np.asarray(query_embeddings, dtype=np.float32)) if query_embeddings is not None \
+            else self._embed(query_texts or [])
+        result = {"ids": [], "distances": [], "metadatas": [], "documents": []}
+        with self._lock:
+            k = min(n_results, self.count())
+            if k <= 0 or self.dim is None:
+                for key in result:
+                    result[key] = [[] for _ in queries]
+                return result
+            scores = self._scores(queries)
+            for row_scores in scores:
+                top = np.argpartition(-row_scores, k - 1)[:k]
+                top = top[np.argsort(-row_scores[top], kind="stable")]
+                found = {row: (doc_id, doc, meta) for row, doc_id, doc, meta in self._db.execute(
+                    f"SELECT row, id, document, metadata FROM rows WHERE row IN ({','.join('?' * k)})",
+                    [int(r) for r in top])}
+                hits = [(found[int(r)], float(row_scores[r])) for r in top if int(r) in found]
+                result["ids"].append([doc_id for (doc_id, _, _), _ in hits])
+                result["distances"].append([1.0 - score for _, score in hits])
+                result["metadatas"].append([json.loads(meta) if meta else {} for (_, _, meta), _ in hits])
+                result["documents"].append([doc for (_, doc, _), _ in hits])
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            with self._db:
+                self._db.execute("DELETE FROM rows")
+                self._db.execute("DELETE FROM store_meta")
+            self._vectors = self._scales = self._alive = None
+            for file_path in (self._vector_file(), self._scale_file(), self._alive_file()):
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+            self.dim = self.embedder = None
+            self._capacity = self._rows = 0
+            self._row_of, self._free = {}, []
+
+    def close(self) -> None:
+        with self._lock:
+            self._vectors = self._scales = self._alive = None
+            self._db.close()
+
+
+class FlatMemoryBank(LocalMemoryBank):
+    """
+    LocalMemoryBank on a FlatVectorStore instead of ChromaDB
+    (`memory_provider: flat`). Ingest, manifest and recall behave the same.
+    """
+
+    def __init__(self, persistence_path=None, batch_size: int = DEFAULT_INGEST_BATCH,
+                 embedding_function: Optional[EmbeddingFunction] = None, dtype: str = DEFAULT_DTYPE):
+        self.batch_size = max(1, batch_size)
+        if not persistence_path:
+            persistence_path = os.path.join(os.path.expanduser("~/.jcapy"), "flat_memory")
+        self.collection = FlatVectorStore(persistence_path, embedding_function=embedding_function, dtype=dtype)
+        self.client = self.collection
+        self.manifest = IngestManifest(os.path.join(persistence_path, MANIFEST_FILE))
+
+    def clear(self) -> bool:
+        """Wipes the entire memory bank."""
+        try:
+            self.collection.clear()
+            self.manifest.clear()
+            self.manifest.save()
+            return True
+        except Exception as e:
+            print(f"Error clearing memory: {e}")
+            return False
@@ -0,0 +1,214 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Hybrid keyword + vector retrieval for the memory bank.
+
+Files are split into chunks that are stored twice: in a vector store
+(FlatVectorStore by default) and in a SQLite FTS5 index ranked with BM25.
+A query runs against both and the two rankings are merged with reciprocal
+rank fusion, score(d) = sum(weight / (RRF_K + rank)), so a chunk that
+holds an exact identifier surfaces even when its embedding is not close.
+
+The vectors come from default_embedding_function(): chromadb's
+all-MiniLM-L6-v2 model when chromadb is installed and the model is in
+its local cache, which lets a paraphrase match without sharing a word.
+Otherwise it falls back to HashingEmbedder, and both halves of the fusion
+are lexical (words and character trigrams). JCAPY_EMBEDDER picks one
+explicitly: `minilm` (downloading the model if needed) or `hashing`. A
+store built with another embedder is rebuilt on open.
+
+HybridCollection exposes the same collection API as the vector store, so
+HybridMemoryBank is FlatMemoryBank with chunking and a different
+collection. `jcapy ask` always retrieves through it; `jcapy recall` does
+only with `memory_provider: hybrid`.
+"""
+import os
+import re
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from jcapy.memory import IngestManifest, MANIFEST_FILE, DEFAULT_INGEST_BATCH
+from jcapy.memory.chunking import CHUNK_CHARS, chunk_text
+from jcapy.memory.flat import (DEFAULT_DTYPE, EmbeddingFunction, FlatMemoryBank, FlatVectorStore,
+                               HashingEmbedder, embedder_name)
+
+RRF_K = 60
+CANDIDATES = 50             # per retriever, before fusion
+EMBEDDER = os.environ.get('JCAPY_EMBEDDER', 'auto')
+MINILM_MODEL = os.path.join(os.path.expanduser("~/.cache/chroma/onnx_models/all-MiniLM-L6-v2"), "onnx", "model.onnx")
+
+_WORD = re.compile(r'\w+')
+
+
+class MiniLMEmbedder:
+    """chromadb's default sentence embedder (all-MiniLM-L6-v2 on ONNX Runtime)."""
+
+    name = "all-MiniLM-L6-v2"
+
+    def __init__(self):
+        from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+        self._model = DefaultEmbeddingFunction()
+
+    def __call__(self, texts: List[str]):
+        return self._model(texts)
+
+
+def default_embedding_function(choice: str = EMBEDDER) -> EmbeddingFunction:
+    """A semantic embedder when one can run offline, else HashingEmbedder."""
+    if choice == "minilm" or (choice == "auto" and os.path.exists(MINILM_MODEL)):
+        try:
+            return MiniLMEmbedder()
+        except Exception:  # chromadb or onnxruntime missing
+            pass
+    return HashingEmbedder()
+
+
+def _match_expression(query: str) -> Optional[str]:
+    """Any query word, BM25 ranking rewarding chunks that hold more of them.
+    A word like get_memory_bank becomes the phrase "get memory bank"."""
+    words = _WORD.findall(query)
+    if not words:
+        return None
+    return " OR ".join('"' + w.replace('"', '""') + '"' for w in words)
+
+
+class KeywordIndex:
+    """BM25 full-text index over chunks (SQLite FTS5)."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS chunks (rowid INTEGER PRIMARY KEY, id TEXT UNIQUE NOT NULL)")
+        try:
+            self._db.execute("CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5("
+                             "body, tokenize = 'porter unicode61')")
+            self.has_fts = True
+        except sqlite3.OperationalError:  # SQLite built without FTS5: vector-only
+            self.has_fts = False
+
+    def upsert(self, ids: List[str], documents: List[str]) -> None:
+        if not self.has_fts:
+            return
+        with self._lock, self._db:
+            self._delete(ids)
+            for doc_id, doc in zip(ids, documents):
+                rowid = self._db.execute("INSERT INTO chunks (id) VALUES (?)", (doc_id,)).lastrowid
+                self._db.execute("INSERT INTO chunks_fts (rowid, body) VALUES (?, ?)", (rowid, doc or ""))
+
+    def _delete(self, ids: List[str]) -> None:
+        for doc_id in ids:
+            self._db.execute("DELETE FROM chunks_fts WHERE rowid = (SELECT rowid FROM chunks WHERE id = ?)", (doc_id,))
+            self._db.execute("DELETE FROM chunks WHERE id = ?", (doc_id,))
+
+    def delete(self, ids: List[str]) -> None:
+        if not self.has_fts:
+            return
+        with self._lock, self._db:
+            self._delete(ids)
+
+    def search(self, query: str, limit: int = CANDIDATES) -> List[Tuple[str, float]]:
+        """(id, bm25 score) pairs, best first."""
+        expression = _match_expression(query)
+        if not self.has_fts or expression is None:
+            return []
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT c.id, bm25(chunks_fts) AS score FROM chunks_fts "
+                "JOIN chunks c ON c.rowid = chunks_fts.rowid "
+                "WHERE chunks_fts MATCH ? ORDER BY score LIMIT ?", (expression, int(limit))).fetchall()
+        return [(doc_id, -score) for doc_id, score in rows]
+
+    def clear(self) -> None:
+        if not self.has_fts:
+            return
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM chunks")
+            self._db.execute("DELETE FROM chunks_fts")
+
+    def close(self) -> None:
+        self._db.close()
+
+
+class HybridCollection:
+    """A vector collection and a KeywordIndex kept in step, queried with RRF."""
+
+    def __init__(self, vectors, keywords: KeywordIndex,
+                 vector_weight: float = 1.0, keyword_weight: float = 1.0, rrf_k: int = RRF_K):
+        self.vectors = vectors
+        self.keywords = keywords
+        self.vector_weight = vector_weight
+        self.keyword_weight = keyword_weight
+        self.rrf_k = rrf_k
+
+    def count(self) -> int:
+        return self.vectors.count()
+
+    def upsert(self, ids: List[str], documents: List[str], metadatas: Optional[List[Dict[str, Any]]] = None) -> None:
+        self.vectors.upsert(ids=ids, documents=documents, metadatas=metadatas)
+        self.keywords.upsert(ids, documents)
+
+    def delete(self, ids: List[str]) -> None:
+        self.vectors.delete(ids)
+        self.keywords.delete(ids)
+
+    def fuse(self, query: str, n_results: int) -> List[Tuple[str, float]]:
+        """(id, fused score) pairs, best first."""
+        candidates = max(CANDIDATES, n_results)
+        by_vector = self.vectors.query(query_texts=[query], n_results=candidates)["ids"][0]
+        by_keyword = [doc_id for doc_id, _ in self.keywords.search(query, candidates)]
+        scores: Dict[str, float] = {}
+        for weight, ranking in ((self.vector_weight, by_vector), (self.keyword_weight, by_keyword)):
+            for rank, doc_id in enumerate(ranking, start=1):
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight / (self.rrf_k + rank)
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:n_results]
+
+    def query(self, query_texts: List[str], n_results: int = 10) -> Dict[str, List[List[Any]]]:
+        """Chroma-shaped results. Distance is 1 - fused score / the score of
+        a chunk ranked first by both retrievers, so 0 is a perfect hit."""
+        best = (self.vector_weight + self.keyword_weight) / (self.rrf_k + 1)
+        result = {"ids": [], "distances": [], "metadatas": [], "documents": []}
+        for query in query_texts:
+            fused = self.fuse(query, n_results)
+            stored = self.vectors.get(ids=[doc_id for doc_id, _ in fused])
+            found = dict(zip(stored["ids"], zip(stored["documents"], stored["metadatas"])))
+            hits = [(doc_id, score) for doc_id, score in fused if doc_id in found]
+            result["ids"].append([doc_id for doc_id, _ in hits])
+            result["distances"].append([1.0 - score / best for _, score in hits])
+            result["documents"].append([found[doc_id][0] for doc_id, _ in hits])
+            result["metadatas"].append([found[doc_id][1] for doc_id, _ in hits])
+        return result
+
+    def clear(self) -> None:
+        self.vectors.clear()
+        self.keywords.clear()
+
+
+class HybridMemoryBank(FlatMemoryBank):
+    """
+    Chunked memory bank answering recall() from both BM25 and vector
+    rankings (`memory_provider: hybrid`).
+    """
+
+    def __init__(self, persistence_path=None, batch_size: int = DEFAULT_INGEST_BATCH,
+                 embedding_function: Optional[EmbeddingFunction] = None, dtype: str = DEFAULT_DTYPE,
+                 chunk_chars: int = CHUNK_CHARS):
+        self.batch_size = max(1, batch_size)
+        self.chunk_chars = chunk_chars
+        if not persistence_path:
+            persistence_path = os.path.join(os.path.expanduser("~/.jcapy"), "hybrid_memory")
+        embedding_function = embedding_function or default_embedding_function()
+        vectors = FlatVectorStore(os.path.join(persistence_path, "vectors"),
+                                  embedding_function=embedding_function, dtype=dtype)
+        keywords = KeywordIndex(os.path.join(persistence_path, "keywords.db"))
+        self.collection = HybridCollection(vectors, keywords)
+        self.client = self.collection
+        self.manifest = IngestManifest(os.path.join(persistence_path, MANIFEST_FILE))
+        if vectors.embedder not in (None, embedder_name(embedding_function)):
+            # Vectors from another model can't be compared; the next memorize() re-embeds
+            self.clear()
+
+    def _chunk(self, content: str) -> List[str]:
+        return chunk_text(content, self.chunk_chars)
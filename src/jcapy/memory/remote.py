@@ -2,10 +2,11 @@
 import os
 import time
 import hashlib
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from rich.console import Console
 from jcapy.memory_interfaces import MemoryInterface
 from jcapy.core.vault import resolve_secret
+from jcapy.memory.batching import BatchedUpsert
 
 try:
     from pinecone import Pinecone
@@ -14,19 +15,32 @@ except ImportError:
 
 console = Console()
 
+# Pinecone Inference accepts up to 96 inputs per embed request
+EMBED_BATCH = int(os.environ.get('JCAPY_PINECONE_EMBED_BATCH', 96))
+# 50 vectors per upsert stays well inside free-tier write limits
+UPSERT_BATCH = int(os.environ.get('JCAPY_PINECONE_UPSERT_BATCH', 50))
+UPSERT_CONCURRENCY = int(os.environ.get('JCAPY_PINECONE_CONCURRENCY', 4))
+
 class RemoteMemoryBank(MemoryInterface):
     """
     Pro Tier: Remote memory implementation using Pinecone with built-in Inference.
     """
-    def __init__(self):
+    def __init__(self, embed_batch: int = EMBED_BATCH, upsert_batch: int = UPSERT_BATCH,
+                 concurrency: int = UPSERT_CONCURRENCY):
+        self.embed_batch = max(1, embed_batch)
+        self.upsert_batch = max(1, upsert_batch)
+        self.concurrency = max(1, concurrency)
         if not Pinecone:
             console.print("[red]Error: 'pinecone' package not installed.[/red]")
             self.active = False
             return
 
         self.api_key = resolve_secret("PINECONE_API_KEY")
-        self.index_name = resolve_secret("PINECONE_INDEX", "jcapy")
-        self.model_name = resolve_secret("PINECONE_MODEL", "llama-text-embed-v2")
+        self.index_name = resolve_secret("PINECONE_INDEX") or "jcapy"
+        self.model_name = resolve_secret("PINECONE_MODEL") or "llama-text-embed-v2"
+        # Optional overrides, e.g. a local Pinecone-compatible server
+        self.host = resolve_secret("PINECONE_HOST")
+        self.index_host = resolve_secret("PINECONE_INDEX_HOST")
 
         if not self.api_key:
              console.print("[yellow]Warning: PINECONE_API_KEY not set. Remote memory disabled.[/yellow]")
@@ -34,8 +48,9 @@ class RemoteMemoryBank(MemoryInterface):
              return
 
         try:
-            self.pc = Pinecone(api_key=self.api_key)
-            self.index = self.pc.Index(self.index_name)
+            self.pc = Pinecone(api_key=self.api_key, host=self.host) if self.host else Pinecone(api_key=self.api_key)
+            self.index = self.pc.Index(self.index_name, host=self.index_host) if self.index_host \
+                else self.pc.Index(self.index_name)
             self.active = True
             console.print(f"[dim]☁️  Remote Memory Active: [bold]{self.index_name}[/bold] using {self.model_name}[/dim]")
         except Exception as e:
@@ -45,6 +60,10 @@ class RemoteMemoryBank(MemoryInterface):
     def memorize(self, paths: List[str], clear_first: bool = False) -> Dict[str, int]:
         """
         Upserts content from files to Pinecone after chunking and embedding.
+
+        Chunks from consecutive files are packed into full embedding
+        requests, and the resulting vectors are upserted by a bounded pool
+        of concurrent requests while the next batch is embedded.
         """
         if not self.active:
             console.print("[red]Remote memory not active. Check API Key and dependencies.[/red]")
@@ -53,78 +72,71 @@ class RemoteMemoryBank(MemoryInterface):
         if clear_first:
             console.print("[yellow]Warning: Remote 'clear_first' not supported via CLI for safety.[/yellow]")
 
-        stats = {"added": 0, "errors": 0, "skipped": 0}
-
-        for path in paths:
-             if os.path.isfile(path):
-                 self._ingest_file(path, stats)
-             elif os.path.isdir(path):
-                 console.print(f"[dim]Scanning directory: {path}[/dim]")
-                 for root, _, files in os.walk(path):
-                     for file in files:
-                         if file.lower().endswith(('.md', '.txt', '.py', '.json', '.yaml', '.yml')):
-                             self._ingest_file(os.path.join(root, file), stats)
-
+        run = BatchedUpsert(self._upsert_with_retry, "Remote", self.embed_batch, self.concurrency,
+                            write_size=self.upsert_batch, prepare=self._vectors)
+        try:
+            for path in paths:
+                 if os.path.isfile(path):
+                     self._ingest_file(path, run)
+                 elif os.path.isdir(path):
+                     console.print(f"[dim]Scanning directory: {path}[/dim]")
+                     for root, _, files in os.walk(path):
+                         for file in files:
+                             if file.lower().endswith(('.md', '.txt', '.py', '.json', '.yaml', '.yml')):
+                                 self._ingest_file(os.path.join(root, file), run)
+            run.flush()
+        finally:
+            run.close()
+
+        stats = run.stats
+        if stats["chunks"]:
+            console.print(f"[dim]☁️  [Remote] {stats['chunks']} chunks in {run.elapsed:.1f}s "
+                          f"({stats['chunks_per_sec']} chunks/s)[/dim]")
         return stats
 
-    def _ingest_file(self, file_path: str, stats: Dict[str, int]):
+    def _ingest_file(self, file_path: str, run: BatchedUpsert):
         try:
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                 content = f.read()
 
             if not content.strip():
-                stats["skipped"] += 1
+                run.tally("skipped")
                 return
 
             # Simple Chunking (2000 chars)
-            chunks = self._chunk_text(content)
-
-            # Generate Embeddings in batch
-            try:
-                # Pinecone Inference handles batching well, but we'll still rescue it
-                embeddings_response = self.pc.inference.embed(
-                    model=self.model_name,
-                    inputs=chunks,
-                    parameters={"input_type": "passage"}
-                )
-            except Exception as e:
-                console.print(f"[red]Inference error for {file_path}: {e}[/red]")
-                stats["errors"] += 1
-                return
-
-            vectors = []
-            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings_response)):
-                chunk_id = hashlib.md5(f"{file_path}_{i}".encode()).hexdigest()
-
-                vectors.append({
-                    "id": chunk_id,
-                    "values": embedding.values,
-                    "metadata": {
-                        "path": file_path,
-                        "filename": os.path.basename(file_path),
-                        "chunk_index": i,
-                        "content": chunk[:2000] # Pinecone metadata limit check
-                    }
-                })
-
-            # Upsert in batches of 50 (Safer for Free Tier write units)
-            for i in range(0, len(vectors), 50):
-                batch = vectors[i:i + 50]
-                self._upsert_with_retry(batch)
-
-            console.print(f"[green]☁️  [Remote] Indexed:[/green] {os.path.basename(file_path)} ({len(chunks)} chunks)")
-            stats["added"] += 1
+            run.add(file_path, [(file_path, i, chunk) for i, chunk in enumerate(self._chunk_text(content))])
 
         except Exception as e:
              console.print(f"[red]Error indexing {file_path}: {e}[/red]")
-             stats["errors"] += 1
-
-    def _upsert_with_retry(self, vectors, max_retries=3):
+             run.tally("errors")
+
+    def _embed(self, chunks: List[str]):
+        return self.pc.inference.embed(
+            model=self.model_name,
+            inputs=chunks,
+            parameters={"input_type": "passage"}
+        )
+
+    def _vectors(self, chunks: List[Tuple[str, int, str]]) -> List[Dict[str, Any]]:
+        """Embeds (file_path, chunk_index, chunk) triples in one request."""
+        embeddings = self._embed([chunk for _, _, chunk in chunks])
+        return [{
+            "id": hashlib.md5(f"{file_path}_{i}".encode()).hexdigest(),
+            "values": embedding.values,
+            "metadata": {
+                "path": file_path,
+                "filename": os.path.basename(file_path),
+                "chunk_index": i,
+                "content": chunk[:2000] # Pinecone metadata limit check
+            }
+        } for (file_path, i, chunk), embedding in zip(chunks, embeddings)]
+
+    def _upsert_with_retry(self, vectors, max_retries=3) -> bool:
         """Helper to handle rate limits with exponential backoff."""
         for attempt in range(max_retries):
             try:
                 self.index.upsert(vectors=vectors)
-                return
+                return True
             except Exception as e:
                 if "429" in str(e) or "limit" in str(e).lower():
                     wait = (2 ** attempt) + 1
@@ -133,6 +145,7 @@ class RemoteMemoryBank(MemoryInterface):
                 else:
                     raise e
         console.print("[red]❌ Failed to upsert after multiple retries.[/red]")
+        return False
 
     def _chunk_text(self, text: str, chunk_size: int = 2000, overlap: int = 200) -> List[str]:
         """Simple sliding window chunking."""
@@ -110,6 +110,10 @@ class FrameworkEngine:
             with open(target_path, 'w') as f:
                 f.write(content)
 
+            # An overwrite doesn't change the directory's mtime; tell the catalog
+            from jcapy.core.skill_catalog import get_catalog
+            get_catalog(lib_path).touch(target_path)
+
             return FrameworkResult(
                 status=ResultStatus.SUCCESS,
                 message=f"Skill '{name}' saved to {domain}",
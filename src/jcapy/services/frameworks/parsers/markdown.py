@@ -68,35 +68,40 @@ class MarkdownParser(BaseParser):
 
     def _parse_frontmatter(self, content: str) -> Optional[Dict[str, Any]]:
         """Internal YAML frontmatter parser (subset of YAML)."""
-        content = content.strip()
-        if not content.startswith("---"):
-            return None
+        return parse_frontmatter(content)
 
-        try:
-            parts = content.split("---", 2)
-            if len(parts) < 3:
-                return None
 
-            yaml_content = parts[1].strip()
+def parse_frontmatter(content: str) -> Optional[Dict[str, Any]]:
+    """YAML frontmatter of a markdown document (subset of YAML without PyYAML)."""
+    content = content.strip()
+    if not content.startswith("---"):
+        return None
 
-            # Try PyYAML if available
-            try:
-                import yaml
-                return yaml.safe_load(yaml_content)
-            except ImportError:
-                # Native Fallback (Simple subset)
-                meta = {}
-                for line in yaml_content.split("\n"):
-                    if ":" in line:
-                        key, val = line.split(":", 1)
-                        key = key.strip()
-                        val = val.strip()
-                        if val.startswith("[") and val.endswith("]"):
-                            val = [i.strip().strip("'").strip('"') for i in val[1:-1].split(",")]
-                        else:
-                            val = val.strip("'").strip('"')
-                        meta[key] = val
-                return meta
-        except:
+    try:
+        parts = content.split("---", 2)
+        if len(parts) < 3:
             return None
+
+        yaml_content = parts[1].strip()
+
+        # Try PyYAML if available
+        try:
+            import yaml
+            return yaml.safe_load(yaml_content)
+        except ImportError:
+            # Native Fallback (Simple subset)
+            meta = {}
+            for line in yaml_content.split("\n"):
+                if ":" in line:
+                    key, val = line.split(":", 1)
+                    key = key.strip()
+                    val = val.strip()
+                    if val.startswith("[") and val.endswith("]"):
+                        val = [i.strip().strip("'").strip('"') for i in val[1:-1].split(",")]
+                    else:
+                        val = val.strip("'").strip('"')
+                    meta[key] = val
+            return meta
+    except:
         return None
+    return None
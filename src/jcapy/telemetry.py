@@ -1,27 +1,18 @@
 # SPDX-License-Identifier: Apache-2.0
+import importlib.util
 import os
 import json
 import uuid
+import threading
 import time
 from typing import Dict, Any, Optional
 from jcapy.config import load_config, get_all_ux_preferences
-import dotenv
-try:
-    dotenv.load_dotenv()
-except (ImportError, OSError):
-    pass
-from posthog import Posthog
+from jcapy.utils.startup_profile import timed
 
-# Ideally use posthog-python, but we might not want to force dependency immediately
-# We can use a simple HTTP request or check if installed
-try:
-    import posthog
-    HAS_POSTHOG = True
-except ImportError:
-    HAS_POSTHOG = False
+# Ideally use posthog-python, but we might not want to force dependency immediately.
+# It (and dotenv) is imported by TelemetryClient, which get_telemetry() creates on first use.
+HAS_POSTHOG = importlib.util.find_spec("posthog") is not None
 
-POSTHOG_API_KEY = os.getenv("POSTHOG_API_KEY") # Public key or read from env. DONT COMMIT REAL KEY.
-POSTHOG_HOST = os.getenv("POSTHOG_HOST") # Public key or read from env. DONT COMMIT REAL KEY.
 # For Open Source, usually we use a proxy or just don't track by default unless opt-in
 # OR we use a public project key that only accepts ingestion.
 # Since user said "Privacy First: Add a flag in jcapy config to let users opt-out."
@@ -36,8 +27,14 @@ class TelemetryClient:
         self.shadow_log_path = os.path.expanduser("~/.jcapy/shadow_log.jsonl")
 
         if self.enabled and HAS_POSTHOG:
-            posthog = Posthog(api_key=POSTHOG_API_KEY, host=POSTHOG_HOST)
-            pass
+            try:
+                import dotenv
+                dotenv.load_dotenv()
+            except (ImportError, OSError):
+                pass
+            from posthog import Posthog
+            # Public key or read from env. DONT COMMIT REAL KEY.
+            posthog = Posthog(api_key=os.getenv("POSTHOG_API_KEY"), host=os.getenv("POSTHOG_HOST"))
 
     def _get_or_create_user_id(self) -> str:
         # Check config for UUID, else generate and save
@@ -95,7 +92,15 @@ class TelemetryClient:
             "match": suggestion == user_action
         })
 
-_client = TelemetryClient()
+_client: Optional[TelemetryClient] = None
+_client_lock = threading.Lock()
 
 def get_telemetry() -> TelemetryClient:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                with timed("telemetry"):
+                    _client = TelemetryClient()
     return _client
+
@@ -29,6 +29,9 @@ from typing import Optional, Callable, Dict
 import logging
 import json
 
+# Seconds of quiet before the TUI persists config changes
+TUI_CONFIG_SAVE_DELAY = 0.5
+
 logger = logging.getLogger('jcapy.tui')
 
 # ZMQ Bridge integration for Web Control Plane
@@ -140,6 +143,10 @@ class JCapyApp(App):
         # Bind config manager for reactive updates
         from jcapy.config import CONFIG_MANAGER, get_ux_preference
         CONFIG_MANAGER.bind_app(self)
+        # Coalesce bursts (splitter drags, widget toggles) into one write
+        CONFIG_MANAGER.save_delay = max(CONFIG_MANAGER.save_delay, TUI_CONFIG_SAVE_DELAY)
+        # Edits from the CLI or daemon arrive as ConfigUpdated messages
+        CONFIG_MANAGER.watch()
 
         # Apply persistent theme
         theme = get_ux_preference("theme")
@@ -238,6 +245,8 @@ class JCapyApp(App):
 
     def on_unmount(self) -> None:
         """Called when app shuts down."""
+        CONFIG_MANAGER.stop_watching()
+        CONFIG_MANAGER.flush()
         global _zmq_bridge
         if _zmq_bridge:
             try:
@@ -248,19 +257,21 @@ class JCapyApp(App):
 
     def on_config_updated(self, message: ConfigUpdated) -> None:
         """Handle configuration updates."""
-        if message.key == "ux.theme" or message.key == "*":
-            self.apply_theme(message.value)
-            self.notify(f"Theme changed to: {message.value}")
-
-        if message.key == "core.persona":
-            self.notify(f"Switching persona to: {message.value}")
+        if message.touches("ux.theme"):
+            from jcapy.config import get_ux_preference
+            theme = get_ux_preference("theme")
+            self.apply_theme(theme)
+            self.notify(f"Theme changed to: {theme}")
+
+        if message.touches("core.persona"):
+            self.notify(f"Switching persona to: {CONFIG_MANAGER.get('core.persona')}")
             # Persona application logic is handled by the command/config logic mostly,
             # but we might need to trigger visual refreshes if persona implies theme/layout changes.
             # The apply_persona function ALREADY updates config keys for dashboard_layout and theme.
             # So those specific ConfigUpdated events will fire separately and be handled.
             pass
 
-        if message.key == "commands.disabled":
+        if message.touches("commands.disabled"):
             get_registry().apply_disabled_from_config()
             self.notify("Enabled/Disabled commands updated.")
             # Refresh command palette if open?
@@ -1,9 +1,21 @@
 from textual.message import Message
-from typing import Any
+from typing import Any, Iterable, Optional
 
 class ConfigUpdated(Message):
-    """Message sent when configuration changes."""
-    def __init__(self, key: str, value: Any):
+    """
+    Message sent when configuration changes.
+    A batched update carries every changed key in `keys`; `key`/`value`
+    describe the change when there was exactly one, else key is "*".
+    """
+    def __init__(self, key: str, value: Any, keys: Optional[Iterable[str]] = None):
         self.key = key
         self.value = value
+        self.keys = tuple(keys) if keys is not None else (key,)
         super().__init__()
+
+    def touches(self, key: str) -> bool:
+        """True if `key`, one of its parents or one of its children changed."""
+        return any(
+            k == "*" or k == key or key.startswith(k + ".") or k.startswith(key + ".")
+            for k in self.keys
+        )
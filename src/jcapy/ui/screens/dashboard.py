@@ -596,7 +596,7 @@ class DashboardScreen(Screen):
         # Add other handlers as needed
     def on_config_updated(self, message: ConfigUpdated) -> None:
         """Handle configuration updates."""
-        if message.key.startswith("dashboard_layout") or message.key == "*":
+        if message.touches("dashboard_layout"):
             # Refresh layout if layout config changed
             self.notify("Dashboard layout updated!")
             # Rebuild all columns to be safe
@@ -1,16 +1,25 @@
 # UX Module - Centralized UI/UX helpers for jcapy
-from jcapy.ui.ux.feedback import with_spinner, progress_bar, show_success, show_error, show_warning
-from jcapy.ui.ux.safety import confirm, UndoStack, require_dependency
-from jcapy.ui.ux.hints import suggest_command, show_hint, Tutorial
-from jcapy.ui.ux.a11y import get_color, announce, is_reduced_motion, THEMES
+# Names are resolved from their submodule on first access, so importing one
+# helper (e.g. hints) doesn't pull in rich via feedback.
+import importlib
 
-__all__ = [
+_EXPORTS = {
     # Feedback
-    'with_spinner', 'progress_bar', 'show_success', 'show_error', 'show_warning',
+    'with_spinner': 'feedback', 'progress_bar': 'feedback', 'show_success': 'feedback',
+    'show_error': 'feedback', 'show_warning': 'feedback',
     # Safety
-    'confirm', 'UndoStack', 'require_dependency',
+    'confirm': 'safety', 'UndoStack': 'safety', 'require_dependency': 'safety',
     # Hints
-    'suggest_command', 'show_hint', 'Tutorial',
+    'suggest_command': 'hints', 'show_hint': 'hints', 'Tutorial': 'hints',
     # Accessibility
-    'get_color', 'announce', 'is_reduced_motion', 'THEMES',
-]
+    'get_color': 'a11y', 'announce': 'a11y', 'is_reduced_motion': 'a11y', 'THEMES': 'a11y',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{__name__}.{module}"), name)
@@ -65,8 +65,8 @@ def load_theme_from_config():
     """Load theme preference from config file."""
     global _current_theme
     try:
-        from jcapy.config import load_config
-        config = load_config()
+        from jcapy.config import CONFIG_MANAGER
+        config = CONFIG_MANAGER.snapshot().data
         theme = config.get("theme", "default")
         if theme in THEMES:
             _current_theme = theme
@@ -81,8 +81,8 @@ def is_reduced_motion() -> bool:
     """
     # Check config
     try:
-        from jcapy.config import load_config
-        config = load_config()
+        from jcapy.config import CONFIG_MANAGER
+        config = CONFIG_MANAGER.snapshot().data
         if config.get("reduced_motion", False):
             return True
     except ImportError:
@@ -139,8 +139,8 @@ def _is_accessible_mode() -> bool:
 
     # Check config
     try:
-        from jcapy.config import load_config
-        config = load_config()
+        from jcapy.config import CONFIG_MANAGER
+        config = CONFIG_MANAGER.snapshot().data
         return config.get("accessible", False)
     except ImportError:
         return False
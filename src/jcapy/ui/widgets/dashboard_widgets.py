@@ -755,6 +755,10 @@ class UsageTrackerWidget(Static):
         content.append(f"${cost:>8.4f}", style="bold yellow")
         content.append("\n  LIMIT:    ", style="dim white")
         content.append(f"${session_limit:>8.2f}", style="dim")
+        if summary.get("cache_hits"):
+            content.append("\n  SAVED:    ", style="dim white")
+            content.append(f"${summary.get('saved', 0.0):>8.4f}", style="bold green")
+            content.append(f" ({summary['cache_hits']} cached)", style="dim")
 
         content.append("\n\n  [LIFETIME]\n", style="dim italic")
         content.append("  TOTAL:    ", style="dim white")
@@ -778,7 +782,7 @@ class UsageTrackerWidget(Static):
 
     def on_config_updated(self, message: ConfigUpdated) -> None:
         """Refresh if usage keys change."""
-        if message.key.startswith("usage."):
+        if message.touches("usage"):
             self.refresh_content()
 
 class ScratchpadWidget(Static, can_focus=True):
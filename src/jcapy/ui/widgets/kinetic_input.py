@@ -1,7 +1,7 @@
 # SPDX-License-Identifier: Apache-2.0
 from textual.widgets import Input
 from textual.binding import Binding
-from jcapy.core.history import HISTORY_MANAGER
+from jcapy.core.history import get_history_manager
 from jcapy.core.plugins import get_registry
 
 class KineticInput(Input):
@@ -24,7 +24,7 @@ class KineticInput(Input):
 
     def refresh_history(self) -> None:
         """Load latest history from manager."""
-        self._history = HISTORY_MANAGER.get_history()
+        self._history = get_history_manager().get_history()
         self._history_index = len(self._history)
 
     def action_history_up(self) -> None:
@@ -52,7 +52,7 @@ class KineticInput(Input):
             self.value = self._current_input
             self.cursor_position = len(self.value)
     def action_autocomplete(self) -> None:
-        """Simple command autocomplete from registry."""
+        """Command autocomplete from registry, then from the most recent matching history entry."""
         val = self.value.strip()
         if not val:
             return
@@ -65,3 +65,9 @@ class KineticInput(Input):
             # Pick first match for simplicity
             self.value = matches[0] + " "
             self.cursor_position = len(self.value)
+            return
+
+        recent = [c for c in get_history_manager().search_prefix(val, limit=2) if c != val]
+        if recent:
+            self.value = recent[0]
+            self.cursor_position = len(self.value)
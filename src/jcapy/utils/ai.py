@@ -3,9 +3,16 @@ import json
 import urllib.request
 import urllib.error
 from jcapy.config import get_api_key
-from typing import Optional
+from jcapy.utils.ai_cache import cache_enabled, cache_key, get_response_cache
+from typing import Any, Dict, Optional, Tuple
 
-def _track_usage(provider: str, prompt: str, response: str, model: Optional[str] = None):
+DEFAULT_MODELS = {
+    "gemini": "gemini-1.5-flash",
+    "openai": "gpt-4o",
+    "deepseek": "deepseek-chat",
+}
+
+def _track_usage(provider: str, prompt: str, response: str, model: Optional[str] = None, cached: bool = False):
     """Helper to track token usage and cost via UsageLogManager."""
     try:
         from jcapy.utils.usage import USAGE_LOG_MANAGER
@@ -16,79 +23,108 @@ def _track_usage(provider: str, prompt: str, response: str, model: Optional[str]
 
         # Use provided model or fall back to defaults
         if not model:
-            if provider == "gemini": model = "gemini-1.5-flash"
-            elif provider == "openai": model = "gpt-4o"
-            elif provider == "deepseek": model = "deepseek-chat"
-            else: model = "local"
+            model = DEFAULT_MODELS.get(provider, "local")
 
-        USAGE_LOG_MANAGER.record_hit(provider, model, in_tokens, out_tokens)
+        USAGE_LOG_MANAGER.record_hit(provider, model, in_tokens, out_tokens, cached=cached)
     except Exception:
         # Don't let usage tracking break the AI call
         pass
 
-def call_ai_agent(prompt, provider='gemini'):
-    """Generic helper to call LLM providers directly via urllib."""
+def _call_gemini(api_key: str, model: str, prompt: str) -> Tuple[Optional[str], Optional[str]]:
+    url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}"
+    data = json.dumps({
+        "contents": [{
+            "parts": [{"text": prompt}]
+        }]
+    }).encode('utf-8')
+
+    req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
+
+    try:
+        with urllib.request.urlopen(req, timeout=30) as response_obj:
+            result = json.loads(response_obj.read().decode('utf-8'))
+            if 'candidates' in result:
+                return result['candidates'][0]['content']['parts'][0]['text'], None
+            return None, "Gemini Error: Unexpected response format"
+    except urllib.error.HTTPError as e:
+        err_msg = e.read().decode('utf-8')
+        return None, f"Gemini HTTP Error: {err_msg}"
+    except Exception as e:
+        return None, str(e)
+
+def _call_openai_compatible(provider: str, api_key: str, model: str, prompt: str, params: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    url = "https://api.openai.com/v1/chat/completions"
+    if provider == 'deepseek':
+        url = "https://api.deepseek.com/chat/completions"
+
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {api_key}"
+    }
+    data = json.dumps({
+        "model": model,
+        "messages": [{"role": "user", "content": prompt}],
+        **params
+    }).encode('utf-8')
+
+    req = urllib.request.Request(url, data=data, headers=headers)
+
+    try:
+        with urllib.request.urlopen(req, timeout=30) as response_obj:
+            result = json.loads(response_obj.read().decode('utf-8'))
+            if 'choices' in result:
+                return result['choices'][0]['message']['content'], None
+            return None, f"{provider.capitalize()} Error: Unexpected response format"
+    except urllib.error.HTTPError as e:
+        err_msg = e.read().decode('utf-8')
+        return None, f"{provider.capitalize()} HTTP Error: {err_msg}"
+    except Exception as e:
+        return None, str(e)
+
+def call_ai_agent(prompt, provider='gemini', use_cache: Optional[bool] = None):
+    """
+    Generic helper to call LLM providers directly via urllib.
+
+    With the response cache enabled (`ai.cache.enabled`, or `use_cache=True`)
+    an identical provider/model/prompt/params request is answered from disk
+    without touching the network; the avoided cost is logged as saved.
+    """
     provider = provider.lower()
     api_key = get_api_key(provider)
 
     if not api_key:
         return None, f"No API key found for {provider}"
 
-    if provider == 'gemini':
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent?key={api_key}"
-        data = json.dumps({
-            "contents": [{
-                "parts": [{"text": prompt}]
-            }]
-        }).encode('utf-8')
+    model = DEFAULT_MODELS.get(provider)
+    if model is None:
+        return None, f"Unsupported provider: {provider}"
+    params: Dict[str, Any] = {"temperature": 0.2} if provider in ('openai', 'deepseek') else {}
 
-        req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
+    if use_cache is None:
+        use_cache = cache_enabled()
 
+    cache = key = None
+    if use_cache:
         try:
-            with urllib.request.urlopen(req, timeout=30) as response_obj:
-                result = json.loads(response_obj.read().decode('utf-8'))
-                if 'candidates' in result:
-                    text = result['candidates'][0]['content']['parts'][0]['text']
-                    _track_usage('gemini', prompt, text)
-                    return text, None
-                return None, "Gemini Error: Unexpected response format"
-        except urllib.error.HTTPError as e:
-            err_msg = e.read().decode('utf-8')
-            return None, f"Gemini HTTP Error: {err_msg}"
-        except Exception as e:
-            return None, str(e)
-
-    elif provider == 'openai' or provider == 'deepseek':
-        url = "https://api.openai.com/v1/chat/completions"
-        model = "gpt-4o"
-        if provider == 'deepseek':
-            url = "https://api.deepseek.com/chat/completions"
-            model = "deepseek-chat"
-
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}"
-        }
-        data = json.dumps({
-            "model": model,
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": 0.2
-        }).encode('utf-8')
-
-        req = urllib.request.Request(url, data=data, headers=headers)
+            cache = get_response_cache()
+            key = cache_key(provider, model, prompt, params)
+            cached = cache.get(key)
+            if cached is not None:
+                _track_usage(provider, prompt, cached, model, cached=True)
+                return cached, None
+        except Exception:
+            cache = None  # A broken cache must never block the real call
 
-        try:
-            with urllib.request.urlopen(req, timeout=30) as response_obj:
-                result = json.loads(response_obj.read().decode('utf-8'))
-                if 'choices' in result:
-                    text = result['choices'][0]['message']['content']
-                    _track_usage(provider, prompt, text)
-                    return text, None
-                return None, f"{provider.capitalize()} Error: Unexpected response format"
-        except urllib.error.HTTPError as e:
-            err_msg = e.read().decode('utf-8')
-            return None, f"{provider.capitalize()} HTTP Error: {err_msg}"
-        except Exception as e:
-            return None, str(e)
-
-    return None, f"Unsupported provider: {provider}"
+    if provider == 'gemini':
+        text, err = _call_gemini(api_key, model, prompt)
+    else:
+        text, err = _call_openai_compatible(provider, api_key, model, prompt, params)
+
+    if text is not None:
+        _track_usage(provider, prompt, text, model)
+        if cache is not None:
+            try:
+                cache.put(key, provider, model, text)
+            except Exception:
+                pass
+    return text, err
@@ -0,0 +1,182 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Disk-backed LLM response cache for call_ai_agent.
+
+Opt-in via `ai.cache.enabled` in config (or JCAPY_AI_CACHE=1). Entries are
+keyed on provider, model, prompt and request parameters, expire after
+`ai.cache.ttl` seconds and are evicted least-recently-used once the stored
+responses exceed `ai.cache.max_mb`. Hit, miss and eviction counts are kept
+in the database too, so `jcapy doctor` can report them from another process.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_MB = 50
+
+
+def cache_key(provider: str, model: str, prompt: str, params: Optional[Dict[str, Any]] = None) -> str:
+    payload = json.dumps(
+        {"provider": provider, "model": model, "prompt": prompt, "params": params or {}},
+        sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed response store with TTL expiry and LRU size cap."""
+
+    def __init__(self, db_path: str, ttl: float = DEFAULT_TTL_SECONDS, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=5.0)
+
+    def _init_db(self):
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    provider TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_lru ON responses(last_access)")
+            conn.execute("CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response, or None on miss/expiry."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            try:
+                row = conn.execute("SELECT response, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is None or now - row[1] > self.ttl:
+                    if row is not None:
+                        conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._count(conn, misses=1)
+                    conn.commit()
+                    return None
+                conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+                self._count(conn, hits=1)
+                conn.commit()
+                return row[0]
+            finally:
+                conn.close()
+
+    def put(self, key: str, provider: str, model: str, response: str):
+        now = time.time()
+        size = len(response.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, provider, model, response, size, created_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, provider, model, response, size, now, now)
+                )
+                conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl,))
+                self._evict(conn)
+                conn.commit()
+            finally:
+                conn.close()
+
+    def _evict(self, conn: sqlite3.Connection):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY last_access"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self._count(conn, evictions=len(victims))
+
+    @staticmethod
+    def _count(conn: sqlite3.Connection, **deltas: int):
+        conn.executemany(
+            "INSERT INTO stats (name, value) VALUES (?, ?) "
+            "ON CONFLICT (name) DO UPDATE SET value = value + excluded.value",
+            deltas.items()
+        )
+
+    def clear(self):
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM responses")
+                conn.commit()
+            finally:
+                conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            conn = self._connect()
+            try:
+                entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+                counts = dict(conn.execute("SELECT name, value FROM stats"))
+            finally:
+                conn.close()
+        hits, misses = counts.get("hits", 0), counts.get("misses", 0)
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "evictions": counts.get("evictions", 0),
+            "entries": entries,
+            "size_bytes": size,
+        }
+
+
+_response_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def cache_enabled() -> bool:
+    env = os.getenv("JCAPY_AI_CACHE")
+    if env is not None:
+        return env.strip().lower() in ("1", "true", "yes", "on")
+    try:
+        from jcapy.config import CONFIG_MANAGER
+        return bool(CONFIG_MANAGER.get("ai.cache.enabled", False))
+    except Exception:
+        return False
+
+
+def get_response_cache() -> ResponseCache:
+    """Lazily create the process-wide cache from config."""
+    global _response_cache
+    if _response_cache is None:
+        with _cache_lock:
+            if _response_cache is None:
+                from jcapy.config import CONFIG_MANAGER, JCAPY_HOME
+                _response_cache = ResponseCache(
+                    os.path.join(JCAPY_HOME, "ai_cache.db"),
+                    ttl=float(CONFIG_MANAGER.get("ai.cache.ttl", DEFAULT_TTL_SECONDS)),
+                    max_bytes=int(float(CONFIG_MANAGER.get("ai.cache.max_mb", DEFAULT_MAX_MB)) * 1024 * 1024),
+                )
+    return _response_cache
@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+`jcapy --profile-startup <args>` — where does startup time go?
+
+The command is re-run in a child interpreter with `-X importtime`. The
+child also records how long each lazily created service took to
+initialize (see `timed`). The parent then prints both breakdowns and
+the total wall time.
+
+Keep this module's own imports to the standard library; it is imported
+before anything else.
+"""
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+ENV_VAR = "JCAPY_PROFILE_STARTUP"
+FLAG = "--profile-startup"
+
+# Set in the profiled child only; `timed` is a no-op otherwise
+_OUTPUT = os.environ.get(ENV_VAR)
+_inits: List[Tuple[str, float]] = []
+
+GREY = '\033[0;90m'
+CYAN = '\033[1;36m'
+BOLD = '\033[1m'
+RESET = '\033[0m'
+
+
+@contextmanager
+def timed(label: str):
+    """Record how long a lazy service took to initialize (only while profiling)."""
+    if _OUTPUT is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _inits.append((label, time.perf_counter() - start))
+
+
+def _dump():
+    with open(_OUTPUT, "w") as f:
+        json.dump(_inits, f)
+
+
+if _OUTPUT is not None:
+    import atexit
+    atexit.register(_dump)
+
+
+def parse_importtime(lines: List[str]) -> Dict[str, Tuple[int, int]]:
+    """`-X importtime` stderr lines -> {module: (self_us, cumulative_us)}."""
+    modules = {}
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # the header row
+        modules[parts[2].strip()] = (int(parts[0]), int(parts[1]))
+    return modules
+
+
+def render_report(wall: float, modules: Dict[str, Tuple[int, int]], inits: List[Tuple[str, float]],
+                  top: int = 15) -> str:
+    total_import = sum(s for s, _ in modules.values()) / 1e6
+    by_package: Dict[str, int] = {}
+    for name, (self_us, _) in modules.items():
+        root = name.split(".")[0]
+        if root == "jcapy":
+            root = ".".join(name.split(".")[:3])
+        by_package[root] = by_package.get(root, 0) + self_us
+
+    out = [f"\n{BOLD}Startup profile{RESET}  wall {wall * 1000:.0f}ms · "
+           f"imports {total_import * 1000:.0f}ms ({len(modules)} modules) · "
+           f"service init {sum(d for _, d in inits) * 1000:.0f}ms"]
+    out.append(f"\n{CYAN}Import time by package (self){RESET}")
+    for name, us in sorted(by_package.items(), key=lambda kv: -kv[1])[:top]:
+        out.append(f"  {us / 1000:8.1f}ms  {name}")
+    out.append(f"\n{CYAN}Slowest modules (self / cumulative){RESET}")
+    for name, (self_us, cum_us) in sorted(modules.items(), key=lambda kv: -kv[1][0])[:top]:
+        out.append(f"  {self_us / 1000:8.1f}ms {GREY}{cum_us / 1000:8.1f}ms{RESET}  {name}")
+    if inits:
+        out.append(f"\n{CYAN}Service initialization{RESET}")
+        for label, seconds in sorted(inits, key=lambda kv: -kv[1]):
+            out.append(f"  {seconds * 1000:8.1f}ms  {label}")
+    return "\n".join(out) + "\n"
+
+
+def run(argv: List[str]) -> int:
+    """Run `jcapy <argv>` in a profiled child and print the report to stderr."""
+    import subprocess
+    import tempfile
+    fd, inits_path = tempfile.mkstemp(prefix="jcapy-startup-", suffix=".json")
+    os.close(fd)
+    env = dict(os.environ, **{ENV_VAR: inits_path})
+    cmd = [sys.executable, "-X", "importtime", "-m", "jcapy", *argv]
+    start = time.perf_counter()
+    try:
+        proc = subprocess.Popen(cmd, env=env, stderr=subprocess.PIPE, text=True)
+        import_lines = []
+        for line in proc.stderr:
+            if line.startswith("import time:"):
+                import_lines.append(line)
+            else:
+                sys.stderr.write(line)  # the command's own stderr
+        code = proc.wait()
+        wall = time.perf_counter() - start
+        try:
+            with open(inits_path) as f:
+                inits = [tuple(x) for x in json.load(f)]
+        except (OSError, ValueError):
+            inits = []
+    finally:
+        os.remove(inits_path)
+    sys.stderr.write(render_report(wall, parse_importtime(import_lines), inits))
+    return code
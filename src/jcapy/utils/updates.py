@@ -1,7 +1,7 @@
 import os
 import subprocess
 from datetime import datetime
-from jcapy.config import load_config, save_config, DEFAULT_LIBRARY_PATH
+from jcapy.config import load_config, save_config
 
 # Global State for Main Loop
 SKILL_UPDATES_AVAILABLE = False
@@ -60,6 +60,7 @@ def check_for_framework_updates():
     check_for_app_updates()
 
     # Check updates for CORE library (Programmer) only
+    from jcapy.config import DEFAULT_LIBRARY_PATH
     lib_path = DEFAULT_LIBRARY_PATH
 
     # 1. Throttling Check
@@ -1,16 +1,68 @@
-
+import atexit
 import os
 import json
 import sqlite3
-import time
-from datetime import datetime
-from typing import Dict, List, Optional
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 from jcapy.config import JCAPY_HOME
+from jcapy.utils.startup_profile import timed
+from jcapy.utils.write_behind import WriteBehindQueue, flush_defaults
+
+DEFAULT_FLUSH_INTERVAL, DEFAULT_FLUSH_RECORDS = flush_defaults('JCAPY_USAGE', 1.0, 64)
+# Attempts at a batch while the database is locked or busy before it is dropped
+DEFAULT_COMMIT_RETRIES = int(os.environ.get('JCAPY_USAGE_COMMIT_RETRIES', 5))
+
+# Bump when the rollup tables change shape; older databases are re-aggregated once
+ROLLUP_VERSION = "1"
+
+# (timestamp, session_id, provider, model, input_tokens, output_tokens, cost, cached, saved)
+UsageRow = Tuple[str, str, str, str, int, int, float, int, float]
+
+# Rollup table -> the columns it is keyed by
+_ROLLUPS = {
+    "usage_daily": ("day",),
+    "usage_by_provider": ("provider",),
+    "usage_by_model": ("provider", "model"),
+}
+_KEY_SQL = {"day": "substr(timestamp, 1, 10)", "provider": "provider", "model": "model"}
+_KEY_INDEX = {"day": 0, "provider": 2, "model": 3}
+
+_EMPTY_TOTALS = {"input_tokens": 0, "output_tokens": 0, "cost": 0.0, "cache_hits": 0, "saved": 0.0}
+
+
+def _rollup_deltas(rows: List[UsageRow]) -> Dict[str, Dict[Tuple, List[Any]]]:
+    """ Per rollup table: key -> [calls, cache_hits, input_tokens, output_tokens, cost, saved] for `rows`. """
+    deltas: Dict[str, Dict[Tuple, List[Any]]] = {table: {} for table in _ROLLUPS}
+    for row in rows:
+        _, _, _, _, in_tokens, out_tokens, cost, cached, saved = row
+        delta = (1, cached, 0 if cached else in_tokens, 0 if cached else out_tokens, cost, saved)
+        day = (row[0] or "")[:10]
+        for table, keys in _ROLLUPS.items():
+            key = tuple(day if k == "day" else row[_KEY_INDEX[k]] for k in keys)
+            acc = deltas[table].setdefault(key, [0, 0, 0, 0, 0.0, 0.0])
+            for i, value in enumerate(delta):
+                acc[i] += value
+    return deltas
+
 
 class UsageLogManager:
-    """ Manages persistent AI usage logs and session-based tracking using SQLite. """
+    """
+    Manages persistent AI usage logs and session-based tracking using SQLite.
 
-    def __init__(self):
+    Each thread keeps one long-lived WAL connection. record_hit() only queues
+    the row; a background thread inserts queued rows in batches and, in the
+    same transaction, folds them into the daily / per-provider / per-model
+    rollup tables, so summaries never scan usage_logs. Summaries add rows
+    still queued to the committed rollups instead of forcing a write.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        flush_records: int = DEFAULT_FLUSH_RECORDS,
+        commit_retries: int = DEFAULT_COMMIT_RETRIES
+    ):
         self.db_path = os.path.join(JCAPY_HOME, "usage.db")
         self.legacy_log_path = os.path.join(JCAPY_HOME, "usage_log.json")
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -18,28 +70,106 @@ class UsageLogManager:
             "input_tokens": 0,
             "output_tokens": 0,
             "cost": 0.0,
-            "hits": 0
+            "hits": 0,
+            "cache_hits": 0,
+            "saved": 0.0
         }
+        self._local = threading.local()
+        self._session_lock = threading.Lock()
+        self._queue = WriteBehindQueue(
+            self._commit, "jcapy-usage-writer", flush_interval, flush_records, on_stop=self._close_connection
+        )
+        self.commit_retries = max(1, commit_retries)
+        self.batches = 0
+        self.errors = 0
+        self.dropped = 0         # rows given up on after a failed insert
+        self._attempts = 0       # failed attempts at the batch at the head of the queue
+
         self._init_db()
         self._migrate_from_json()
         self.pricing_rules = self._load_pricing_rules()
 
+    def _connect(self) -> sqlite3.Connection:
+        """ The calling thread's connection, opened on first use. """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            # Autocommit mode; writes manage their own transactions
+            conn = sqlite3.connect(self.db_path, timeout=10.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
     def _init_db(self):
         """ Initialize the SQLite database schema. """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS usage_logs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    session_id TEXT NOT NULL,
-                    provider TEXT NOT NULL,
-                    model TEXT NOT NULL,
-                    input_tokens INTEGER DEFAULT 0,
-                    output_tokens INTEGER DEFAULT 0,
-                    cost REAL DEFAULT 0.0
+        conn = self._connect()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS usage_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                session_id TEXT NOT NULL,
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL,
+                input_tokens INTEGER DEFAULT 0,
+                output_tokens INTEGER DEFAULT 0,
+                cost REAL DEFAULT 0.0,
+                cached INTEGER DEFAULT 0,
+                saved REAL DEFAULT 0.0
+            )
+        """)
+        # Databases created before the response cache lack these columns
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(usage_logs)")}
+        if "cached" not in columns:
+            conn.execute("ALTER TABLE usage_logs ADD COLUMN cached INTEGER DEFAULT 0")
+        if "saved" not in columns:
+            conn.execute("ALTER TABLE usage_logs ADD COLUMN saved REAL DEFAULT 0.0")
+
+        conn.execute("CREATE TABLE IF NOT EXISTS usage_meta (key TEXT PRIMARY KEY, value TEXT)")
+        for table, keys in _ROLLUPS.items():
+            key_columns = ", ".join(f"{k} TEXT NOT NULL" for k in keys)
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    {key_columns},
+                    calls INTEGER NOT NULL DEFAULT 0,
+                    cache_hits INTEGER NOT NULL DEFAULT 0,
+                    input_tokens INTEGER NOT NULL DEFAULT 0,
+                    output_tokens INTEGER NOT NULL DEFAULT 0,
+                    cost REAL NOT NULL DEFAULT 0.0,
+                    saved REAL NOT NULL DEFAULT 0.0,
+                    PRIMARY KEY ({", ".join(keys)})
                 )
             """)
-            conn.commit()
+        self._backfill_rollups(conn)
+
+    def _backfill_rollups(self, conn: sqlite3.Connection):
+        """ Aggregate pre-existing usage_logs into the rollup tables, once per ROLLUP_VERSION. """
+        row = conn.execute("SELECT value FROM usage_meta WHERE key = 'rollup_version'").fetchone()
+        if row and row[0] == ROLLUP_VERSION:
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Another process may have done it while we waited for the lock
+            row = conn.execute("SELECT value FROM usage_meta WHERE key = 'rollup_version'").fetchone()
+            if not row or row[0] != ROLLUP_VERSION:
+                for table, keys in _ROLLUPS.items():
+                    select_keys = ", ".join(_KEY_SQL[k] for k in keys)
+                    conn.execute(f"DELETE FROM {table}")
+                    conn.execute(f"""
+                        INSERT INTO {table} ({", ".join(keys)}, calls, cache_hits, input_tokens, output_tokens, cost, saved)
+                        SELECT {select_keys}, COUNT(*), SUM(cached),
+                               SUM(CASE WHEN cached = 0 THEN input_tokens ELSE 0 END),
+                               SUM(CASE WHEN cached = 0 THEN output_tokens ELSE 0 END),
+                               SUM(cost), SUM(saved)
+                        FROM usage_logs GROUP BY {select_keys}
+                    """)
+                conn.execute(
+                    "INSERT OR REPLACE INTO usage_meta (key, value) VALUES ('rollup_version', ?)", (ROLLUP_VERSION,)
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
 
     def _migrate_from_json(self):
         """ Port legacy JSON logs to SQLite if they exist. """
@@ -48,21 +178,20 @@ class UsageLogManager:
                 with open(self.legacy_log_path, 'r') as f:
                     logs = json.load(f)
 
-                with sqlite3.connect(self.db_path) as conn:
-                    for record in logs:
-                        conn.execute("""
-                            INSERT INTO usage_logs (timestamp, session_id, provider, model, input_tokens, output_tokens, cost)
-                            VALUES (?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            record.get("timestamp"),
-                            record.get("session_id", "legacy"),
-                            record.get("provider", "unknown"),
-                            record.get("model", "unknown"),
-                            record.get("input", 0),
-                            record.get("output", 0),
-                            record.get("cost", 0.0)
-                        ))
-                    conn.commit()
+                self._write_batch([
+                    (
+                        record.get("timestamp"),
+                        record.get("session_id", "legacy"),
+                        record.get("provider", "unknown"),
+                        record.get("model", "unknown"),
+                        record.get("input", 0),
+                        record.get("output", 0),
+                        record.get("cost", 0.0),
+                        0,
+                        0.0
+                    )
+                    for record in logs
+                ])
 
                 # Cleanup legacy file
                 os.rename(self.legacy_log_path, self.legacy_log_path + ".bak")
@@ -83,51 +212,174 @@ class UsageLogManager:
             CONFIG_MANAGER.set("usage.pricing", rules)
         return rules
 
-    def record_hit(self, provider: str, model: str, in_tokens: int, out_tokens: int):
-        """ Record a single AI interaction in the database. """
+    def record_hit(self, provider: str, model: str, in_tokens: int, out_tokens: int, cached: bool = False):
+        """
+        Record a single AI interaction.
+        Responses served from the response cache cost nothing; what they
+        would have cost is recorded as `saved` instead. The row is written
+        by the background writer; call flush() to wait for it.
+        """
         model_key = model if model in self.pricing_rules else "local"
         rates = self.pricing_rules.get(model_key, {"in": 0, "out": 0})
         hit_cost = (in_tokens * rates["in"] + out_tokens * rates["out"]) / 1_000_000
+        saved = 0.0
+
+        with self._session_lock:
+            # Update Session Cache
+            if cached:
+                saved, hit_cost = hit_cost, 0.0
+                self.session_data["cache_hits"] += 1
+                self.session_data["saved"] += saved
+            else:
+                self.session_data["input_tokens"] += in_tokens
+                self.session_data["output_tokens"] += out_tokens
+                self.session_data["cost"] += hit_cost
+                self.session_data["hits"] += 1
 
-        # Update Session Cache
-        self.session_data["input_tokens"] += in_tokens
-        self.session_data["output_tokens"] += out_tokens
-        self.session_data["cost"] += hit_cost
-        self.session_data["hits"] += 1
-
-        # Persistent SQL Log
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO usage_logs (timestamp, session_id, provider, model, input_tokens, output_tokens, cost)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                datetime.now().isoformat(),
-                self.session_id,
-                provider,
-                model,
-                in_tokens,
-                out_tokens,
-                round(hit_cost, 6)
-            ))
-            conn.commit()
+        # Persistent SQL Log (write-behind)
+        self._queue.put((
+            datetime.now().isoformat(),
+            self.session_id,
+            provider,
+            model,
+            in_tokens,
+            out_tokens,
+            round(hit_cost, 6),
+            int(cached),
+            round(saved, 6)
+        ))
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """ Commit every row queued so far. Returns False if it timed out. """
+        return self._queue.flush(timeout)
+
+    def close(self, timeout: float = 5.0):
+        self._queue.close(timeout)
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _commit(self, batch: List[UsageRow]) -> bool:
+        try:
+            self._write_batch(batch)
+        except sqlite3.Error as e:
+            self.errors += 1
+            self._attempts += 1
+            message = str(e).lower()
+            if (isinstance(e, sqlite3.OperationalError) and ("locked" in message or "busy" in message)
+                    and self._attempts < self.commit_retries):
+                return False  # Another process holds the lock; the queue retries after flush_interval
+            # Read-only, corrupt or failing disk will not clear up by itself; usage
+            # tracking must not grow without bound behind it
+            self.dropped += len(batch)
+            self._close_connection()
+        self._attempts = 0
+        return True
+
+    def _close_connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _write_batch(self, rows: List[UsageRow]):
+        """ Insert rows and fold them into every rollup table in one transaction. """
+        if not rows:
+            return
+        deltas = _rollup_deltas(rows)
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany("""
+                INSERT INTO usage_logs (timestamp, session_id, provider, model, input_tokens, output_tokens, cost, cached, saved)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            for table, keys in _ROLLUPS.items():
+                placeholders = ", ".join("?" for _ in keys)
+                conn.executemany(f"""
+                    INSERT INTO {table} ({", ".join(keys)}, calls, cache_hits, input_tokens, output_tokens, cost, saved)
+                    VALUES ({placeholders}, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT ({", ".join(keys)}) DO UPDATE SET
+                        calls = calls + excluded.calls,
+                        cache_hits = cache_hits + excluded.cache_hits,
+                        input_tokens = input_tokens + excluded.input_tokens,
+                        output_tokens = output_tokens + excluded.output_tokens,
+                        cost = cost + excluded.cost,
+                        saved = saved + excluded.saved
+                """, [key + tuple(acc) for key, acc in deltas[table].items()])
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        self.batches += 1
+
+    # ------------------------------------------------------------------
+    # Summaries (read from the rollups)
+    # ------------------------------------------------------------------
 
     def get_session_summary(self) -> Dict:
         return self.session_data
 
+    def _rollup(self, table: str, keys: Tuple[str, ...], since: Optional[str] = None) -> List[Dict]:
+        columns = keys + ("calls", "cache_hits", "input_tokens", "output_tokens", "cost", "saved")
+        sql = f"SELECT {', '.join(columns)} FROM {table}"
+        params: Tuple = ()
+        if since is not None:
+            sql += " WHERE day >= ?"
+            params = (since,)
+        with self._queue.view() as queued:
+            rows = {row[:len(keys)]: list(row[len(keys):]) for row in self._connect().execute(sql, params)}
+        for key, delta in _rollup_deltas(queued)[table].items():
+            if since is not None and key[0] < since:
+                continue
+            acc = rows.setdefault(key, [0, 0, 0, 0, 0.0, 0.0])
+            for i, value in enumerate(delta):
+                acc[i] += value
+        return [dict(zip(columns, key + tuple(rows[key]))) for key in sorted(rows)]
+
     def get_total_summary(self) -> Dict:
-        """ Calculates totals across the entire SQLite history. """
+        """ Totals across the entire history, summed from the per-provider rollup. """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT SUM(input_tokens), SUM(output_tokens), SUM(cost) FROM usage_logs")
-                row = cursor.fetchone()
-                return {
-                    "input_tokens": int(row[0] or 0),
-                    "output_tokens": int(row[1] or 0),
-                    "cost": float(row[2] or 0.0)
-                }
+            providers = self.get_provider_summary()
         except Exception:
-            return {"input_tokens": 0, "output_tokens": 0, "cost": 0.0}
+            return dict(_EMPTY_TOTALS)
+        return {
+            "input_tokens": int(sum(p["input_tokens"] for p in providers)),
+            "output_tokens": int(sum(p["output_tokens"] for p in providers)),
+            "cost": float(sum(p["cost"] for p in providers)),
+            "cache_hits": int(sum(p["cache_hits"] for p in providers)),
+            "saved": float(sum(p["saved"] for p in providers))
+        }
+
+    def get_daily_summary(self, days: int = 30) -> List[Dict]:
+        """ One row per day for the last `days` days (oldest first); days without usage are omitted. """
+        since = (datetime.now() - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+        return self._rollup("usage_daily", ("day",), since)
+
+    def get_provider_summary(self) -> List[Dict]:
+        return self._rollup("usage_by_provider", ("provider",))
+
+    def get_model_summary(self) -> List[Dict]:
+        return self._rollup("usage_by_model", ("provider", "model"))
+
+# Global singleton, created on first use: opening it creates the database and
+# runs the JSON migration, which commands that never touch usage shouldn't pay for
+_manager: Optional[UsageLogManager] = None
+_manager_lock = threading.Lock()
+
+def get_usage_log_manager() -> UsageLogManager:
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                with timed("usage log"):
+                    _manager = UsageLogManager()
+                atexit.register(_manager.close)
+    return _manager
 
-# Global singleton
-USAGE_LOG_MANAGER = UsageLogManager()
+def __getattr__(name):
+    # Keeps `from jcapy.utils.usage import USAGE_LOG_MANAGER` working
+    if name == "USAGE_LOG_MANAGER":
+        return get_usage_log_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,163 @@
+"""
+Write-behind queue shared by the audit log and the usage log.
+
+Producers put() items and return immediately; one background thread
+hands them to a commit callback in batches, when `flush_records` are
+pending or `flush_interval` elapses. flush() waits for everything queued
+so far; close() flushes and stops the thread. view() lets readers combine
+what is already committed with what is still queued without forcing a
+write.
+"""
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+
+def flush_defaults(prefix: str, interval: float, records: int) -> Tuple[float, int]:
+    """(interval, records) defaults, overridable via `<prefix>_FLUSH_INTERVAL` / `<prefix>_FLUSH_RECORDS`."""
+    return (float(os.environ.get(f'{prefix}_FLUSH_INTERVAL', interval)),
+            int(os.environ.get(f'{prefix}_FLUSH_RECORDS', records)))
+
+
+class WriteBehindQueue:
+    """
+    Group-commit queue drained by a single background thread.
+
+    `commit(batch)` runs on that thread and returns True once the batch is
+    done with (written, or deliberately dropped) or False to retry it after
+    `flush_interval`; a batch still failing at close() is dropped. `on_stop`
+    runs on the thread as it exits, to release per-thread resources.
+    """
+
+    def __init__(
+        self,
+        commit: Callable[[List[Any]], bool],
+        name: str,
+        flush_interval: float,
+        flush_records: int,
+        max_pending: int = 0,
+        on_stop: Optional[Callable[[], None]] = None
+    ):
+        self._commit = commit
+        self._name = name
+        self.flush_interval = flush_interval
+        self.flush_records = max(1, flush_records)
+        self.max_pending = max_pending  # 0 = unbounded
+        self._on_stop = on_stop
+
+        self._pending: deque = deque()
+        self._in_flight: List[Any] = []  # Taken by the writer, not yet committed
+        self._cond = threading.Condition()
+        self._commit_lock = threading.Lock()  # Held while a batch is committed
+        self._enqueued = 0      # sequence number of the last item queued
+        self._written = 0       # sequence number of the last item committed
+        self._flush_requested = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def put(self, item: Any) -> bool:
+        """Queue one item. Blocks only if `max_pending` items are waiting. False once closed."""
+        with self._cond:
+            if self._closed:
+                return False
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+            while self.max_pending and len(self._pending) >= self.max_pending and not self._closed:
+                self._cond.wait(0.1)
+            self._pending.append(item)
+            self._enqueued += 1
+            if len(self._pending) >= self.flush_records:
+                self._cond.notify_all()
+            return True
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Commit everything queued so far. Returns False if it timed out."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            target = self._enqueued
+            if self._written >= target:
+                return True
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._written < target:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def close(self, timeout: float = 5.0):
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def depth(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    @contextmanager
+    def view(self) -> Iterator[List[Any]]:
+        """
+        Yield every item not yet committed, holding off the writer until the
+        block exits, so a read of the committed data inside the block
+        neither misses nor double-counts a batch.
+        """
+        with self._commit_lock:
+            with self._cond:
+                uncommitted = self._in_flight + list(self._pending)
+            yield uncommitted
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _run(self):
+        retrying = False
+        try:
+            while True:
+                with self._cond:
+                    deadline = time.monotonic() + self.flush_interval
+                    # After a failed commit, wait out the interval even if a batch is ready
+                    while ((retrying or (len(self._pending) < self.flush_records and not self._flush_requested))
+                           and not self._closed):
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    batch = self._in_flight = list(self._pending)
+                    self._pending.clear()
+                    self._flush_requested = False
+                    closing = self._closed
+                    self._cond.notify_all()  # wake producers blocked on max_pending
+
+                with self._commit_lock:
+                    done = not batch or self._commit(batch)
+                    with self._cond:
+                        self._in_flight = []
+                        retrying = not (done or closing)
+                        if retrying:
+                            self._pending.extendleft(reversed(batch))
+                        else:
+                            self._written += len(batch)
+                        self._cond.notify_all()
+                if closing:
+                    break
+        finally:
+            if self._on_stop is not None:
+                self._on_stop()
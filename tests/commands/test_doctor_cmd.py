@@ -0,0 +1,32 @@
+import jcapy.config
+import jcapy.utils.ai_cache as ai_cache
+from jcapy.commands.doctor import DoctorCommand
+
+
+def test_doctor_reports_ai_cache_stats(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(jcapy.config, "JCAPY_HOME", str(tmp_path))
+    monkeypatch.setattr(ai_cache, "_response_cache", None)
+    monkeypatch.setenv("JCAPY_AI_CACHE", "1")
+
+    cache = ai_cache.get_response_cache()
+    cache.put("k", "openai", "gpt-4o", "x" * 2048)
+    cache.get("k")
+    cache.get("missing")
+
+    # doctor runs in its own process: it only sees what the cache persisted
+    monkeypatch.setattr(ai_cache, "_response_cache", None)
+    DoctorCommand().check_ai_cache()
+    out = capsys.readouterr().out
+    assert "Enabled" in out
+    assert "Entries:   1" in out
+    assert "Hit rate:  50% (1 hits, 1 misses, 0 evicted)" in out
+
+
+def test_doctor_reports_disabled_cache_without_creating_it(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(jcapy.config, "JCAPY_HOME", str(tmp_path))
+    monkeypatch.setattr(ai_cache, "_response_cache", None)
+    monkeypatch.setenv("JCAPY_AI_CACHE", "0")
+
+    DoctorCommand().check_ai_cache()
+    assert "Disabled" in capsys.readouterr().out
+    assert not (tmp_path / "ai_cache.db").exists()
@@ -0,0 +1,31 @@
+import os
+
+from jcapy.commands import frameworks
+from jcapy.core.skill_catalog import SkillCatalog
+
+
+def test_open_reindexes_the_file_after_the_editor_exits(tmp_path, monkeypatch):
+    lib = tmp_path / "library"
+    skill = lib / "skills" / "devops" / "deploy_fly.md"
+    skill.parent.mkdir(parents=True)
+    skill.write_text("# Deploy to Fly\nflyctl deploy\n")
+    catalog = SkillCatalog(str(lib), db_path=str(tmp_path / "catalog.db"),
+                           verify_interval=3600, file_check_interval=3600)
+    catalog.refresh()
+
+    def editor(argv):
+        dir_mtime = os.stat(skill.parent).st_mtime_ns
+        skill.write_text("# Deploy to Fly\nUse a zebrafish canary.\n")
+        os.utime(skill.parent, ns=(dir_mtime, dir_mtime))   # in-place: directory unchanged
+        return 0
+
+    monkeypatch.setenv("EDITOR", "vim")
+    monkeypatch.setattr(frameworks, "get_active_library_path", lambda: str(lib))
+    monkeypatch.setattr(frameworks, "get_catalog", lambda path: catalog)
+    monkeypatch.setattr(frameworks.subprocess, "call", editor)
+
+    frameworks.open_framework("deploy_fly")
+
+    assert not catalog.refresh()
+    assert [h.entry.name for h in catalog.search("zebrafish")] == ["deploy_fly.md"]
+    assert catalog.search("flyctl") == []
@@ -0,0 +1,171 @@
+import argparse
+import os
+import subprocess
+import threading
+import time
+
+import pytest
+
+from jcapy.commands import sync
+from jcapy.commands.sync import push_personas, sync_personas
+from jcapy.core.bootstrap import register_core_commands, setup_sync
+from jcapy.core.plugins import CommandRegistry
+
+
+def git(*args, cwd):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+@pytest.fixture(autouse=True)
+def git_identity(monkeypatch):
+    monkeypatch.setenv("GIT_AUTHOR_NAME", "Test")
+    monkeypatch.setenv("GIT_AUTHOR_EMAIL", "test@example.com")
+    monkeypatch.setenv("GIT_COMMITTER_NAME", "Test")
+    monkeypatch.setenv("GIT_COMMITTER_EMAIL", "test@example.com")
+
+
+def make_remote(tmp_path, name):
+    """A bare repository standing in for the persona's remote, seeded with one commit."""
+    remote = tmp_path / "remotes" / f"{name}.git"
+    remote.mkdir(parents=True)
+    git("init", "--bare", "-b", "main", cwd=remote)
+
+    seed = tmp_path / "seed" / name
+    seed.mkdir(parents=True)
+    git("init", "-b", "main", cwd=seed)
+    (seed / "README.md").write_text(f"# {name}\n")
+    git("add", ".", cwd=seed)
+    git("commit", "-m", "seed", cwd=seed)
+    git("remote", "add", "origin", str(remote), cwd=seed)
+    git("push", "origin", "main", cwd=seed)
+    return remote, seed
+
+
+@pytest.fixture
+def personas(tmp_path):
+    result = {}
+    for name in ("programmer", "writer", "designer"):
+        remote, seed = make_remote(tmp_path, name)
+        local = tmp_path / "brains" / name
+        git("clone", str(remote), str(local), cwd=tmp_path)
+        result[name] = {"path": str(local), "remote_url": str(remote), "_seed": seed}
+    return result
+
+
+def test_sync_pulls_every_persona(personas):
+    for name, data in personas.items():
+        seed = data["_seed"]
+        (seed / "new.md").write_text(f"upstream change for {name}\n")
+        git("add", ".", cwd=seed)
+        git("commit", "-m", "upstream", cwd=seed)
+        git("push", "origin", "main", cwd=seed)
+
+    # A dirty working tree is stashed and restored around the pull
+    dirty = personas["writer"]["path"]
+    with open(f"{dirty}/README.md", "a") as f:
+        f.write("local edit\n")
+
+    events = []
+    results = sync_personas(personas, list(personas), max_workers=3,
+                            progress=lambda name, msg: events.append(name))
+
+    assert [r.name for r in results] == list(personas)
+    assert all(r.status == "updated" for r in results), [r.message for r in results]
+    assert all(r.duration > 0 for r in results)
+    for data in personas.values():
+        assert os.path.exists(os.path.join(data["path"], "new.md"))
+    assert "local edit" in open(f"{dirty}/README.md").read()
+    assert set(events) == set(personas)
+
+
+def test_sync_clones_missing_and_flags_unlinked(tmp_path, personas):
+    missing = personas["designer"]
+    subprocess.run(["rm", "-rf", missing["path"]], check=True)
+    unlinked = tmp_path / "plain"
+    unlinked.mkdir()
+    personas["plain"] = {"path": str(unlinked)}
+
+    results = {r.name: r for r in sync_personas(personas, list(personas), max_workers=2)}
+
+    assert results["designer"].status == "cloned"
+    assert (tmp_path / "brains" / "designer" / "README.md").exists()
+    assert results["plain"].status == "needs_setup"
+
+
+def test_push_publishes_local_commits(personas):
+    for name, data in personas.items():
+        with open(f"{data['path']}/notes.md", "w") as f:
+            f.write(f"notes for {name}\n")
+
+    personas["writer"].pop("remote_url")
+    results = {r.name: r for r in push_personas(personas, list(personas), max_workers=3)}
+
+    for name, data in personas.items():
+        assert results[name].status == "pushed", results[name].message
+        log = git("log", "--format=%s", "-1", "main", cwd=data["remote_url"] if "remote_url" in data else results[name].remote_url)
+        assert log.startswith("Brain Sync:")
+    assert results["writer"].remote_url.endswith("writer.git")
+    assert results["programmer"].remote_url is None
+
+
+def test_push_without_remote_needs_setup(tmp_path):
+    repo = tmp_path / "solo"
+    repo.mkdir()
+    git("init", "-b", "main", cwd=repo)
+    results = push_personas({"solo": {"path": str(repo)}}, ["solo"])
+    assert results[0].status == "needs_setup"
+
+
+def test_worker_limit_is_respected(monkeypatch):
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_sync(name, p_data, progress):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return sync.PersonaResult(name, "updated")
+
+    monkeypatch.setattr(sync, "sync_persona", fake_sync)
+    names = [f"p{i}" for i in range(8)]
+    start = time.monotonic()
+    results = sync_personas({n: {} for n in names}, names, max_workers=2)
+
+    assert [r.name for r in results] == names
+    assert peak == 2
+    assert time.monotonic() - start >= 0.2  # 8 tasks / 2 workers * 50ms
+
+
+def test_workers_option_rejects_values_below_one(capsys):
+    parser = argparse.ArgumentParser(prog="jcapy sync")
+    setup_sync(parser)
+
+    assert parser.parse_args(["--workers", "3"]).workers == 3
+    assert parser.parse_args([]).workers is None
+    for bad in ("0", "-2", "many"):
+        with pytest.raises(SystemExit):
+            parser.parse_args(["--workers", bad])
+    assert "must be at least 1" in capsys.readouterr().err
+
+    with pytest.raises(ValueError):
+        sync_personas({"solo": {}}, ["solo"], max_workers=0)
+
+
+def test_workers_option_reaches_the_command(monkeypatch):
+    calls = []
+    monkeypatch.setattr(sync, "sync_all_personas", lambda workers=None: calls.append(workers))
+    registry = CommandRegistry()
+    register_core_commands(registry)
+
+    registry.execute_string("sync --workers 2")
+    registry.execute_string("sync")
+    result = registry.execute_string("sync --workers 0")
+
+    assert calls == [2, None]
+    assert result.error_code == "ValueError" and "at least 1" in result.message
+
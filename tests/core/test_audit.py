@@ -2,7 +2,9 @@ import pytest
 import os
 import json
 import tempfile
-from jcapy.core.audit import AuditLogger
+import gzip
+import threading
+from jcapy.core.audit import AuditLogger, AuditWriter, list_segments
 
 @pytest.fixture
 def temp_audit_file():
@@ -22,6 +24,7 @@ def test_log_event_persistence(temp_audit_file):
 
     payload = {"key": "value"}
     logger.log_event("TEST_EVENT", "agent-p", payload, outcome="SUCCESS")
+    assert logger.flush()
 
     assert os.path.exists(temp_audit_file)
 
@@ -42,9 +45,146 @@ def test_multiple_events(temp_audit_file):
 
     logger.log_event("EVENT_1", "agent-1", {"id": 1})
     logger.log_event("EVENT_2", "agent-1", {"id": 2})
+    assert logger.flush()
 
     with open(temp_audit_file, 'r') as f:
         lines = f.readlines()
         assert len(lines) == 2
         assert json.loads(lines[0])["event_type"] == "EVENT_1"
         assert json.loads(lines[1])["event_type"] == "EVENT_2"
+
+def test_records_are_group_committed(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    writer = AuditWriter(path, flush_interval=10.0, flush_records=50, fsync=False)
+    logger = AuditLogger(audit_file=path, writer=writer)
+
+    for i in range(200):
+        logger.log_event("TOOL_CALL", "agent", {"i": i})
+    assert logger.flush()
+
+    with open(path) as f:
+        assert [json.loads(line)["payload"]["i"] for line in f] == list(range(200))
+    stats = logger.stats()
+    assert stats["records_written"] == 200
+    assert stats["queue_depth"] == 0
+    assert stats["batches"] <= 5  # 50-record batches, plus at most one tail flush
+    assert stats["records_per_second"] > 0
+    logger.close()
+
+def test_payload_is_snapshotted_at_log_time(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    logger = AuditLogger(audit_file=path)
+    payload = {"state": "before"}
+    logger.log_event("EVENT", "agent", payload)
+    payload["state"] = "after"
+    logger.flush()
+
+    with open(path) as f:
+        assert json.loads(f.readline())["payload"]["state"] == "before"
+    logger.close()
+
+def test_concurrent_producers_lose_nothing(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    logger = AuditLogger(audit_file=path, writer=AuditWriter(path, flush_records=64, fsync=False))
+
+    def produce(n):
+        for i in range(500):
+            logger.log_event("EVENT", f"agent-{n}", {"i": i})
+
+    threads = [threading.Thread(target=produce, args=(n,)) for n in range(8)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    assert logger.flush()
+
+    with open(path) as f:
+        assert sum(1 for _ in f) == 4000
+    logger.close()
+
+def test_rotation_and_compression(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    writer = AuditWriter(path, flush_records=10, max_bytes=2000, fsync=False, compress=True)
+    logger = AuditLogger(audit_file=path, writer=writer)
+
+    for i in range(100):
+        logger.log_event("EVENT", "agent", {"i": i, "pad": "x" * 50})
+        if i % 10 == 9:
+            logger.flush()
+    logger.close()
+    # Compression runs in the background; wait for it to settle
+    for _ in range(100):
+        if not any(p.endswith(tuple("0123456789")) for p in list_segments(path)):
+            break
+        threading.Event().wait(0.02)
+
+    segments = list_segments(path)
+    assert writer.stats()["rotations"] >= 2
+    assert all(p.endswith(".gz") for p in segments if p != path)
+
+    ids = []
+    for segment in segments:
+        opener = gzip.open if segment.endswith(".gz") else open
+        with opener(segment, "rt") as f:
+            ids.extend(json.loads(line)["payload"]["i"] for line in f)
+    assert ids == list(range(100))
+
+def test_writers_rotating_together_lose_no_segment(tmp_path):
+    # Two writers on one file stand in for two processes (flocks are per open file)
+    path = str(tmp_path / "audit.jsonl")
+    writers = [AuditWriter(path, flush_records=5, max_bytes=1500, fsync=False) for _ in range(2)]
+
+    def produce(n):
+        for i in range(400):
+            writers[n].write(json.dumps({"w": n, "i": i, "pad": "x" * 40}) + "\n")
+            if i % 5 == 4:
+                writers[n].flush()
+
+    threads = [threading.Thread(target=produce, args=(n,)) for n in range(2)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    for writer in writers:
+        writer.close()
+
+    records = []
+    for segment in list_segments(path):
+        with open(segment) as f:
+            records.extend((r["w"], r["i"]) for r in map(json.loads, f))
+    assert sorted(records) == [(n, i) for n in range(2) for i in range(400)]
+    assert sum(w.stats()["rotations"] for w in writers) > 10
+
+
+def test_rotation_never_overwrites_a_segment(tmp_path, monkeypatch):
+    import jcapy.core.audit as audit
+    path = str(tmp_path / "audit.jsonl")
+    with open(path + ".000001", "w") as f:
+        f.write('{"from": "another process"}\n')
+    # A listing taken before the other process rotated into .000001
+    monkeypatch.setattr(audit, "list_segments", lambda audit_file: [audit_file])
+
+    writer = AuditWriter(path, flush_records=1, max_bytes=10, fsync=False)
+    writer.write('{"from": "this process"}\n')
+    writer.close()
+
+    with open(path + ".000001") as f:
+        assert f.read() == '{"from": "another process"}\n'
+    with open(path + ".000002") as f:
+        assert f.read() == '{"from": "this process"}\n'
+
+
+def test_close_waits_for_compression(tmp_path, monkeypatch):
+    import jcapy.core.audit as audit
+    copy = audit.shutil.copyfileobj
+
+    def slow_copy(src, dst):
+        threading.Event().wait(0.2)
+        copy(src, dst)
+
+    monkeypatch.setattr(audit.shutil, "copyfileobj", slow_copy)
+    path = str(tmp_path / "audit.jsonl")
+    writer = AuditWriter(path, flush_records=1, max_bytes=100, fsync=False, compress=True)
+    for i in range(5):
+        writer.write(json.dumps({"i": i, "pad": "x" * 200}) + "\n")
+        writer.flush()
+    writer.close()
+
+    closed = [p for p in list_segments(path) if p != path]
+    assert len(closed) == 5 and all(p.endswith(".gz") for p in closed)
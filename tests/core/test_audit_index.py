@@ -0,0 +1,155 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from jcapy.commands import audit_cmd
+from jcapy.core import audit_index
+from jcapy.core.audit import AuditLogger, AuditWriter, list_segments
+from jcapy.core.audit_index import AuditIndex, AuditQuery
+from jcapy.core.plugins import CommandRegistry
+from jcapy.core.bootstrap import register_core_commands
+
+
+def write_records(path, records):
+    with open(path, "a") as f:
+        for r in records:
+            f.write(json.dumps(r) + "\n")
+
+
+def record(ts, event_type="TOOL_CALL", session="sess-a", i=0):
+    return {"timestamp": ts, "session_id": session, "agent_id": "agent", "event_type": event_type,
+            "payload": {"i": i}, "outcome": "SUCCESS"}
+
+
+@pytest.fixture
+def audit_file(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    records = []
+    for i in range(300):
+        records.append(record(1000.0 + i, ("TOOL_CALL", "command_intent", "LOGIN")[i % 3],
+                              ("sess-a", "sess-b")[i % 2], i))
+    write_records(path, records)
+    return path
+
+
+def ids(results):
+    return [rec["payload"]["i"] for _, rec in results]
+
+
+def test_filters_by_type_session_and_time(audit_file):
+    index = AuditIndex(audit_file)
+
+    got = ids(index.query(AuditQuery(event_type="TOOL_CALL", session_id="sess-a", start=1100, end=1200)))
+    expected = [i for i in range(100, 200) if i % 3 == 0 and i % 2 == 0]
+    assert got == expected
+    assert index.count(AuditQuery(event_type="LOGIN")) == 100
+    assert ids(index.query(AuditQuery(session_id="sess-*"), limit=3)) == [0, 1, 2]
+
+
+def test_refresh_is_incremental(audit_file):
+    index = AuditIndex(audit_file)
+    assert index.refresh() == 300
+    assert index.refresh() == 0
+
+    write_records(audit_file, [record(2000.0, i=300)])
+    with open(audit_file, "a") as f:
+        f.write('{"timestamp": 2001.0, "event_ty')  # record still being written
+    assert index.refresh() == 1
+    assert index.stats()["events"] == 301
+
+
+def test_concurrent_refreshers_index_each_record_once(audit_file, monkeypatch):
+    # Separate instances share no in-process lock, like two CLI processes
+    monkeypatch.setattr(audit_index, "COMMIT_EVERY", 7)
+    indexes = [AuditIndex(audit_file) for _ in range(4)]
+
+    for round_ in range(3):
+        start = threading.Barrier(len(indexes))
+
+        def refresh(index):
+            start.wait()
+            index.refresh()
+
+        threads = [threading.Thread(target=refresh, args=(index,)) for index in indexes]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        write_records(audit_file, [record(3000.0 + round_ * 100 + i, i=300 + round_ * 100 + i) for i in range(100)])
+
+    assert indexes[0].refresh() == 100
+    assert ids(indexes[1].query()) == list(range(600))
+
+
+def test_keyset_pagination_covers_everything_once(audit_file):
+    index = AuditIndex(audit_file)
+    seen, after = [], None
+    while True:
+        page = list(index.query(AuditQuery(event_type="TOOL_CALL"), limit=17, after=after))
+        if not page:
+            break
+        seen.extend(ids(page))
+        after = page[-1][0]
+    assert seen == list(range(0, 300, 3))
+
+
+def test_survives_rotation_and_compression(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    writer = AuditWriter(path, flush_records=10, max_bytes=3000, fsync=False, compress=False)
+    logger = AuditLogger(audit_file=path, writer=writer)
+    index = AuditIndex(path)
+
+    for i in range(60):
+        logger.log_event("EVENT", "agent", {"i": i})
+        if i % 10 == 9:
+            logger.flush()
+            index.refresh()  # index some rows before they get rotated away
+    for i in range(60, 120):
+        logger.log_event("EVENT", "agent", {"i": i})
+    logger.close()
+
+    # Compress every closed segment after the fact
+    for segment in list_segments(path)[:-1]:
+        AuditWriter._compress(segment)
+    assert any(p.endswith(".gz") for p in list_segments(path))
+
+    assert ids(index.query(AuditQuery(event_type="EVENT"))) == list(range(120))
+    assert index.stats()["events"] == 120
+
+
+def test_deleted_segments_drop_out(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    write_records(path + ".000001", [record(1.0, i=0)])
+    write_records(path, [record(2.0, i=1)])
+    index = AuditIndex(path)
+    assert index.refresh() == 2
+
+    os.remove(path + ".000001")
+    index.refresh()
+    assert ids(index.query()) == [1]
+
+
+def test_cli_query_streams_pages(audit_file, monkeypatch, capsys):
+    monkeypatch.setattr(audit_cmd, "_index", lambda: AuditIndex(audit_file))
+    registry = CommandRegistry()
+    register_core_commands(registry)
+
+    result = registry.execute_string("audit query --type LOGIN --limit 5 --json")
+    lines = "".join(result.logs).strip().splitlines()
+    records = [json.loads(l) for l in lines if l.startswith("{")]
+    assert [r["payload"]["i"] for r in records] == [2, 5, 8, 11, 14]
+    cursor = [l for l in lines if "--after" in l][0].split("--after ")[1].split("\x1b")[0]
+
+    result = registry.execute_string(f"audit query --type LOGIN --limit 5 --json --after {cursor}")
+    records = [json.loads(l) for l in "".join(result.logs).splitlines() if l.startswith("{")]
+    assert [r["payload"]["i"] for r in records] == [17, 20, 23, 26, 29]
+
+
+def test_parse_time_formats():
+    assert audit_cmd.parse_time("1h", now=10000.0) == 6400.0
+    assert audit_cmd.parse_time("1700000000") == 1700000000.0
+    assert audit_cmd.parse_time("2026-01-01") == time.mktime((2026, 1, 1, 0, 0, 0, 0, 0, -1))
+    assert audit_cmd.parse_time(None) is None
@@ -0,0 +1,112 @@
+import argparse
+import importlib
+import sys
+
+import pytest
+
+from jcapy.core.bootstrap import CORE_COMMANDS, register_core_commands
+from jcapy.core.plugins import CommandRegistry, CommandSpec, LazyHandler
+
+
+def _describe(parser):
+    """Structural fingerprint of an argparse parser, including subcommands."""
+    out = []
+    for action in parser._actions:
+        entry = (tuple(action.option_strings), action.dest, action.nargs,
+                 tuple(action.choices) if isinstance(action.choices, list) else None,
+                 action.default, action.help)
+        if isinstance(action, argparse._SubParsersAction):
+            entry += (tuple((name, tuple(_describe(sub))) for name, sub in action.choices.items()),)
+        out.append(entry)
+    return out
+
+
+def _class_specs():
+    for spec in CORE_COMMANDS:
+        module_name, _, attr = spec.target.partition(":")
+        if attr.endswith("Command"):
+            yield spec, module_name, attr
+
+
+@pytest.mark.parametrize("spec,module_name,attr", list(_class_specs()), ids=lambda v: getattr(v, "name", None))
+def test_manifest_matches_command_class(spec, module_name, attr):
+    cls = getattr(importlib.import_module(module_name), attr)
+    cmd = cls()
+
+    assert spec.name == cmd.name
+    assert spec.description == cmd.description
+    assert tuple(spec.aliases) == tuple(getattr(cmd, "aliases", []))
+    if getattr(cmd, "is_interactive", False):
+        assert spec.interactive
+
+    expected = argparse.ArgumentParser(add_help=False)
+    cmd.setup_parser(expected)
+    actual = argparse.ArgumentParser(add_help=False)
+    if spec.setup_parser:
+        spec.setup_parser(actual)
+    assert _describe(actual) == _describe(expected)
+
+
+def test_manifest_targets_resolve():
+    missing = []
+    for spec in CORE_COMMANDS:
+        module_name, _, attr = spec.target.partition(":")
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError as e:
+            if e.name == module_name:
+                missing.append(spec.name)
+            continue  # otherwise an optional third-party dependency is absent
+        assert hasattr(module, attr), spec.target
+    # rapid_fix has no implementation yet; everything else must resolve
+    assert missing == ["fix"]
+
+
+def test_register_core_commands_is_lazy():
+    registry = CommandRegistry()
+    register_core_commands(registry)
+
+    handler = registry.get_handler("ls")
+    assert isinstance(handler, LazyHandler)
+    assert registry.get_handler("sync") is not None
+    assert registry.get_handler("push") is not None
+    assert "edit" in registry.get_interactive_defaults()
+
+
+def test_lazy_handler_imports_on_first_call(tmp_path, monkeypatch):
+    (tmp_path / "lazy_cmd_mod.py").write_text(
+        "CALLS = []\n"
+        "def no_args():\n"
+        "    CALLS.append('no_args')\n"
+        "    return 'plain'\n"
+        "def with_args(args):\n"
+        "    CALLS.append(args._tokens)\n"
+        "def named(value):\n"
+        "    return f'value={value}'\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    registry = CommandRegistry()
+    registry.register_manifest([
+        CommandSpec("plain", "lazy_cmd_mod:no_args", "No args"),
+        CommandSpec("tokens", "lazy_cmd_mod:with_args", "Args"),
+        CommandSpec("named", "lazy_cmd_mod:named", "Adapter",
+                    setup_parser=lambda p: p.add_argument("value"),
+                    adapter=lambda fn, args: fn(args.value)),
+    ])
+    assert "lazy_cmd_mod" not in sys.modules
+
+    assert registry.execute_string("plain").logs == ["plain"]
+    assert "lazy_cmd_mod" in sys.modules
+    registry.execute_string("tokens a b")
+    assert sys.modules["lazy_cmd_mod"].CALLS == ["no_args", ["a", "b"]]
+    assert registry.execute_string("named 42").logs == ["value=42"]
+
+
+def test_lazy_handler_import_error_is_reported():
+    registry = CommandRegistry()
+    registry.register_manifest([CommandSpec("ghost", "jcapy.no_such_module:run", "Missing")])
+
+    result = registry.execute_string("ghost")
+    assert result.error_code == "ModuleNotFoundError"
+    assert not registry.get_handler("ghost").is_loaded
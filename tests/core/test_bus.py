@@ -1,5 +1,8 @@
+import threading
+import time
+
 import pytest
-from jcapy.core.bus import EventBus
+from jcapy.core.bus import EventBus, OverflowPolicy
 
 def test_bus_subscription_delivery():
     bus = EventBus()
@@ -44,3 +47,171 @@ def test_bus_error_isolation():
     bus.publish("FAIL", "test")
 
     assert received == ["test"]
+
+def test_bus_background_dispatch_preserves_topic_order():
+    bus = EventBus()
+    received = []
+    publisher_thread = threading.current_thread()
+    threads = set()
+
+    def callback(payload):
+        threads.add(threading.current_thread())
+        received.append(payload)
+
+    bus.subscribe("ORDERED", callback)
+    bus.start(workers=4)
+    for i in range(500):
+        bus.publish("ORDERED", i)
+    assert bus.flush(timeout=5)
+    bus.stop()
+
+    assert received == list(range(500))
+    assert publisher_thread not in threads
+
+def test_bus_slow_subscriber_does_not_block_publisher():
+    bus = EventBus()
+    release = threading.Event()
+    bus.subscribe("SLOW", lambda p: release.wait(5))
+    bus.start(workers=1)
+
+    start = time.monotonic()
+    bus.publish("SLOW", "x")
+    assert time.monotonic() - start < 0.5
+
+    release.set()
+    assert bus.stop()
+    assert not bus.is_async
+
+def test_bus_overflow_drop_newest():
+    bus = EventBus()
+    release = threading.Event()
+    received = []
+
+    def callback(p):
+        release.wait(5)
+        received.append(p)
+
+    bus.subscribe("FULL", callback)
+    bus.start(workers=1, max_queue=2, overflow=OverflowPolicy.DROP_NEWEST)
+    bus.publish("FULL", 0)  # picked up by the worker, which then blocks
+    deadline = time.monotonic() + 2
+    while bus.stats()["queue_depth"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    for i in range(1, 6):
+        bus.publish("FULL", i)
+
+    assert bus.stats()["dropped"] == 3
+    release.set()
+    bus.stop()
+    assert received == [0, 1, 2]
+
+def test_bus_overflow_drop_oldest():
+    bus = EventBus()
+    release = threading.Event()
+    received = []
+
+    def callback(p):
+        release.wait(5)
+        received.append(p)
+
+    bus.subscribe("FULL", callback)
+    bus.start(workers=1, max_queue=2, overflow=OverflowPolicy.DROP_OLDEST)
+    bus.publish("FULL", 0)
+    deadline = time.monotonic() + 2
+    while bus.stats()["queue_depth"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    for i in range(1, 6):
+        bus.publish("FULL", i)
+
+    release.set()
+    bus.stop()
+    assert received == [0, 4, 5]
+
+def test_bus_nested_publish_from_worker():
+    bus = EventBus()
+    received = []
+    bus.subscribe("OUTER", lambda p: bus.publish("OUTER_ECHO", p))
+    bus.subscribe("OUTER_ECHO", received.append)
+    bus.start(workers=1, max_queue=1)
+
+    for i in range(20):
+        bus.publish("OUTER", i)
+    assert bus.flush(timeout=5)
+    bus.stop()
+    assert received == list(range(20))
+
+def test_bus_reentrant_publish_keeps_topic_order():
+    bus = EventBus()
+    release = threading.Event()
+    received = []
+
+    def callback(p):
+        if p == "first":
+            release.wait(5)
+            bus.publish("T", "echo")  # must not overtake events already queued
+        received.append(p)
+
+    bus.subscribe("T", callback)
+    bus.start(workers=1, max_queue=2)
+    bus.publish("T", "first")
+    bus.publish("T", "a")
+    bus.publish("T", "b")  # queue is now full
+    release.set()
+    assert bus.flush(timeout=5)
+    bus.stop()
+    assert received == ["first", "a", "b", "echo"]
+
+def test_bus_workers_publishing_across_full_shards_do_not_deadlock():
+    bus = EventBus()
+    bus.start(workers=2, max_queue=1, block_timeout=5)  # fail, rather than hang, on a deadlock
+    ping = "PING"
+    pong = next(t for t in (f"PONG{i}" for i in range(100)) if hash(t) % 2 != hash(ping) % 2)
+    received = []
+
+    def relay(to):
+        def handler(depth):
+            received.append(depth)
+            time.sleep(0.001)
+            if depth < 3:
+                for _ in range(3):
+                    bus.publish(to, depth + 1)
+        return handler
+
+    bus.subscribe(ping, relay(pong))
+    bus.subscribe(pong, relay(ping))
+    for _ in range(10):
+        bus.publish(ping, 0)
+    assert bus.flush(timeout=10)
+    bus.stop()
+    assert len(received) == 10 * (1 + 3 + 9 + 27)
+    assert bus.stats()["dropped"] == 0
+
+def test_bus_stop_timing_out_on_a_full_queue_keeps_order_and_stops_later():
+    bus = EventBus()
+    release = threading.Event()
+    received = []
+
+    def callback(p):
+        if p == 0:
+            release.wait(5)
+        received.append(p)
+
+    bus.subscribe("T", callback)
+    bus.start(workers=1, max_queue=2)
+    bus.publish("T", 0)  # picked up by the worker, which then blocks
+    deadline = time.monotonic() + 2
+    while bus.stats()["queue_depth"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    bus.publish("T", 1)
+    bus.publish("T", 2)  # queue is now full
+
+    assert not bus.stop(timeout=0.2)
+    assert not bus.is_async and bus.stats()["workers"] == 1
+    bus.publish("T", 3)  # inline now
+    release.set()
+
+    assert bus.stop(timeout=5)
+    assert bus.stats()["workers"] == 0
+    # Events left queued by the timed-out stop are discarded, not delivered after newer ones
+    assert received == [3, 0]
+    assert bus.stats()["dropped"] == 2
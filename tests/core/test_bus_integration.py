@@ -26,6 +26,7 @@ def test_decoupled_audit_logging(temp_audit_file):
     }
 
     bus.publish("AUDIT_LOG", event_payload)
+    assert logger.flush()
 
     # Check if the logger captured it
     assert os.path.exists(temp_audit_file)
@@ -0,0 +1,89 @@
+import threading
+
+from jcapy.core.base import ResultStatus
+from jcapy.core.plugins import CommandRegistry
+
+
+def _setup(parser):
+    parser.add_argument("name")
+    parser.add_argument("--count", type=int, default=1)
+
+
+def test_parser_is_built_once_and_reused():
+    calls = []
+
+    def setup(parser):
+        calls.append(1)
+        _setup(parser)
+
+    registry = CommandRegistry()
+    registry.register("greet", lambda args: f"hi {args.name} x{args.count}", "Greet", aliases=["g"], setup_parser=setup)
+
+    first = registry._execute_single_command("greet bob --count 2")
+    second = registry._execute_single_command("g alice")
+
+    assert first.logs == ["hi bob x2"]
+    assert second.logs == ["hi alice x1"]
+    assert len(calls) == 1
+
+
+def test_reregister_invalidates_cached_meta():
+    registry = CommandRegistry()
+    registry.register("cmd", lambda: "old", "Old")
+    assert registry._execute_single_command("cmd").logs == ["old"]
+
+    registry.register("cmd", lambda args: f"new {args.name}", "New", setup_parser=_setup)
+    assert registry._execute_single_command("cmd x").logs == ["new x"]
+
+
+def test_parse_errors_fall_back_to_mock_args():
+    registry = CommandRegistry()
+    registry.register("strict", lambda args: f"tokens={args._tokens}", "Strict", setup_parser=_setup)
+
+    # Missing positional -> SilentParser raises -> MockArgs path
+    result = registry._execute_single_command("strict")
+    assert result.status == ResultStatus.SUCCESS
+    assert result.logs == ["tokens=[]"]
+
+
+def test_concurrent_dispatch_shares_parser():
+    registry = CommandRegistry()
+    registry.register("greet", lambda args: f"{args.name}:{args.count}", "Greet", setup_parser=_setup)
+    results, errors = [], []
+
+    def worker(i):
+        try:
+            for j in range(50):
+                res = registry._execute_single_command(f"greet w{i} --count {j}")
+                if res.logs != [f"w{i}:{j}"]:
+                    errors.append(res.logs)
+            results.append(i)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert len(results) == 8
+
+
+def test_interactive_override_resets_when_key_is_removed(monkeypatch):
+    import jcapy.config
+    values = {"commands.interactive": "plain"}
+    monkeypatch.setattr(jcapy.config.CONFIG_MANAGER, "get", lambda key, default=None: values.get(key, default))
+
+    registry = CommandRegistry()
+    registry.register("edit", lambda: None, "Edit", interactive=True)
+    registry.register("plain", lambda: None, "Plain")
+
+    registry.apply_config_overrides()
+    assert registry._interactive == {"plain"}
+
+    del values["commands.interactive"]
+    registry.apply_config_overrides()
+    assert registry._interactive == {"edit"}
+    assert registry.get_interactive_defaults() == {"edit"}
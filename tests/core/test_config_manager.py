@@ -1,9 +1,10 @@
 import os
 import json
+import time
 import unittest
 import tempfile
 import shutil
-from jcapy.core.config_manager import ConfigManager
+from jcapy.core.config_manager import ConfigManager, FrozenDict, diff_config, thaw
 
 class TestConfigManager(unittest.TestCase):
     def setUp(self):
@@ -93,5 +94,248 @@ class TestConfigManager(unittest.TestCase):
             del os.environ["JCAPY__NESTED__KEY"]
 
 
+    def test_snapshots_are_immutable_and_versioned(self):
+        cm = ConfigManager(self.config_file)
+        cm.set("dashboard.layout", {"left": ["Clock", "News"]})
+        before = cm.snapshot()
+
+        layout = cm.get("dashboard.layout")
+        self.assertIsInstance(layout, FrozenDict)
+        self.assertEqual(layout["left"], ("Clock", "News"))
+        with self.assertRaises(TypeError):
+            layout["left"] = ()
+        with self.assertRaises(TypeError):
+            cm.get_all()["dashboard"] = {}
+
+        # Reads hand out the stored object, not a copy
+        self.assertIs(cm.get("dashboard.layout"), layout)
+
+        cm.set("dashboard.theme", "nord")
+        after = cm.snapshot()
+        self.assertGreater(after.version, before.version)
+        self.assertIsNone(before.get("dashboard.theme"))  # old snapshot unchanged
+        self.assertEqual(after.get("dashboard.theme"), "nord")
+        self.assertIs(after.get("dashboard.layout"), layout)  # untouched branches are shared
+
+    def test_thaw_gives_editable_copy_and_json_roundtrips(self):
+        cm = ConfigManager(self.config_file)
+        cm.set("personas", {"dev": {"path": "/tmp/dev", "tags": ["a"]}})
+        editable = thaw(cm.get_all())
+        editable["personas"]["dev"]["tags"].append("b")
+        cm.set_all(editable)
+
+        with open(self.config_file) as f:
+            self.assertEqual(json.load(f), {"personas": {"dev": {"path": "/tmp/dev", "tags": ["a", "b"]}}})
+        version = cm.version
+        cm.set("personas.dev.tags", ["a", "b"])  # same value as a list: no new version
+        self.assertEqual(cm.version, version)
+
+
+    def _spy(self, cm):
+        class MockApp:
+            def __init__(self): self.messages = []
+            def post_message(self, msg): self.messages.append(msg)
+        app = MockApp()
+        cm.bind_app(app)
+        saves = []
+        real_save = cm._save
+        cm._save = lambda: (saves.append(1), real_save())
+        return app, saves
+
+    def test_transaction_writes_once_with_all_keys(self):
+        cm = ConfigManager(self.config_file)
+        app, saves = self._spy(cm)
+
+        with cm.transaction():
+            cm.set("dashboard_dimensions.sidebar", 30)
+            cm.set("dashboard_layout.left_col", ["Clock"])
+            cm.set("dashboard_dimensions.sidebar", 32)
+            self.assertEqual(cm.get("dashboard_dimensions.sidebar"), 32)  # visible immediately
+            self.assertEqual(saves, [])
+
+        self.assertEqual(len(saves), 1)
+        self.assertEqual(len(app.messages), 1)
+        msg = app.messages[0]
+        self.assertEqual(msg.key, "*")
+        self.assertEqual(set(msg.keys), {"dashboard_dimensions.sidebar", "dashboard_layout.left_col"})
+        self.assertTrue(msg.touches("dashboard_layout"))
+        self.assertFalse(msg.touches("ux.theme"))
+        self.assertEqual(ConfigManager(self.config_file).get("dashboard_dimensions.sidebar"), 32)
+
+    def test_transaction_rolls_back_on_error(self):
+        cm = ConfigManager(self.config_file)
+        cm.set("ux.theme", "nord")
+        app, saves = self._spy(cm)
+
+        with self.assertRaises(RuntimeError):
+            with cm.transaction():
+                cm.set("ux.theme", "dracula")
+                raise RuntimeError("boom")
+
+        self.assertEqual(cm.get("ux.theme"), "nord")
+        self.assertEqual((saves, app.messages), ([], []))
+
+    def test_debounced_sets_coalesce(self):
+        cm = ConfigManager(self.config_file, save_delay=0.05)
+        app, saves = self._spy(cm)
+
+        for width in range(20, 40):
+            cm.set("dashboard_dimensions.sidebar", width)
+        self.assertFalse(os.path.exists(self.config_file))
+        self.assertEqual(cm.pending_keys, ("dashboard_dimensions.sidebar",))
+
+        deadline = time.time() + 2
+        while cm.pending_keys and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(saves), 1)
+        self.assertEqual([(m.key, m.value) for m in app.messages], [("dashboard_dimensions.sidebar", 39)])
+        self.assertEqual(ConfigManager(self.config_file).get("dashboard_dimensions.sidebar"), 39)
+
+        cm.set("ux.theme", "nord")
+        self.assertTrue(cm.flush())  # explicit flush doesn't wait for the timer
+        self.assertFalse(cm.flush())
+        self.assertEqual(ConfigManager(self.config_file).get("ux.theme"), "nord")
+
+    def test_debounce_restarts_on_each_set_up_to_max_delay(self):
+        cm = ConfigManager(self.config_file, save_delay=0.1, max_delay=0.6)
+        app, saves = self._spy(cm)
+
+        # A burst lasting longer than save_delay is still one write...
+        for width in range(4):
+            cm.set("dashboard_dimensions.sidebar", width)
+            time.sleep(0.05)
+        self.assertEqual(saves, [])
+        deadline = time.time() + 2
+        while cm.pending_keys and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(saves), 1)
+
+        # ...but one that never pauses is written once max_delay has passed
+        start = time.time()
+        width = 100
+        while not len(saves) > 1 and time.time() - start < 2:
+            cm.set("dashboard_dimensions.sidebar", width)
+            width += 1
+            time.sleep(0.02)
+        self.assertEqual(len(saves), 2)
+        self.assertLess(time.time() - start, 1.2)
+        cm.flush()
+
+    def test_failed_write_keeps_previous_file(self):
+        cm = ConfigManager(self.config_file)
+        cm.set("ux.theme", "nord")
+
+        from unittest import mock
+        with mock.patch("jcapy.core.config_manager.json.dump", side_effect=OSError("disk full")):
+            cm.set("ux.theme", "dracula")
+
+        self.assertEqual(ConfigManager(self.config_file).get("ux.theme"), "nord")
+        self.assertEqual(sorted(os.listdir(self.test_dir)), ["config.json", "config.json.lock"])  # no stray temp file
+
+
+    def test_detects_changes_from_other_processes(self):
+        daemon = ConfigManager(self.config_file)
+        cli = ConfigManager(self.config_file)
+        app, _ = self._spy(daemon)
+        seen = []
+        daemon.subscribe(seen.append)
+
+        self.assertEqual(daemon.check_for_changes(), {})
+        cli.set("ux.theme", "nord")
+        daemon.set("core.persona", "writer")  # our own write is not a "change from disk"
+        self.assertEqual(app.messages[-1].key, "core.persona")
+
+        # The daemon's write came after the CLI's and folded it in
+        self.assertEqual(daemon.get("ux.theme"), "nord")
+        self.assertEqual(seen, [{"ux.theme": (None, "nord")}])
+
+        with cli.transaction():
+            cli.set("ux.theme", "dracula")
+            cli.set("commands.disabled", "sync")
+        changes = daemon.check_for_changes()
+        self.assertEqual(changes, {"ux.theme": ("nord", "dracula"), "commands.disabled": (None, "sync")})
+        self.assertEqual(daemon.get("commands.disabled"), "sync")
+        self.assertEqual(set(app.messages[-1].keys), {"ux.theme", "commands.disabled"})
+        self.assertEqual(daemon.check_for_changes(), {})
+
+    def test_concurrent_writers_keep_each_others_keys(self):
+        import threading
+        from unittest import mock
+        import jcapy.core.config_manager as config_manager
+
+        writers = [ConfigManager(self.config_file) for _ in range(4)]
+        start = threading.Barrier(len(writers))
+        real_dump = config_manager.json.dump
+
+        def slow_dump(*args, **kwargs):
+            time.sleep(0.02)  # widen the gap between re-reading and replacing
+            real_dump(*args, **kwargs)
+
+        def write(i, cm):
+            start.wait()
+            cm.set(f"writers.w{i}", i)
+
+        with mock.patch.object(config_manager.json, "dump", side_effect=slow_dump):
+            threads = [threading.Thread(target=write, args=(i, cm)) for i, cm in enumerate(writers)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        self.assertEqual(thaw(ConfigManager(self.config_file).get("writers")), {f"w{i}": i for i in range(4)})
+
+    def test_subscriber_errors_are_logged(self):
+        daemon = ConfigManager(self.config_file)
+        daemon.subscribe(lambda changes: 1 / 0)
+        ConfigManager(self.config_file).set("ux.theme", "nord")
+        with self.assertLogs("jcapy.config", level="ERROR") as logs:
+            daemon.check_for_changes()
+        self.assertIn("Config subscriber error", logs.output[0])
+
+    def test_unsaved_local_changes_survive_reload(self):
+        tui = ConfigManager(self.config_file, save_delay=60)
+        cli = ConfigManager(self.config_file)
+        tui.set("dashboard_dimensions.sidebar", 40)
+        cli.set("ux.theme", "nord")
+
+        tui.check_for_changes()
+        self.assertEqual(tui.get("dashboard_dimensions.sidebar"), 40)
+        self.assertEqual(tui.get("ux.theme"), "nord")
+        tui.flush()
+        fresh = ConfigManager(self.config_file)
+        self.assertEqual((fresh.get("ux.theme"), fresh.get("dashboard_dimensions.sidebar")), ("nord", 40))
+
+    def test_get_does_not_touch_the_filesystem(self):
+        from unittest import mock
+        cm = ConfigManager(self.config_file)
+        cm.set("ux.theme", "nord")
+        with mock.patch("jcapy.core.config_manager.os.stat", side_effect=AssertionError("stat on get")):
+            self.assertEqual(cm.get("ux.theme"), "nord")
+            cm.snapshot()
+
+    def test_watch_reloads_in_background(self):
+        watcher = ConfigManager(self.config_file)
+        seen = []
+        watcher.subscribe(seen.append)
+        watcher.watch(interval=0.01)
+        try:
+            ConfigManager(self.config_file).set("ux.theme", "nord")
+            deadline = time.time() + 2
+            while not seen and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            watcher.stop_watching()
+        self.assertEqual(seen, [{"ux.theme": (None, "nord")}])
+        self.assertEqual(watcher.get("ux.theme"), "nord")
+
+    def test_diff_config(self):
+        shared = FrozenDict({"big": 1})
+        old = {"a": {"b": 1, "c": [1]}, "gone": True, "same": shared}
+        new = {"a": {"b": 2, "c": [1]}, "added": {"x": 1}, "same": shared}
+        self.assertEqual(diff_config(old, new), {
+            "a.b": (1, 2), "gone": (True, None), "added.x": (None, 1),
+        })
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,126 @@
+import json
+import multiprocessing
+import os
+
+from jcapy.core.history import CommandHistoryManager
+
+
+def make(tmp_path, **kwargs):
+    return CommandHistoryManager(history_file=str(tmp_path / "history.jsonl"), **kwargs)
+
+
+def test_dedupe_moves_repeats_to_the_end(tmp_path):
+    history = make(tmp_path)
+    for cmd in ["ls", "git status", "ls", "ls", "  ", "grep foo"]:
+        history.add_command(cmd)
+    assert history.get_history() == ["git status", "ls", "grep foo"]
+
+    # Reloads from the log in the same order
+    assert make(tmp_path).get_history() == ["git status", "ls", "grep foo"]
+
+
+def test_log_is_append_only_and_compacts(tmp_path):
+    history = make(tmp_path, max_entries=10)
+    path = tmp_path / "history.jsonl"
+
+    for i in range(5):
+        history.add_command(f"cmd {i}")
+    before = path.read_bytes()
+    history.add_command("cmd 5")
+    assert path.read_bytes().startswith(before)
+    assert len(path.read_text().splitlines()) == 6
+
+    for i in range(100):
+        history.add_command(f"cmd {i % 15}")
+    lines = path.read_text().splitlines()
+    assert len(lines) <= 20
+    assert history.get_history() == [f"cmd {i}" for i in range(10)]
+    assert make(tmp_path, max_entries=10).get_history() == history.get_history()
+
+
+def test_prefix_and_substring_search_rank_by_recency(tmp_path):
+    history = make(tmp_path)
+    for cmd in ["git status", "git push origin main", "grep -r main", "git log", "ls"]:
+        history.add_command(cmd)
+
+    assert history.search_prefix("git") == ["git log", "git push origin main", "git status"]
+    assert history.search_prefix("git", limit=1) == ["git log"]
+    assert history.search_prefix("zz") == []
+    assert history.search("main") == ["grep -r main", "git push origin main"]
+    assert history.search("s") == ["ls", "git push origin main", "git status"]
+
+    history.add_command("git status")
+    assert history.search_prefix("git")[0] == "git status"
+
+
+def test_evicted_entries_leave_the_indexes(tmp_path):
+    history = make(tmp_path, max_entries=3)
+    for cmd in ["alpha one", "alpha two", "beta", "gamma"]:
+        history.add_command(cmd)
+    assert history.search_prefix("alpha") == ["alpha two"]
+    assert history.search("one") == []
+
+
+def test_sees_commands_from_other_instances(tmp_path):
+    cli, daemon = make(tmp_path), make(tmp_path)
+    cli.add_command("ls")
+    daemon.add_command("sync")
+    cli.add_command("ls")
+    assert cli.get_history() == daemon.get_history() == ["sync", "ls"]
+
+    daemon.clear()
+    assert cli.get_history() == []
+
+
+def test_partial_lines_are_ignored_until_complete(tmp_path):
+    history = make(tmp_path)
+    history.add_command("one")
+    with open(tmp_path / "history.jsonl", "a") as f:
+        f.write('"tw')
+    assert history.get_history() == ["one"]
+    with open(tmp_path / "history.jsonl", "a") as f:
+        f.write('o"\n')
+    assert history.get_history() == ["one", "two"]
+
+
+def test_migrates_legacy_json(tmp_path):
+    (tmp_path / "history.json").write_text(json.dumps(["a", "b"]))
+    assert make(tmp_path).get_history() == ["a", "b"]
+    assert (tmp_path / "history.json.bak").exists()
+
+
+def _append_many(path, worker, max_entries):
+    history = CommandHistoryManager(history_file=path, max_entries=max_entries)
+    for i in range(100):
+        history.add_command(f"w{worker} {i}")
+
+
+def _run_workers(path, max_entries):
+    ctx = multiprocessing.get_context("fork" if hasattr(os, "fork") else "spawn")
+    procs = [ctx.Process(target=_append_many, args=(path, w, max_entries)) for w in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(30)
+        assert p.exitcode == 0
+    with open(path) as f:
+        return [json.loads(line) for line in f]  # every line is intact
+
+
+def test_concurrent_processes_lose_nothing(tmp_path):
+    path = str(tmp_path / "history.jsonl")
+    commands = _run_workers(path, max_entries=1000)
+    assert sorted(commands) == sorted(f"w{w} {i}" for w in range(4) for i in range(100))
+    for w in range(4):
+        mine = [int(c.split()[1]) for c in commands if c.startswith(f"w{w} ")]
+        assert mine == list(range(100))
+
+
+def test_concurrent_processes_with_compaction(tmp_path):
+    path = str(tmp_path / "history.jsonl")
+    commands = _run_workers(path, max_entries=50)
+    assert len(commands) <= 100
+    for w in range(4):
+        mine = [int(c.split()[1]) for c in commands if c.startswith(f"w{w} ")]
+        assert mine == sorted(mine)
+    assert len(CommandHistoryManager(history_file=path, max_entries=50).get_history()) == 50
@@ -0,0 +1,162 @@
+import os
+import time
+
+import pytest
+
+from jcapy.core.skill_catalog import SkillCatalog
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def bump_dir_mtime(path):
+    # Some filesystems have coarse mtimes; make a directory change visible
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def library(tmp_path):
+    lib = tmp_path / "library"
+    write(lib / "README.md", "# Library\n")
+    write(lib / "skills" / "devops" / "deploy_fly.md",
+          "---\ntitle: Deploy to Fly\ngrade: A\ntags: [deploy, fly]\n---\n# ignored\n")
+    write(lib / "skills" / "frontend" / "react_vite.md", "# React + Vite\nBody\n")
+    write(lib / "skills" / "frontend" / "setup.sh", "echo hi\n")
+    write(lib / ".git" / "HEAD", "ref: main\n")
+    return lib
+
+
+def make(library, tmp_path, **kwargs):
+    return SkillCatalog(str(library), db_path=str(tmp_path / "catalog.db"), **kwargs)
+
+
+def test_catalogs_files_with_metadata(library, tmp_path):
+    catalog = make(library, tmp_path)
+    entries = {e.rel_path: e for e in catalog.entries()}
+    assert set(entries) == {"README.md", "skills/devops/deploy_fly.md",
+                            "skills/frontend/react_vite.md", "skills/frontend/setup.sh"}
+
+    fly = entries["skills/devops/deploy_fly.md"]
+    assert fly.title == "Deploy to Fly"
+    assert fly.metadata["tags"] == ["deploy", "fly"]
+    assert fly.category == "skills/devops"
+    assert fly.path == str(library / "skills" / "devops" / "deploy_fly.md")
+    assert entries["skills/frontend/react_vite.md"].title == "React + Vite"
+    assert entries["skills/frontend/setup.sh"].metadata == {}
+
+    assert [e.rel_path for e in catalog.entries(under="skills/frontend", markdown_only=True)] == \
+        ["skills/frontend/react_vite.md"]
+
+
+def test_find_prefers_exact_then_fuzzy(library, tmp_path):
+    catalog = make(library, tmp_path)
+    write(library / "skills" / "misc" / "deploy_fly_v2.md", "# v2\n")
+
+    assert catalog.find("deploy_fly").rel_path == "skills/devops/deploy_fly.md"
+    assert catalog.find("deploy_fly.md").rel_path == "skills/devops/deploy_fly.md"
+    assert catalog.find("setup.sh").name == "setup.sh"
+    assert catalog.find("REACT").name == "react_vite.md"
+    assert catalog.find("setup") is None            # fuzzy only matches markdown
+    assert catalog.find("REACT", fuzzy=False) is None
+    assert catalog.find("deploy_fly", under="skills/misc").name == "deploy_fly_v2.md"
+
+
+def test_refresh_rescans_only_changed_directories(library, tmp_path):
+    catalog = make(library, tmp_path, verify_interval=3600)
+    assert len(catalog.refresh().updated) == 4
+    assert not catalog.refresh()
+
+    write(library / "skills" / "frontend" / "vue.md", "# Vue\n")
+    bump_dir_mtime(library / "skills" / "frontend")
+    changes = catalog.refresh()
+    assert changes.updated == ["skills/frontend/vue.md"] and changes.removed == []
+
+    (library / "skills" / "devops" / "deploy_fly.md").unlink()
+    bump_dir_mtime(library / "skills" / "devops")
+    assert catalog.refresh().removed == ["skills/devops/deploy_fly.md"]
+
+    write(library / "skills" / "new" / "deep" / "x.md", "# X\n")
+    bump_dir_mtime(library / "skills")
+    assert catalog.refresh().updated == ["skills/new/deep/x.md"]
+    assert catalog.find("x").category == "skills/new/deep"
+
+
+def test_in_place_edits_need_touch_or_verify(library, tmp_path):
+    catalog = make(library, tmp_path, verify_interval=3600)
+    catalog.refresh()
+    path = library / "skills" / "frontend" / "react_vite.md"
+    dir_mtime = os.stat(path.parent).st_mtime_ns
+    write(path, "---\ntitle: React 19\n---\n")
+    os.utime(path.parent, ns=(dir_mtime, dir_mtime))
+
+    assert catalog.find("react_vite").title == "React + Vite"   # directory unchanged
+    catalog.touch(str(path))
+    assert catalog.find("react_vite").title == "React 19"
+
+    write(path, "# React 20\n")
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 2_000_000_000))
+    os.utime(path.parent, ns=(dir_mtime, dir_mtime))
+    assert catalog.refresh(full=True).updated == ["skills/frontend/react_vite.md"]
+    assert catalog.find("react_vite").title == "React 20"
+
+    path.unlink()
+    catalog.touch(str(path))
+    assert catalog.find("react_vite", fuzzy=False) is None
+
+
+def test_persists_across_instances_and_drops_removed_library(library, tmp_path):
+    make(library, tmp_path).refresh()
+    again = make(library, tmp_path)
+    assert not again.refresh()
+    assert len(again.entries(refresh=False)) == 4
+
+    import shutil
+    shutil.rmtree(library)
+    assert len(again.refresh().removed) == 4
+    assert again.entries() == []
+
+
+def test_search_ranks_title_hits_and_follows_edits(library, tmp_path):
+    catalog = make(library, tmp_path)
+    write(library / "skills" / "misc" / "notes.md", "# Notes\nWe once tried to deploy with rsync.\n")
+
+    hits = catalog.search("deploy")
+    assert [h.entry.name for h in hits] == ["deploy_fly.md", "notes.md"]
+    assert "[deploy]" in hits[1].snippet
+    assert [h.entry.name for h in catalog.search("fly deplo")] == ["deploy_fly.md"]   # all words, last as prefix
+    assert [h.entry.name for h in catalog.search("deploy", under="skills/misc")] == ["notes.md"]
+    assert catalog.search("echo") == []              # only markdown is indexed
+    assert catalog.search('"react)*') != []      # query syntax is taken literally
+    assert catalog.search("   ") == []
+
+    path = library / "skills" / "misc" / "notes.md"
+    write(path, "# Notes\nNothing to see.\n")
+    catalog.touch(str(path))
+    assert [h.entry.name for h in catalog.search("deploy")] == ["deploy_fly.md"]
+    path.unlink()
+    catalog.touch(str(path))
+    assert catalog.search("nothing") == []
+
+
+def test_search_sees_in_place_edits_and_is_unlimited(library, tmp_path):
+    catalog = make(library, tmp_path, verify_interval=3600, file_check_interval=0)
+    assert [h.entry.name for h in catalog.search("vite")] == ["react_vite.md"]
+
+    path = library / "skills" / "frontend" / "react_vite.md"
+    dir_mtime = os.stat(path.parent).st_mtime_ns
+    write(path, "# React + Vite\nNow about zebrafish.\n")
+    os.utime(path.parent, ns=(dir_mtime, dir_mtime))   # directory looks unchanged
+
+    assert [h.entry.name for h in make(library, tmp_path).search("zebrafish")] == ["react_vite.md"]
+    write(path, "# React + Vite\nNow about axolotls.\n")
+    os.utime(path.parent, ns=(dir_mtime, dir_mtime))
+    assert [h.entry.name for h in catalog.search("axolotls")] == ["react_vite.md"]
+    assert catalog.search("zebrafish") == []
+
+    for i in range(30):
+        write(library / "skills" / "bulk" / f"note_{i:02d}.md", f"# Note {i}\nshared term\n")
+    assert len(catalog.search("shared")) == 30
+    assert len(catalog.search("shared", limit=5)) == 5
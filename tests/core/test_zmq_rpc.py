@@ -0,0 +1,159 @@
+import json
+import socket
+import types
+import threading
+import time
+
+import pytest
+
+zmq = pytest.importorskip("zmq")
+
+from jcapy.core.zmq_publisher import ZmqRpcServer
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _handler(command, params):
+    if command == "SLOW":
+        time.sleep(params.get("seconds", 1))
+        return {"slept": params.get("seconds", 1)}
+    if command == "FAIL":
+        raise ValueError("bad")
+    if command == "OPAQUE":
+        return object()
+    return {"echo": command}
+
+
+@pytest.fixture
+def rpc_server():
+    server = ZmqRpcServer(port=_free_port(), bind_addr="tcp://127.0.0.1", command_handler=_handler, workers=3)
+    assert server.start()
+    yield server
+    server.stop()
+
+
+def _request(port, payload, timeout_ms=5000):
+    ctx = zmq.Context.instance()
+    sock = ctx.socket(zmq.REQ)
+    sock.setsockopt(zmq.RCVTIMEO, timeout_ms)
+    sock.setsockopt(zmq.LINGER, 0)
+    sock.connect(f"tcp://127.0.0.1:{port}")
+    try:
+        sock.send_string(payload if isinstance(payload, str) else json.dumps(payload))
+        return json.loads(sock.recv_string())
+    finally:
+        sock.close()
+
+
+def test_req_client_wire_compatibility(rpc_server):
+    assert _request(rpc_server.port, {"command": "PING"}) == {"status": "ok", "result": {"echo": "PING"}}
+    assert _request(rpc_server.port, "not json") == {"status": "error", "message": "Invalid JSON"}
+    assert _request(rpc_server.port, {"command": "FAIL"}) == {"status": "error", "message": "bad"}
+
+
+def test_unencodable_requests_and_results_do_not_lose_workers():
+    server = ZmqRpcServer(port=_free_port(), bind_addr="tcp://127.0.0.1", command_handler=_handler, workers=1)
+    assert server.start()
+    try:
+        ctx = zmq.Context.instance()
+        sock = ctx.socket(zmq.REQ)
+        sock.setsockopt(zmq.RCVTIMEO, 5000)
+        sock.setsockopt(zmq.LINGER, 0)
+        sock.connect(f"tcp://127.0.0.1:{server.port}")
+        try:
+            sock.send(b"\xff\xfe not utf-8")
+            assert json.loads(sock.recv())["status"] == "error"
+        finally:
+            sock.close()
+
+        for _ in range(2):
+            assert _request(server.port, {"command": "OPAQUE"})["status"] == "error"
+        assert _request(server.port, {"command": "PING"}, timeout_ms=2000)["result"] == {"echo": "PING"}
+        assert server.stats()["queue_depth"] == 0
+    finally:
+        server.stop()
+
+
+def test_slow_request_does_not_block_others(rpc_server):
+    slow_result = []
+    slow = threading.Thread(target=lambda: slow_result.append(
+        _request(rpc_server.port, {"command": "SLOW", "params": {"seconds": 1.5}})))
+    slow.start()
+    time.sleep(0.1)
+
+    start = time.monotonic()
+    for _ in range(5):
+        assert _request(rpc_server.port, {"command": "PING"})["status"] == "ok"
+    assert time.monotonic() - start < 1.0
+
+    slow.join()
+    assert slow_result[0]["result"] == {"slept": 1.5}
+
+
+def test_request_timeout(rpc_server):
+    start = time.monotonic()
+    response = _request(rpc_server.port, {"command": "SLOW", "params": {"seconds": 1}, "timeout": 0.2})
+    assert response == {"status": "error", "message": "Request timed out"}
+    assert time.monotonic() - start < 0.9
+    assert rpc_server.stats()["timeouts"] == 1
+
+
+def test_stats_report_queue_depth(rpc_server):
+    threads = [
+        threading.Thread(target=_request, args=(rpc_server.port, {"command": "SLOW", "params": {"seconds": 0.5}}))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    time.sleep(0.2)
+    stats = rpc_server.stats()
+    assert stats["busy_workers"] == 3
+    assert stats["queue_depth"] == 2
+    for t in threads:
+        t.join()
+    assert rpc_server.stats()["handled"] == 5
+
+
+def test_parallel_commands_keep_their_own_output(monkeypatch, capsys):
+    from jcapy.core.plugins import CommandRegistry
+    from jcapy.daemon import server as daemon_server
+
+    both_running = threading.Barrier(2, timeout=5)
+
+    def chatty(args):
+        for i in range(30):
+            print(f"{args._tokens[0]} {i}")
+            if i == 0:
+                both_running.wait()
+            time.sleep(0.001)
+
+    registry = CommandRegistry()
+    registry.register("chatty", chatty, "Prints a lot")
+    monkeypatch.setattr(daemon_server, "get_service",
+                        lambda: types.SimpleNamespace(execute=lambda cmd, tui_data=None: registry.execute_string(cmd)))
+
+    server = ZmqRpcServer(port=_free_port(), bind_addr="tcp://127.0.0.1",
+                          command_handler=daemon_server._handle_rpc_command, workers=2)
+    assert server.start()
+    try:
+        replies = {}
+        threads = [threading.Thread(target=lambda n=name: replies.__setitem__(n, _request(
+            server.port, {"command": "EXECUTE_COMMAND", "params": {"command": f"chatty {n}"}})))
+            for name in ("alpha", "beta")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        server.stop()
+
+    for name, reply in replies.items():
+        assert reply["status"] == "ok" and reply["result"]["status"] == "success"
+        lines = "".join(reply["result"]["logs"]).splitlines()
+        assert lines == [f"{name} {i}" for i in range(30)]
+    print("after")
+    assert capsys.readouterr().out == "after\n"
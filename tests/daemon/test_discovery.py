@@ -0,0 +1,112 @@
+import os
+import socket
+import time
+from concurrent import futures
+
+import pytest
+
+from jcapy.daemon import discovery
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    sock = tmp_path / "run" / "d.sock"
+    pid = tmp_path / "d.pid"
+    monkeypatch.setenv("JCAPY_DAEMON_SOCKET", str(sock))
+    monkeypatch.setenv("JCAPY_PID_FILE", str(pid))
+    return sock, pid
+
+
+def listen(path):
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    server.listen(8)
+    return server
+
+
+def test_no_daemon_is_answered_in_microseconds(paths):
+    assert not discovery.daemon_alive()
+    start = time.perf_counter()
+    for _ in range(1000):
+        discovery.daemon_alive()
+    per_call = (time.perf_counter() - start) / 1000
+    print(f"\n[Discovery] no daemon: {per_call * 1e6:.1f}us per probe")
+    assert per_call < 0.001
+
+
+def test_listening_socket_is_alive_and_stale_one_is_not(paths):
+    sock, _ = paths
+    assert discovery.prepare_socket() == sock
+    server = listen(sock)
+    try:
+        assert discovery.daemon_alive()
+        assert discovery.prepare_socket() is None  # someone else is serving
+    finally:
+        server.close()
+
+    # The daemon died without cleaning up: the file is there, nobody listens
+    assert sock.exists() and not discovery.daemon_alive()
+    assert discovery.prepare_socket() == sock and not sock.exists()
+    assert oct(sock.parent.stat().st_mode & 0o777) == "0o700"
+
+
+def test_refuses_a_shared_socket_directory(tmp_path, monkeypatch):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o1777)
+    monkeypatch.setenv("JCAPY_DAEMON_SOCKET", str(shared / "d.sock"))
+
+    with pytest.raises(PermissionError):
+        discovery.prepare_socket()
+    assert oct(shared.stat().st_mode & 0o7777) == "0o1777"  # left alone
+
+    link = tmp_path / "link"
+    private = tmp_path / "private"
+    private.mkdir(mode=0o700)
+    link.symlink_to(private)
+    monkeypatch.setenv("JCAPY_DAEMON_SOCKET", str(link / "d.sock"))
+    with pytest.raises(PermissionError):
+        discovery.prepare_socket()
+
+
+def test_pidfile_is_published_and_removed(paths):
+    sock, pid = paths
+    discovery.prepare_socket()
+    server = listen(sock)
+    discovery.publish(sock)
+    assert discovery.read_pid() == os.getpid()
+    assert oct(sock.stat().st_mode & 0o777) == "0o600"
+
+    server.close()
+    discovery.unpublish(sock)
+    assert not pid.exists() and not sock.exists()
+    assert discovery.read_pid() is None
+
+
+def test_grpc_over_unix_socket(paths):
+    grpc = pytest.importorskip("grpc")
+    from jcapy.core.client import JCapyClient
+    from jcapy.core.proto import jcapy_pb2, jcapy_pb2_grpc
+
+    class Servicer(jcapy_pb2_grpc.JCapyOrchestratorServicer):
+        def GetStatus(self, request, context):
+            return jcapy_pb2.StatusResponse(status="online", version="test")
+
+    sock, _ = paths
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    jcapy_pb2_grpc.add_JCapyOrchestratorServicer_to_server(Servicer(), server)
+    assert server.add_insecure_port(discovery.grpc_target(discovery.prepare_socket()))
+    server.start()
+    try:
+        assert discovery.daemon_alive()
+        client = JCapyClient(socket_path=str(sock))
+        assert client.connect(timeout=5)
+        assert client.get_status().status == "online"
+
+        start = time.perf_counter()
+        for _ in range(200):
+            client.get_status()
+        print(f"\n[Discovery] unix-socket GetStatus: {(time.perf_counter() - start) / 200 * 1e6:.0f}us round trip")
+        client.close()
+    finally:
+        server.stop(0)
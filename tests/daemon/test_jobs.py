@@ -0,0 +1,192 @@
+import http.client
+import json
+import sys
+import threading
+import time
+
+import pytest
+
+from jcapy.core.base import CommandResult, ResultStatus
+from jcapy.daemon import server as daemon_server
+from jcapy.daemon.jobs import JobManager, JobQueueFull, JobStatus
+
+
+def echo_executor(command, context):
+    return CommandResult(status=ResultStatus.SUCCESS, message=f"ran {command}", data={"ctx": context})
+
+
+def test_job_runs_and_result_is_retrievable():
+    manager = JobManager(executor=echo_executor, max_workers=2)
+    job = manager.submit("doctor", context={"a": 1})
+
+    finished = manager.wait(job.job_id, timeout=5)
+    assert finished.status == JobStatus.SUCCEEDED
+    assert finished.result["status"] == "success"
+    assert finished.result["message"] == "ran doctor"
+    assert finished.result["data"] == {"ctx": {"a": 1}}
+    manager.stop()
+
+
+def test_failure_result_and_exception_are_marked_failed():
+    def executor(command, context):
+        if command == "boom":
+            raise RuntimeError("exploded")
+        return CommandResult(status=ResultStatus.FAILURE, message="nope")
+
+    manager = JobManager(executor=executor, max_workers=1)
+    bad = manager.wait(manager.submit("bad").job_id, timeout=5)
+    boom = manager.wait(manager.submit("boom").job_id, timeout=5)
+
+    assert bad.status == JobStatus.FAILED
+    assert boom.status == JobStatus.FAILED
+    assert boom.error == "exploded"
+    manager.stop()
+
+
+def test_queue_is_bounded():
+    release = threading.Event()
+
+    def blocking_executor(command, context):
+        release.wait(5)
+
+    manager = JobManager(executor=blocking_executor, max_workers=1, max_queue=2)
+    first = manager.submit("hold")
+    # Wait until the worker has dequeued the first job
+    deadline = time.time() + 5
+    while first.status != JobStatus.RUNNING and time.time() < deadline:
+        time.sleep(0.01)
+
+    manager.submit("q1")
+    manager.submit("q2")
+    with pytest.raises(JobQueueFull):
+        manager.submit("overflow")
+    assert manager.stats()["rejected"] == 1
+
+    release.set()
+    manager.stop()
+
+
+def test_finished_results_are_lru_capped():
+    manager = JobManager(executor=echo_executor, max_workers=1, max_results=3)
+    ids = [manager.submit(f"cmd{i}").job_id for i in range(5)]
+    for job_id in ids:
+        manager.wait(job_id, timeout=5)
+
+    assert manager.get(ids[0]) is None
+    assert manager.get(ids[1]) is None
+    assert manager.get(ids[4]).status == JobStatus.SUCCEEDED
+    assert manager.stats()["evicted"] == 2
+    manager.stop()
+
+
+def test_concurrent_jobs_keep_their_own_output(capsys):
+    from jcapy.core.plugins import CommandRegistry
+
+    both_running = threading.Barrier(2, timeout=5)
+
+    def chatty(args):
+        for i in range(50):
+            print(f"{args._tokens[0]} line {i}")
+            if i == 0:
+                both_running.wait()
+            time.sleep(0.001)
+        print(f"{args._tokens[0]} warning", file=sys.stderr)
+
+    registry = CommandRegistry()
+    registry.register("chatty", chatty, "Prints a lot")
+
+    manager = JobManager(executor=lambda command, context: registry.execute_string(command), max_workers=2)
+    jobs = [manager.submit(f"chatty {name}") for name in ("alpha", "beta")]
+    results = [manager.wait(job.job_id, timeout=10).result for job in jobs]
+    manager.stop()
+
+    for name, result in zip(("alpha", "beta"), results):
+        lines = "".join(result["logs"]).splitlines()
+        assert len(lines) == 51
+        assert all(line.startswith(name) for line in lines)
+
+    # Nothing leaked to, or stayed hijacked on, the process-wide streams
+    print("after")
+    out, err = capsys.readouterr()
+    assert out == "after\n" and err == ""
+
+
+@pytest.fixture
+def http_daemon(monkeypatch):
+    manager = JobManager(executor=echo_executor, max_workers=2)
+    monkeypatch.setattr(daemon_server, "jobs", manager)
+    httpd = daemon_server.ControlPlaneServer(('127.0.0.1', 0), daemon_server.ControlPlaneHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+    manager.stop()
+
+
+def test_http_submit_and_long_poll(http_daemon):
+    conn = http.client.HTTPConnection('127.0.0.1', http_daemon, timeout=10)
+    conn.request('POST', '/api/command', body=json.dumps({"command": "doctor"}),
+                 headers={'Content-Type': 'application/json'})
+    response = conn.getresponse()
+    accepted = json.loads(response.read())
+    assert response.status == 202
+    assert accepted["job_id"]
+
+    conn.request('GET', f"/api/jobs/{accepted['job_id']}?wait=5")
+    response = conn.getresponse()
+    job = json.loads(response.read())
+    assert response.status == 200
+    assert job["status"] == "succeeded"
+    assert job["result"]["message"] == "ran doctor"
+
+    conn.request('GET', '/api/jobs/does-not-exist')
+    response = conn.getresponse()
+    response.read()
+    assert response.status == 404
+    conn.close()
+
+
+def test_long_polls_cannot_starve_the_pool(monkeypatch):
+    release = threading.Event()
+    manager = JobManager(executor=lambda command, context: release.wait(10), max_workers=1)
+    monkeypatch.setattr(daemon_server, "jobs", manager)
+    httpd = daemon_server.ControlPlaneServer(('127.0.0.1', 0), daemon_server.ControlPlaneHandler,
+                                             max_workers=4, max_long_polls=1)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    port = httpd.server_address[1]
+    job_id = manager.submit("hold").job_id
+
+    def poll(results):
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=20)
+        conn.request('GET', f"/api/jobs/{job_id}?wait=20")
+        results.append(json.loads(conn.getresponse().read())["status"])
+        conn.close()
+
+    parked = []
+    waiter = threading.Thread(target=poll, args=(parked,))
+    waiter.start()
+    deadline = time.time() + 5
+    while httpd.connection_stats()["long_polls"] < 1 and time.time() < deadline:
+        time.sleep(0.01)
+
+    # More pollers than workers: each is answered at once instead of parking
+    answered = []
+    pollers = [threading.Thread(target=poll, args=(answered,)) for _ in range(4)]
+    for t in pollers:
+        t.start()
+    for t in pollers:
+        t.join(5)
+    assert sorted(answered) == ["running"] * 4
+
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+    conn.request('GET', '/health')
+    assert conn.getresponse().status == 200
+    conn.close()
+
+    release.set()
+    waiter.join(5)
+    assert parked == ["succeeded"]
+    httpd.shutdown()
+    httpd.server_close()
+    manager.stop()
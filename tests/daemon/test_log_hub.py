@@ -0,0 +1,92 @@
+import threading
+import time
+
+from jcapy.core.bus import EventBus
+from jcapy.daemon.log_hub import LogFanoutHub, compile_filter, normalize_log_event
+
+
+def test_subscription_receives_bus_events():
+    bus = EventBus()
+    hub = LogFanoutHub(bus=bus)
+    sub = hub.subscribe()
+
+    bus.publish("TERMINAL_OUTPUT", {"line": "hello", "source": "service"})
+    bus.publish("AUDIT_LOG", {"message": "audited", "level": "warning"})
+
+    items = sub.get(timeout=1)
+    assert [i["message"] for i in items] == ["hello", "audited"]
+    assert items[0]["topic"] == "TERMINAL_OUTPUT"
+    assert items[1]["level"] == "warning"
+    hub.unsubscribe(sub)
+
+
+def test_unsubscribe_detaches_from_bus():
+    bus = EventBus()
+    hub = LogFanoutHub(bus=bus)
+    subs = [hub.subscribe() for _ in range(50)]
+    assert len(bus._subscribers["TERMINAL_OUTPUT"]) == 1
+
+    for sub in subs:
+        hub.unsubscribe(sub)
+
+    assert hub.subscriber_count == 0
+    assert bus._subscribers["TERMINAL_OUTPUT"] == []
+    assert bus._subscribers["AUDIT_LOG"] == []
+
+
+def test_ring_buffer_drops_oldest_and_counts():
+    bus = EventBus()
+    hub = LogFanoutHub(bus=bus, capacity=3)
+    sub = hub.subscribe()
+
+    for i in range(5):
+        bus.publish("TERMINAL_OUTPUT", {"line": f"line {i}"})
+
+    stats = sub.stats()
+    assert stats["dropped"] == 2
+    assert stats["pending"] == 3
+    assert [i["message"] for i in sub.get(timeout=0)] == ["line 2", "line 3", "line 4"]
+    assert sub.stats()["delivered"] == 3
+    hub.unsubscribe(sub)
+
+
+def test_server_side_filter():
+    bus = EventBus()
+    hub = LogFanoutHub(bus=bus)
+    errors = hub.subscribe("level:error")
+    timeouts = hub.subscribe("Timeout")
+
+    bus.publish("TERMINAL_OUTPUT", {"line": "connection timeout", "level": "error"})
+    bus.publish("TERMINAL_OUTPUT", {"line": "all good", "level": "info"})
+    bus.publish("TERMINAL_OUTPUT", {"line": "read timeout", "level": "info"})
+
+    assert [i["message"] for i in errors.get(timeout=0)] == ["connection timeout"]
+    assert [i["message"] for i in timeouts.get(timeout=0)] == ["connection timeout", "read timeout"]
+    assert errors.stats()["filtered"] == 2
+    hub.unsubscribe(errors)
+    hub.unsubscribe(timeouts)
+
+
+def test_close_wakes_blocked_reader():
+    hub = LogFanoutHub(bus=EventBus())
+    sub = hub.subscribe()
+    result = []
+
+    reader = threading.Thread(target=lambda: result.append(sub.get(timeout=10)))
+    reader.start()
+    time.sleep(0.05)
+    start = time.monotonic()
+    sub.close()
+    reader.join(timeout=2)
+
+    assert result == [[]]
+    assert time.monotonic() - start < 1
+    hub.unsubscribe(sub)
+
+
+def test_filter_helpers():
+    assert compile_filter("") is None
+    entry = normalize_log_event("AUDIT_LOG", "plain string")
+    assert entry["message"] == "plain string"
+    assert compile_filter("topic:audit_log plain")(entry)
+    assert not compile_filter("source:tui")(entry)
@@ -0,0 +1,256 @@
+import hashlib
+import shutil
+import socket
+import subprocess
+import threading
+import time
+import types
+
+import numpy as np
+import pytest
+
+import jcapy.memory.chroma_cloud as chroma_cloud
+from jcapy.memory.chroma_cloud import ChromaCloudMemoryBank
+
+
+class FakeCollection:
+    """Records every upsert call; a batch holding `poison` fails `failures` times."""
+
+    def __init__(self, poison=None, failures=0, latency=0.0):
+        self.poison, self.failures, self.latency = poison, failures, latency
+        self.calls = []
+        self.stored = {}
+        self.in_flight = self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def upsert(self, ids, documents, metadatas):
+        with self.lock:
+            self.calls.append(list(ids))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency)
+            with self.lock:
+                if self.poison in ids and self.failures:
+                    self.failures -= 1
+                    raise RuntimeError("503 Service Unavailable")
+                self.stored.update(zip(ids, zip(documents, metadatas)))
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def delete(self, ids=None, where=None):
+        with self.lock:
+            for doc_id, (_, meta) in list(self.stored.items()):
+                if (ids is not None and doc_id in ids) or (where is not None and matches(meta, where)):
+                    del self.stored[doc_id]
+
+
+def matches(meta, where):
+    """The subset of Chroma's where syntax the bank uses."""
+    if "$and" in where:
+        return all(matches(meta, clause) for clause in where["$and"])
+    if "$or" in where:
+        return any(matches(meta, clause) for clause in where["$or"])
+    (key, condition), = where.items()
+    if isinstance(condition, dict):
+        return key in meta and meta[key] >= condition["$gte"]
+    return meta.get(key) == condition
+
+
+def offline_bank(collection, batch_size=4, concurrency=2):
+    bank = ChromaCloudMemoryBank.__new__(ChromaCloudMemoryBank)
+    bank.active, bank.collection = True, collection
+    bank.batch_size, bank.concurrency = batch_size, concurrency
+    return bank
+
+
+def write_library(root, files, size=100):
+    root.mkdir(exist_ok=True)
+    for i in range(files):
+        (root / f"note_{i:03d}.md").write_text(f"# Note {i}\n\n" + "x" * size)
+    return root
+
+
+def doc_id(path):
+    return hashlib.md5(str(path).encode()).hexdigest()
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(chroma_cloud, "time", types.SimpleNamespace(sleep=sleeps.append, perf_counter=time.perf_counter))
+    return sleeps
+
+
+def test_files_are_packed_into_bounded_concurrent_batches(tmp_path):
+    lib = write_library(tmp_path / "lib", files=30)
+    collection = FakeCollection(latency=0.01)
+
+    stats = offline_bank(collection, batch_size=8, concurrency=3).memorize([str(lib)])
+
+    assert stats["added"] == 30 and stats["errors"] == 0
+    assert stats["chunks"] == 30 and stats["batches"] == 4
+    assert sorted(len(ids) for ids in collection.calls) == [6, 8, 8, 8]
+    assert len(collection.stored) == 30
+    assert 1 < collection.max_in_flight <= 3
+
+
+def test_long_files_are_chunked_by_encoded_size(tmp_path):
+    lib = write_library(tmp_path / "lib", files=1, size=0)
+    # 21k characters but 42KB of UTF-8
+    (lib / "long.md").write_text("\n\n".join("é" * 7000 for _ in range(3)))
+    collection = FakeCollection()
+
+    stats = offline_bank(collection).memorize([str(lib)])
+
+    assert stats["added"] == 2 and stats["chunks"] == 4
+    chunks = [(meta["chunk_index"], doc) for doc, meta in collection.stored.values() if "chunk_index" in meta]
+    assert sorted(i for i, _ in chunks) == [0, 1, 2]
+    assert all(len(doc.encode()) <= chroma_cloud.MAX_DOCUMENT_BYTES for _, doc in chunks)
+
+
+def test_reingest_prunes_what_earlier_versions_left(tmp_path):
+    lib = tmp_path / "lib"
+    lib.mkdir()
+    note, other = lib / "note.md", lib / "other.md"
+    other.write_text("# Other\n\nkept")
+    collection = FakeCollection()
+    bank = offline_bank(collection)
+
+    def versions():
+        return sorted(doc_id for doc_id, (_, meta) in collection.stored.items() if meta["source"] == str(note))
+
+    note.write_text("short")
+    bank.memorize([str(lib)])
+    assert versions() == [doc_id(note)]
+
+    note.write_text("\n\n".join("z" * 10000 for _ in range(3)))
+    bank.memorize([str(lib)])
+    assert versions() == [f"{doc_id(note)}:{i}" for i in range(3)]
+
+    note.write_text("\n\n".join("z" * 10000 for _ in range(2)))
+    bank.memorize([str(note)])
+    assert versions() == [f"{doc_id(note)}:{i}" for i in range(2)]
+
+    note.write_text("short again")
+    bank.memorize([str(note)])
+    assert versions() == [doc_id(note)]
+    assert doc_id(other) in collection.stored
+
+
+def test_retries_resend_only_the_failed_batch(tmp_path, no_sleep):
+    lib = write_library(tmp_path / "lib", files=8)
+    poison = doc_id(lib / "note_005.md")
+    collection = FakeCollection(poison=poison, failures=1)
+
+    stats = offline_bank(collection, batch_size=4, concurrency=1).memorize([str(lib)])
+
+    assert stats["added"] == 8 and stats["errors"] == 0
+    failed = [ids for ids in collection.calls if poison in ids]
+    assert len(collection.calls) == 3 and len(failed) == 2
+    assert failed[0] == failed[1] and len(failed[0]) == 4
+    assert no_sleep == [1]
+
+
+def test_exhausted_retries_fail_only_the_batchs_files(tmp_path, no_sleep):
+    lib = write_library(tmp_path / "lib", files=8)
+    poison = doc_id(lib / "note_005.md")
+    collection = FakeCollection(poison=poison, failures=99)
+
+    stats = offline_bank(collection, batch_size=4, concurrency=1).memorize([str(lib)])
+
+    assert stats["added"] == 4 and stats["errors"] == 4 and stats["chunks"] == 4
+    assert len(collection.calls) == 1 + chroma_cloud.UPSERT_RETRIES
+    assert no_sleep == [1, 2]
+
+
+def test_a_path_given_twice_is_ingested_once(tmp_path):
+    lib = write_library(tmp_path / "lib", files=5)
+    collection = FakeCollection()
+
+    stats = offline_bank(collection, batch_size=2).memorize([str(lib), str(lib / "note_002.md")])
+
+    assert stats["added"] == 5 and stats["errors"] == 0 and stats["chunks"] == 5
+    assert sum(ids.count(doc_id(lib / "note_002.md")) for ids in collection.calls) == 1
+
+
+class WordCounts:
+    """Tiny offline embedding function for the real server; the default one downloads a model."""
+
+    def __call__(self, input):
+        return [np.array([len(doc), doc.count("x") + 1, 1], dtype=np.float32) for doc in input]
+
+    embed_query = __call__
+
+    @staticmethod
+    def name():
+        return "word_counts"
+
+    def get_config(self):
+        return {}
+
+    @staticmethod
+    def build_from_config(config):
+        return WordCounts()
+
+    def is_legacy(self):
+        return False
+
+    def supported_spaces(self):
+        return ["cosine", "l2", "ip"]
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def chroma_server(tmp_path):
+    pytest.importorskip("chromadb")
+    if not shutil.which("chroma"):
+        pytest.skip("chroma CLI not installed")
+    port = free_port()
+    proc = subprocess.Popen(["chroma", "run", "--path", str(tmp_path / "chroma"), "--port", str(port)],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.time() + 30
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+                break
+            except OSError:
+                if time.time() > deadline or proc.poll() is not None:
+                    pytest.skip("local chroma server did not start")
+                time.sleep(0.2)
+        yield port
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def test_ingests_into_a_local_chroma_server(chroma_server, tmp_path, monkeypatch):
+    secrets = {"CHROMA_HOST": "127.0.0.1", "CHROMA_PORT": str(chroma_server)}
+    monkeypatch.setattr(chroma_cloud, "resolve_secret", lambda key, env_var=None: secrets.get(key))
+    lib = write_library(tmp_path / "lib", files=25)
+
+    bank = ChromaCloudMemoryBank(batch_size=10, concurrency=3, embedding_function=WordCounts())
+    assert bank.active
+    stats = bank.memorize([str(lib)])
+
+    assert stats["added"] == 25 and stats["batches"] == 3
+    assert bank.collection.count() == 25
+
+    # Growing past the document limit replaces the whole-file document with chunks
+    note = lib / "note_000.md"
+    note.write_text("\n\n".join("z" * 10000 for _ in range(3)))
+    bank.memorize([str(note)])
+    assert sorted(bank.collection.get(where={"source": str(note)})["ids"]) == [f"{doc_id(note)}:{i}" for i in range(3)]
+    note.write_text("short")
+    bank.memorize([str(note)])
+    assert bank.collection.get(where={"source": str(note)})["ids"] == [doc_id(note)]
+    assert bank.collection.count() == 25
+    assert bank.recall("note", n_results=3)
+    assert bank.clear() and bank.collection.count() == 0
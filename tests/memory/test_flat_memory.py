@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from jcapy.memory.flat import FlatMemoryBank, FlatVectorStore, HashingEmbedder
+
+
+def vectors(*rows):
+    return np.asarray(rows, dtype=np.float32)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "int8"])
+def test_store_ranks_by_cosine_and_persists(tmp_path, dtype):
+    store = FlatVectorStore(str(tmp_path / "store"), dtype=dtype)
+    store.upsert(ids=["x", "y", "xy"], documents=["dx", "dy", "dxy"],
+                 metadatas=[{"n": 1}, {"n": 2}, None],
+                 embeddings=vectors([1, 0, 0], [0, 1, 0], [1, 1, 0]))
+
+    res = store.query(query_embeddings=vectors([1, 0.1, 0]), n_results=2)
+    assert res["ids"] == [["x", "xy"]]
+    assert res["documents"] == [["dx", "dxy"]]
+    assert res["metadatas"] == [[{"n": 1}, {}]]
+    assert res["distances"][0][0] == pytest.approx(1 - 1 / np.sqrt(1.01), abs=0.01)
+    store.close()
+
+    again = FlatVectorStore(str(tmp_path / "store"), dtype="float32")
+    assert again.dtype == dtype and again.dim == 3 and again.count() == 3
+    assert again.query(query_embeddings=vectors([0, 1, 0]), n_results=1)["ids"] == [["y"]]
+
+
+def test_update_delete_and_row_reuse(tmp_path):
+    store = FlatVectorStore(str(tmp_path / "store"))
+    store.upsert(ids=["a", "b"], documents=["a", "b"], embeddings=vectors([1, 0], [0, 1]))
+    store.upsert(ids=["a"], documents=["a2"], embeddings=vectors([0, 1]))
+    assert store.count() == 2
+    assert sorted(store.query(query_embeddings=vectors([0, 1]), n_results=5)["documents"][0]) == ["a2", "b"]
+
+    store.delete(["b", "missing"])
+    assert store.query(query_embeddings=vectors([0, 1]), n_results=5)["ids"] == [["a"]]
+    store.upsert(ids=["c"], embeddings=vectors([1, 0]))
+    assert store._row_of["c"] == 1          # the deleted row is reused
+    with pytest.raises(ValueError):
+        store.upsert(ids=["d"], embeddings=vectors([1, 0, 0]))
+
+    store.clear()
+    assert store.count() == 0
+    assert store.query(query_embeddings=vectors([1, 0]), n_results=3)["ids"] == [[]]
+
+
+def test_grows_past_initial_capacity(tmp_path):
+    store = FlatVectorStore(str(tmp_path / "store"), dtype="int8")
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((3000, 16)).astype(np.float32)
+    store.upsert(ids=[str(i) for i in range(3000)], embeddings=data)
+    assert store.query(query_embeddings=data[[2999, 7]], n_results=1)["ids"] == [["2999"], ["7"]]
+
+
+def test_hashing_embedder_is_stable_and_lexical():
+    embed = HashingEmbedder(dim=256)
+    a, b, c = embed(["deploy to fly.io", "Deploy to Fly", "postgres migrations"])
+    assert embed(["deploy to fly.io"])[0] == pytest.approx(a)
+    assert float(a @ b) > 0.6 > float(a @ c)
+    assert np.linalg.norm(embed([""])[0]) == 0
+
+
+def test_flat_memory_bank_ingests_incrementally(tmp_path):
+    lib = tmp_path / "library"
+    lib.mkdir()
+    (lib / "fly.md").write_text("# Fly\nDeploy the app to fly.io with flyctl\n")
+    (lib / "pg.md").write_text("# Postgres\nRun database migrations with alembic\n")
+
+    bank = FlatMemoryBank(persistence_path=str(tmp_path / "mem"))
+    assert bank.memorize([str(lib)])["embedded"] == 2
+    hits = bank.recall("alembic migrations", n_results=1)
+    assert hits[0]["metadata"]["name"] == "pg.md"
+    assert "alembic" in hits[0]["content"]
+
+    again = FlatMemoryBank(persistence_path=str(tmp_path / "mem"))
+    stats = again.memorize([str(lib)])
+    assert stats["embedded"] == 0 and stats["unchanged"] == 2
+
+    (lib / "pg.md").unlink()
+    assert again.memorize([str(lib)])["removed"] == 1
+    assert [h["metadata"]["name"] for h in again.recall("migrations", n_results=5)] == ["fly.md"]
+    assert again.clear() and again.recall("fly") == []
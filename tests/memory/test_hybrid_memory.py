@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+
+import jcapy.commands.brain_cmd as brain_cmd
+import jcapy.memory.hybrid as hybrid
+from jcapy.memory.flat import FlatVectorStore, HashingEmbedder
+from jcapy.memory.hybrid import HybridCollection, HybridMemoryBank, KeywordIndex, chunk_text
+
+
+@pytest.fixture(autouse=True)
+def no_cached_model(tmp_path, monkeypatch):
+    # Keep results independent of a MiniLM model cached on this machine
+    monkeypatch.setattr(hybrid, "MINILM_MODEL", str(tmp_path / "no-model.onnx"))
+
+
+def test_chunk_text_packs_paragraphs_and_splits_at_headings():
+    text = "# A\n\none\n\ntwo\n\n# B\n\n" + "x" * 25 + "\n\nthree"
+    assert chunk_text(text, size=20) == ["# A\n\none\n\ntwo", "# B", "x" * 20, "xxxxx\n\nthree"]
+    assert chunk_text("short") == ["short"]
+
+
+def test_keyword_index_finds_identifiers(tmp_path):
+    index = KeywordIndex(str(tmp_path / "kw.db"))
+    index.upsert(["a", "b", "c"], ["call get_memory_bank() first", "the memory of a bank", "unrelated"])
+    assert [doc_id for doc_id, _ in index.search("get_memory_bank")] == ["a"]
+    assert {doc_id for doc_id, _ in index.search("memory bank")} == {"a", "b"}
+    index.upsert(["a"], ["now it is about fly.io"])
+    assert [doc_id for doc_id, _ in index.search("get_memory_bank")] == []
+    index.delete(["b"])
+    assert index.search("memory") == []
+
+
+class OneHotEmbedder:
+    """Every text points at a fixed axis: the vector side ranks by that alone."""
+    AXES = {"deploy": 0, "database": 1}
+
+    def __call__(self, texts):
+        out = np.full((len(texts), 3), 0.01, dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word, axis in self.AXES.items():
+                if word in text:
+                    out[row, axis] = 1.0
+        return out
+
+
+def test_rrf_combines_both_rankings(tmp_path):
+    collection = HybridCollection(FlatVectorStore(str(tmp_path / "v"), embedding_function=OneHotEmbedder()),
+                                  KeywordIndex(str(tmp_path / "kw.db")))
+    collection.upsert(ids=["vec", "kw", "both"],
+                      documents=["how we deploy", "set PG_POOL_SIZE here", "deploy: PG_POOL_SIZE=20"],
+                      metadatas=[{"n": 1}, {"n": 2}, {"n": 3}])
+
+    res = collection.query(["deploy PG_POOL_SIZE"], n_results=3)
+    assert res["ids"][0][0] == "both"
+    assert set(res["ids"][0]) == {"vec", "kw", "both"}
+    assert res["metadatas"][0][0] == {"n": 3}
+    assert 0 <= res["distances"][0][0] < res["distances"][0][1]
+
+    # The identifier alone: only the keyword side can tell these apart
+    assert set(collection.query(["PG_POOL_SIZE"], n_results=2)["ids"][0]) == {"kw", "both"}
+
+    collection.delete(["both"])
+    assert "both" not in collection.query(["deploy PG_POOL_SIZE"], n_results=3)["ids"][0]
+
+
+@pytest.fixture
+def library(tmp_path):
+    lib = tmp_path / "library"
+    (lib / "skills").mkdir(parents=True)
+    (lib / "skills" / "fly.md").write_text("# Fly\n\nDeploy the app with `flyctl deploy --remote-only`.\n\n"
+                                            "# Scaling\n\nUse `fly scale count 3` for more machines.\n")
+    (lib / "skills" / "pg.md").write_text("# Postgres\n\nSet PG_POOL_SIZE to twice the worker count.\n")
+    for i in range(30):
+        (lib / "skills" / f"filler_{i}.md").write_text(f"# Filler {i}\n\nNothing about databases here {i}.\n")
+    return lib
+
+
+def test_bank_recalls_chunks_and_replaces_them(library, tmp_path):
+    bank = HybridMemoryBank(persistence_path=str(tmp_path / "mem"))
+    assert bank.memorize([str(library)])["embedded"] == 32
+    hits = bank.recall("fly scale count", n_results=3)
+    assert hits[0]["metadata"]["name"] == "fly.md"
+    assert hits[0]["content"].startswith("# Scaling")
+    assert bank.recall("PG_POOL_SIZE", n_results=1)[0]["metadata"]["name"] == "pg.md"
+
+    (library / "skills" / "fly.md").write_text("# Fly\n\nGone.\n")
+    bank.memorize([str(library)])
+    assert all("Scaling" not in h["content"] for h in bank.recall("fly scale count", n_results=5))
+
+
+def test_ask_brain_sends_top_chunks(library, tmp_path, monkeypatch):
+    monkeypatch.setattr("jcapy.config.JCAPY_HOME", str(tmp_path / "home"))
+    monkeypatch.setattr(brain_cmd, "get_active_library_path", lambda: str(library))
+    monkeypatch.setattr(brain_cmd, "load_config", lambda: {})
+    monkeypatch.setattr("jcapy.config.get_api_key", lambda provider: "key")
+    prompts = []
+
+    def call_ai_agent(prompt, provider):
+        prompts.append(prompt)
+        return "ok", None
+
+    monkeypatch.setattr(brain_cmd, "call_ai_agent", call_ai_agent)
+
+    brain_cmd.ask_brain("what is PG_POOL_SIZE")
+    context = prompts[0].split("--- KNOWLEDGE GRAPH CONTEXT")[1]
+    assert context.index("--- FILE: skills/pg.md ---") < context.index("Filler")
+    assert "twice the worker count" in context
+
+
+def test_semantic_embedder_when_cached_else_rebuild_on_change(library, tmp_path, monkeypatch):
+    assert isinstance(hybrid.default_embedding_function("auto"), HashingEmbedder)
+    assert isinstance(hybrid.default_embedding_function("hashing"), HashingEmbedder)
+
+    class FakeMiniLM(OneHotEmbedder):
+        name = "fake-minilm"
+
+    model = tmp_path / "model.onnx"
+    model.write_bytes(b"")
+    monkeypatch.setattr(hybrid, "MINILM_MODEL", str(model))
+    monkeypatch.setattr(hybrid, "MiniLMEmbedder", FakeMiniLM)
+    assert isinstance(hybrid.default_embedding_function("auto"), FakeMiniLM)
+    assert isinstance(hybrid.default_embedding_function("hashing"), HashingEmbedder)
+
+    path = str(tmp_path / "mem")
+    assert HybridMemoryBank(persistence_path=path).memorize([str(library)])["embedded"] == 32
+    assert HybridMemoryBank(persistence_path=path).memorize([str(library)])["embedded"] == 0
+
+    # Vectors from another model are dropped and rebuilt
+    monkeypatch.setattr(hybrid, "MINILM_MODEL", str(tmp_path / "gone.onnx"))
+    switched = HybridMemoryBank(persistence_path=path)
+    assert switched.collection.count() == 0
+    assert switched.memorize([str(library)])["embedded"] == 32
@@ -0,0 +1,199 @@
+import os
+import types
+
+import pytest
+
+import jcapy.memory as memory
+from jcapy.memory import LocalMemoryBank, MANIFEST_FILE
+
+
+class FakeCollection:
+    def __init__(self):
+        self.docs = {}
+        self.upsert_calls = 0
+        self.fail_next_upsert = False
+        self.fail_next_delete = False
+
+    def upsert(self, documents, metadatas, ids, embeddings=None):
+        if self.fail_next_upsert:
+            self.fail_next_upsert = False
+            raise RuntimeError("embedding backend down")
+        self.upsert_calls += 1
+        for doc, meta, doc_id in zip(documents, metadatas, ids):
+            self.docs[doc_id] = (doc, meta)
+
+    def delete(self, ids):
+        if self.fail_next_delete:
+            self.fail_next_delete = False
+            raise RuntimeError("collection locked")
+        for doc_id in ids:
+            self.docs.pop(doc_id, None)
+
+    def count(self):
+        return len(self.docs)
+
+    def get(self, include=None):
+        ids = list(self.docs)
+        return {"ids": ids, "documents": [self.docs[i][0] for i in ids],
+                "metadatas": [self.docs[i][1] for i in ids], "embeddings": [[0.0]] * len(ids)}
+
+
+class FakeClient:
+    def __init__(self, path):
+        self.collection = FakeCollection()
+
+    def get_or_create_collection(self, name, metadata=None):
+        return self.collection
+
+    def delete_collection(self, name):
+        self.collection.docs.clear()
+
+
+@pytest.fixture
+def fake_chroma(monkeypatch):
+    clients = {}
+
+    def persistent_client(path):
+        # Same path -> same store, like a real PersistentClient
+        return clients.setdefault(path, FakeClient(path))
+
+    monkeypatch.setattr(memory, "chromadb", types.SimpleNamespace(PersistentClient=persistent_client))
+    return clients
+
+
+@pytest.fixture
+def library(tmp_path):
+    lib = tmp_path / "library"
+    (lib / "skills").mkdir(parents=True)
+    (lib / ".git").mkdir()
+    for i in range(5):
+        (lib / "skills" / f"skill_{i}.md").write_text(f"# Skill {i}\nbody {i}\n")
+    (lib / "notes.txt").write_text("notes")
+    (lib / "image.png").write_bytes(b"\x89PNG")
+    (lib / ".git" / "HEAD.md").write_text("ignored")
+    return lib
+
+
+def _bank(tmp_path, batch_size=2):
+    return LocalMemoryBank(persistence_path=str(tmp_path / "db"), batch_size=batch_size)
+
+
+def test_first_run_embeds_in_batches(fake_chroma, library, tmp_path):
+    bank = _bank(tmp_path)
+    stats = bank.memorize([str(library)])
+
+    assert stats["scanned"] == 6
+    assert stats["embedded"] == stats["added"] == 6
+    assert stats["unchanged"] == 0
+    assert len(bank.collection.docs) == 6
+    assert bank.collection.upsert_calls == 3  # 6 files / batch of 2
+    assert os.path.exists(tmp_path / "db" / MANIFEST_FILE)
+
+
+def test_rerun_skips_unchanged_files(fake_chroma, library, tmp_path):
+    _bank(tmp_path).memorize([str(library)])
+
+    bank = _bank(tmp_path)  # fresh instance reloads the persisted manifest
+    calls_before = bank.collection.upsert_calls
+    stats = bank.memorize([str(library)])
+
+    assert stats["scanned"] == 6
+    assert stats["embedded"] == 0
+    assert stats["unchanged"] == stats["skipped"] == 6
+    assert bank.collection.upsert_calls == calls_before
+
+
+def test_touched_but_identical_file_is_not_reembedded(fake_chroma, library, tmp_path):
+    bank = _bank(tmp_path)
+    bank.memorize([str(library)])
+
+    target = library / "notes.txt"
+    st = target.stat()
+    os.utime(target, (st.st_atime, st.st_mtime + 10))
+
+    stats = bank.memorize([str(library)])
+    assert stats["embedded"] == 0
+    assert stats["unchanged"] == 6
+
+
+def test_changed_file_is_replaced_and_deleted_file_purged(fake_chroma, library, tmp_path):
+    bank = _bank(tmp_path)
+    bank.memorize([str(library)])
+
+    changed = library / "skills" / "skill_0.md"
+    changed.write_text("# Skill 0\nrewritten with new content\n")
+    (library / "skills" / "skill_1.md").unlink()
+
+    stats = bank.memorize([str(library)])
+    assert stats["embedded"] == 1
+    assert stats["removed"] == 1
+    assert stats["unchanged"] == 4
+
+    docs = {meta["source"]: doc for doc, meta in bank.collection.docs.values()}
+    assert len(docs) == 5
+    assert "rewritten" in docs[str(changed)]
+    assert str(library / "skills" / "skill_1.md") not in docs
+
+
+def test_failed_batch_is_retried_next_run(fake_chroma, library, tmp_path):
+    bank = _bank(tmp_path, batch_size=10)
+    bank.collection.fail_next_upsert = True
+
+    stats = bank.memorize([str(library)])
+    assert stats["embedded"] == 0
+    assert stats["errors"] == 6
+
+    stats = bank.memorize([str(library)])
+    assert stats["embedded"] == 6
+    assert len(bank.collection.docs) == 6
+
+
+def test_failed_delete_of_outdated_chunks_is_retried_next_run(fake_chroma, library, tmp_path, monkeypatch):
+    bank = _bank(tmp_path)
+    monkeypatch.setattr(bank, "_chunk", lambda content: content.split("\n\n"))
+    target = library / "skills" / "skill_0.md"
+    target.write_text("one\n\ntwo\n\nthree")
+    bank.memorize([str(library)])
+    assert len(bank.collection.docs) == 8
+
+    target.write_text("just one")
+    bank.collection.fail_next_delete = True
+    stats = bank.memorize([str(library)])
+    assert stats["errors"] == 1 and stats["embedded"] == 1
+    assert len(bank.collection.docs) == 9  # the three outdated chunks are still stored
+
+    stats = bank.memorize([str(library)])
+    assert stats["errors"] == 0 and stats["unchanged"] == 6
+    sources = [meta["source"] for _, meta in bank.collection.docs.values()]
+    assert len(sources) == 6 and sources.count(str(target)) == 1
+
+
+def test_clear_first_resets_manifest(fake_chroma, library, tmp_path):
+    bank = _bank(tmp_path)
+    bank.memorize([str(library)])
+
+    stats = bank.memorize([str(library)], clear_first=True)
+    assert stats["embedded"] == 6
+    assert len(bank.collection.docs) == 6
+
+
+def test_documents_under_relative_path_ids_are_rekeyed_once(fake_chroma, library, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    bank = _bank(tmp_path)
+    legacy = os.path.join("library", "notes.txt")
+    bank.collection.docs[LocalMemoryBank._doc_id(legacy)] = ("notes", {"source": legacy})
+    bank.collection.docs["gone"] = ("old", {"source": "library/deleted.md"})
+
+    bank.memorize([str(library)])
+
+    notes = str(library / "notes.txt")
+    sources = [meta["source"] for _, meta in bank.collection.docs.values()]
+    assert sources.count(notes) == 1 and legacy not in sources
+    assert LocalMemoryBank._doc_id(notes) in bank.collection.docs
+    assert "gone" in bank.collection.docs  # unresolvable, left alone
+    assert len(bank.collection.docs) == 7
+
+    # Once the manifest exists the migration never runs again
+    bank.collection.docs["later"] = ("x", {"source": legacy})
+    bank.memorize([str(library)])
+    assert "later" in bank.collection.docs
@@ -0,0 +1,185 @@
+import json
+import threading
+import time
+import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import jcapy.memory.remote as remote
+from jcapy.memory.remote import RemoteMemoryBank
+
+
+class FakePinecone:
+    """Local stand-in for Pinecone Inference (/embed) and an index (/vectors/upsert)."""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.embed_sizes = []
+        self.upserts = 0
+        self.vectors = {}
+        self.in_flight = self.max_in_flight = 0
+        self.lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                self._reply(fake.handle(self.path, body))
+
+            def _reply(self, payload):
+                data = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def handle(self, path, body):
+        if path.endswith("/embed"):
+            with self.lock:
+                self.embed_sizes.append(len(body["inputs"]))
+            time.sleep(self.latency)
+            return {"model": body["model"], "vector_type": "dense", "usage": {"total_tokens": 1},
+                    "data": [{"vector_type": "dense", "values": [float(len(i["text"])), 1.0]} for i in body["inputs"]]}
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        with self.lock:
+            self.in_flight -= 1
+            self.upserts += 1
+            for vector in body["vectors"]:
+                self.vectors[vector["id"]] = vector
+        return {"upsertedCount": len(body["vectors"])}
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def write_library(root, files, chunks_per_file):
+    root.mkdir(exist_ok=True)
+    for i in range(files):
+        # 2000-char windows with 200 overlap: n chunks need 1800 * n + 1 chars
+        (root / f"note_{i:03d}.md").write_text("x" * (1800 * (chunks_per_file - 1) + 1000))
+    return root
+
+
+@pytest.fixture
+def server():
+    fake = FakePinecone(latency=0.01)
+    yield fake
+    fake.close()
+
+
+def pinecone_bank(server, monkeypatch, **kwargs):
+    pytest.importorskip("pinecone")
+    secrets = {"PINECONE_API_KEY": "test", "PINECONE_HOST": server.url, "PINECONE_INDEX_HOST": server.url}
+    monkeypatch.setattr(remote, "resolve_secret", lambda key, env_var=None: secrets.get(key))
+    return RemoteMemoryBank(**kwargs)
+
+
+def test_chunks_from_many_files_share_embed_requests(server, tmp_path, monkeypatch):
+    lib = write_library(tmp_path / "lib", files=40, chunks_per_file=3)
+    bank = pinecone_bank(server, monkeypatch, embed_batch=32, upsert_batch=10, concurrency=3)
+
+    stats = bank.memorize([str(lib)])
+
+    assert stats["added"] == 40 and stats["errors"] == 0
+    assert stats["chunks"] == 120 and stats["chunks_per_sec"] > 0
+    assert server.embed_sizes == [32, 32, 32, 24]
+    assert len(server.vectors) == 120
+    assert 1 < server.max_in_flight <= 3
+    print(f"\n[Remote Ingest] 120 chunks, 10ms fake latency: {stats['chunks_per_sec']} chunks/s")
+
+
+def test_pipeline_beats_file_at_a_time(tmp_path, monkeypatch):
+    fake = FakePinecone(latency=0.02)
+    try:
+        lib = write_library(tmp_path / "lib", files=30, chunks_per_file=2)
+        files = sorted(str(p) for p in lib.iterdir())
+
+        # The previous behaviour: one embed request per file, upserts in sequence
+        before = pinecone_bank(fake, monkeypatch, embed_batch=10_000, concurrency=1)
+        start = time.perf_counter()
+        for path in files:
+            before.memorize([path])
+        serial = 60 / (time.perf_counter() - start)
+
+        stats = pinecone_bank(fake, monkeypatch, embed_batch=96, upsert_batch=10).memorize([str(lib)])
+        print(f"\n[Remote Ingest] 30 files / 60 chunks, 20ms fake latency: "
+              f"{serial:.0f} -> {stats['chunks_per_sec']} chunks/s")
+        assert stats["added"] == 30
+        assert stats["chunks_per_sec"] > 3 * serial
+    finally:
+        fake.close()
+
+
+class FakeIndex:
+    def __init__(self, fail):
+        self.fail = list(fail)
+        self.stored = {}
+
+    def upsert(self, vectors):
+        if self.fail:
+            raise RuntimeError(self.fail.pop(0))
+        for v in vectors:
+            self.stored[v["id"]] = v
+
+
+def offline_bank(fail=(), embed_error=None):
+    bank = RemoteMemoryBank.__new__(RemoteMemoryBank)
+    bank.active, bank.model_name = True, "model"
+    bank.embed_batch, bank.upsert_batch, bank.concurrency = 4, 2, 2
+
+    def embed(model, inputs, parameters):
+        if embed_error:
+            raise RuntimeError(embed_error)
+        return [types.SimpleNamespace(values=[1.0]) for _ in inputs]
+
+    bank.pc = types.SimpleNamespace(inference=types.SimpleNamespace(embed=embed))
+    bank.index = FakeIndex(fail)
+    return bank
+
+
+def test_rate_limits_back_off_and_exhausted_retries_fail_the_file(tmp_path, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(remote, "time", types.SimpleNamespace(sleep=sleeps.append, perf_counter=time.perf_counter))
+    lib = write_library(tmp_path / "lib", files=1, chunks_per_file=2)
+
+    bank = offline_bank(fail=["429 Too Many Requests"])
+    stats = bank.memorize([str(lib)])
+    assert stats["added"] == 1 and len(bank.index.stored) == 2
+    assert sleeps == [2]
+
+    bank = offline_bank(fail=["rate limit"] * 3)
+    stats = bank.memorize([str(lib)])
+    assert stats["added"] == 0 and stats["errors"] == 1 and stats["chunks"] == 0
+
+    bank = offline_bank(fail=["400 bad vector"])
+    assert bank.memorize([str(lib)])["errors"] == 1
+
+
+def test_embed_failure_counts_each_file_once(tmp_path):
+    lib = write_library(tmp_path / "lib", files=3, chunks_per_file=2)
+    stats = offline_bank(embed_error="503").memorize([str(lib)])
+    assert stats["errors"] == 3 and stats["added"] == 0
+
+
+def test_a_path_given_twice_is_ingested_once(tmp_path):
+    lib = write_library(tmp_path / "lib", files=3, chunks_per_file=2)
+    bank = offline_bank()
+    stats = bank.memorize([str(lib), str(lib / "note_001.md"), str(lib)])
+    assert stats["added"] == 3 and stats["errors"] == 0
+    assert stats["chunks"] == len(bank.index.stored) == 6
+
@@ -0,0 +1,60 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from jcapy.core.audit_index import AuditIndex, AuditQuery
+
+
+class TestAuditQuery(unittest.TestCase):
+    """Indexed audit lookups vs. a full scan of audit.jsonl."""
+
+    RECORDS = 100_000
+    SESSIONS = 500
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "audit.jsonl")
+        with open(self.path, "w") as f:
+            for i in range(self.RECORDS):
+                f.write(json.dumps({
+                    "timestamp": 1_700_000_000 + i,
+                    "session_id": f"session-{i % self.SESSIONS}",
+                    "agent_id": "agent",
+                    "event_type": "TOOL_CALL" if i % 10 == 0 else "command_intent",
+                    "payload": {"command": "ls", "i": i},
+                    "outcome": "SUCCESS",
+                }) + "\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _scan(self, session_id, event_type):
+        with open(self.path) as f:
+            return [r for r in map(json.loads, f)
+                    if r["session_id"] == session_id and r["event_type"] == event_type]
+
+    def test_indexed_lookup_beats_full_scan(self):
+        index = AuditIndex(self.path)
+        start = time.perf_counter()
+        index.refresh()
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scanned = self._scan("session-10", "TOOL_CALL")
+        scan = time.perf_counter() - start
+
+        q = AuditQuery(session_id="session-10", event_type="TOOL_CALL")
+        start = time.perf_counter()
+        indexed = [r for _, r in index.query(q, refresh=False)]
+        lookup = time.perf_counter() - start
+
+        print(f"\n[Audit Query] {self.RECORDS} records: build={build:.2f}s "
+              f"scan={scan * 1000:.1f}ms indexed={lookup * 1000:.2f}ms ({len(indexed)} hits)")
+        self.assertEqual(indexed, scanned)
+        self.assertLess(lookup * 5, scan)
+
+
+if __name__ == "__main__":
+    unittest.main()
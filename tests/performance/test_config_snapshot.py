@@ -0,0 +1,59 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from jcapy.core.config_manager import ConfigManager, thaw
+
+
+def best_of(fn, repeat=5, number=2000):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+class TestConfigSnapshotReads(unittest.TestCase):
+    """Config reads hand out frozen snapshot values, so their cost must not grow with config size."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _manager(self, name, entries):
+        cm = ConfigManager(os.path.join(self.test_dir, name))
+        cm.set_all({
+            "ux": {"theme": "dracula"},
+            "personas": {f"p{i}": {"path": f"/lib/{i}", "tags": ["a", "b"]} for i in range(entries)},
+        })
+        return cm
+
+    def test_read_cost_independent_of_size(self):
+        small = self._manager("small.json", 10)
+        large = self._manager("large.json", 20_000)
+
+        timings = {}
+        for label, cm in (("small", small), ("large", large)):
+            timings[label] = {
+                "get_leaf": best_of(lambda: cm.get("ux.theme")),
+                "get_subtree": best_of(lambda: cm.get("personas")),
+                "snapshot": best_of(lambda: cm.snapshot().get("personas")),
+            }
+        deepcopy_large = best_of(lambda: thaw(large.get("personas")), repeat=1, number=3)
+
+        print(f"\n[Config Reads] small={timings['small']} large={timings['large']} "
+              f"(deepcopy of large subtree: {deepcopy_large * 1e3:.1f}ms)")
+        for op in timings["small"]:
+            # Generous bound for timer noise; a copying read would be ~1000x slower
+            self.assertLess(timings["large"][op], timings["small"][op] * 5 + 2e-6, op)
+        self.assertLess(timings["large"]["get_subtree"] * 100, deepcopy_large)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -32,5 +32,16 @@ class TestConfigStress(unittest.TestCase):
         self.assertEqual(cm2.get("stress.key_0"), "value_0")
         self.assertEqual(cm2.get("stress.key_49"), "value_49")
 
+    def test_batched_writes(self):
+        start_time = time.time()
+        with self.cm.transaction():
+            for i in range(50):
+                self.cm.set(f"stress.key_{i}", f"value_{i}")
+        duration = time.time() - start_time
+        print(f"\nStress Test: 50 sets in one transaction in {duration:.4f}s")
+
+        cm2 = ConfigManager(self.config_file)
+        self.assertEqual(cm2.get("stress.key_49"), "value_49")
+
 if __name__ == '__main__':
     unittest.main()
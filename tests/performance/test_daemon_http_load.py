@@ -0,0 +1,124 @@
+import http.client
+import statistics
+import threading
+import time
+import unittest
+
+from jcapy.daemon.server import ControlPlaneServer, ControlPlaneHandler
+
+
+class TestDaemonHttpLoad(unittest.TestCase):
+    """Local load test: 200 keep-alive pollers against the Control Plane."""
+
+    POLLERS = 200
+    REQUESTS_PER_POLLER = 10
+
+    def setUp(self):
+        self.server = ControlPlaneServer(
+            ('127.0.0.1', 0),
+            ControlPlaneHandler,
+            max_workers=32,
+            backlog=256,
+            keepalive_timeout=2.0
+        )
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _poller(self, latencies, errors, start_gate):
+        conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=10)
+        start_gate.wait()
+        for _ in range(self.REQUESTS_PER_POLLER):
+            try:
+                t0 = time.perf_counter()
+                try:
+                    conn.request('GET', '/api/status')
+                    response = conn.getresponse()
+                except http.client.RemoteDisconnected:
+                    # The server closed the idle connection as we reused it; like
+                    # browsers and urllib3, retry the idempotent request once
+                    conn.close()
+                    conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=10)
+                    conn.request('GET', '/api/status')
+                    response = conn.getresponse()
+                response.read()
+                latencies.append(time.perf_counter() - t0)
+                if response.status != 200:
+                    errors.append(response.status)
+                if response.getheader('Connection') == 'close':
+                    conn.close()
+                    conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=10)
+            except Exception as e:
+                errors.append(repr(e))
+                conn.close()
+                conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=10)
+        conn.close()
+
+    def test_concurrent_pollers(self):
+        latencies, errors = [], []
+        start_gate = threading.Event()
+        threads = [
+            threading.Thread(target=self._poller, args=(latencies, errors, start_gate))
+            for _ in range(self.POLLERS)
+        ]
+        for t in threads:
+            t.start()
+
+        start_time = time.perf_counter()
+        start_gate.set()
+        for t in threads:
+            t.join()
+        duration = time.perf_counter() - start_time
+
+        quantiles = statistics.quantiles(latencies, n=100)
+        p50, p99 = quantiles[49], quantiles[98]
+        print(
+            f"\nHTTP Load Test: {len(latencies)} requests from {self.POLLERS} pollers in {duration:.2f}s "
+            f"(p50={p50 * 1000:.1f}ms, p99={p99 * 1000:.1f}ms, errors={len(errors)})"
+        )
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(latencies), self.POLLERS * self.REQUESTS_PER_POLLER)
+
+    def test_slow_client_does_not_block_health(self):
+        # Open a connection and stall mid-request
+        import socket
+        stalled = socket.create_connection(('127.0.0.1', self.port))
+        stalled.sendall(b'GET /api/status HTTP/1.1\r\nHost: x\r\n')
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=2)
+            conn.request('GET', '/health')
+            self.assertEqual(conn.getresponse().status, 200)
+            conn.close()
+        finally:
+            stalled.close()
+
+    def test_idle_keepalive_connections_do_not_hold_every_worker(self):
+        idle = []
+        try:
+            for _ in range(self.server.max_workers):
+                conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=5)
+                conn.request('GET', '/health')
+                response = conn.getresponse()
+                response.read()
+                self.assertEqual(response.getheader('Connection'), 'keep-alive')
+                idle.append(conn)  # each now holds a worker, waiting for its next request
+
+            t0 = time.perf_counter()
+            conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=5)
+            conn.request('GET', '/health')
+            self.assertEqual(conn.getresponse().status, 200)
+            conn.close()
+            # Well under the 2s keep-alive timeout the idle connections would otherwise hold out for
+            self.assertLess(time.perf_counter() - t0, 1.0)
+        finally:
+            for conn in idle:
+                conn.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
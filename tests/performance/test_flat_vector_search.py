@@ -0,0 +1,96 @@
+import importlib.util
+import os
+import resource
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+from jcapy.memory.flat import FlatVectorStore
+
+ROWS = int(os.environ.get("JCAPY_VECTOR_BENCH_ROWS", 100_000))
+
+
+class TestFlatVectorSearch(unittest.TestCase):
+    """recall@k and latency of the flat store (float32 / int8) vs. exact search."""
+
+    DIM = 384
+    QUERIES = 50
+    K = 10
+
+    @classmethod
+    def setUpClass(cls):
+        # Clustered data, like embeddings of related documents; random
+        # isotropic vectors make every neighbour list a coin toss
+        rng = np.random.default_rng(42)
+        centers = rng.standard_normal((ROWS // 100, cls.DIM)).astype(np.float32)
+        data = centers[rng.integers(0, len(centers), ROWS)] + 0.6 * rng.standard_normal((ROWS, cls.DIM)).astype(np.float32)
+        cls.data = data / np.linalg.norm(data, axis=1, keepdims=True)
+        queries = cls.data[rng.integers(0, ROWS, cls.QUERIES)] + 0.3 * rng.standard_normal((cls.QUERIES, cls.DIM)).astype(np.float32)
+        cls.queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+        exact = cls.queries @ cls.data.T
+        cls.truth = [set(np.argsort(-row)[:cls.K].tolist()) for row in exact]
+        cls.ids = [str(i) for i in range(ROWS)]
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _measure(self, dtype):
+        path = os.path.join(self.tmp.name, dtype)
+        store = FlatVectorStore(path, dtype=dtype)
+        for start in range(0, ROWS, 10_000):
+            store.upsert(ids=self.ids[start:start + 10_000], embeddings=self.data[start:start + 10_000])
+        store.close()
+
+        start = time.perf_counter()
+        store = FlatVectorStore(path)       # what a new CLI process pays
+        open_time = time.perf_counter() - start
+
+        latencies, recall = [], 0.0
+        for query, truth in zip(self.queries, self.truth):
+            start = time.perf_counter()
+            ids = store.query(query_embeddings=query[None, :], n_results=self.K)["ids"][0]
+            latencies.append(time.perf_counter() - start)
+            recall += len(truth & {int(i) for i in ids}) / self.K
+        size = sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+        store.close()
+        return open_time, float(np.median(latencies)), recall / self.QUERIES, size
+
+    def test_recall_and_latency(self):
+        results = {dtype: self._measure(dtype) for dtype in ("float32", "int8")}
+        for dtype, (open_time, p50, recall, size) in results.items():
+            print(f"\n[Flat Vectors] {ROWS}x{self.DIM} {dtype}: open={open_time * 1000:.1f}ms "
+                  f"query p50={p50 * 1000:.1f}ms recall@{self.K}={recall:.3f} disk={size / 2**20:.0f}MiB")
+
+        if importlib.util.find_spec("chromadb") is not None:
+            # Same workload through Chroma, for comparison only
+            import chromadb
+            rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            start = time.perf_counter()
+            client = chromadb.PersistentClient(path=os.path.join(self.tmp.name, "chroma"))
+            collection = client.get_or_create_collection("bench", metadata={"hnsw:space": "cosine"})
+            open_time = time.perf_counter() - start
+            for i in range(0, ROWS, 5000):
+                collection.upsert(ids=self.ids[i:i + 5000], embeddings=self.data[i:i + 5000].tolist())
+            latencies, recall = [], 0.0
+            for query, truth in zip(self.queries, self.truth):
+                start = time.perf_counter()
+                ids = collection.query(query_embeddings=[query.tolist()], n_results=self.K)["ids"][0]
+                latencies.append(time.perf_counter() - start)
+                recall += len(truth & {int(i) for i in ids}) / self.K
+            grown = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss) / 1024
+            print(f"[Flat Vectors] chromadb: open={open_time * 1000:.1f}ms query p50={np.median(latencies) * 1000:.1f}ms "
+                  f"recall@{self.K}={recall / self.QUERIES:.3f} peak RSS +{grown:.0f}MiB")
+
+        self.assertEqual(results["float32"][2], 1.0)
+        self.assertGreaterEqual(results["int8"][2], 0.95)
+        self.assertLess(results["float32"][1], 0.25)
+        self.assertLess(results["int8"][0], 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+# Measured in a fresh interpreter so earlier tests' imports don't hide regressions.
+PROBE = r"""
+import json, sys, time
+start = time.perf_counter()
+from jcapy.core.plugins import CommandRegistry
+from jcapy.core.bootstrap import register_core_commands
+imported = time.perf_counter()
+registry = CommandRegistry()
+register_core_commands(registry)
+registered = time.perf_counter()
+print(json.dumps({
+    "import_s": imported - start,
+    "register_s": registered - imported,
+    "command_modules": sorted(m for m in sys.modules if m.startswith("jcapy.commands.")),
+    "heavy": sorted(m for m in ("chromadb", "pinecone", "git", "jcapy.memory", "jcapy.mcp.server") if m in sys.modules),
+}))
+"""
+
+# Importing the CLI entry point must not pull in the TUI, RPC or analytics
+# stacks, nor create the lazily initialized services.
+CLI_PROBE = r"""
+import json, sys
+import jcapy.main
+from jcapy.core import audit, history
+from jcapy.utils import usage
+from jcapy import telemetry
+print(json.dumps({
+    "heavy": sorted(m for m in ("textual", "grpc", "posthog", "pydantic", "rich", "yaml", "zmq",
+                                "jcapy.core.client", "jcapy.core.a2a") if m in sys.modules),
+    "created": [name for name, obj in (("audit", audit._global_audit_logger), ("history", history._manager),
+                                       ("usage", usage._manager), ("telemetry", telemetry._client)) if obj is not None],
+    "library_resolved": sys.modules["jcapy.config"]._default_library_path is not None,
+}))
+"""
+
+# Generous ceilings: they catch a command module being pulled in eagerly
+# again, not machine-to-machine noise.
+REGISTER_BUDGET_S = float(os.environ.get("JCAPY_REGISTER_BUDGET", 0.05))
+STARTUP_BUDGET_S = float(os.environ.get("JCAPY_STARTUP_BUDGET", 2.0))
+
+
+class TestImportBudget(unittest.TestCase):
+    """Cold start: registering the built-in commands must not import them."""
+
+    def _probe(self, probe=PROBE):
+        env = dict(os.environ, PYTHONPATH=SRC + os.pathsep + os.environ.get("PYTHONPATH", ""))
+        out = subprocess.run([sys.executable, "-c", probe], env=env, capture_output=True,
+                             text=True, check=True, timeout=60)
+        return json.loads(out.stdout.strip().splitlines()[-1])
+
+    def test_registration_defers_command_imports(self):
+        report = self._probe()
+        print(f"\n[Import Budget] import={report['import_s'] * 1000:.1f}ms "
+              f"register={report['register_s'] * 1000:.2f}ms")
+
+        self.assertEqual(report["command_modules"], [])
+        self.assertEqual(report["heavy"], [])
+        self.assertLess(report["register_s"], REGISTER_BUDGET_S)
+        self.assertLess(report["import_s"] + report["register_s"], STARTUP_BUDGET_S)
+
+    def test_cli_import_is_side_effect_free(self):
+        report = self._probe(CLI_PROBE)
+        self.assertEqual(report["heavy"], [])
+        self.assertEqual(report["created"], [])
+        self.assertFalse(report["library_resolved"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import tempfile
+import time
+import unittest
+
+from jcapy.core.skill_catalog import SkillCatalog
+
+
+class TestSkillCatalogScan(unittest.TestCase):
+    """Catalog lookups vs. the os.walk scans they replace."""
+
+    DIRS = 200
+    FILES_PER_DIR = 25
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.lib = os.path.join(self.tmp.name, "library")
+        for d in range(self.DIRS):
+            folder = os.path.join(self.lib, "skills", f"domain_{d:03d}")
+            os.makedirs(folder)
+            for i in range(self.FILES_PER_DIR):
+                with open(os.path.join(folder, f"skill_{d:03d}_{i:02d}.md"), "w") as f:
+                    f.write(f"---\ntitle: Skill {d}/{i}\ngrade: B\n---\n# Skill\nbody {i}\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _walk_find(self, name):
+        # The exact-then-fuzzy search open/delete/apply used to run
+        for root, dirs, files in os.walk(self.lib):
+            for f in files:
+                if f == name or f == f"{name}.md":
+                    return os.path.join(root, f)
+        for root, dirs, files in os.walk(self.lib):
+            for f in files:
+                if name.lower() in f.lower() and f.endswith(".md"):
+                    return os.path.join(root, f)
+        return None
+
+    def _walk_list(self):
+        rows = []
+        for root, dirs, files in os.walk(self.lib):
+            for f in files:
+                rows.append((f, os.path.getmtime(os.path.join(root, f))))
+        return rows
+
+    def _best(self, fn, runs=5):
+        best = float("inf")
+        for _ in range(runs):
+            start = time.perf_counter()
+            result = fn()
+            best = min(best, time.perf_counter() - start)
+        return best, result
+
+    def test_catalog_beats_walking_the_library(self):
+        catalog = SkillCatalog(self.lib, db_path=os.path.join(self.tmp.name, "catalog.db"))
+        start = time.perf_counter()
+        catalog.refresh()
+        build = time.perf_counter() - start
+
+        # Spread over the library so the walk's luck with directory order averages out
+        targets = [f"skill_{d:03d}_{d % self.FILES_PER_DIR:02d}" for d in range(0, self.DIRS, 20)]
+        walk_find, walked = self._best(lambda: [self._walk_find(t) for t in targets])
+        cat_find, found = self._best(lambda: [catalog.find(t).path for t in targets])
+        walk_find, cat_find = walk_find / len(targets), cat_find / len(targets)
+        walk_miss, _ = self._best(lambda: self._walk_find("does_not_exist"))
+        cat_miss, missing = self._best(lambda: catalog.find("does_not_exist"))
+        walk_list, listed = self._best(self._walk_list)
+        cat_list, entries = self._best(catalog.entries)
+
+        total = self.DIRS * self.FILES_PER_DIR
+        print(f"\n[Skill Catalog] {total} files: build={build:.2f}s "
+              f"find={walk_find * 1000:.1f}->{cat_find * 1000:.2f}ms "
+              f"miss={walk_miss * 1000:.1f}->{cat_miss * 1000:.2f}ms "
+              f"list={walk_list * 1000:.1f}->{cat_list * 1000:.1f}ms")
+
+        self.assertEqual(found, walked)
+        self.assertIsNone(missing)
+        self.assertEqual(len(entries), len(listed))
+        self.assertLess(cat_find * 3, walk_find)
+        self.assertLess(cat_miss * 3, walk_miss)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+import random
+import tempfile
+import time
+import unittest
+
+from jcapy.core.skill_catalog import SkillCatalog
+
+WORDS = ("docker kubernetes deploy react vite python fastapi redis cache queue worker auth oauth "
+         "token database postgres migration index schema test pytest lint format build release "
+         "monitor metrics logging trace grpc socket stream batch retry backoff config secret").split()
+
+
+class TestSkillSearch(unittest.TestCase):
+    """Full-text catalog search vs. reading every markdown file per query."""
+
+    SKILLS = 10_000
+    DIRS = 100
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.lib = os.path.join(self.tmp.name, "library")
+        rng = random.Random(7)
+        for i in range(self.SKILLS):
+            folder = os.path.join(self.lib, "skills", f"domain_{i % self.DIRS:03d}")
+            os.makedirs(folder, exist_ok=True)
+            body = " ".join(rng.choice(WORDS) for _ in range(300))
+            if i == 4242:
+                body += " zanzibar"
+            with open(os.path.join(folder, f"skill_{i:05d}.md"), "w") as f:
+                f.write(f"---\ntitle: {' '.join(rng.sample(WORDS, 3))}\ntags: [{rng.choice(WORDS)}]\n---\n"
+                        f"# Skill {i}\n{body}\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _scan(self, term):
+        # What search_frameworks used to do for every query
+        matches = []
+        for root, dirs, files in os.walk(self.lib):
+            for f in files:
+                if f.endswith(".md"):
+                    with open(os.path.join(root, f)) as fh:
+                        if term in fh.read().lower():
+                            matches.append(os.path.join(root, f))
+        return matches
+
+    def test_indexed_search_beats_scanning(self):
+        catalog = SkillCatalog(self.lib, db_path=os.path.join(self.tmp.name, "catalog.db"))
+        start = time.perf_counter()
+        catalog.refresh()
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scanned = self._scan("zanzibar")
+        scan = time.perf_counter() - start
+
+        timings = []
+        # Every vocabulary word is in nearly every skill: the worst case for ranking
+        for query in ("grpc retry", "kubernetes deploy", "postg"):
+            start = time.perf_counter()
+            hits = catalog.search(query, limit=20)
+            timings.append(time.perf_counter() - start)
+            self.assertTrue(hits, query)
+        start = time.perf_counter()
+        rare = catalog.search("zanzibar")
+        rare_time = time.perf_counter() - start
+
+        # An edit is picked up without rebuilding
+        path = rare[0].entry.path
+        with open(path, "a") as f:
+            f.write("quokka\n")
+        start = time.perf_counter()
+        catalog.touch(path)
+        update = time.perf_counter() - start
+
+        print(f"\n[Skill Search] {self.SKILLS} skills: build={build:.1f}s scan={scan * 1000:.0f}ms "
+              f"search rare={rare_time * 1000:.1f}ms common={max(timings) * 1000:.1f}ms update={update * 1000:.1f}ms")
+
+        self.assertEqual([h.entry.path for h in rare], scanned)
+        self.assertEqual([h.entry.path for h in catalog.search("quokka")], [path])
+        self.assertLess(rare_time * 20, scan)
+        self.assertLess(max(timings) * 2, scan)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import io
+import json
+import sqlite3
+
+import pytest
+
+import jcapy.utils.ai as ai
+import jcapy.utils.ai_cache as ai_cache
+import jcapy.utils.usage as usage
+from jcapy.utils.ai_cache import ResponseCache, cache_key
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(str(tmp_path / "ai_cache.db"), ttl=60, max_bytes=1000)
+
+
+def test_key_covers_provider_model_prompt_and_params():
+    base = cache_key("openai", "gpt-4o", "hello", {"temperature": 0.2})
+    assert base == cache_key("openai", "gpt-4o", "hello", {"temperature": 0.2})
+    assert base != cache_key("deepseek", "gpt-4o", "hello", {"temperature": 0.2})
+    assert base != cache_key("openai", "gpt-4o-mini", "hello", {"temperature": 0.2})
+    assert base != cache_key("openai", "gpt-4o", "hello!", {"temperature": 0.2})
+    assert base != cache_key("openai", "gpt-4o", "hello", {"temperature": 0.7})
+
+
+def test_hit_miss_and_ttl(cache, monkeypatch):
+    assert cache.get("k") is None
+    cache.put("k", "gemini", "gemini-1.5-flash", "answer")
+    assert cache.get("k") == "answer"
+
+    now = ai_cache.time.time()
+    monkeypatch.setattr(ai_cache.time, "time", lambda: now + 120)
+    assert cache.get("k") is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["hit_rate"] == pytest.approx(1 / 3, abs=0.001)
+    assert stats["entries"] == 0
+    # Persisted, so a fresh instance (another process) reports the same counts
+    assert ResponseCache(cache.db_path).stats()["misses"] == 2
+
+
+def test_size_cap_evicts_least_recently_used(cache, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(ai_cache.time, "time", lambda: clock[0])
+
+    for key in ("a", "b", "c"):
+        clock[0] += 1
+        cache.put(key, "gemini", "m", key * 400)
+    # a, b, c = 1200 bytes > 1000: the oldest (a) is gone
+    assert cache.get("a") is None
+
+    clock[0] += 1
+    assert cache.get("b") is not None  # touch b so c becomes LRU
+    clock[0] += 1
+    cache.put("d", "gemini", "m", "d" * 400)
+
+    assert cache.get("c") is None
+    assert cache.get("b") is not None
+    assert cache.get("d") is not None
+    assert cache.stats()["size_bytes"] <= 1000
+
+
+class FakeResponse(io.BytesIO):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def offline_agent(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_urlopen(req, timeout=30):
+        calls.append(json.loads(req.data))
+        body = {"choices": [{"message": {"content": "cached answer " * 50}}]}
+        return FakeResponse(json.dumps(body).encode())
+
+    monkeypatch.setattr(ai.urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(ai, "get_api_key", lambda provider: "sk-test")
+    monkeypatch.setattr(ai, "get_response_cache", lambda: ResponseCache(str(tmp_path / "ai_cache.db")))
+
+    monkeypatch.setattr(usage, "JCAPY_HOME", str(tmp_path))
+    manager = usage.UsageLogManager()
+    manager.pricing_rules = {"gpt-4o": {"in": 5.0, "out": 15.0}, "local": {"in": 0, "out": 0}}
+    # Patch what backs get_usage_log_manager(): reading USAGE_LOG_MANAGER would build the real one
+    monkeypatch.setattr(usage, "_manager", manager)
+    yield calls, manager
+    manager.close()
+
+
+def test_call_ai_agent_serves_repeats_from_cache(offline_agent):
+    calls, manager = offline_agent
+
+    first, err = ai.call_ai_agent("explain caching", provider="openai", use_cache=True)
+    second, err2 = ai.call_ai_agent("explain caching", provider="openai", use_cache=True)
+
+    assert err is None and err2 is None
+    assert first == second
+    assert len(calls) == 1
+
+    session = manager.get_session_summary()
+    assert session["hits"] == 1
+    assert session["cache_hits"] == 1
+    assert session["saved"] == pytest.approx(session["cost"])
+
+    totals = manager.get_total_summary()
+    assert totals["cache_hits"] == 1
+    assert totals["saved"] > 0
+
+
+def test_call_ai_agent_cache_is_opt_in(offline_agent, monkeypatch):
+    calls, _ = offline_agent
+    monkeypatch.setenv("JCAPY_AI_CACHE", "0")
+
+    ai.call_ai_agent("same prompt", provider="openai")
+    ai.call_ai_agent("same prompt", provider="openai")
+    assert len(calls) == 2
+
+
+def test_usage_db_gains_cache_columns(tmp_path, monkeypatch):
+    db = tmp_path / "usage.db"
+    with sqlite3.connect(db) as conn:
+        conn.execute("""
+            CREATE TABLE usage_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL, session_id TEXT NOT NULL,
+                provider TEXT NOT NULL, model TEXT NOT NULL, input_tokens INTEGER DEFAULT 0,
+                output_tokens INTEGER DEFAULT 0, cost REAL DEFAULT 0.0)
+        """)
+    monkeypatch.setattr(usage, "JCAPY_HOME", str(tmp_path))
+    manager = usage.UsageLogManager()
+    manager.record_hit("openai", "gpt-4o", 100, 100, cached=True)
+
+    assert manager.get_total_summary()["cache_hits"] == 1
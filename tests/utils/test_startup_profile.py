@@ -0,0 +1,35 @@
+import os
+import subprocess
+import sys
+
+from jcapy.utils import startup_profile
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+
+def test_parse_importtime_skips_the_header():
+    lines = [
+        "import time: self [us] | cumulative | imported package\n",
+        "import time:       120 |        120 |   json.decoder\n",
+        "import time:       300 |        420 | json\n",
+        "some other stderr\n",
+    ]
+    assert startup_profile.parse_importtime(lines) == {"json.decoder": (120, 120), "json": (300, 420)}
+
+
+def test_report_groups_by_package():
+    modules = {"yaml": (2000, 5000), "yaml.reader": (3000, 3000), "jcapy.core.plugins": (1000, 4000)}
+    report = startup_profile.render_report(0.1, modules, [("usage log", 0.012)])
+    assert "5.0ms  yaml\n" in report
+    assert "jcapy.core.plugins" in report
+    assert "12.0ms  usage log" in report
+
+
+def test_profile_startup_flag_runs_the_command(tmp_path):
+    env = dict(os.environ, PYTHONPATH=SRC, HOME=str(tmp_path))
+    out = subprocess.run([sys.executable, "-m", "jcapy", "--profile-startup", "--version"], env=env,
+                         capture_output=True, text=True, timeout=60, cwd=str(tmp_path))
+    assert out.returncode == 0
+    assert out.stdout.startswith("jcapy v")
+    assert "Startup profile" in out.stderr
+    assert "import time:" not in out.stderr
@@ -0,0 +1,221 @@
+import json
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from jcapy.utils import usage
+
+PRICING = {"gpt-4o": {"in": 5.0, "out": 15.0}, "local": {"in": 0, "out": 0}}
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(usage, "JCAPY_HOME", str(tmp_path))
+    m = usage.UsageLogManager(flush_interval=60, flush_records=1000)
+    m.pricing_rules = dict(PRICING)
+    yield m
+    m.close()
+
+
+def scan_totals(db_path):
+    """The pre-rollup query, used as the reference answer."""
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("""
+            SELECT SUM(CASE WHEN cached = 0 THEN input_tokens ELSE 0 END),
+                   SUM(CASE WHEN cached = 0 THEN output_tokens ELSE 0 END),
+                   SUM(cost), SUM(cached), SUM(saved), COUNT(*)
+            FROM usage_logs
+        """).fetchone()
+
+
+def test_hits_are_batched_until_flush(manager):
+    for _ in range(10):
+        manager.record_hit("openai", "gpt-4o", 1000, 500)
+    assert manager.get_session_summary()["hits"] == 10
+
+    # Nothing reached the database yet: the writer waits for 1000 rows or 60s
+    with sqlite3.connect(manager.db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM usage_logs").fetchone()[0] == 0
+
+    assert manager.flush()
+    assert scan_totals(manager.db_path)[5] == 10
+    assert manager.batches == 1
+
+
+def test_rollups_match_a_full_scan(manager):
+    for i in range(50):
+        manager.record_hit("openai", "gpt-4o", 100 + i, 10 * i, cached=i % 5 == 0)
+        manager.record_hit("ollama", "llama3", 20, 20)
+
+    totals = manager.get_total_summary()
+    assert manager.flush()
+    in_tokens, out_tokens, cost, cache_hits, saved, _ = scan_totals(manager.db_path)
+    assert totals["input_tokens"] == in_tokens
+    assert totals["output_tokens"] == out_tokens
+    assert totals["cost"] == pytest.approx(cost)
+    assert totals["cache_hits"] == cache_hits == 10
+    assert totals["saved"] == pytest.approx(saved)
+
+    providers = {row["provider"]: row for row in manager.get_provider_summary()}
+    assert providers["openai"]["calls"] == 50 and providers["ollama"]["calls"] == 50
+    models = manager.get_model_summary()
+    assert [(m["provider"], m["model"]) for m in models] == [("ollama", "llama3"), ("openai", "gpt-4o")]
+    daily = manager.get_daily_summary()
+    assert len(daily) == 1 and daily[0]["calls"] == 100
+
+
+def test_summaries_include_queued_rows_without_writing_them(manager):
+    manager.record_hit("openai", "gpt-4o", 1000, 0)
+    assert manager.flush()
+    for _ in range(3):
+        manager.record_hit("openai", "gpt-4o", 1000, 0)
+    manager.record_hit("ollama", "llama3", 5, 5, cached=True)
+
+    assert manager.get_total_summary()["input_tokens"] == 4000
+    providers = {row["provider"]: row for row in manager.get_provider_summary()}
+    assert providers["openai"]["calls"] == 4
+    assert providers["ollama"]["cache_hits"] == 1 and providers["ollama"]["input_tokens"] == 0
+    assert manager.get_daily_summary()[0]["calls"] == 5
+    assert manager.batches == 1
+    assert scan_totals(manager.db_path)[5] == 1
+
+    assert manager.flush()
+    assert manager.get_total_summary()["input_tokens"] == 4000
+
+
+def test_summary_reads_never_miss_or_double_count_a_batch(tmp_path, monkeypatch):
+    monkeypatch.setattr(usage, "JCAPY_HOME", str(tmp_path))
+    m = usage.UsageLogManager(flush_interval=0.001, flush_records=7)
+    m.pricing_rules = dict(PRICING)
+    done = threading.Event()
+    seen = []
+
+    def reader():
+        while not done.is_set():
+            seen.append(m.get_provider_summary())
+
+    t = threading.Thread(target=reader)
+    t.start()
+    try:
+        for i in range(300):
+            m.record_hit("openai", "gpt-4o", 1, 0)
+            assert m.get_total_summary()["input_tokens"] == i + 1
+    finally:
+        done.set()
+        t.join()
+        m.close()
+    counts = [rows[0]["calls"] if rows else 0 for rows in seen]
+    assert counts == sorted(counts) and counts[-1] <= 300
+
+
+def failing_writes(monkeypatch, m, errors):
+    """Make m's inserts raise each of `errors` in turn, then succeed."""
+    calls = []
+    real = m._write_batch
+
+    def write_batch(rows):
+        calls.append(time.monotonic())
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        real(rows)
+
+    monkeypatch.setattr(m, "_write_batch", write_batch)
+    return calls
+
+
+def test_locked_database_is_retried_with_backoff(tmp_path, monkeypatch):
+    monkeypatch.setattr(usage, "JCAPY_HOME", str(tmp_path))
+    m = usage.UsageLogManager(flush_interval=0.1, flush_records=1, commit_retries=3)
+    m.pricing_rules = dict(PRICING)
+    calls = failing_writes(monkeypatch, m, [sqlite3.OperationalError("database is locked")] * 2)
+    try:
+        m.record_hit("openai", "gpt-4o", 10, 10)
+        assert m.flush()
+    finally:
+        m.close()
+
+    assert len(calls) == 3 and calls[2] - calls[0] >= 0.18
+    assert m.errors == 2 and m.dropped == 0
+    assert scan_totals(m.db_path)[5] == 1
+
+
+def test_batches_are_dropped_on_permanent_or_persistent_errors(tmp_path, monkeypatch):
+    monkeypatch.setattr(usage, "JCAPY_HOME", str(tmp_path))
+    m = usage.UsageLogManager(flush_interval=0.01, flush_records=1000, commit_retries=3)
+    m.pricing_rules = dict(PRICING)
+    locked = sqlite3.OperationalError("database is locked")
+    calls = failing_writes(monkeypatch, m, [sqlite3.DatabaseError("file is not a database")] + [locked] * 3)
+    try:
+        for _ in range(5):
+            m.record_hit("openai", "gpt-4o", 10, 10)
+        assert m.flush()
+        assert len(calls) == 1 and m.dropped == 5  # not retried at all
+
+        m.record_hit("openai", "gpt-4o", 10, 10)
+        assert m.flush()
+        assert len(calls) == 4 and m.dropped == 6  # retried, then given up on
+
+        m.record_hit("openai", "gpt-4o", 10, 10)
+        assert m.flush()
+    finally:
+        m.close()
+    assert m._queue.depth() == 0
+    assert scan_totals(m.db_path)[5] == 1
+
+
+def test_concurrent_writers(manager):
+    def worker():
+        for _ in range(200):
+            manager.record_hit("openai", "gpt-4o", 10, 10)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert manager.get_provider_summary()[0]["calls"] == 1600
+    assert manager.flush()
+    assert scan_totals(manager.db_path)[5] == 1600
+
+
+def test_existing_history_is_backfilled(tmp_path, monkeypatch):
+    monkeypatch.setattr(usage, "JCAPY_HOME", str(tmp_path))
+    with sqlite3.connect(tmp_path / "usage.db") as conn:
+        conn.execute("""
+            CREATE TABLE usage_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL, session_id TEXT NOT NULL,
+                provider TEXT NOT NULL, model TEXT NOT NULL, input_tokens INTEGER DEFAULT 0,
+                output_tokens INTEGER DEFAULT 0, cost REAL DEFAULT 0.0)
+        """)
+        conn.executemany(
+            "INSERT INTO usage_logs (timestamp, session_id, provider, model, input_tokens, output_tokens, cost) "
+            "VALUES (?, 's', 'openai', 'gpt-4o', 100, 50, 0.5)",
+            [("2026-01-01T10:00:00",), ("2026-01-01T11:00:00",), ("2026-01-02T09:00:00",)],
+        )
+
+    first = usage.UsageLogManager()
+    assert first.get_total_summary()["input_tokens"] == 300
+    first.close()
+
+    # Opening the database again must not aggregate the history twice
+    second = usage.UsageLogManager()
+    assert second.get_total_summary()["cost"] == pytest.approx(1.5)
+    with sqlite3.connect(second.db_path) as conn:
+        days = conn.execute("SELECT day, calls FROM usage_daily ORDER BY day").fetchall()
+    assert days == [("2026-01-01", 2), ("2026-01-02", 1)]
+    second.close()
+
+
+def test_legacy_json_is_migrated_into_rollups(tmp_path, monkeypatch):
+    monkeypatch.setattr(usage, "JCAPY_HOME", str(tmp_path))
+    (tmp_path / "usage_log.json").write_text(json.dumps([
+        {"timestamp": "2025-12-31T23:00:00", "provider": "gemini", "model": "gemini-1.5-flash",
+         "input": 10, "output": 20, "cost": 0.01},
+    ]))
+    manager = usage.UsageLogManager()
+    assert manager.get_total_summary()["output_tokens"] == 20
+    assert (tmp_path / "usage_log.json.bak").exists()
+    manager.close()